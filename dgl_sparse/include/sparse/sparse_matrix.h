@@ -190,8 +190,9 @@ class SparseMatrix : public torch::CustomClassHolder {
   std::tuple<torch::Tensor, torch::Tensor, torch::optional<torch::Tensor>>
   CSCTensors();
 
-  /** @brief Return the transposition of the sparse matrix. It transposes the
-   * first existing sparse format by checking COO, CSR, and CSC.
+  /** @brief Return the transposition of the sparse matrix. All the existing
+   * sparse formats are carried over, e.g., the CSR format of the matrix becomes
+   * the CSC format of the transposition.
    */
   c10::intrusive_ptr<SparseMatrix> Transpose() const;
 
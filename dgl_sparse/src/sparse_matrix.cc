@@ -130,18 +130,13 @@ c10::intrusive_ptr<SparseMatrix> SparseMatrix::ValLike(
   TORCH_CHECK(
       mat->value().device() == value.device(), "The device of the ",
       "old values and the new values must be the same.");
-  const auto& shape = mat->shape();
-  if (mat->HasDiag()) {
-    return SparseMatrix::FromDiagPointer(mat->DiagPtr(), value, shape);
-  }
-  if (mat->HasCOO()) {
-    return SparseMatrix::FromCOOPointer(mat->COOPtr(), value, shape);
-  }
-  if (mat->HasCSR()) {
-    return SparseMatrix::FromCSRPointer(mat->CSRPtr(), value, shape);
-  }
-  TORCH_CHECK(mat->HasCSC(), "Invalid sparse format for ValLike.")
-  return SparseMatrix::FromCSCPointer(mat->CSCPtr(), value, shape);
+  // Share all the sparse formats that have been created so that they are not
+  // recomputed for the new matrix.
+  return c10::make_intrusive<SparseMatrix>(
+      mat->HasCOO() ? mat->COOPtr() : nullptr,
+      mat->HasCSR() ? mat->CSRPtr() : nullptr,
+      mat->HasCSC() ? mat->CSCPtr() : nullptr,
+      mat->HasDiag() ? mat->DiagPtr() : nullptr, value, mat->shape());
 }
 
 std::shared_ptr<COO> SparseMatrix::COOPtr() {
@@ -201,14 +196,12 @@ c10::intrusive_ptr<SparseMatrix> SparseMatrix::Transpose() const {
   auto value = value_;
   if (HasDiag()) {
     return SparseMatrix::FromDiag(value, shape);
-  } else if (HasCOO()) {
-    auto coo = COOTranspose(coo_);
-    return SparseMatrix::FromCOOPointer(coo, value, shape);
-  } else if (HasCSR()) {
-    return SparseMatrix::FromCSCPointer(csr_, value, shape);
-  } else {
-    return SparseMatrix::FromCSRPointer(csc_, value, shape);
   }
+  // The CSR and CSC formats swap roles in the transposed matrix, so all the
+  // created formats are carried over without any conversion.
+  return c10::make_intrusive<SparseMatrix>(
+      HasCOO() ? COOTranspose(coo_) : nullptr, csc_, csr_, nullptr, value,
+      shape);
 }
 
 void SparseMatrix::_CreateCOO() {
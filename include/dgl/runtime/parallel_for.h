@@ -112,6 +112,131 @@ void parallel_for(const size_t begin, const size_t end, F&& f) {
   parallel_for(begin, end, default_grain_size(), std::forward<F>(f));
 }
 
+/**
+ * @brief Split the rows [begin, end) of a CSR matrix into \a num_parts
+ * contiguous ranges with a similar amount of work.
+ *
+ * Each row costs its number of nonzeros plus one, i.e. the ranges are cut
+ * along the merge path of the row pointer and the nonzeros, so that both
+ * hub rows and long runs of empty rows are balanced.
+ *
+ * @param begin The starting row (inclusive).
+ * @param end The ending row (exclusive).
+ * @param indptr The row pointer array. Only entries in [begin, end] are read.
+ * @param num_parts The number of ranges.
+ * @return The \a num_parts + 1 range boundaries, starting with \a begin and
+ * ending with \a end.
+ */
+template <typename IdType>
+std::vector<size_t> nnz_balanced_partition(
+    const size_t begin, const size_t end, const IdType* indptr,
+    const size_t num_parts) {
+  std::vector<size_t> bounds(num_parts + 1, end);
+  bounds[0] = begin;
+  const int64_t nnz_begin = indptr[begin];
+  auto cost = [&](size_t i) {
+    return static_cast<int64_t>(indptr[i] - nnz_begin) +
+           static_cast<int64_t>(i - begin);
+  };
+  const int64_t total = cost(end);
+  for (size_t p = 1; p < num_parts; ++p) {
+    const int64_t target = total * p / num_parts;
+    size_t lo = bounds[p - 1], hi = end;
+    // Find the first row whose prefix cost reaches the target.
+    while (lo < hi) {
+      const size_t mid = lo + (hi - lo) / 2;
+      if (cost(mid) < target)
+        lo = mid + 1;
+      else
+        hi = mid;
+    }
+    bounds[p] = lo;
+  }
+  return bounds;
+}
+
+/**
+ * @brief OpenMP-based parallel for loop over the rows of a CSR matrix with
+ * nnz-balanced partitioning.
+ *
+ * Unlike parallel_for, which assigns each thread the same number of rows, the
+ * rows are split with nnz_balanced_partition so that each thread processes a
+ * similar number of nonzeros on skewed-degree graphs. The loop body has the
+ * same signature as parallel_for.
+ */
+template <typename IdType, typename F>
+void parallel_for_nnz(
+    const size_t begin, const size_t end, const IdType* indptr, F&& f) {
+  if (begin >= end) {
+    return;
+  }
+
+#ifdef _OPENMP
+  auto num_threads = compute_num_threads(begin, end, default_grain_size());
+  if (num_threads == 1) {
+    f(begin, end);
+    return;
+  }
+  const auto bounds = nnz_balanced_partition(begin, end, indptr, num_threads);
+  std::atomic_flag err_flag = ATOMIC_FLAG_INIT;
+  std::exception_ptr eptr;
+
+#pragma omp parallel num_threads(num_threads)
+  {
+    auto tid = omp_get_thread_num();
+    if (bounds[tid] < bounds[tid + 1]) {
+      try {
+        f(bounds[tid], bounds[tid + 1]);
+      } catch (...) {
+        if (!err_flag.test_and_set()) eptr = std::current_exception();
+      }
+    }
+  }
+  if (eptr) std::rethrow_exception(eptr);
+#else
+  f(begin, end);
+#endif
+}
+
+/**
+ * @brief OpenMP-based parallel for loop with dynamic load balancing.
+ *
+ * The range is cut into chunks of \a grain_size elements which idle threads
+ * claim from a shared atomic counter, so that threads finishing cheap chunks
+ * early take over the remaining work. The loop body has the same signature as
+ * parallel_for but may be called several times per thread.
+ */
+template <typename F>
+void parallel_for_dynamic(
+    const size_t begin, const size_t end, const size_t grain_size, F&& f) {
+  if (begin >= end) {
+    return;
+  }
+
+#ifdef _OPENMP
+  auto num_threads = compute_num_threads(begin, end, grain_size);
+  const size_t chunk_size = std::max(grain_size, static_cast<size_t>(1));
+  std::atomic<size_t> next(begin);
+  std::atomic_flag err_flag = ATOMIC_FLAG_INIT;
+  std::exception_ptr eptr;
+
+#pragma omp parallel num_threads(num_threads)
+  {
+    try {
+      for (size_t begin_chunk = next.fetch_add(chunk_size); begin_chunk < end;
+           begin_chunk = next.fetch_add(chunk_size)) {
+        f(begin_chunk, std::min(end, begin_chunk + chunk_size));
+      }
+    } catch (...) {
+      if (!err_flag.test_and_set()) eptr = std::current_exception();
+    }
+  }
+  if (eptr) std::rethrow_exception(eptr);
+#else
+  f(begin, end);
+#endif
+}
+
 /**
  * @brief OpenMP-based two-stage parallel reduction.
  *
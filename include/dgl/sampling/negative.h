@@ -38,6 +38,47 @@ std::pair<IdArray, IdArray> GlobalUniformNegativeSampling(
     HeteroGraphPtr hg, dgl_type_t etype, int64_t num_samples, int num_trials,
     bool exclude_self_loops, bool replace, double redundancy);
 
+/**
+ * @brief Build a bloom filter of the edges with the given type.
+ *
+ * @param hg The graph.
+ * @param etype The edge type.
+ * @param num_bits The number of bits of the filter; a multiple of 64.
+ * @param num_hashes The number of hash functions.
+ * @return The bit words of the filter.
+ */
+IdArray BuildEdgeBloomFilter(
+    HeteroGraphPtr hg, dgl_type_t etype, int64_t num_bits, int num_hashes);
+
+/**
+ * @brief Given an edge type, uniformly sample source-destination pairs that do
+ * not have an edge in between using rejection sampling against a bloom filter
+ * built by BuildEdgeBloomFilter.
+ *
+ * Unlike GlobalUniformNegativeSampling, the graph structure is never touched,
+ * and the candidates are drawn in parallel from random streams seeded by the
+ * thread-local random engine of the caller, so the result is reproducible
+ * regardless of the number of threads.  The false positives of the filter
+ * only reject some valid negative examples.
+ *
+ * @param hg The graph.
+ * @param etype The edge type.
+ * @param filter The bloom filter.
+ * @param num_hashes The number of hash functions of the filter.
+ * @param num_samples The number of negative examples to sample.
+ * @param num_trials The number of rejection sampling trials.
+ * @param exclude_self_loops Do not include the examples where the source equals
+ * the destination.
+ * @param replace Whether to sample with replacement.
+ * @param redundancy How much redundant negative examples to take in case of
+ * duplicate examples.
+ * @return The pair of source and destination tensors.
+ */
+std::pair<IdArray, IdArray> BloomFilterNegativeSampling(
+    HeteroGraphPtr hg, dgl_type_t etype, IdArray filter, int num_hashes,
+    int64_t num_samples, int num_trials, bool exclude_self_loops, bool replace,
+    double redundancy);
+
 };  // namespace sampling
 };  // namespace dgl
 
@@ -1,13 +1,21 @@
 """Utilities for batching/unbatching graphs."""
 from collections.abc import Mapping
 
+import numpy as np
+
 from . import backend as F, convert, utils
 from .base import ALL, DGLError, EID, is_all, NID
+from .frame import Frame
 from .heterograph import DGLGraph
-from .heterograph_index import disjoint_union, slice_gidx
+from .heterograph_index import (
+    create_heterograph_from_relations,
+    create_unitgraph_from_coo,
+    disjoint_union,
+    slice_gidx,
+)
 
 
-__all__ = ["batch", "unbatch", "slice_batch"]
+__all__ = ["batch", "unbatch", "slice_batch", "BatchedGraphView"]
 
 
 def batch(graphs, ndata=ALL, edata=ALL):
@@ -403,46 +411,99 @@ def unbatch(g, node_split=None, edge_split=None):
         k: F.asnumpy(split).tolist() for k, split in edge_split.items()
     }
 
-    # Split edges for each relation
-    edge_dict_per = [{} for i in range(num_split)]
+    # Split the edges of each relation in one pass, after shifting them by
+    # the node offsets of the graphs they belong to.
+    rel_graphs_per = [[] for _ in range(num_split)]
     for rel in g.canonical_etypes:
-        srctype, etype, dsttype = rel
-        srcnid_off = dstnid_off = 0
+        srctype, _, dsttype = rel
         u, v = g.edges(order="eid", etype=rel)
+        u = _rebase_ids(u, node_split[srctype], edge_split[rel], srctype)
+        v = _rebase_ids(v, node_split[dsttype], edge_split[rel], dsttype)
         us = F.split(u, edge_split[rel], 0)
         vs = F.split(v, edge_split[rel], 0)
+        num_ntypes = 1 if srctype == dsttype else 2
         for i, (subu, subv) in enumerate(zip(us, vs)):
-            edge_dict_per[i][rel] = (subu - srcnid_off, subv - dstnid_off)
-            srcnid_off += node_split[srctype][i]
-            dstnid_off += node_split[dsttype][i]
-    num_nodes_dict_per = [
-        {k: split[i] for k, split in node_split.items()}
-        for i in range(num_split)
-    ]
-
-    # Create graphs
-    gs = [
-        convert.heterograph(edge_dict, num_nodes_dict, idtype=g.idtype)
-        for edge_dict, num_nodes_dict in zip(edge_dict_per, num_nodes_dict_per)
-    ]
-
-    # Unbatch node features
-    for ntype in g.ntypes:
-        for key, feat in g.nodes[ntype].data.items():
-            subfeats = F.split(feat, node_split[ntype], 0)
-            for subg, subf in zip(gs, subfeats):
-                subg.nodes[ntype].data[key] = subf
+            rel_graphs_per[i].append(
+                create_unitgraph_from_coo(
+                    num_ntypes,
+                    node_split[srctype][i],
+                    node_split[dsttype][i],
+                    subu,
+                    subv,
+                    ["coo", "csr", "csc"],
+                )
+            )
 
-    # Unbatch edge features
-    for etype in g.canonical_etypes:
-        for key, feat in g.edges[etype].data.items():
-            subfeats = F.split(feat, edge_split[etype], 0)
-            for subg, subf in zip(gs, subfeats):
-                subg.edges[etype].data[key] = subf
+    # Split the features of each type in one pass.
+    node_frames_per = _split_frames(
+        [g.nodes[ntype].data for ntype in g.ntypes],
+        [node_split[ntype] for ntype in g.ntypes],
+        num_split,
+    )
+    edge_frames_per = _split_frames(
+        [g.edges[etype].data for etype in g.canonical_etypes],
+        [edge_split[etype] for etype in g.canonical_etypes],
+        num_split,
+    )
 
+    # Create graphs. They share the metagraph of the input graph.
+    metagraph = g._graph.metagraph
+    gs = []
+    for i in range(num_split):
+        num_nodes_per_type = utils.toindex(
+            [node_split[ntype][i] for ntype in g.ntypes], "int64"
+        )
+        gidx = create_heterograph_from_relations(
+            metagraph, rel_graphs_per[i], num_nodes_per_type
+        )
+        gs.append(
+            DGLGraph(
+                gidx,
+                g.ntypes,
+                g.etypes,
+                node_frames_per[i],
+                edge_frames_per[i],
+            )
+        )
     return gs
 
 
+def _rebase_ids(ids, node_split, edge_split, ntype):
+    """Shift the node IDs of the edges of each split to start from zero, and
+    check that they stay within the nodes of the split."""
+    ctx = F.context(ids)
+    node_counts = F.copy_to(F.tensor(node_split, F.dtype(ids)), ctx)
+    edge_counts = F.copy_to(F.tensor(edge_split, F.int64), ctx)
+    offsets = F.cumsum(node_counts, 0) - node_counts
+    ids = ids - F.repeat(offsets, edge_counts, dim=0)
+    upper = F.repeat(node_counts, edge_counts, dim=0)
+    num_invalid = F.sum(F.astype(ids < 0, F.int64), 0) + F.sum(
+        F.astype(ids >= upper, F.int64), 0
+    )
+    if F.as_scalar(num_invalid) > 0:
+        raise DGLError(
+            "Edges of a split connect nodes of type {} outside the"
+            " split.".format(ntype)
+        )
+    return ids
+
+
+def _split_frames(data_list, split_list, num_split):
+    """Split the feature dicts of all the types into ``num_split`` lists of
+    frames, one frame per type."""
+    frames_per = [[] for _ in range(num_split)]
+    for data, split in zip(data_list, split_list):
+        columns = {key: F.split(feat, split, 0) for key, feat in data.items()}
+        for i in range(num_split):
+            frames_per[i].append(
+                Frame(
+                    {key: subfeats[i] for key, subfeats in columns.items()},
+                    num_rows=split[i],
+                )
+            )
+    return frames_per
+
+
 def slice_batch(g, gid, store_ids=False):
     """Get a particular graph from a batch of graphs.
 
@@ -507,6 +568,14 @@ def slice_batch(g, gid, store_ids=False):
                 F.as_scalar(F.sum(F.slice_axis(batch_num_edges, 0, 0, gid), 0))
             )
 
+    return _slice_batch(
+        g, start_nid, num_nodes, start_eid, num_edges, store_ids
+    )
+
+
+def _slice_batch(g, start_nid, num_nodes, start_eid, num_edges, store_ids):
+    """Get the graph of the given node and edge ranges of each type from a
+    batch of graphs."""
     # Slice graph structure
     gidx = slice_gidx(
         g._graph,
@@ -542,3 +611,190 @@ def slice_batch(g, gid, store_ids=False):
             )
 
     return retg
+
+
+class BatchedGraphView(object):
+    """A lazy view of the graphs in a batch.
+
+    Unlike :func:`dgl.unbatch`, the view does not construct any graph up
+    front. The node and edge offsets of the graphs are computed once, so
+    indexing the view slices a single graph out of the batch in constant
+    time, and per-graph results computed on the batched graph can be split
+    in one pass with :meth:`split_nodes` and :meth:`split_edges` without
+    materializing the graphs at all.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The batched graph.
+
+    Examples
+    --------
+
+    >>> import dgl
+    >>> import torch as th
+    >>> bg = dgl.batch([dgl.graph(([0, 1], [2, 3])), dgl.graph(([1], [2]))])
+    >>> view = dgl.BatchedGraphView(bg)
+    >>> len(view)
+    2
+    >>> view[1]
+    Graph(num_nodes=3, num_edges=1,
+          ndata_schemes={}
+          edata_schemes={})
+
+    Split the per-node outputs of a model on the batched graph.
+
+    >>> out = th.arange(bg.num_nodes())
+    >>> view.split_nodes(out)
+    (tensor([0, 1, 2, 3]), tensor([4, 5, 6]))
+
+    See Also
+    --------
+    unbatch
+    slice_batch
+    """
+
+    def __init__(self, g):
+        self._g = g
+        self._num_nodes = {
+            ntype: F.asnumpy(g.batch_num_nodes(ntype)).tolist()
+            for ntype in g.ntypes
+        }
+        self._num_edges = {
+            etype: F.asnumpy(g.batch_num_edges(etype)).tolist()
+            for etype in g.canonical_etypes
+        }
+        self._node_offsets = {
+            ntype: np.cumsum([0] + num).tolist()
+            for ntype, num in self._num_nodes.items()
+        }
+        self._edge_offsets = {
+            etype: np.cumsum([0] + num).tolist()
+            for etype, num in self._num_edges.items()
+        }
+
+    @property
+    def graph(self):
+        """The batched graph."""
+        return self._g
+
+    def __len__(self):
+        return self._g.batch_size
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, gid):
+        """Get the graph of the given index from the batch, or a list of
+        graphs for a slice."""
+        if isinstance(gid, slice):
+            return [self[i] for i in range(*gid.indices(len(self)))]
+        gid = int(gid)
+        if gid < 0:
+            gid += len(self)
+        if gid < 0 or gid >= len(self):
+            raise IndexError(
+                "Graph index {} out of range for a batch of {} graphs.".format(
+                    gid, len(self)
+                )
+            )
+        return self.slice(gid)
+
+    def slice(self, gid, store_ids=False):
+        """Get the graph of the given index from the batch.
+
+        Parameters
+        ----------
+        gid : int
+            The ID of the graph to retrieve.
+        store_ids : bool
+            If True, store the IDs of the extracted nodes and edges in the
+            batched graph under ``dgl.NID`` and ``dgl.EID``.
+
+        Returns
+        -------
+        DGLGraph
+            Retrieved graph.
+        """
+        return _slice_batch(
+            self._g,
+            [self._node_offsets[ntype][gid] for ntype in self._g.ntypes],
+            [self._num_nodes[ntype][gid] for ntype in self._g.ntypes],
+            [
+                self._edge_offsets[etype][gid]
+                for etype in self._g.canonical_etypes
+            ],
+            [self._num_edges[etype][gid] for etype in self._g.canonical_etypes],
+            store_ids,
+        )
+
+    def node_offsets(self, ntype=None):
+        """Return the offsets of the nodes of each graph in the batch.
+
+        Parameters
+        ----------
+        ntype : str, optional
+            The node type. Can be omitted if there is only one node type.
+
+        Returns
+        -------
+        list[int]
+            The offsets, of length ``batch_size + 1``.
+        """
+        return self._node_offsets[self._g.ntypes[self._g.get_ntype_id(ntype)]]
+
+    def edge_offsets(self, etype=None):
+        """Return the offsets of the edges of each graph in the batch.
+
+        Parameters
+        ----------
+        etype : str or (str, str, str), optional
+            The edge type. Can be omitted if there is only one edge type.
+
+        Returns
+        -------
+        list[int]
+            The offsets, of length ``batch_size + 1``.
+        """
+        return self._edge_offsets[self._g.to_canonical_etype(etype)]
+
+    def split_nodes(self, feat, ntype=None):
+        """Split a node tensor of the batched graph into one tensor per graph.
+
+        Parameters
+        ----------
+        feat : Tensor
+            The tensor whose first dimension is the number of nodes of the
+            given type in the batched graph.
+        ntype : str, optional
+            The node type. Can be omitted if there is only one node type.
+
+        Returns
+        -------
+        list[Tensor]
+            The tensors of the graphs.
+        """
+        ntype = self._g.ntypes[self._g.get_ntype_id(ntype)]
+        return F.split(feat, self._num_nodes[ntype], 0)
+
+    def split_edges(self, feat, etype=None):
+        """Split an edge tensor of the batched graph into one tensor per
+        graph.
+
+        Parameters
+        ----------
+        feat : Tensor
+            The tensor whose first dimension is the number of edges of the
+            given type in the batched graph.
+        etype : str or (str, str, str), optional
+            The edge type. Can be omitted if there is only one edge type.
+
+        Returns
+        -------
+        list[Tensor]
+            The tensors of the graphs.
+        """
+        return F.split(
+            feat, self._num_edges[self._g.to_canonical_etype(etype)], 0
+        )
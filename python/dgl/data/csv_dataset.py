@@ -54,6 +54,30 @@ class CSVDataset(DGLDataset):
         A transform that takes in a :class:`~dgl.DGLGraph` object and returns
         a transformed version. The :class:`~dgl.DGLGraph` object will be
         transformed before every access.
+    ndata_columns : dict[str, list[str]] or list[str], optional
+        The node data columns to load. If given a dictionary, the key is node
+        type and the value is the list of columns of that node type. Other
+        columns except the ID fields are never parsed. Default: None, which
+        loads all the columns.
+    edata_columns : dict[(str, str, str), list[str]] or list[str], optional
+        The edge data columns to load, in the same form as
+        :attr:`ndata_columns`. Default: None, which loads all the columns.
+    gdata_columns : list[str], optional
+        The graph data columns to load. Default: None, which loads all the
+        columns.
+    chunk_size : int, optional
+        If given, stream each file in chunks of this many rows and apply the
+        data parsers chunk by chunk, which bounds the memory held by
+        ``pandas``. The data parsers must then parse rows independently.
+        Default: None, which reads each file whole.
+    num_workers : int, optional
+        The number of processes to parse each file with. Files are split at
+        line boundaries (row groups for Parquet), so quoted fields must not
+        contain line breaks. With more than one worker, the data parsers must
+        be picklable. Default: 1.
+
+    Files whose names end with ``.parquet`` are read as Parquet files, which
+    requires ``pyarrow``.
 
     Attributes
     ----------
@@ -79,6 +103,11 @@ class CSVDataset(DGLDataset):
         edata_parser=None,
         gdata_parser=None,
         transform=None,
+        ndata_columns=None,
+        edata_columns=None,
+        gdata_columns=None,
+        chunk_size=None,
+        num_workers=1,
     ):
         from .csv_dataset_base import (
             DefaultDataParser,
@@ -90,6 +119,11 @@ class CSVDataset(DGLDataset):
         self.ndata_parser = {} if ndata_parser is None else ndata_parser
         self.edata_parser = {} if edata_parser is None else edata_parser
         self.gdata_parser = gdata_parser
+        self.ndata_columns = ndata_columns
+        self.edata_columns = edata_columns
+        self.gdata_columns = gdata_columns
+        self.chunk_size = chunk_size
+        self.num_workers = num_workers
         self.default_data_parser = DefaultDataParser()
         meta_yaml_path = os.path.join(data_path, CSVDataset.META_YAML_NAME)
         if not os.path.exists(meta_yaml_path):
@@ -100,9 +134,11 @@ class CSVDataset(DGLDataset):
             )
         self.meta_yaml = load_yaml_with_sanity_check(meta_yaml_path)
         ds_name = self.meta_yaml.dataset_name
+        # Projections of the same data are cached separately.
         super().__init__(
             ds_name,
             raw_dir=os.path.dirname(meta_yaml_path),
+            hash_key=(ndata_columns, edata_columns, gdata_columns),
             force_reload=force_reload,
             verbose=verbose,
             transform=transform,
@@ -134,6 +170,9 @@ class CSVDataset(DGLDataset):
                 base_dir=base_dir,
                 separator=meta_yaml.separator,
                 data_parser=data_parser,
+                columns=self._get_columns(self.ndata_columns, ntype),
+                chunk_size=self.chunk_size,
+                num_workers=self.num_workers,
             )
             node_data.append(ndata)
         edge_data = []
@@ -151,6 +190,9 @@ class CSVDataset(DGLDataset):
                 base_dir=base_dir,
                 separator=meta_yaml.separator,
                 data_parser=data_parser,
+                columns=self._get_columns(self.edata_columns, etype),
+                chunk_size=self.chunk_size,
+                num_workers=self.num_workers,
             )
             edge_data.append(edata)
         graph_data = None
@@ -166,6 +208,9 @@ class CSVDataset(DGLDataset):
                 base_dir=base_dir,
                 separator=meta_yaml.separator,
                 data_parser=data_parser,
+                columns=self.gdata_columns,
+                chunk_size=self.chunk_size,
+                num_workers=self.num_workers,
             )
         # construct graphs
         self.graphs, self.data = DGLGraphConstructor.construct_graphs(
@@ -174,8 +219,21 @@ class CSVDataset(DGLDataset):
         if len(self.data) == 1:
             self.labels = list(self.data.values())[0]
 
+    @staticmethod
+    def _get_columns(columns, type_name):
+        """Get the projected columns of a node or edge type."""
+        if isinstance(columns, dict):
+            return columns.get(type_name)
+        return columns
+
+    def _cache_path(self):
+        """Path of the cached graphs of the dataset and its projection."""
+        return os.path.join(
+            self.save_path, "{}_{}.bin".format(self.name, self.hash)
+        )
+
     def has_cache(self):
-        graph_path = os.path.join(self.save_path, self.name + ".bin")
+        graph_path = self._cache_path()
         if os.path.exists(graph_path):
             return True
 
@@ -184,11 +242,11 @@ class CSVDataset(DGLDataset):
     def save(self):
         if self.graphs is None:
             raise DGLError("No graphs available in dataset")
-        graph_path = os.path.join(self.save_path, self.name + ".bin")
+        graph_path = self._cache_path()
         save_graphs(graph_path, self.graphs, labels=self.data)
 
     def load(self):
-        graph_path = os.path.join(self.save_path, self.name + ".bin")
+        graph_path = self._cache_path()
         self.graphs, self.data = load_graphs(graph_path)
         if len(self.data) == 1:
             self.labels = list(self.data.values())[0]
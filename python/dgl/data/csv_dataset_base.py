@@ -1,4 +1,6 @@
 import ast
+import io
+import multiprocessing as mp
 import os
 from typing import Callable, List, Optional
 
@@ -105,15 +107,150 @@ def _tensor(data, dtype=None):
     return ret
 
 
+class _RangeReader(io.RawIOBase):
+    """Read-only file object limited to the byte range [begin, end) of a
+    file. Internal use only."""
+
+    def __init__(self, path, begin, end):
+        super().__init__()
+        self._f = open(path, "rb")
+        self._f.seek(begin)
+        self._remaining = end - begin
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        size = min(len(b), self._remaining)
+        if size <= 0:
+            return 0
+        n = self._f.readinto(memoryview(b)[:size])
+        self._remaining -= n
+        return n
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def _split_csv(path, num_parts):
+    """Split the rows of a CSV file into at most ``num_parts`` byte ranges
+    aligned to line boundaries. The header line is excluded. Internal use
+    only."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.readline()
+        bounds = [f.tell()]
+        for i in range(1, num_parts):
+            pos = bounds[0] + (size - bounds[0]) * i // num_parts
+            if pos <= bounds[-1]:
+                continue
+            f.seek(pos - 1)
+            f.readline()
+            if bounds[-1] < f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _parse_frame(df, id_fields, data_parser):
+    """Pop the ID columns out of a data frame and parse the rest of it.
+    Internal use only."""
+    ids = {field: BaseData.pop_from_dataframe(df, field) for field in id_fields}
+    return ids, data_parser(df)
+
+
+def _concat_parsed(parts):
+    """Concatenate the results of :func:`_parse_frame` on consecutive chunks
+    of a file. Internal use only."""
+    if len(parts) == 1:
+        return parts[0]
+    ids = {
+        field: None
+        if parts[0][0][field] is None
+        else np.concatenate([np.atleast_1d(p[0][field]) for p in parts])
+        for field in parts[0][0]
+    }
+    data = {
+        key: np.concatenate([np.atleast_1d(p[1][key]) for p in parts])
+        for key in parts[0][1]
+    }
+    return ids, data
+
+
+def _parse_csv_range(args):
+    """Parse the rows of a CSV file within a byte range in chunks. Internal
+    use only."""
+    (
+        path,
+        begin,
+        end,
+        separator,
+        names,
+        usecols,
+        chunk_size,
+        id_fields,
+        data_parser,
+    ) = args
+    parts = []
+    with io.BufferedReader(_RangeReader(path, begin, end)) as f:
+        reader = pd.read_csv(
+            f,
+            sep=separator,
+            header=None,
+            names=names,
+            usecols=usecols,
+            chunksize=chunk_size,
+        )
+        for df in reader if chunk_size is not None else [reader]:
+            parts.append(_parse_frame(df, id_fields, data_parser))
+    if not parts:
+        return None
+    return _concat_parsed(parts)
+
+
+def _parse_parquet_row_groups(args):
+    """Parse the given row groups of a Parquet file in chunks. Internal use
+    only."""
+    path, row_groups, columns, chunk_size, id_fields, data_parser = args
+    import pyarrow.parquet as pq
+
+    parts = []
+    batches = pq.ParquetFile(path).iter_batches(
+        batch_size=chunk_size if chunk_size is not None else 65536,
+        row_groups=row_groups,
+        columns=columns,
+    )
+    for batch in batches:
+        parts.append(_parse_frame(batch.to_pandas(), id_fields, data_parser))
+    if not parts:
+        return None
+    return _concat_parsed(parts)
+
+
+def _map_ids(sorted_ids, ids, ntype):
+    """Map the original IDs to their ranks in the sorted unique IDs."""
+    new_ids = np.searchsorted(sorted_ids, ids)
+    valid = new_ids < len(sorted_ids)
+    valid[valid] = sorted_ids[new_ids[valid]] == ids[valid]
+    if not np.all(valid):
+        raise DGLError(
+            "Edges refer to the following nodes of type {} which do not exist: {}".format(
+                ntype, np.unique(ids[~valid])
+            )
+        )
+    return new_ids
+
+
 class BaseData:
     """Class of base data which is inherited by Node/Edge/GraphData. Internal use only."""
 
     @staticmethod
-    def read_csv(file_name, base_dir, separator):
+    def read_csv(file_name, base_dir, separator, usecols=None):
         csv_path = file_name
         if base_dir is not None:
             csv_path = os.path.join(base_dir, csv_path)
-        return pd.read_csv(csv_path, sep=separator)
+        return pd.read_csv(csv_path, sep=separator, usecols=usecols)
 
     @staticmethod
     def pop_from_dataframe(df: pd.DataFrame, item: str):
@@ -124,6 +261,94 @@ class BaseData:
             pass
         return ret
 
+    @staticmethod
+    def load_columns(
+        file_name,
+        base_dir,
+        separator,
+        id_fields,
+        data_parser,
+        columns=None,
+        chunk_size=None,
+        num_workers=1,
+    ):
+        """Read a CSV or Parquet file and parse it into ID arrays and data.
+
+        If ``columns`` is given, only the ID fields and these columns are
+        read. If ``chunk_size`` is given or ``num_workers`` is larger than 1,
+        the file is streamed in chunks of rows (row groups for Parquet) and
+        split across ``num_workers`` processes; ``data_parser`` is then
+        applied to each chunk and the results are concatenated, so it must be
+        row-wise and, with multiple workers, picklable.
+
+        Returns a dict of the ID arrays (``None`` for missing fields) and the
+        dict of parsed data.
+        """
+        path = file_name
+        if base_dir is not None:
+            path = os.path.join(base_dir, path)
+        is_parquet = path.endswith((".parquet", ".pq"))
+        if is_parquet:
+            import pyarrow.parquet as pq
+
+            names = pq.ParquetFile(path).schema_arrow.names
+        else:
+            names = list(pd.read_csv(path, sep=separator, nrows=0).columns)
+        usecols = None
+        if columns is not None:
+            keep = set(id_fields) | set(columns)
+            usecols = [name for name in names if name in keep]
+        if not is_parquet and chunk_size is None and num_workers <= 1:
+            df = BaseData.read_csv(path, None, separator, usecols=usecols)
+            return _parse_frame(df, id_fields, data_parser)
+
+        if is_parquet:
+            num_row_groups = pq.ParquetFile(path).num_row_groups
+            # Contiguous blocks of row groups keep the rows in order.
+            tasks = [
+                (
+                    path,
+                    row_groups.tolist(),
+                    usecols,
+                    chunk_size,
+                    id_fields,
+                    data_parser,
+                )
+                for row_groups in np.array_split(
+                    np.arange(num_row_groups), max(num_workers, 1)
+                )
+                if len(row_groups) > 0
+            ]
+            parse_fn = _parse_parquet_row_groups
+        else:
+            tasks = [
+                (
+                    path,
+                    begin,
+                    end,
+                    separator,
+                    names,
+                    usecols,
+                    chunk_size,
+                    id_fields,
+                    data_parser,
+                )
+                for begin, end in _split_csv(path, num_workers)
+                if begin < end
+            ]
+            parse_fn = _parse_csv_range
+        if num_workers > 1 and len(tasks) > 1:
+            with mp.get_context().Pool(min(num_workers, len(tasks))) as pool:
+                parts = pool.map(parse_fn, tasks)
+        else:
+            parts = [parse_fn(task) for task in tasks]
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            # No rows at all. Fall back to parsing the empty frame.
+            df = BaseData.read_csv(path, None, separator, usecols=usecols)
+            return _parse_frame(df, id_fields, data_parser)
+        return _concat_parsed(parts)
+
 
 class NodeData(BaseData):
     """Class of node data which is used for DGLGraph construction. Internal use only."""
@@ -143,11 +368,26 @@ class NodeData(BaseData):
 
     @staticmethod
     def load_from_csv(
-        meta: MetaNode, data_parser: Callable, base_dir=None, separator=","
+        meta: MetaNode,
+        data_parser: Callable,
+        base_dir=None,
+        separator=",",
+        columns=None,
+        chunk_size=None,
+        num_workers=1,
     ):
-        df = BaseData.read_csv(meta.file_name, base_dir, separator)
-        node_ids = BaseData.pop_from_dataframe(df, meta.node_id_field)
-        graph_ids = BaseData.pop_from_dataframe(df, meta.graph_id_field)
+        ids, ndata = BaseData.load_columns(
+            meta.file_name,
+            base_dir,
+            separator,
+            [meta.node_id_field, meta.graph_id_field],
+            data_parser,
+            columns=columns,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+        )
+        node_ids = ids[meta.node_id_field]
+        graph_ids = ids[meta.graph_id_field]
         if node_ids is None:
             raise DGLError(
                 "Missing node id field [{}] in file [{}].".format(
@@ -155,7 +395,6 @@ class NodeData(BaseData):
                 )
             )
         ntype = meta.ntype
-        ndata = data_parser(df)
         return NodeData(node_ids, ndata, type=ntype, graph_id=graph_ids)
 
     @staticmethod
@@ -179,9 +418,8 @@ class NodeData(BaseData):
                 if graph_id not in node_dict:
                     node_dict[graph_id] = {}
                 node_dict[graph_id][n_data.type] = {
-                    "mapping": {
-                        index: i for i, index in enumerate(ids[u_indices])
-                    },
+                    # Sorted unique IDs. The new ID of a node is its rank.
+                    "mapping": u_ids,
                     "data": {
                         k: _tensor(v[idx][u_indices])
                         for k, v in n_data.data.items()
@@ -213,26 +451,40 @@ class EdgeData(BaseData):
 
     @staticmethod
     def load_from_csv(
-        meta: MetaEdge, data_parser: Callable, base_dir=None, separator=","
+        meta: MetaEdge,
+        data_parser: Callable,
+        base_dir=None,
+        separator=",",
+        columns=None,
+        chunk_size=None,
+        num_workers=1,
     ):
-        df = BaseData.read_csv(meta.file_name, base_dir, separator)
-        src_ids = BaseData.pop_from_dataframe(df, meta.src_id_field)
+        ids, edata = BaseData.load_columns(
+            meta.file_name,
+            base_dir,
+            separator,
+            [meta.src_id_field, meta.dst_id_field, meta.graph_id_field],
+            data_parser,
+            columns=columns,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+        )
+        src_ids = ids[meta.src_id_field]
         if src_ids is None:
             raise DGLError(
                 "Missing src id field [{}] in file [{}].".format(
                     meta.src_id_field, meta.file_name
                 )
             )
-        dst_ids = BaseData.pop_from_dataframe(df, meta.dst_id_field)
+        dst_ids = ids[meta.dst_id_field]
         if dst_ids is None:
             raise DGLError(
                 "Missing dst id field [{}] in file [{}].".format(
                     meta.dst_id_field, meta.file_name
                 )
             )
-        graph_ids = BaseData.pop_from_dataframe(df, meta.graph_id_field)
+        graph_ids = ids[meta.graph_id_field]
         etype = tuple(meta.etype)
-        edata = data_parser(df)
         return EdgeData(src_ids, dst_ids, edata, type=etype, graph_id=graph_ids)
 
     @staticmethod
@@ -255,8 +507,8 @@ class EdgeData(BaseData):
                 orig_dst_ids = e_data.dst[idx].astype(
                     node_dict[graph_id][dst_type]["dtype"]
                 )
-                src_ids = [src_mapping[index] for index in orig_src_ids]
-                dst_ids = [dst_mapping[index] for index in orig_dst_ids]
+                src_ids = _map_ids(src_mapping, orig_src_ids, src_type)
+                dst_ids = _map_ids(dst_mapping, orig_dst_ids, dst_type)
                 if graph_id not in edge_dict:
                     edge_dict[graph_id] = {}
                 edge_dict[graph_id][e_data.type] = {
@@ -278,17 +530,31 @@ class GraphData(BaseData):
 
     @staticmethod
     def load_from_csv(
-        meta: MetaGraph, data_parser: Callable, base_dir=None, separator=","
+        meta: MetaGraph,
+        data_parser: Callable,
+        base_dir=None,
+        separator=",",
+        columns=None,
+        chunk_size=None,
+        num_workers=1,
     ):
-        df = BaseData.read_csv(meta.file_name, base_dir, separator)
-        graph_ids = BaseData.pop_from_dataframe(df, meta.graph_id_field)
+        ids, gdata = BaseData.load_columns(
+            meta.file_name,
+            base_dir,
+            separator,
+            [meta.graph_id_field],
+            data_parser,
+            columns=columns,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+        )
+        graph_ids = ids[meta.graph_id_field]
         if graph_ids is None:
             raise DGLError(
                 "Missing graph id field [{}] in file [{}].".format(
                     meta.graph_id_field, meta.file_name
                 )
             )
-        gdata = data_parser(df)
         return GraphData(graph_ids, gdata)
 
     @staticmethod
@@ -378,9 +644,52 @@ class DefaultDataParser:
             if "Unnamed" in header:
                 dgl_warning("Unamed column is found. Ignored...")
                 continue
-            dt = df[header].to_numpy().squeeze()
+            dt = df[header].to_numpy()
             if len(dt) > 0 and isinstance(dt[0], str):
                 # probably consists of list of numeric values
-                dt = np.array([ast.literal_eval(row) for row in dt])
+                dt = _parse_list_column(df[header])
+            elif len(dt) > 0 and isinstance(dt[0], (list, tuple, np.ndarray)):
+                # list-valued columns, e.g. read from parquet
+                dt = _stack_list_column(dt)
             data[header] = dt
         return data
+
+
+def _parse_list_column(column: pd.Series):
+    """Parse a column of strings holding numeric values into an array. Cells
+    that are lists of numeric values, e.g. ``"[0.1, 0.2]"`` or ``"0.1,0.2"``,
+    give a 2D array and scalar cells give a 1D array, the same as evaluating
+    each cell with ``ast.literal_eval``. Regular columns are converted all at
+    once and anything else falls back to evaluating row by row.
+    """
+    try:
+        cells = column.str.strip()
+        is_list = cells.str[:1].isin(["[", "("]) | cells.str.contains(",")
+        if not is_list.any():
+            return pd.to_numeric(cells).to_numpy()
+        # Nested lists keep their extra dimensions through literal_eval.
+        is_flat = cells.str.count(r"[\[\(]") <= 1
+        if is_list.all() and is_flat.all():
+            cells = cells.str.strip("[]() ").str.split(",", expand=True)
+            # Empty lists and trailing commas leave empty cells.
+            if not (cells.isnull() | (cells == "")).to_numpy().any():
+                return np.stack(
+                    [pd.to_numeric(cells[i]).to_numpy() for i in cells],
+                    axis=1,
+                )
+    except (ValueError, TypeError, AttributeError):
+        pass
+    return np.array([ast.literal_eval(row) for row in column])
+
+
+def _stack_list_column(column: np.ndarray):
+    """Stack a column whose cells are lists or arrays of numeric values, e.g.
+    a list column read from parquet, into an array with one row per cell.
+    Nested lists are stacked recursively."""
+    rows = [np.asarray(row) for row in column]
+    return np.stack(
+        [
+            _stack_list_column(row) if row.dtype == object else row
+            for row in rows
+        ]
+    )
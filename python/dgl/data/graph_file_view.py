@@ -0,0 +1,286 @@
+"""Memory-mapped graph file format (version 3) with random access by index.
+
+Layout of a version 3 file::
+
+    uint64  kDGLSerializeMagic
+    uint64  version (= 3)
+    uint64  number of graphs
+    uint64  offset of the graph index
+    uint64  offset of the label record
+    uint64  length of the label record
+    ...     tensor blobs, each aligned to 64 bytes
+    ...     one JSON record per graph describing its blobs
+    uint64  graph index, ``num_graphs + 1`` offsets of the JSON records
+    ...     JSON record of the labels
+
+All the integers are little-endian. A blob is described by its offset, numpy
+dtype string and shape so that it can be viewed in place from the memory
+mapped file without a copy.
+"""
+import json
+import os
+
+import numpy as np
+
+from .. import backend as F
+from ..base import DGLError
+from ..convert import heterograph as create_heterograph
+from ..heterograph import DGLGraph
+
+__all__ = ["GraphFileView"]
+
+_MAGIC = 0xDD2E4FF046B4A13F
+_VERSION = 3
+_ALIGNMENT = 64
+_HEADER = np.dtype(
+    [
+        ("magic", "<u8"),
+        ("version", "<u8"),
+        ("num_graphs", "<u8"),
+        ("index_offset", "<u8"),
+        ("label_offset", "<u8"),
+        ("label_length", "<u8"),
+    ]
+)
+
+
+class _BlobWriter(object):
+    """Append tensors to a file as 64-byte aligned blobs."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def pad(self):
+        """Pad the file to the next aligned offset."""
+        pos = self._f.tell()
+        padding = -pos % _ALIGNMENT
+        if padding:
+            self._f.write(b"\0" * padding)
+        return pos + padding
+
+    def write(self, tensor):
+        """Write a tensor and return its blob descriptor."""
+        arr = np.ascontiguousarray(F.asnumpy(tensor))
+        if arr.dtype.hasobject:
+            raise DGLError(
+                "Tensors of dtype {} cannot be saved.".format(arr.dtype)
+            )
+        offset = self.pad()
+        self._f.write(arr.tobytes())
+        return {
+            "offset": offset,
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+        }
+
+
+def save_graphs_v3(filename, g_list, labels=None):
+    """Save graphs and labels in the memory-mappable version 3 format.
+
+    Only the COO format of the graph structure is stored.
+    """
+    if isinstance(g_list, DGLGraph):
+        g_list = [g_list]
+    if labels is None:
+        labels = {}
+    with open(filename, "wb") as f:
+        f.write(np.zeros(1, dtype=_HEADER).tobytes())
+        writer = _BlobWriter(f)
+        records = []
+        for g in g_list:
+            if g.batch_size != 1:
+                raise DGLError(
+                    "Batched DGLGraph is not supported for serialization."
+                )
+            record = {
+                "idtype": "int32" if g.idtype == F.int32 else "int64",
+                "ntypes": g.ntypes,
+                "num_nodes": [g.num_nodes(ntype) for ntype in g.ntypes],
+                "etypes": [list(etype) for etype in g.canonical_etypes],
+                "edges": [],
+                "ndata": [],
+                "edata": [],
+            }
+            for ntype in g.ntypes:
+                record["ndata"].append(
+                    {k: writer.write(v) for k, v in g.nodes[ntype].data.items()}
+                )
+            for etype in g.canonical_etypes:
+                src, dst = g.edges(etype=etype)
+                record["edges"].append([writer.write(src), writer.write(dst)])
+                record["edata"].append(
+                    {k: writer.write(v) for k, v in g.edges[etype].data.items()}
+                )
+            records.append(record)
+        label_record = {k: writer.write(v) for k, v in labels.items()}
+
+        index = [writer.pad()]
+        for record in records:
+            f.write(json.dumps(record).encode("utf-8"))
+            index.append(f.tell())
+        index_offset = writer.pad()
+        f.write(np.asarray(index, dtype="<u8").tobytes())
+        label_bytes = json.dumps(label_record).encode("utf-8")
+        label_offset = f.tell()
+        f.write(label_bytes)
+
+        header = np.zeros(1, dtype=_HEADER)
+        header["magic"] = _MAGIC
+        header["version"] = _VERSION
+        header["num_graphs"] = len(records)
+        header["index_offset"] = index_offset
+        header["label_offset"] = label_offset
+        header["label_length"] = len(label_bytes)
+        f.seek(0)
+        f.write(header.tobytes())
+
+
+class GraphFileView(object):
+    """Random-access view of a graph file saved by :func:`dgl.save_graphs`
+    with ``version=3``.
+
+    The file is memory-mapped instead of read. Indexing the view builds only
+    the requested graph, and its node and edge features are zero-copy views
+    of the mapped file. Since the pages are backed by the file, processes
+    opening the same file (e.g., dataloader workers) share the page cache
+    instead of each holding a copy of the dataset. Features are mapped
+    copy-on-write, so modifying them in place never touches the file.
+
+    The view can be pickled, in which case the file is re-mapped lazily in
+    the receiving process.
+
+    Parameters
+    ----------
+    filename : str
+        The local file to open.
+
+    Examples
+    --------
+    >>> dgl.save_graphs("./data.bin", g_list, {"glabel": labels}, version=3)
+    >>> view = dgl.data.utils.GraphFileView("./data.bin")
+    >>> len(view)
+    1000
+    >>> g = view[10]
+    >>> label = view.labels["glabel"][10]
+    """
+
+    def __init__(self, filename):
+        if not os.path.isfile(filename):
+            raise DGLError("File {} does not exist.".format(filename))
+        self._filename = filename
+        self._buf = None
+        self._index = None
+        self._labels = None
+        header = np.fromfile(filename, dtype=_HEADER, count=1)
+        if header.shape[0] != 1 or int(header["magic"][0]) != _MAGIC:
+            raise DGLError("Invalid DGL file {}.".format(filename))
+        if int(header["version"][0]) != _VERSION:
+            raise DGLError(
+                "GraphFileView requires a version {} file, got version {}. "
+                "Save the graphs again with dgl.save_graphs(..., "
+                "version=3).".format(_VERSION, int(header["version"][0]))
+            )
+        self._header = header[0]
+
+    def _mmap(self):
+        if self._buf is None:
+            # Copy-on-write so that the features are writable tensors whose
+            # untouched pages stay shared with the page cache.
+            self._buf = np.memmap(self._filename, dtype=np.uint8, mode="c")
+            num_graphs = int(self._header["num_graphs"])
+            offset = int(self._header["index_offset"])
+            self._index = self._buf[
+                offset : offset + 8 * (num_graphs + 1)
+            ].view("<u8")
+        return self._buf
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_buf"] = None
+        state["_index"] = None
+        state["_labels"] = None
+        return state
+
+    def _blob(self, desc):
+        buf = self._mmap()
+        dtype = np.dtype(desc["dtype"])
+        shape = tuple(desc["shape"])
+        nbytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        offset = desc["offset"]
+        arr = buf[offset : offset + nbytes].view(dtype).reshape(shape)
+        return F.zerocopy_from_numpy(arr)
+
+    def _record(self, idx):
+        buf = self._mmap()
+        begin, end = int(self._index[idx]), int(self._index[idx + 1])
+        return json.loads(buf[begin:end].tobytes().decode("utf-8"))
+
+    def __len__(self):
+        return int(self._header["num_graphs"])
+
+    def __getitem__(self, idx):
+        """Get the graph of the given index, or the list of graphs of the
+        given indices."""
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if not np.isscalar(idx) and not (F.is_tensor(idx) and F.ndim(idx) == 0):
+            return [self[int(i)] for i in idx]
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError(
+                "Graph index {} out of range for {} graphs.".format(
+                    idx, len(self)
+                )
+            )
+        record = self._record(idx)
+        idtype = getattr(F, record["idtype"])
+        data_dict = {
+            tuple(etype): (self._blob(src), self._blob(dst))
+            for etype, (src, dst) in zip(record["etypes"], record["edges"])
+        }
+        g = create_heterograph(
+            data_dict,
+            num_nodes_dict=dict(zip(record["ntypes"], record["num_nodes"])),
+            idtype=idtype,
+        )
+        for ntype, ndata in zip(record["ntypes"], record["ndata"]):
+            for k, desc in ndata.items():
+                g.nodes[ntype].data[k] = self._blob(desc)
+        for etype, edata in zip(record["etypes"], record["edata"]):
+            for k, desc in edata.items():
+                g.edges[tuple(etype)].data[k] = self._blob(desc)
+        return g
+
+    @property
+    def labels(self):
+        """The graph labels stored in the file, as zero-copy views.
+
+        Returns
+        -------
+        dict[str, Tensor]
+            The labels. The dictionary is empty if no label is stored.
+        """
+        if self._labels is None:
+            buf = self._mmap()
+            offset = int(self._header["label_offset"])
+            length = int(self._header["label_length"])
+            record = json.loads(
+                buf[offset : offset + length].tobytes().decode("utf-8")
+            )
+            self._labels = {k: self._blob(v) for k, v in record.items()}
+        return self._labels
+
+
+def load_graph_v3(filename, idx_list=None):
+    """Internal functions for loading DGLGraphs from the version 3 format."""
+    view = GraphFileView(filename)
+    if idx_list is None:
+        idx_list = range(len(view))
+    return [view[i] for i in idx_list], dict(view.labels)
+
+
+def load_labels_v3(filename):
+    """Internal functions for loading labels from the version 3 format."""
+    return dict(GraphFileView(filename).labels)
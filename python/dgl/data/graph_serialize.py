@@ -8,6 +8,7 @@ from .._ffi.function import _init_api
 from .._ffi.object import ObjectBase, register_object
 from ..base import dgl_warning, DGLError
 from ..heterograph import DGLGraph
+from .graph_file_view import load_graph_v3, load_labels_v3, save_graphs_v3
 from .heterograph_serialize import save_heterographs
 
 _init_api("dgl.data.graph_serialize")
@@ -80,7 +81,7 @@ class GraphData(ObjectBase):
         return g
 
 
-def save_graphs(filename, g_list, labels=None, formats=None):
+def save_graphs(filename, g_list, labels=None, formats=None, version=2):
     r"""Save graphs and optionally their labels to file.
 
     Besides saving to local files, DGL supports writing the graphs directly
@@ -105,6 +106,13 @@ def save_graphs(filename, g_list, labels=None, formats=None):
         only according to what format is available. If multiple formats
         are available, selection priority from high to low is ``coo``,
         ``csc``, ``csr``.
+    version: int, optional
+        The file format version. Version 2 (default) is DGL's binary format.
+        Version 3 stores the graphs with an offset index and 64-byte aligned
+        tensor blobs, so that the file can be memory-mapped and accessed by
+        graph index with :class:`~dgl.data.utils.GraphFileView`. Version 3 only
+        supports local files, stores the graph structure in COO format and
+        ignores :attr:`formats`.
 
     Examples
     ----------
@@ -127,6 +135,7 @@ def save_graphs(filename, g_list, labels=None, formats=None):
     See Also
     --------
     load_graphs
+    GraphFileView
     """
     # if it is local file, do some sanity check
     if is_local_path(filename):
@@ -137,9 +146,16 @@ def save_graphs(filename, g_list, labels=None, formats=None):
         f_path = os.path.dirname(filename)
         if f_path and not os.path.exists(f_path):
             os.makedirs(f_path)
+    if version not in (2, 3):
+        raise DGLError("Unsupported DGL file version {}.".format(version))
+    if version == 3 and not is_local_path(filename):
+        raise DGLError("Version 3 files can only be saved to local paths.")
     g_sample = g_list[0] if isinstance(g_list, list) else g_list
     if type(g_sample) == DGLGraph:  # Doesn't support DGLGraph's derived class
-        save_heterographs(filename, g_list, labels, formats)
+        if version == 3:
+            save_graphs_v3(filename, g_list, labels)
+        else:
+            save_heterographs(filename, g_list, labels, formats)
     else:
         raise DGLError(
             "Invalid argument g_list. Must be a DGLGraph or a list of DGLGraphs."
@@ -178,21 +194,28 @@ def load_graphs(filename, idx_list=None):
     >>> glist, label_dict = load_graphs("./data.bin") # glist will be [g1, g2]
     >>> glist, label_dict = load_graphs("./data.bin", [0]) # glist will be [g1]
 
+    For files saved with ``version=3``, the node and edge features of the
+    returned graphs are zero-copy views of the memory-mapped file. Use
+    :class:`~dgl.data.utils.GraphFileView` to access the graphs lazily by index.
+
     See Also
     --------
     save_graphs
+    GraphFileView
     """
     # if it is local file, do some sanity check
     check_local_file_exists(filename)
     version = _CAPI_GetFileVersion(filename)
     if version == 1:
         dgl_warning(
-            "You are loading a graph file saved by old version of dgl.  \
+            "You are loading a graph file saved by old version of dgl.  \
             Please consider saving it again with the current format."
         )
         return load_graph_v1(filename, idx_list)
     elif version == 2:
         return load_graph_v2(filename, idx_list)
+    elif version == 3:
+        return load_graph_v3(filename, idx_list)
     else:
         raise DGLError("Invalid DGL Version Number.")
 
@@ -250,6 +273,8 @@ def load_labels(filename):
         return load_labels_v1(filename)
     elif version == 2:
         return load_labels_v2(filename)
+    elif version == 3:
+        return load_labels_v3(filename)
     else:
         raise Exception("Invalid DGL Version Number")
 
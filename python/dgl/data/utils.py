@@ -14,6 +14,7 @@ import numpy as np
 import requests
 
 from .. import backend as F
+from .graph_file_view import GraphFileView
 from .graph_serialize import load_graphs, load_labels, save_graphs
 from .tensor_serialize import load_tensors, save_tensors
 
@@ -28,6 +29,7 @@ __all__ = [
     "save_graphs",
     "load_graphs",
     "load_labels",
+    "GraphFileView",
     "save_tensors",
     "load_tensors",
     "add_nodepred_split",
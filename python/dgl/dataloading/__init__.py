@@ -11,3 +11,5 @@ from .shadow import *
 if F.get_preferred_backend() == "pytorch":
     from .dataloader import *
     from .dist_dataloader import *
+    from .packed_graph import *
+    from .skipgram import *
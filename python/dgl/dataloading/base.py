@@ -8,6 +8,7 @@ from ..convert import heterograph
 from ..frame import LazyFeature
 from ..transforms import compact_graphs
 from ..utils import context_of, recursive_apply
+from .negative_sampler import SharedNegatives
 
 
 def _set_lazy_features(x, xdata, feature_names):
@@ -443,6 +444,36 @@ class EdgePredictionSampler(Sampler):
         )
         return neg_pair_graph
 
+    def _compact_with_shared_negatives(self, g, pair_graph, seed_edges):
+        """Compact the pair graph while keeping the shared negative nodes.
+
+        Returns the compacted pair graph and the IDs of the negative nodes
+        within it.
+        """
+        neg_dst = self.negative_sampler.sample_shared(g, seed_edges)
+        is_dict = isinstance(neg_dst, Mapping)
+        if not is_dict:
+            neg_dst = {g.canonical_etypes[0]: neg_dst}
+        ctx = pair_graph.device
+        neg_dst = {k: F.copy_to(v, ctx) for k, v in neg_dst.items()}
+        # Several edge types may corrupt the same node type.
+        etypes_of = {}
+        for etype in neg_dst:
+            etypes_of.setdefault(etype[2], []).append(etype)
+        preserve = {}
+        local_neg_dst = {}
+        for ntype, etypes in etypes_of.items():
+            nodes = F.cat([neg_dst[etype] for etype in etypes], 0)
+            preserve[ntype], inverse = F.unique(nodes, return_inverse=True)
+            sizes = [len(neg_dst[etype]) for etype in etypes]
+            local_neg_dst.update(zip(etypes, F.split(inverse, sizes, 0)))
+        # The preserved nodes come first in the compacted graph, so the
+        # inverse indices of the unique negatives are also their local IDs.
+        pair_graph = compact_graphs(pair_graph, always_preserve=preserve)
+        if not is_dict:
+            local_neg_dst = local_neg_dst[g.canonical_etypes[0]]
+        return pair_graph, local_neg_dst
+
     def assign_lazy_features(self, result):
         """Assign lazy features for prefetching."""
         pair_graph = result[1]
@@ -455,7 +486,10 @@ class EdgePredictionSampler(Sampler):
         edges from the original graph.
 
         If :attr:`negative_sampler` is given, also returns another graph containing the
-        negative pairs as edges.
+        negative pairs as edges.  If it is a
+        :class:`~dgl.dataloading.negative_sampler.SharedNegatives`, returns the IDs
+        of the shared negative destination nodes in the positive pair graph
+        instead.
         """
         if isinstance(seed_edges, Mapping):
             seed_edges = {
@@ -467,7 +501,11 @@ class EdgePredictionSampler(Sampler):
         )
         eids = pair_graph.edata[EID]
 
-        if self.negative_sampler is not None:
+        if isinstance(self.negative_sampler, SharedNegatives):
+            pair_graph, neg_graph = self._compact_with_shared_negatives(
+                g, pair_graph, seed_edges
+            )
+        elif self.negative_sampler is not None:
             neg_graph = self._build_neg_graph(g, seed_edges)
             pair_graph, neg_graph = compact_graphs([pair_graph, neg_graph])
         else:
@@ -563,6 +601,12 @@ def as_edge_prediction_sampler(
         The mapping from the original edge types to their reverse edge types.
     negative_sampler : callable, optional
         The negative sampler.
+
+        If it is a :class:`~dgl.dataloading.negative_sampler.SharedNegatives`,
+        the sampler yields, in place of the negative graph, the IDs of the
+        negative destination nodes in the positive pair graph, or a dictionary
+        of edge types and such IDs.  They are shared by all the edges of the
+        same type in the minibatch.
     prefetch_labels : list[str] or dict[etype, list[str]], optional
         The edge labels to prefetch for the returned positive pair graph.
 
@@ -612,6 +656,24 @@ def as_edge_prediction_sampler(
     >>> for input_nodes, pos_pair_graph, neg_pair_graph, blocks in dataloader:
     ...     train_on(input_nodes, pair_graph, neg_pair_graph, blocks)
 
+    With :class:`~dgl.dataloading.negative_sampler.SharedNegatives`, the edges in
+    a minibatch share the same negative nodes, which are scored against the
+    source node of every edge as a dense matrix:
+
+    >>> neg_sampler = dgl.dataloading.negative_sampler.SharedNegatives(1000)
+    >>> sampler = dgl.dataloading.as_edge_prediction_sampler(
+    ...     dgl.dataloading.NeighborSampler([15, 10, 5]),
+    ...     exclude='reverse_id', reverse_eids=reverse_eids,
+    ...     negative_sampler=neg_sampler)
+    >>> dataloader = dgl.dataloading.DataLoader(
+    ...     g, train_eid, sampler,
+    ...     batch_size=1024, shuffle=True, drop_last=False, num_workers=4)
+    >>> for input_nodes, pair_graph, neg_dst, blocks in dataloader:
+    ...     h = model(blocks, blocks[0].srcdata['feat'])
+    ...     src, dst = pair_graph.edges()
+    ...     pos_score = (h[src] * h[dst]).sum(1)      # (B,)
+    ...     neg_score = h[src] @ h[neg_dst].T         # (B, k)
+
     For heterogeneous graphs, reverse edges may belong to a different relation. For example,
     the relations "user-click-item" and "item-click-by-user" in the graph below are
     mutual reverse.
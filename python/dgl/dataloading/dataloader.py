@@ -34,6 +34,7 @@ from ..utils import (
     recursive_apply_pair,
     set_num_threads,
 )
+from .packed_graph import PackedGraphDataset
 
 PYTHON_EXIT_STATUS = False
 
@@ -1305,6 +1306,10 @@ class GraphCollator(object):
         raise TypeError(self.graph_collate_err_msg_format.format(elem_type))
 
 
+def _identity(x):
+    return x
+
+
 class GraphDataLoader(torch.utils.data.DataLoader):
     """Batched graph data loader.
 
@@ -1314,7 +1319,10 @@ class GraphDataLoader(torch.utils.data.DataLoader):
     Parameters
     ----------
     dataset : torch.utils.data.Dataset
-        The dataset to load graphs from.
+        The dataset to load graphs from. If it is a
+        :class:`~dgl.dataloading.PackedGraphDataset`, each minibatch is
+        collated by :meth:`~dgl.dataloading.PackedGraphDataset.collate`
+        directly instead of batching the graphs one by one.
     collate_fn : Function, default is None
         The customized collate function. Will use the default collate
         function if not given.
@@ -1380,7 +1388,30 @@ class GraphDataLoader(torch.utils.data.DataLoader):
             )
             dataloader_kwargs["sampler"] = self.dist_sampler
 
-        if collate_fn is None and kwargs.get("batch_size", 1) is not None:
+        batch_size = kwargs.get("batch_size", 1)
+        if (
+            isinstance(dataset, PackedGraphDataset)
+            and collate_fn is None
+            and batch_size is not None
+        ):
+            # Fetch the whole minibatch with one indexing call so that the
+            # packed dataset can collate it in a vectorized way.
+            sampler = dataloader_kwargs.pop("sampler", None)
+            if sampler is None:
+                if dataloader_kwargs.pop("shuffle", False):
+                    sampler = torch.utils.data.RandomSampler(dataset)
+                else:
+                    sampler = torch.utils.data.SequentialSampler(dataset)
+            else:
+                dataloader_kwargs.pop("shuffle", None)
+            dataloader_kwargs["sampler"] = torch.utils.data.BatchSampler(
+                sampler,
+                dataloader_kwargs.pop("batch_size", 1),
+                dataloader_kwargs.pop("drop_last", False),
+            )
+            dataloader_kwargs["batch_size"] = None
+            collate_fn = _identity
+        elif collate_fn is None and batch_size is not None:
             collate_fn = GraphCollator(**collator_kwargs).collate
 
         super().__init__(
@@ -1,6 +1,9 @@
 """Negative samplers"""
+import weakref
 from collections.abc import Mapping
 
+import numpy as np
+
 from .. import backend as F
 
 
@@ -124,3 +127,110 @@ class GlobalUniform(_BaseNegativeSampler):
             self.replace,
             canonical_etype,
         )
+
+
+class SharedNegatives(_BaseNegativeSampler):
+    """Negative sampler that draws one set of negative destination nodes
+    shared by all the edges in a minibatch.
+
+    For each edge type ``(srctype, etype, dsttype)`` in the minibatch, DGL draws
+    :attr:`k` nodes ``v'`` of type ``dsttype``, with a probability proportional
+    to their in-degree to the power of :attr:`power`.  Every edge ``(u, v)`` is
+    then corrupted into the :attr:`k` negative edges ``(u, v')``.  This is the
+    common trick in knowledge graph embedding to score a minibatch of
+    ``B`` edges against a dense ``B x k`` matrix of negatives.
+
+    The sampling distribution is stored as a table of node IDs in which each
+    node appears a number of times proportional to its probability.  The table
+    is built once per graph and edge type, and drawing the negatives only
+    indexes it at random.
+
+    Called directly, the sampler returns ``B * k`` source-destination pairs
+    like the other negative samplers.  When given to
+    :func:`~dgl.dataloading.as_edge_prediction_sampler`, the sampler does not
+    build a negative graph at all.  Instead, it yields the IDs of the shared
+    negative nodes within the positive pair graph in its place.
+
+    Parameters
+    ----------
+    k : int
+        The number of negative nodes per minibatch and edge type.
+    power : float, optional
+        The exponent of the in-degrees.  0 means a uniform distribution.
+        (Default: 0.75)
+    table_size : int, optional
+        The number of entries of the sampling table.  A larger table
+        approximates the distribution more closely.  (Default: 1000000)
+
+    Examples
+    --------
+    >>> g = dgl.graph(([0, 1, 2], [1, 2, 3]))
+    >>> neg_sampler = dgl.dataloading.negative_sampler.SharedNegatives(2)
+    >>> neg_sampler(g, torch.tensor([0, 1]))
+    (tensor([0, 0, 1, 1]), tensor([3, 1, 3, 1]))
+    >>> neg_sampler.sample_shared(g, torch.tensor([0, 1]))
+    tensor([2, 2])
+    """
+
+    def __init__(self, k, power=0.75, table_size=1000000):
+        self.k = k
+        self.power = power
+        self.table_size = table_size
+        self._tables = weakref.WeakKeyDictionary()
+
+    def _get_table(self, g, canonical_etype):
+        """Get the sampling table of the destination nodes of an edge type."""
+        tables = self._tables.setdefault(g, {})
+        entry = tables.get(canonical_etype)
+        if entry is None or entry[0] is not g._graph:
+            deg = F.asnumpy(g.in_degrees(etype=canonical_etype))
+            weights = deg.astype(np.float64) ** self.power
+            if weights.sum() == 0:
+                weights = np.ones_like(weights)
+            counts = np.round(weights / weights.sum() * self.table_size)
+            table = np.repeat(np.arange(len(weights)), counts.astype(np.int64))
+            if len(table) == 0:
+                table = np.arange(len(weights))
+            table = F.copy_to(F.tensor(table, g.idtype), g.device)
+            entry = (g._graph, table)
+            tables[canonical_etype] = entry
+        return entry[1]
+
+    def _draw(self, g, canonical_etype, ctx):
+        table = self._get_table(g, canonical_etype)
+        idx = F.randint((self.k,), F.int64, F.context(table), 0, len(table))
+        return F.copy_to(F.gather_row(table, idx), ctx)
+
+    def _generate(self, g, eids, canonical_etype):
+        src, _ = g.find_edges(eids, etype=canonical_etype)
+        neg = self._draw(g, canonical_etype, F.context(src))
+        src = F.repeat(src, self.k, 0)
+        idx = F.arange(0, len(eids) * self.k, F.int64, F.context(neg)) % self.k
+        return src, F.gather_row(neg, idx)
+
+    def sample_shared(self, g, eids):
+        """Returns the shared negative destination nodes.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The graph.
+        eids : Tensor or dict[etype, Tensor]
+            The sampled edges in the minibatch.
+
+        Returns
+        -------
+        Tensor or dict[etype, Tensor]
+            The :attr:`k` negative destination nodes of each edge type.
+        """
+        if isinstance(eids, Mapping):
+            return {
+                g.to_canonical_etype(k): self._draw(
+                    g, g.to_canonical_etype(k), F.context(v)
+                )
+                for k, v in eids.items()
+            }
+        assert (
+            len(g.canonical_etypes) == 1
+        ), "please specify a dict of etypes and ids for graphs with multiple edge types"
+        return self._draw(g, g.canonical_etypes[0], F.context(eids))
@@ -0,0 +1,201 @@
+"""Packed storage of many small graphs for graph-level minibatch training."""
+from collections.abc import Mapping
+
+import torch
+
+from .. import backend as F
+from ..base import DGLError
+from ..batch import batch as batch_graphs
+from ..convert import graph as create_graph
+
+__all__ = ["PackedGraphDataset"]
+
+
+def _gather_ranges(starts, lengths):
+    """Return the concatenation of ``arange(s, s + l)`` for all the given
+    starts and lengths without a Python loop."""
+    total = int(lengths.sum())
+    if total == 0:
+        return torch.zeros(0, dtype=starts.dtype, device=starts.device)
+    # Offset of each range in the output.
+    out_offsets = torch.cumsum(lengths, 0) - lengths
+    base = torch.repeat_interleave(starts - out_offsets, lengths)
+    return base + torch.arange(total, dtype=starts.dtype, device=starts.device)
+
+
+class PackedGraphDataset(torch.utils.data.Dataset):
+    """A dataset of many small homogeneous graphs packed into one set of
+    concatenated tensors.
+
+    The edges of all the graphs are stored as a single concatenated COO with
+    node and edge offset arrays, and the node and edge features are stored
+    column-wise, one concatenated tensor per feature. A minibatch of graphs is
+    then produced by vectorized offset slicing and node ID re-basing, instead
+    of calling :func:`dgl.batch` on many per-graph objects. This makes
+    collation cost independent of the number of graphs in a minibatch, which
+    matters for datasets with millions of tiny graphs such as molecules.
+
+    :class:`~dgl.dataloading.GraphDataLoader` accepts this dataset directly
+    and fetches each minibatch with a single :meth:`collate` call. Indexing the
+    dataset with an integer returns a graph, or a tuple of a graph and its
+    graph-level data if :attr:`graph_data` is given; indexing it with a list
+    or tensor of indices returns the batched graph of those graphs.
+
+    Parameters
+    ----------
+    src : Tensor
+        The source node of each edge, relative to the first node of its graph.
+    dst : Tensor
+        The destination node of each edge, relative to the first node of its
+        graph.
+    node_offsets : Tensor
+        The first node of each graph, of length ``num_graphs + 1``.
+    edge_offsets : Tensor
+        The first edge of each graph, of length ``num_graphs + 1``.
+    ndata : dict[str, Tensor], optional
+        The concatenated node features.
+    edata : dict[str, Tensor], optional
+        The concatenated edge features.
+    graph_data : Tensor or dict[str, Tensor], optional
+        The graph-level data (e.g., labels), whose first dimension is the
+        number of graphs.
+
+    Examples
+    --------
+    >>> dataset = dgl.data.GINDataset('MUTAG', self_loop=False)
+    >>> graphs, labels = zip(*dataset)
+    >>> packed = dgl.dataloading.PackedGraphDataset.from_graphs(
+    ...     graphs, torch.stack(labels))
+    >>> dataloader = dgl.dataloading.GraphDataLoader(
+    ...     packed, batch_size=1024, shuffle=True)
+    >>> for batched_graph, labels in dataloader:
+    ...     train_on(batched_graph, labels)
+    """
+
+    def __init__(
+        self,
+        src,
+        dst,
+        node_offsets,
+        edge_offsets,
+        ndata=None,
+        edata=None,
+        graph_data=None,
+    ):
+        if node_offsets.shape[0] != edge_offsets.shape[0]:
+            raise DGLError(
+                "node_offsets and edge_offsets must have the same length."
+            )
+        if src.shape[0] != dst.shape[0] or src.shape[0] != int(
+            edge_offsets[-1]
+        ):
+            raise DGLError(
+                "The number of edges does not match edge_offsets[-1]."
+            )
+        self.src = src
+        self.dst = dst
+        self.node_offsets = node_offsets.long()
+        self.edge_offsets = edge_offsets.long()
+        self.ndata = ndata or {}
+        self.edata = edata or {}
+        self.graph_data = graph_data
+
+    @classmethod
+    def from_graphs(cls, graphs, graph_data=None):
+        """Pack a list of homogeneous graphs and their features.
+
+        Parameters
+        ----------
+        graphs : list[DGLGraph]
+            The graphs to pack. They must have the same node and edge feature
+            schemes.
+        graph_data : Tensor or dict[str, Tensor], optional
+            The graph-level data of the graphs.
+
+        Returns
+        -------
+        PackedGraphDataset
+            The packed dataset.
+        """
+        bg = batch_graphs(list(graphs))
+        if not bg.is_homogeneous:
+            raise DGLError("Only homogeneous graphs are supported.")
+        zero = torch.zeros(1, dtype=torch.int64)
+        node_offsets = torch.cat(
+            [zero, torch.cumsum(F.copy_to(bg.batch_num_nodes(), F.cpu()), 0)]
+        )
+        edge_offsets = torch.cat(
+            [zero, torch.cumsum(F.copy_to(bg.batch_num_edges(), F.cpu()), 0)]
+        )
+        src, dst = bg.edges()
+        # Store the edges relative to the first node of their graphs.
+        edge_graph = torch.repeat_interleave(
+            torch.arange(len(graphs)), F.copy_to(bg.batch_num_edges(), F.cpu())
+        )
+        base = node_offsets[edge_graph].to(src.dtype)
+        return cls(
+            src - base,
+            dst - base,
+            node_offsets,
+            edge_offsets,
+            ndata=dict(bg.ndata),
+            edata=dict(bg.edata),
+            graph_data=graph_data,
+        )
+
+    def __len__(self):
+        return self.node_offsets.shape[0] - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (list, tuple)) or (
+            torch.is_tensor(idx) and idx.dim() > 0
+        ):
+            return self.collate(idx)
+        return self.collate([int(idx)])
+
+    def collate(self, indices):
+        """Build the batched graph of the given graphs and stack their
+        graph-level data.
+
+        Parameters
+        ----------
+        indices : list[int] or Tensor
+            The indices of the graphs in the minibatch.
+
+        Returns
+        -------
+        DGLGraph or tuple[DGLGraph, Tensor or dict[str, Tensor]]
+            The batched graph, together with the graph-level data if any.
+        """
+        indices = torch.as_tensor(indices, dtype=torch.int64)
+        node_starts = self.node_offsets[indices]
+        edge_starts = self.edge_offsets[indices]
+        num_nodes = self.node_offsets[indices + 1] - node_starts
+        num_edges = self.edge_offsets[indices + 1] - edge_starts
+
+        nids = _gather_ranges(node_starts, num_nodes)
+        eids = _gather_ranges(edge_starts, num_edges)
+        # Re-base the relative node IDs to the nodes of the batched graph.
+        new_node_starts = torch.cumsum(num_nodes, 0) - num_nodes
+        base = torch.repeat_interleave(new_node_starts, num_edges).to(
+            self.src.dtype
+        )
+        g = create_graph(
+            (self.src[eids] + base, self.dst[eids] + base),
+            num_nodes=int(num_nodes.sum()),
+        )
+        g.set_batch_num_nodes(F.astype(num_nodes, g.idtype))
+        g.set_batch_num_edges(F.astype(num_edges, g.idtype))
+        for key, feat in self.ndata.items():
+            g.ndata[key] = feat[nids.to(feat.device)]
+        for key, feat in self.edata.items():
+            g.edata[key] = feat[eids.to(feat.device)]
+
+        if self.graph_data is None:
+            return g
+        if isinstance(self.graph_data, Mapping):
+            return g, {
+                key: data[indices.to(data.device)]
+                for key, data in self.graph_data.items()
+            }
+        return g, self.graph_data[indices.to(self.graph_data.device)]
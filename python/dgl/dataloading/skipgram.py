@@ -0,0 +1,430 @@
+"""Streaming skip-gram corpus from random walks for network embedding."""
+import threading
+from collections import deque
+from queue import Empty, Queue
+
+import torch
+
+from .. import backend as F
+from ..base import DGLError
+from ..sampling import node2vec_random_walk, random_walk
+from ..utils import ExceptionWrapper
+from .dataloader import _put_if_event_not_set
+
+__all__ = ["SkipGramDataLoader"]
+
+# Marks the end of the blocks produced by a walker thread.
+_WALKER_DONE = object()
+
+
+def _skip_gram_pairs(traces, window_size, keep, dynamic_window, generator):
+    """Build the shuffled (center, context) pairs of a batch of random walks.
+
+    ``keep`` is a boolean mask of the walk positions that are neither padding
+    nor subsampled away.
+    """
+    length = traces.shape[1]
+    if dynamic_window:
+        # Each center only looks at a window of size uniformly drawn from
+        # [1, window_size], as in word2vec.
+        reduced = torch.randint(
+            1, window_size + 1, traces.shape, generator=generator
+        )
+    centers, contexts = [], []
+    for d in range(1, min(window_size, length - 1) + 1):
+        mask = keep[:, :-d] & keep[:, d:]
+        fwd, bwd = mask, mask
+        if dynamic_window:
+            fwd = mask & (reduced[:, :-d] >= d)
+            bwd = mask & (reduced[:, d:] >= d)
+        centers += [traces[:, :-d][fwd], traces[:, d:][bwd]]
+        contexts += [traces[:, d:][fwd], traces[:, :-d][bwd]]
+    centers = torch.cat(centers)
+    contexts = torch.cat(contexts)
+    perm = torch.randperm(centers.shape[0], generator=generator)
+    return centers[perm], contexts[perm]
+
+
+class SkipGramDataLoader(object):
+    r"""Streaming loader of skip-gram training pairs from random walks, for
+    network embedding models such as :class:`~dgl.nn.pytorch.DeepWalk`.
+
+    Random walks are generated by background threads, which also turn them
+    into (center, context) pairs.  The pairs are packed with their negative
+    samples into a fixed set of reusable (and optionally pinned) buffers, so
+    walk generation and pair building overlap with the embedding update in the
+    training loop.
+
+    Iterating over the loader once runs :attr:`walks_per_node` walks from every
+    node in a random order and yields minibatches of ``(center, context,
+    negatives)`` tensors of shapes ``(batch_size,)``, ``(batch_size,)`` and
+    ``(batch_size, negative_size)``.  The last minibatch may be smaller.
+
+    The buffers of a minibatch are reused after two more minibatches are
+    fetched; clone the tensors if they must live longer than that.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The homogeneous graph on CPU.
+    batch_size : int
+        The number of pairs in a minibatch.
+    walk_length : int, optional
+        The number of nodes in a random walk. Default: 40
+    window_size : int, optional
+        The maximum distance between a center node and its context nodes in a
+        random walk. Default: 5
+    negative_size : int, optional
+        The number of negative nodes per pair. Default: 5
+    walks_per_node : int, optional
+        The number of random walks from each node per epoch. Default: 1
+    dynamic_window : bool, optional
+        If True, the window of each center is shrunk to a size drawn uniformly
+        from ``[1, window_size]``, which weights the nearer contexts more.
+        Default: True
+    subsample : float, optional
+        If given, the threshold :math:`t` to subsample frequent nodes with:
+        a node of frequency :math:`f` is kept in a walk with probability
+        :math:`\min(1, \sqrt{t / f} + t / f)`.  The frequency of a node is
+        estimated by its share of the out-degrees, which is its visiting rate
+        of a random walk on an undirected graph. Default: None
+    negative_power : float, optional
+        Negative nodes are drawn with probability proportional to the
+        out-degree to this power. Default: 0.75
+    negative_table_size : int, optional
+        The size of the table the negative nodes are drawn from, in which each
+        node takes a number of entries proportional to its probability.
+        Default: 10,000,000
+    prob : str, optional
+        The name of the edge feature of transition weights. The weighted steps
+        are drawn with alias tables. Default: None
+    p : float, optional
+        The return parameter of node2vec random walks. Default: 1
+    q : float, optional
+        The in-out parameter of node2vec random walks. Default: 1
+    num_workers : int, optional
+        The number of threads generating walks and pairs. Default: 4
+    walk_batch_size : int, optional
+        The number of walks a thread generates at a time. Default: 1024
+    prefetch : int, optional
+        The number of minibatches packed ahead. Default: 4
+    pin_memory : bool, optional
+        Whether to pin the buffers. Default: None, which pins them if CUDA is
+        available.
+
+    Examples
+    --------
+    >>> model = dgl.nn.DeepWalk(g)
+    >>> dataloader = dgl.dataloading.SkipGramDataLoader(
+    ...     g, batch_size=4096, walk_length=model.walk_length,
+    ...     window_size=model.window_size, negative_size=model.negative_size)
+    >>> optimizer = torch.optim.SparseAdam(model.parameters(), lr=0.01)
+    >>> for epoch in range(num_epochs):
+    ...     for center, context, negatives in dataloader:
+    ...         loss = model.pair_loss(center, context, negatives)
+    ...         optimizer.zero_grad()
+    ...         loss.backward()
+    ...         optimizer.step()
+    """
+
+    def __init__(
+        self,
+        g,
+        batch_size,
+        walk_length=40,
+        window_size=5,
+        negative_size=5,
+        walks_per_node=1,
+        dynamic_window=True,
+        subsample=None,
+        negative_power=0.75,
+        negative_table_size=10000000,
+        prob=None,
+        p=1.0,
+        q=1.0,
+        num_workers=4,
+        walk_batch_size=1024,
+        prefetch=4,
+        pin_memory=None,
+    ):
+        if not g.is_homogeneous:
+            raise DGLError(
+                "SkipGramDataLoader only supports homogeneous graphs."
+            )
+        if g.device != F.cpu():
+            raise DGLError("SkipGramDataLoader requires the graph on CPU.")
+        if walk_length < 2:
+            raise DGLError("walk_length must be at least 2.")
+        self.g = g
+        self.batch_size = batch_size
+        self.walk_length = walk_length
+        self.window_size = window_size
+        self.negative_size = negative_size
+        self.walks_per_node = walks_per_node
+        self.dynamic_window = dynamic_window
+        self.prob = prob
+        self.p = p
+        self.q = q
+        self.num_workers = max(num_workers, 1)
+        self.walk_batch_size = walk_batch_size
+        self.prefetch = max(prefetch, 1)
+        if pin_memory is None:
+            pin_memory = torch.cuda.is_available()
+        self.pin_memory = pin_memory
+
+        degrees = g.out_degrees().to(torch.float64)
+        self.keep_prob = None
+        if subsample is not None:
+            freq = degrees / degrees.sum()
+            ratio = subsample / freq
+            self.keep_prob = torch.clamp(ratio.sqrt() + ratio, max=1.0)
+        weights = degrees.pow(negative_power)
+        counts = torch.round(weights / weights.sum() * negative_table_size)
+        self.negative_table = torch.repeat_interleave(
+            torch.arange(g.num_nodes()), counts.to(torch.int64)
+        )
+        if self.negative_table.shape[0] == 0:
+            raise DGLError(
+                "The negative table is empty. Increase negative_table_size."
+            )
+
+    def _walk(self, seeds):
+        if self.p != 1 or self.q != 1:
+            return node2vec_random_walk(
+                self.g,
+                seeds,
+                self.p,
+                self.q,
+                self.walk_length - 1,
+                prob=self.prob,
+                use_alias_table=self.prob is not None,
+            )
+        return random_walk(
+            self.g,
+            seeds,
+            length=self.walk_length - 1,
+            prob=self.prob,
+            use_alias_table=self.prob is not None,
+        )[0]
+
+    def _pairs(self, seeds, generator):
+        traces = self._walk(seeds).to(torch.int64)
+        keep = traces >= 0
+        if self.keep_prob is not None:
+            rand = torch.rand(
+                traces.shape, generator=generator, dtype=torch.float64
+            )
+            keep &= rand < self.keep_prob[traces.clamp(min=0)]
+        return _skip_gram_pairs(
+            traces, self.window_size, keep, self.dynamic_window, generator
+        )
+
+    def __iter__(self):
+        return _SkipGramIter(self)
+
+    def __len__(self):
+        """The estimated number of minibatches per epoch, which ignores the
+        walks terminated early and the subsampling."""
+        length = self.walk_length
+        window = min(self.window_size, length - 1)
+        if self.dynamic_window:
+            # The expected number of contexts at distance d is
+            # (window - d + 1) / window of the full window.
+            pairs = sum(
+                2 * (length - d) * (window - d + 1) / window
+                for d in range(1, window + 1)
+            )
+        else:
+            pairs = sum(2 * (length - d) for d in range(1, window + 1))
+        total = pairs * self.g.num_nodes() * self.walks_per_node
+        return int((total + self.batch_size - 1) // self.batch_size)
+
+
+def _walker_entry(loader, tasks, blocks, generator, done_event):
+    try:
+        while not done_event.is_set():
+            try:
+                seeds = tasks.get_nowait()
+            except Empty:
+                break
+            block = loader._pairs(seeds, generator)
+            _put_if_event_not_set(blocks, block, done_event)
+        _put_if_event_not_set(blocks, _WALKER_DONE, done_event)
+    except:  # pylint: disable=bare-except
+        _put_if_event_not_set(
+            blocks, ExceptionWrapper(where="in skip-gram walker"), done_event
+        )
+
+
+def _pack(loader, centers, contexts, free, ready, generator, done_event):
+    """Pack the given pairs with their negatives into a free buffer."""
+    buf = None
+    while buf is None and not done_event.is_set():
+        try:
+            buf = free.get(timeout=1.0)
+        except Empty:
+            continue
+    if buf is None:
+        return
+    num_pairs = centers.shape[0]
+    num_negatives = num_pairs * loader.negative_size
+    center, context, negatives = buf
+    center[:num_pairs].copy_(centers)
+    context[:num_pairs].copy_(contexts)
+    idx = torch.randint(
+        loader.negative_table.shape[0], (num_negatives,), generator=generator
+    )
+    torch.index_select(
+        loader.negative_table, 0, idx, out=negatives.view(-1)[:num_negatives]
+    )
+    ready.put((buf, num_pairs, None))
+
+
+def _packer_entry(loader, blocks, free, ready, generator, done_event):
+    batch_size = loader.batch_size
+    try:
+        num_running = loader.num_workers
+        pending_centers, pending_contexts, num_pending = [], [], 0
+        while num_running > 0 and not done_event.is_set():
+            try:
+                block = blocks.get(timeout=1.0)
+            except Empty:
+                continue
+            if block is _WALKER_DONE:
+                num_running -= 1
+                continue
+            if isinstance(block, ExceptionWrapper):
+                ready.put((None, 0, block))
+                return
+            pending_centers.append(block[0])
+            pending_contexts.append(block[1])
+            num_pending += block[0].shape[0]
+            if num_pending < batch_size:
+                continue
+            centers = torch.cat(pending_centers)
+            contexts = torch.cat(pending_contexts)
+            start = 0
+            while num_pending - start >= batch_size:
+                end = start + batch_size
+                _pack(
+                    loader,
+                    centers[start:end],
+                    contexts[start:end],
+                    free,
+                    ready,
+                    generator,
+                    done_event,
+                )
+                start = end
+            pending_centers = [centers[start:]]
+            pending_contexts = [contexts[start:]]
+            num_pending -= start
+        if num_pending > 0:
+            _pack(
+                loader,
+                torch.cat(pending_centers),
+                torch.cat(pending_contexts),
+                free,
+                ready,
+                generator,
+                done_event,
+            )
+        ready.put((None, 0, None))
+    except:  # pylint: disable=bare-except
+        ready.put((None, 0, ExceptionWrapper(where="in skip-gram packer")))
+
+
+def _new_generator():
+    generator = torch.Generator()
+    generator.manual_seed(int(torch.randint(1 << 62, ())))
+    return generator
+
+
+class _SkipGramIter(object):
+    def __init__(self, loader):
+        self.loader = loader
+        # The threads must not hold a reference to the iterator so that an
+        # abandoned iterator is collected and stops them.
+        self._done_event = threading.Event()
+        self._ready = Queue()
+        self._free = Queue()
+        # The packer may hold one buffer and the consumer two besides the
+        # prefetched ones.
+        for _ in range(loader.prefetch + 3):
+            self._free.put(self._alloc())
+        self._in_use = deque()
+
+        seeds = torch.randperm(loader.g.num_nodes()).repeat(
+            loader.walks_per_node
+        )
+        tasks = Queue()
+        for chunk in torch.split(seeds, loader.walk_batch_size):
+            tasks.put(chunk.to(loader.g.idtype))
+        blocks = Queue(2 * loader.num_workers)
+        threads = [
+            threading.Thread(
+                target=_walker_entry,
+                args=(
+                    loader,
+                    tasks,
+                    blocks,
+                    _new_generator(),
+                    self._done_event,
+                ),
+                daemon=True,
+            )
+            for _ in range(loader.num_workers)
+        ]
+        threads.append(
+            threading.Thread(
+                target=_packer_entry,
+                args=(
+                    loader,
+                    blocks,
+                    self._free,
+                    self._ready,
+                    _new_generator(),
+                    self._done_event,
+                ),
+                daemon=True,
+            )
+        )
+        for thread in threads:
+            thread.start()
+
+    def _alloc(self):
+        loader = self.loader
+        shapes = [
+            (loader.batch_size,),
+            (loader.batch_size,),
+            (loader.batch_size, loader.negative_size),
+        ]
+        return tuple(
+            torch.empty(shape, dtype=torch.int64, pin_memory=loader.pin_memory)
+            for shape in shapes
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done_event.is_set():
+            raise StopIteration
+        while len(self._in_use) >= 2:
+            self._free.put(self._in_use.popleft())
+        buf, num_pairs, exception = self._ready.get()
+        if buf is None:
+            self._done_event.set()
+            if exception is not None:
+                exception.reraise()
+            raise StopIteration
+        self._in_use.append(buf)
+        center, context, negatives = buf
+        if num_pairs < self.loader.batch_size:
+            center = center[:num_pairs]
+            context = context[:num_pairs]
+            negatives = negatives[:num_pairs]
+        return center, context, negatives
+
+    def __del__(self):
+        self._done_event.set()
@@ -21,21 +21,154 @@ from Xie et al.
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import torch as th
 
-from dgl import DGLGraph
-from dgl._sparse_ops import (
-    libra2dgl_build_adjlist,
-    libra2dgl_build_dict,
-    libra2dgl_set_lr,
-    libra_vertex_cut,
-)
+from dgl import graph
+from dgl._sparse_ops import libra_vertex_cut
 from dgl.base import DGLError
 from dgl.data.utils import save_graphs, save_tensors
 
 
-def libra_partition(num_community, G, resultdir):
+def _relabel_partition(u, v):
+    """Assign consecutive local node IDs to the nodes of a partition.
+
+    The nodes are numbered in the order of their first appearance in the
+    edge list ``(u[0], v[0], u[1], v[1], ...)``.
+
+    Returns
+    -------
+    tuple[Tensor, Tensor, Tensor]
+        The global node ID of each local node, and the local source and
+        destination node IDs of the edges.
+    """
+    seq = th.stack([u, v], 1).reshape(-1)
+    uniq, inverse = th.unique(seq, return_inverse=True)
+    first = th.full((uniq.shape[0],), seq.shape[0], dtype=th.int64)
+    first.scatter_reduce_(0, inverse, th.arange(seq.shape[0]), "amin")
+    order = th.argsort(first)
+    rank = th.empty_like(order)
+    rank[order] = th.arange(order.shape[0])
+    local = rank[inverse]
+    return uniq[order], local[0::2], local[1::2]
+
+
+def _build_replica_table(ldt_keys, node_map, num_nodes):
+    """Build the sparse table of the copies of every node.
+
+    The copies of node ``k`` are ``gdt_value[gdt_ptr[k]:gdt_ptr[k + 1]]`` in
+    the order of the partitions, identified by their IDs in the consecutive
+    local node ID space of all the partitions.
+    """
+    offsets = th.cat([th.zeros(1, dtype=th.int64), node_map[:-1]])
+    keys = th.cat(ldt_keys)
+    values = th.cat(
+        [off + th.arange(k.shape[0]) for off, k in zip(offsets, ldt_keys)]
+    )
+    order = th.argsort(keys, stable=True)
+    gdt_value = values[order]
+    gdt_key = th.bincount(keys, minlength=num_nodes)
+    gdt_ptr = th.cat([th.zeros(1, dtype=th.int64), th.cumsum(gdt_key, 0)])
+    return gdt_key, gdt_ptr, gdt_value
+
+
+def _set_lr(gdt_key, gdt_ptr, gdt_value):
+    """Pick the root of the 1-level tree among the copies of every node."""
+    lrtensor = th.zeros(gdt_key.shape[0], dtype=th.int64)
+    has = gdt_key > 0
+    pick = (th.rand(gdt_key.shape[0]) * gdt_key).long()
+    lrtensor[has] = gdt_value[gdt_ptr[:-1][has] + pick[has]]
+    return lrtensor
+
+
+def _build_adjlist(
+    ldt_key,
+    gdt_key,
+    gdt_ptr,
+    gdt_value,
+    lrtensor,
+    part_id,
+    node_map,
+    num_community,
+):
+    """Build the remote copies and the 1-level tree of a partition's nodes."""
+    num_nodes = ldt_key.shape[0]
+    counts = gdt_key[ldt_key]
+    adj = th.full((num_nodes, num_community - 1), -1, dtype=th.int64)
+    inner_node = (counts == 1).int()
+    lr_t = lrtensor[ldt_key]
+    lr_t[counts == 1] = -200
+
+    # Expand the copies of every node and drop the local one.
+    seg = th.repeat_interleave(th.arange(num_nodes), counts)
+    seg_start = th.cumsum(counts, 0) - counts
+    pos = th.arange(seg.shape[0]) - seg_start[seg]
+    copies = gdt_value[gdt_ptr[ldt_key][seg] + pos]
+    remote = th.searchsorted(node_map, copies, right=True) != part_id
+    seg, copies = seg[remote], copies[remote]
+    # Every node has exactly one local copy.
+    remote_start = th.cumsum(counts - 1, 0) - (counts - 1)
+    pos = th.arange(seg.shape[0]) - remote_start[seg]
+    adj[seg, pos] = copies
+    return adj, inner_node, lr_t
+
+
+def _write_partition(
+    part_id, G, edges, ldt_key, replicas, node_map, num_community, out_path
+):
+    """Gather the data of a partition and save it."""
+    gdt_key, gdt_ptr, gdt_value, lrtensor = replicas
+    a_t, b_t = edges
+    g = graph((a_t, b_t), num_nodes=ldt_key.shape[0])
+    adj, inner_node, lr_t = _build_adjlist(
+        ldt_key,
+        gdt_key,
+        gdt_ptr,
+        gdt_value,
+        lrtensor,
+        part_id,
+        node_map,
+        num_community,
+    )
+
+    try:
+        feat = G.ndata["feat"]
+    except KeyError:
+        feat = G.ndata["features"]
+
+    try:
+        labels = G.ndata["label"]
+    except KeyError:
+        labels = G.ndata["labels"]
+
+    g.ndata["adj"] = adj  ## database of remote clones
+    g.ndata["inner_node"] = inner_node  ## split node '0' else '1'
+    g.ndata["feat"] = feat[ldt_key]  ## gathered features
+    g.ndata["lf"] = lr_t  ## 1-level tree among split nodes
+
+    g.ndata["label"] = labels[ldt_key]
+    g.ndata["train_mask"] = G.ndata["train_mask"][ldt_key].int()
+    g.ndata["test_mask"] = G.ndata["test_mask"][ldt_key].int()
+    g.ndata["val_mask"] = G.ndata["val_mask"][ldt_key].int()
+
+    print("Writing partition {} to file".format(part_id), flush=True)
+
+    part_dir = os.path.join(out_path, "part" + str(part_id))
+    node_feat_file = os.path.join(part_dir, "node_feat.dgl")
+    edge_feat_file = os.path.join(part_dir, "edge_feat.dgl")
+    part_graph_file = os.path.join(part_dir, "graph.dgl")
+    os.makedirs(part_dir, mode=0o775, exist_ok=True)
+    save_tensors(node_feat_file, g.ndata)
+    save_graphs(part_graph_file, [g])
+    return {
+        "node_feats": node_feat_file,
+        "edge_feats": edge_feat_file,
+        "part_graph": part_graph_file,
+    }
+
+
+def libra_partition(num_community, G, resultdir, num_workers=4):
     """
     Performs vertex-cut based graph partitioning and converts the partitioning
     output to DGL input format.
@@ -45,18 +178,14 @@ def libra_partition(num_community, G, resultdir):
     num_community : Number of partitions to create
     G : Input graph to be partitioned
     resultdir : Output location for storing the partitioned graphs
+    num_workers : Number of threads converting the partitions
 
     Output
     ------
-    1. Creates X partition folder as XCommunities (say, X=2, so, 2Communities)
-       XCommunities contains file name communityZ.txt per partition Z (Z <- 0 .. X-1);
-       each such file contains a list of edges assigned to that partition.
-       These files constitute the output of Libra graph partitioner
-       (An intermediate result of this function).
-    2. The folder also contains partZ folders, each of these folders stores
+    1. The output folder contains partZ folders, each of these folders stores
        DGL/DistGNN graphs for the Z partitions;
        these graph files are used as input to DistGNN.
-    3. The folder also contains a json file which contains partitions' information.
+    2. The folder also contains a json file which contains partitions' information.
     """
 
     num_nodes = G.num_nodes()  # number of nodes
@@ -73,15 +202,8 @@ def libra_partition(num_community, G, resultdir):
     weight_ = th.ones(u_t.shape[0], dtype=th.int64)
     community_weights = th.zeros(num_community, dtype=th.int64)
 
-    # self_loop = 0
-    # for p, q in zip(u_t, v_t):
-    #     if p == q:
-    #         self_loop += 1
-    # print("#self loops in the dataset: ", self_loop)
-
-    # del G
-
-    ## call to C/C++ code
+    ## call to C/C++ code; the partitions are converted from the edge
+    ## assignment in memory instead of being written out as text.
     out = th.zeros(u_t.shape[0], dtype=th.int32)
     libra_vertex_cut(
         num_community,
@@ -94,62 +216,38 @@ def libra_partition(num_community, G, resultdir):
         out,
         num_nodes,
         num_edges,
-        resultdir,
+        "",
     )
 
     print("Max partition size: ", int(community_weights.max()))
     print(" ** Converting libra partitions to dgl graphs **")
-    fsize = int(community_weights.max()) + 1024  ## max edges in partition
-    # print("fsize: ", fsize, flush=True)
 
-    node_map = th.zeros(num_community, dtype=th.int64)
-    indices = th.zeros(num_nodes, dtype=th.int64)
-    lrtensor = th.zeros(num_nodes, dtype=th.int64)
-    gdt_key = th.zeros(num_nodes, dtype=th.int64)
-    gdt_value = th.zeros([num_nodes, num_community], dtype=th.int64)
-    offset = th.zeros(1, dtype=th.int64)
-    ldt_ar = []
+    ## Group the edges by partition, keeping their order in the graph.
+    perm = th.argsort(out.long(), stable=True)
+    part_sizes = th.bincount(out.long(), minlength=num_community).tolist()
+    part_u = th.split(u_t.long()[perm], part_sizes)
+    part_v = th.split(v_t.long()[perm], part_sizes)
 
-    gg_ar = [DGLGraph() for i in range(num_community)]
-    part_nodes = []
+    ## Assign local node ids and mapping to global node ids
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        relabeled = list(pool.map(_relabel_partition, part_u, part_v))
+    del perm, part_u, part_v
+    ldt_keys = [r[0] for r in relabeled]
+    part_edges = [(r[1], r[2]) for r in relabeled]
+    node_map = th.cumsum(th.tensor([k.shape[0] for k in ldt_keys]), 0)
 
     print(">>> ", "num_nodes   ", " ", "num_edges")
-    ## Iterator over number of partitions
-    for i in range(num_community):
-        g = gg_ar[i]
-
-        a_t = th.zeros(fsize, dtype=th.int64)
-        b_t = th.zeros(fsize, dtype=th.int64)
-        ldt_key = th.zeros(fsize, dtype=th.int64)
-        ldt_ar.append(ldt_key)
-
-        ## building node, parition dictionary
-        ## Assign local node ids and mapping to global node ids
-        ret = libra2dgl_build_dict(
-            a_t,
-            b_t,
-            indices,
-            ldt_key,
-            gdt_key,
-            gdt_value,
-            node_map,
-            offset,
-            num_community,
-            i,
-            fsize,
-            resultdir,
-        )
+    for key, (a_t, _) in zip(ldt_keys, part_edges):
+        print(">>> ", key.shape[0], " ", a_t.shape[0])
 
-        num_nodes_partition = int(ret[0])
-        num_edges_partition = int(ret[1])
-        part_nodes.append(num_nodes_partition)
-        print(">>> ", num_nodes_partition, " ", num_edges_partition)
-        g.add_edges(a_t[0:num_edges_partition], b_t[0:num_edges_partition])
+    ## Sparse table of the copies of the split nodes, and the 1-level tree
+    ## among them.
+    gdt_key, gdt_ptr, gdt_value = _build_replica_table(
+        ldt_keys, node_map, num_nodes
+    )
+    lrtensor = _set_lr(gdt_key, gdt_ptr, gdt_value)
+    replicas = (gdt_key, gdt_ptr, gdt_value, lrtensor)
 
-    ########################################################
-    ## fixing lr - 1-level tree for the split-nodes
-    libra2dgl_set_lr(gdt_key, gdt_value, lrtensor, num_community, num_nodes)
-    ########################################################
     # graph_name = dataset
     graph_name = resultdir.split("_")[-1].split("/")[0]
     part_method = "Libra"
@@ -169,106 +267,23 @@ def libra_partition(num_community, G, resultdir):
         "node_map": node_map_val,
         "edge_map": edge_map_val,
     }
-    ############################################################
-
-    for i in range(num_community):
-        g = gg_ar[0]
-        num_nodes_partition = part_nodes[i]
-        adj = th.zeros([num_nodes_partition, num_community - 1], dtype=th.int64)
-        inner_node = th.zeros(num_nodes_partition, dtype=th.int32)
-        lr_t = th.zeros(num_nodes_partition, dtype=th.int64)
-        ldt = ldt_ar[0]
-
-        try:
-            feat = G.ndata["feat"]
-        except KeyError:
-            feat = G.ndata["features"]
-
-        try:
-            labels = G.ndata["label"]
-        except KeyError:
-            labels = G.ndata["labels"]
-
-        trainm = G.ndata["train_mask"].int()
-        testm = G.ndata["test_mask"].int()
-        valm = G.ndata["val_mask"].int()
-
-        feat_size = feat.shape[1]
-        gfeat = th.zeros([num_nodes_partition, feat_size], dtype=feat.dtype)
-
-        glabels = th.zeros(num_nodes_partition, dtype=labels.dtype)
-        gtrainm = th.zeros(num_nodes_partition, dtype=trainm.dtype)
-        gtestm = th.zeros(num_nodes_partition, dtype=testm.dtype)
-        gvalm = th.zeros(num_nodes_partition, dtype=valm.dtype)
-
-        ## build remote node databse per local node
-        ## gather feats, train, test, val, and labels for each partition
-        libra2dgl_build_adjlist(
-            feat,
-            gfeat,
-            adj,
-            inner_node,
-            ldt,
-            gdt_key,
-            gdt_value,
-            node_map,
-            lr_t,
-            lrtensor,
-            num_nodes_partition,
-            num_community,
-            i,
-            feat_size,
-            labels,
-            trainm,
-            testm,
-            valm,
-            glabels,
-            gtrainm,
-            gtestm,
-            gvalm,
-            feat.shape[0],
-        )
 
-        g.ndata["adj"] = adj  ## database of remote clones
-        g.ndata["inner_node"] = inner_node  ## split node '0' else '1'
-        g.ndata["feat"] = gfeat  ## gathered features
-        g.ndata["lf"] = lr_t  ## 1-level tree among split nodes
-
-        g.ndata["label"] = glabels
-        g.ndata["train_mask"] = gtrainm
-        g.ndata["test_mask"] = gtestm
-        g.ndata["val_mask"] = gvalm
-
-        # Validation code, run only small graphs
-        # for l in range(num_nodes_partition):
-        #     index = int(ldt[l])
-        #     assert glabels[l] == labels[index]
-        #     assert gtrainm[l] == trainm[index]
-        #     assert gtestm[l] == testm[index]
-        #     for j in range(feat_size):
-        #         assert gfeat[l][j] == feat[index][j]
-
-        print("Writing partition {} to file".format(i), flush=True)
-
-        part = g
-        part_id = i
-        part_dir = os.path.join(out_path, "part" + str(part_id))
-        node_feat_file = os.path.join(part_dir, "node_feat.dgl")
-        edge_feat_file = os.path.join(part_dir, "edge_feat.dgl")
-        part_graph_file = os.path.join(part_dir, "graph.dgl")
-        part_metadata["part-{}".format(part_id)] = {
-            "node_feats": node_feat_file,
-            "edge_feats": edge_feat_file,
-            "part_graph": part_graph_file,
-        }
-        os.makedirs(part_dir, mode=0o775, exist_ok=True)
-        save_tensors(node_feat_file, part.ndata)
-        save_graphs(part_graph_file, [part])
-
-        del g
-        del gg_ar[0]
-        del ldt
-        del ldt_ar[0]
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        part_files = pool.map(
+            lambda i: _write_partition(
+                i,
+                G,
+                part_edges[i],
+                ldt_keys[i],
+                replicas,
+                node_map,
+                num_community,
+                out_path,
+            ),
+            range(num_community),
+        )
+        for i, files in enumerate(part_files):
+            part_metadata["part-{}".format(i)] = files
 
     with open("{}/{}.json".format(out_path, graph_name), "w") as outfile:
         json.dump(part_metadata, outfile, sort_keys=True, indent=4)
@@ -276,20 +291,17 @@ def libra_partition(num_community, G, resultdir):
     print("Conversion libra2dgl completed !!!")
 
 
-def partition_graph(num_community, G, resultdir):
+def partition_graph(num_community, G, resultdir, num_workers=4):
     """
     Performs vertex-cut based graph partitioning and converts the partitioning
     output to DGL input format.
 
     Given a graph, this function will create a folder named ``XCommunities`` where ``X``
-    stands for the number of communities.  It will contain ``X`` files named
-    ``communityZ.txt`` for each partition Z (from 0 to X-1);
-    each such file contains a list of edges assigned to that partition.
-    These files constitute the output of Libra graph partitioner.
-
-    The folder also contains X subfolders named ``partZ``, each of these folders stores
+    stands for the number of communities.  It will contain X subfolders named
+    ``partZ`` for each partition Z (from 0 to X-1), each of these folders stores
     DGL/DistGNN graphs for partition Z; these graph files are used as input to
-    DistGNN.
+    DistGNN.  The partitions are converted from the edge assignment of the Libra
+    graph partitioner in memory, several of them at a time.
 
     The folder also contains a json file which contains partitions' information.
 
@@ -309,6 +321,8 @@ def partition_graph(num_community, G, resultdir):
         Input graph to be partitioned.
     resultdir : str
         Output location for storing the partitioned graphs.
+    num_workers : int, optional
+        Number of threads converting the partitions.  Default: 4.
     """
 
     print("num partitions: ", num_community)
@@ -333,7 +347,7 @@ def partition_graph(num_community, G, resultdir):
         raise DGLError("Error: Could not create sub-directory: ", resultdir)
 
     ## Libra partitioning
-    libra_partition(num_community, G, resultdir)
+    libra_partition(num_community, G, resultdir, num_workers)
 
     ltoc = time.time()
     print(
@@ -1,5 +1,5 @@
 """DGL distributed module"""
-from . import optim
+from . import id_map, optim
 from .dist_context import exit_client, initialize
 from .dist_dataloader import DistDataLoader
 from .dist_graph import DistGraph, DistGraphServer, edge_split, node_split
@@ -14,6 +14,8 @@ from .partition import (
     load_partition_book,
     load_partition_feats,
     partition_graph,
+    rebalance_trainer_ids,
+    update_partitions,
 )
 from .rpc import *
 from .rpc_client import connect_to_server, shutdown_servers
@@ -11,9 +11,9 @@ from ..base import DGLError
 from ..ndarray import exist_shared_mem_array
 from ..partition import NDArrayPartition
 from .constants import DEFAULT_ETYPE, DEFAULT_NTYPE
-from .id_map import IdMap
 from .shared_mem_utils import (
     _get_edata_path,
+    _get_gpb_path,
     _get_ndata_path,
     _to_shared_mem,
     DTYPE_DICT,
@@ -223,9 +223,11 @@ def get_shared_mem_partition_book(graph_name):
         for i, (etype, eid_range) in enumerate(edge_map_data):
             etypes[etype] = i
             edge_map[etype] = eid_range
-        return RangePartitionBook(
+        gpb = RangePartitionBook(
             part_id, num_parts, node_map, edge_map, ntypes, etypes
         )
+        gpb._load_shared_flat_ranges(graph_name)
+        return gpb
     else:
         raise TypeError("Only RangePartitionBook is supported currently.")
 
@@ -430,6 +432,44 @@ class GraphPartitionBook(ABC):
              local edge IDs
         """
 
+    def nid2partid_and_local(self, nids, ntype):
+        """From global node IDs to partition IDs and local node IDs.
+
+        It fuses :func:`nid2partid` and :func:`nid2localnid`; the local node
+        IDs are within the partitions the nodes belong to.
+
+        Parameters
+        ----------
+        nids : tensor
+            global node IDs
+        ntype : str
+            The node type
+
+        Returns
+        -------
+        (tensor, tensor)
+            partition IDs and local node IDs.
+        """
+
+    def eid2partid_and_local(self, eids, etype):
+        """From global edge IDs to partition IDs and local edge IDs.
+
+        It fuses :func:`eid2partid` and :func:`eid2localeid`; the local edge
+        IDs are within the partitions the edges belong to.
+
+        Parameters
+        ----------
+        eids : tensor
+            global edge IDs
+        etype : str or (str, str, str)
+            The edge type
+
+        Returns
+        -------
+        (tensor, tensor)
+            partition IDs and local edge IDs.
+        """
+
     @property
     def partid(self):
         """Get the current partition ID
@@ -538,6 +578,69 @@ class GraphPartitionBook(ABC):
         """
 
 
+def _flatten_id_ranges(id_ranges):
+    """Flatten the ID ranges of all types in all partitions.
+
+    The ranges are ordered by partition and then by the starting IDs of the
+    types as in :class:`~dgl.distributed.id_map.IdMap`, so that their ends are
+    sorted and the range of a homogeneous ID can be found with a single binary
+    search.
+
+    Parameters
+    ----------
+    id_ranges : dict[str or (str, str, str), numpy.ndarray]
+        The ID ranges of each type in each partition.
+
+    Returns
+    -------
+    numpy.ndarray
+        An int64 matrix of 4 rows and K * T columns, where K is the number of
+        partitions and T is the number of types. The rows are the ending IDs,
+        the starting IDs, the type IDs and the type-wise starting IDs of the
+        ranges.
+    """
+    id_ranges = sorted(id_ranges.values(), key=lambda a: a[0, 0])
+    num_types = len(id_ranges)
+    num_parts = id_ranges[0].shape[0]
+    ranges = np.zeros((4, num_parts * num_types), dtype=np.int64)
+    for type_id, id_range in enumerate(id_ranges):
+        sizes = id_range[:, 1] - id_range[:, 0]
+        ranges[0, type_id::num_types] = id_range[:, 1]
+        ranges[1, type_id::num_types] = id_range[:, 0]
+        ranges[2, type_id::num_types] = type_id
+        ranges[3, type_id::num_types] = np.cumsum(sizes) - sizes
+    assert np.all(np.diff(ranges[0]) >= 0)
+    return ranges
+
+
+def _map_to_per_type(flat_ranges, ids):
+    """Map homogeneous IDs to type IDs and type-wise IDs with the flattened ID
+    ranges returned by :func:`_flatten_id_ranges`.
+    """
+    ids = utils.toindex(ids).tonumpy()
+    idx = np.searchsorted(flat_ranges[0], ids, side="right")
+    type_ids = flat_ranges[2][idx]
+    per_type_ids = ids - flat_ranges[1][idx] + flat_ranges[3][idx]
+    return (
+        utils.toindex(type_ids).tousertensor(),
+        utils.toindex(per_type_ids).tousertensor(),
+    )
+
+
+def _id2partid_and_local(max_ids, ids):
+    """Map IDs to partition IDs and the local IDs within the partitions, given
+    the end of the ID range of each partition.
+    """
+    ids = utils.toindex(ids).tonumpy()
+    partids = np.searchsorted(max_ids, ids, side="right")
+    # The start of the ID range of the partition of each ID.
+    starts = np.concatenate([[0], max_ids[:-1]])[partids]
+    return (
+        utils.toindex(partids).tousertensor(),
+        utils.toindex(ids - starts).tousertensor(),
+    )
+
+
 class RangePartitionBook(GraphPartitionBook):
     """This partition book supports more efficient storage of partition information.
 
@@ -568,6 +671,13 @@ class RangePartitionBook(GraphPartitionBook):
     etypes : dict[(str, str, str), int]
         map canonical etypes to etype IDs.
 
+    Notes
+    -----
+    The ID ranges of all types in all partitions are also flattened into one
+    sorted array, so that mapping homogeneous IDs to types only takes a single
+    binary search. :func:`shared_memory` places the flattened arrays in shared
+    memory, and the partition books loaded from shared memory by other
+    processes on the same machine use them instead of their own copies.
     """
 
     def __init__(self, part_id, num_parts, node_map, edge_map, ntypes, etypes):
@@ -658,9 +768,10 @@ class RangePartitionBook(GraphPartitionBook):
         # Similar to _max_node_ids
         self._max_edge_ids = max_edge_map
 
-        # These two are map functions that map node/edge IDs to node/edge type IDs.
-        self._nid_map = IdMap(self._typed_nid_range)
-        self._eid_map = IdMap(self._typed_eid_range)
+        # These two are flattened ID ranges that map node/edge IDs to
+        # node/edge type IDs.
+        self._flat_nid_range = _flatten_id_ranges(self._typed_nid_range)
+        self._flat_eid_range = _flatten_id_ranges(self._typed_eid_range)
 
         # Local node/edge type offset that maps the local homogenized node/edge IDs
         # to local heterogenized node/edge IDs.  One can do the mapping by binary search
@@ -721,6 +832,35 @@ class RangePartitionBook(GraphPartitionBook):
             F.tensor(eid_range_pickle),
             True,
         )
+        # Share the flattened ID ranges with the partition books loaded from
+        # shared memory.
+        self._shared_flat_ranges = (
+            _to_shared_mem(
+                F.zerocopy_from_numpy(self._flat_nid_range),
+                _get_gpb_path(graph_name, "flat_nid_range"),
+            ),
+            _to_shared_mem(
+                F.zerocopy_from_numpy(self._flat_eid_range),
+                _get_gpb_path(graph_name, "flat_eid_range"),
+            ),
+        )
+        self._flat_nid_range = F.asnumpy(self._shared_flat_ranges[0])
+        self._flat_eid_range = F.asnumpy(self._shared_flat_ranges[1])
+
+    def _load_shared_flat_ranges(self, graph_name):
+        """Use the flattened ID ranges in shared memory if they exist."""
+        dtype = DTYPE_DICT[F.int64]
+        for name, attr in [
+            (_get_gpb_path(graph_name, "flat_nid_range"), "_flat_nid_range"),
+            (_get_gpb_path(graph_name, "flat_eid_range"), "_flat_eid_range"),
+        ]:
+            if not exist_shared_mem_array(name):
+                continue
+            shape = getattr(self, attr).shape
+            data = empty_shared_mem(name, False, shape, dtype)
+            setattr(
+                self, attr, F.asnumpy(F.zerocopy_from_dlpack(data.to_dlpack()))
+            )
 
     def num_partitions(self):
         """Return the number of partitions."""
@@ -750,39 +890,35 @@ class RangePartitionBook(GraphPartitionBook):
         Returns
             type_ids, per_type_ids
         """
-        return self._nid_map(ids)
+        return _map_to_per_type(self._flat_nid_range, ids)
 
     def map_to_per_etype(self, ids):
         """Map global homogeneous edge IDs to edge type IDs.
         Returns
             type_ids, per_type_ids
         """
-        return self._eid_map(ids)
+        return _map_to_per_type(self._flat_eid_range, ids)
 
     def map_to_homo_nid(self, ids, ntype):
         """Map per-node-type IDs to global node IDs in the homogeneous format."""
-        ids = utils.toindex(ids).tousertensor()
-        partids = self.nid2partid(ids, ntype)
-        typed_max_nids = F.zerocopy_from_numpy(self._typed_max_node_ids[ntype])
-        end_diff = F.gather_row(typed_max_nids, partids) - ids
-        typed_nid_range = F.zerocopy_from_numpy(
-            self._typed_nid_range[ntype][:, 1]
+        partids, local_ids = _id2partid_and_local(
+            self._typed_max_node_ids[ntype], ids
+        )
+        typed_nid_start = F.zerocopy_from_numpy(
+            self._typed_nid_range[ntype][:, 0]
         )
-        return F.gather_row(typed_nid_range, partids) - end_diff
+        return F.gather_row(typed_nid_start, partids) + local_ids
 
     def map_to_homo_eid(self, ids, etype):
         """Map per-edge-type IDs to global edge IDs in the homoenegeous format."""
-        ids = utils.toindex(ids).tousertensor()
         c_etype = self.to_canonical_etype(etype)
-        partids = self.eid2partid(ids, c_etype)
-        typed_max_eids = F.zerocopy_from_numpy(
-            self._typed_max_edge_ids[c_etype]
+        partids, local_ids = _id2partid_and_local(
+            self._typed_max_edge_ids[c_etype], ids
         )
-        end_diff = F.gather_row(typed_max_eids, partids) - ids
-        typed_eid_range = F.zerocopy_from_numpy(
-            self._typed_eid_range[c_etype][:, 1]
+        typed_eid_start = F.zerocopy_from_numpy(
+            self._typed_eid_range[c_etype][:, 0]
         )
-        return F.gather_row(typed_eid_range, partids) - end_diff
+        return F.gather_row(typed_eid_start, partids) + local_ids
 
     def nid2partid(self, nids, ntype=DEFAULT_NTYPE):
         """From global node IDs to partition IDs"""
@@ -813,6 +949,19 @@ class RangePartitionBook(GraphPartitionBook):
         ret = utils.toindex(ret)
         return ret.tousertensor()
 
+    def nid2partid_and_local(self, nids, ntype=DEFAULT_NTYPE):
+        """From global node IDs to partition IDs and local node IDs"""
+        if ntype == DEFAULT_NTYPE:
+            return _id2partid_and_local(self._max_node_ids, nids)
+        return _id2partid_and_local(self._typed_max_node_ids[ntype], nids)
+
+    def eid2partid_and_local(self, eids, etype=DEFAULT_ETYPE):
+        """From global edge IDs to partition IDs and local edge IDs"""
+        if etype in (DEFAULT_ETYPE, DEFAULT_ETYPE[1]):
+            return _id2partid_and_local(self._max_edge_ids, eids)
+        c_etype = self.to_canonical_etype(etype)
+        return _id2partid_and_local(self._typed_max_edge_ids[c_etype], eids)
+
     def partid2nids(self, partid, ntype=DEFAULT_NTYPE):
         """From partition ID to global node IDs"""
         # TODO do we need to cache it?
@@ -1096,6 +1245,28 @@ class PartitionPolicy(object):
         else:
             return self._partition_book.eid2partid(id_tensor, self.type_name)
 
+    def to_partid_and_local(self, id_tensor):
+        """Mapping global ID to partition ID and local ID.
+
+        Parameters
+        ----------
+        id_tensor : tensor
+            Global ID tensor
+
+        Return
+        ------
+        (tensor, tensor)
+            partition ID and local ID within the partition
+        """
+        if self.is_node:
+            return self._partition_book.nid2partid_and_local(
+                id_tensor, self.type_name
+            )
+        else:
+            return self._partition_book.eid2partid_and_local(
+                id_tensor, self.type_name
+            )
+
     def get_part_size(self):
         """Get data size of current partition.
 
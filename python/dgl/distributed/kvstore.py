@@ -1409,10 +1409,13 @@ class KVClient(object):
             F.shape(id_tensor)[0] == F.shape(data_tensor)[0]
         ), "The data must has the same row size with ID."
         # partition data
-        machine_id = self._part_policy[name].to_partid(id_tensor)
+        machine_id, all_local_id = self._part_policy[name].to_partid_and_local(
+            id_tensor
+        )
         # sort index by machine id
         sorted_id = F.tensor(np.argsort(F.asnumpy(machine_id)))
         id_tensor = id_tensor[sorted_id]
+        all_local_id = all_local_id[sorted_id]
         data_tensor = data_tensor[sorted_id]
         machine, count = np.unique(F.asnumpy(machine_id), return_counts=True)
         # push data to server by order
@@ -1428,7 +1431,7 @@ class KVClient(object):
             if machine_idx == self._machine_id:  # local push
                 # Note that DO NOT push local data right now because we can overlap
                 # communication-local_push here
-                local_id = self._part_policy[name].to_local(partial_id)
+                local_id = all_local_id[start:end]
                 local_data = partial_data
             else:  # push data to remote server
                 request = PushRequest(name, partial_id, partial_data)
@@ -1459,7 +1462,9 @@ class KVClient(object):
         id_tensor = id_tensor.tousertensor()
         assert F.ndim(id_tensor) == 1, "ID must be a vector."
         if self._pull_handlers[name] is default_pull_handler:  # Use fast-pull
-            part_id = self._part_policy[name].to_partid(id_tensor)
+            part_id, local_id = self._part_policy[name].to_partid_and_local(
+                id_tensor
+            )
             return rpc.fast_pull(
                 name,
                 id_tensor,
@@ -1471,14 +1476,18 @@ class KVClient(object):
                 self._client_id,
                 self._data_store[name],
                 self._part_policy[name],
+                local_id=local_id,
             )
         else:
             # partition data
-            machine_id = self._part_policy[name].to_partid(id_tensor)
+            machine_id, all_local_id = self._part_policy[
+                name
+            ].to_partid_and_local(id_tensor)
             # sort index by machine id
             sorted_id = F.tensor(np.argsort(F.asnumpy(machine_id)))
             back_sorted_id = F.tensor(np.argsort(F.asnumpy(sorted_id)))
             id_tensor = id_tensor[sorted_id]
+            all_local_id = all_local_id[sorted_id]
             machine, count = np.unique(
                 F.asnumpy(machine_id), return_counts=True
             )
@@ -1494,7 +1503,7 @@ class KVClient(object):
                 if machine_idx == self._machine_id:  # local pull
                     # Note that DO NOT pull local data right now because we can overlap
                     # communication-local_pull here
-                    local_id = self._part_policy[name].to_local(partial_id)
+                    local_id = all_local_id[start:end]
                 else:  # pull data from remote server
                     request = PullRequest(name, partial_id)
                     rpc.send_request_to_machine(machine_idx, request)
@@ -2,19 +2,24 @@
 
 import json
 import logging
+import multiprocessing as mp
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from .. import backend as F
+from .. import backend as F, utils
 from ..base import DGLError, EID, ETYPE, NID, NTYPE
-from ..convert import to_homogeneous
+from ..convert import graph as dgl_graph, to_homogeneous
 from ..data.utils import load_graphs, load_tensors, save_graphs, save_tensors
 from ..partition import (
+    _partition_part_with_halo,
     get_peak_mem,
     metis_partition_assignment,
+    multilevel_partition_assignment,
     partition_graph_with_halo,
+    reshuffle_graph,
 )
 from ..random import choice as random_choice
 from ..transforms import sort_csc_by_tag, sort_csr_by_tag
@@ -98,6 +103,59 @@ def _save_graphs(filename, g_list, formats=None, sort_etypes=False):
     save_graphs(filename, g_list, formats=formats)
 
 
+def _create_csc_sampling_graph(
+    src, dst, type_per_edge, num_nodes, ntypes, etypes
+):
+    """Create a CSCSamplingGraph of GraphBolt from the edges of a partition.
+
+    The CSC is built directly from the edge list so that a partition can be
+    saved for GraphBolt without reloading it as a DGLGraph. The in-edges of a
+    node keep the order of the edges in the input.
+
+    Parameters
+    ----------
+    src : numpy.ndarray
+        The local source node IDs of the edges.
+    dst : numpy.ndarray
+        The local destination node IDs of the edges.
+    type_per_edge : numpy.ndarray, optional
+        The edge type IDs of the edges. All edges are of type 0 if None.
+    num_nodes : int
+        The number of nodes in the partition.
+    ntypes : dict[str, int]
+        The map from node types to node type IDs.
+    etypes : dict[tuple[str, str, str], int]
+        The map from canonical edge types to edge type IDs.
+
+    Returns
+    -------
+    CSCSamplingGraph
+        The partition as a CSCSamplingGraph.
+    """
+    # As only this function requires GraphBolt for now, let's import here.
+    from .. import graphbolt
+
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    order = np.argsort(dst, kind="stable")
+    indptr = np.zeros((num_nodes + 1,), dtype=np.int64)
+    np.cumsum(np.bincount(dst, minlength=num_nodes), out=indptr[1:])
+    if type_per_edge is None:
+        type_per_edge = np.zeros((len(dst),), dtype=np.int64)
+    type_per_edge = F.astype(
+        F.zerocopy_from_numpy(np.asarray(type_per_edge)[order]),
+        RESERVED_FIELD_DTYPE[ETYPE],
+    )
+    metadata = graphbolt.GraphMetadata(ntypes, etypes)
+    return graphbolt.from_csc(
+        F.zerocopy_from_numpy(indptr),
+        F.zerocopy_from_numpy(src[order]),
+        None,
+        type_per_edge,
+        metadata,
+    )
+
+
 def _get_inner_node_mask(graph, ntype_id):
     if NTYPE in graph.ndata:
         dtype = F.dtype(graph.ndata["inner_node"])
@@ -533,6 +591,325 @@ def _set_trainer_ids(g, sim_g, node_parts):
             g.edges[c_etype].data["trainer_id"] = trainer_id
 
 
+def _set_part_types(g, sim_g, part):
+    """Set the node/edge types of a partition of a heterogeneous graph.
+
+    `part` has three types of node data at this point.
+    NTYPE: the node type.
+    orig_id: the global node IDs in the homogeneous version of input graph.
+    NID: the global node IDs in the reshuffled homogeneous version of the input
+    graph.
+
+    Parameters
+    ----------
+    g : DGLGraph
+       The input graph for partitioning.
+    sim_g : DGLGraph
+        The homogeneous version of the input graph.
+    part : DGLGraph
+        The partition.
+    """
+    orig_ids = part.ndata["orig_id"]
+    ntype = F.gather_row(sim_g.ndata[NTYPE], orig_ids)
+    part.ndata[NTYPE] = F.astype(ntype, RESERVED_FIELD_DTYPE[NTYPE])
+    assert np.all(F.asnumpy(ntype) == F.asnumpy(part.ndata[NTYPE]))
+    # Get the original edge types and original edge IDs.
+    orig_ids = part.edata["orig_id"]
+    etype = F.gather_row(sim_g.edata[ETYPE], orig_ids)
+    part.edata[ETYPE] = F.astype(etype, RESERVED_FIELD_DTYPE[ETYPE])
+    assert np.all(F.asnumpy(etype) == F.asnumpy(part.edata[ETYPE]))
+
+    # Calculate the global node IDs to per-node IDs mapping.
+    inner_ntype = F.boolean_mask(
+        part.ndata[NTYPE], part.ndata["inner_node"] == 1
+    )
+    inner_nids = F.boolean_mask(part.ndata[NID], part.ndata["inner_node"] == 1)
+    for ntype in g.ntypes:
+        inner_ntype_mask = inner_ntype == g.get_ntype_id(ntype)
+        typed_nids = F.boolean_mask(inner_nids, inner_ntype_mask)
+        # inner node IDs are in a contiguous ID range.
+        expected_range = np.arange(
+            int(F.as_scalar(typed_nids[0])),
+            int(F.as_scalar(typed_nids[-1])) + 1,
+        )
+        assert np.all(F.asnumpy(typed_nids) == expected_range)
+    # Calculate the global edge IDs to per-edge IDs mapping.
+    inner_etype = F.boolean_mask(
+        part.edata[ETYPE], part.edata["inner_edge"] == 1
+    )
+    inner_eids = F.boolean_mask(part.edata[EID], part.edata["inner_edge"] == 1)
+    for etype in g.canonical_etypes:
+        inner_etype_mask = inner_etype == g.get_etype_id(etype)
+        typed_eids = np.sort(
+            F.asnumpy(F.boolean_mask(inner_eids, inner_etype_mask))
+        )
+        assert np.all(
+            typed_eids == np.arange(int(typed_eids[0]), int(typed_eids[-1]) + 1)
+        )
+
+
+def _save_partition(
+    g,
+    sim_g,
+    part,
+    part_id,
+    num_parts,
+    out_path,
+    graph_formats,
+    use_graphbolt=False,
+):
+    """Split the node/edge features of a partition and save it on files.
+
+    Parameters
+    ----------
+    g : DGLGraph
+       The input graph for partitioning.
+    sim_g : DGLGraph
+        The homogeneous version of the input graph.
+    part : DGLGraph
+        The partition.
+    part_id : int
+        The partition ID.
+    num_parts : int
+        The number of partitions.
+    out_path : str
+        The absolute path of the output directory.
+    graph_formats : str or list[str]
+        The formats to save the partition in.
+    use_graphbolt : bool, optional
+        Whether to save the partition as a CSCSamplingGraph of GraphBolt too.
+
+    Returns
+    -------
+    dict
+        The ID ranges ``node_map``/``edge_map`` and the numbers
+        ``num_nodes``/``num_edges`` of the inner nodes/edges of each type,
+        the number of inner edges ``num_inner_edges`` and the relative paths
+        of the saved ``files``.
+    """
+    # Get the ID ranges of the inner nodes/edges of each type.
+    node_map = {}
+    edge_map = {}
+    num_nodes = {}
+    num_edges = {}
+    for ntype in g.ntypes:
+        inner_node_mask = _get_inner_node_mask(part, g.get_ntype_id(ntype))
+        num_nodes[ntype] = F.as_scalar(
+            F.sum(F.astype(inner_node_mask, F.int64), 0)
+        )
+        inner_nids = F.boolean_mask(part.ndata[NID], inner_node_mask)
+        node_map[ntype] = [
+            int(F.as_scalar(inner_nids[0])),
+            int(F.as_scalar(inner_nids[-1])) + 1,
+        ]
+    for etype in g.canonical_etypes:
+        inner_edge_mask = _get_inner_edge_mask(part, g.get_etype_id(etype))
+        num_edges[etype] = F.as_scalar(
+            F.sum(F.astype(inner_edge_mask, F.int64), 0)
+        )
+        inner_eids = np.sort(
+            F.asnumpy(F.boolean_mask(part.edata[EID], inner_edge_mask))
+        )
+        edge_map[etype] = [int(inner_eids[0]), int(inner_eids[-1]) + 1]
+
+    # Get the node/edge features of each partition.
+    node_feats = {}
+    edge_feats = {}
+    num_inner_edges = 0
+    if num_parts > 1:
+        for ntype in g.ntypes:
+            ntype_id = g.get_ntype_id(ntype)
+            # To get the edges in the input graph, we should use original node IDs.
+            # Both orig_id and NID stores the per-node-type IDs.
+            ndata_name = "orig_id"
+            inner_node_mask = _get_inner_node_mask(part, ntype_id)
+            # This is global node IDs.
+            local_nodes = F.boolean_mask(
+                part.ndata[ndata_name], inner_node_mask
+            )
+            if len(g.ntypes) > 1:
+                # If the input is a heterogeneous graph.
+                local_nodes = F.gather_row(sim_g.ndata[NID], local_nodes)
+                print(
+                    "part {} has {} nodes of type {} and {} are inside the partition".format(
+                        part_id,
+                        F.as_scalar(F.sum(part.ndata[NTYPE] == ntype_id, 0)),
+                        ntype,
+                        len(local_nodes),
+                    )
+                )
+            else:
+                print(
+                    "part {} has {} nodes and {} are inside the partition".format(
+                        part_id, part.num_nodes(), len(local_nodes)
+                    )
+                )
+
+            for name in g.nodes[ntype].data:
+                if name in [NID, "inner_node"]:
+                    continue
+                node_feats[ntype + "/" + name] = F.gather_row(
+                    g.nodes[ntype].data[name], local_nodes
+                )
+
+        for etype in g.canonical_etypes:
+            etype_id = g.get_etype_id(etype)
+            edata_name = "orig_id"
+            inner_edge_mask = _get_inner_edge_mask(part, etype_id)
+            # This is global edge IDs.
+            local_edges = F.boolean_mask(
+                part.edata[edata_name], inner_edge_mask
+            )
+            if not g.is_homogeneous:
+                local_edges = F.gather_row(sim_g.edata[EID], local_edges)
+                print(
+                    "part {} has {} edges of type {} and {} are inside the partition".format(
+                        part_id,
+                        F.as_scalar(F.sum(part.edata[ETYPE] == etype_id, 0)),
+                        etype,
+                        len(local_edges),
+                    )
+                )
+            else:
+                print(
+                    "part {} has {} edges and {} are inside the partition".format(
+                        part_id, part.num_edges(), len(local_edges)
+                    )
+                )
+            num_inner_edges += len(local_edges)
+
+            for name in g.edges[etype].data:
+                if name in [EID, "inner_edge"]:
+                    continue
+                edge_feats[
+                    _etype_tuple_to_str(etype) + "/" + name
+                ] = F.gather_row(g.edges[etype].data[name], local_edges)
+    else:
+        for ntype in g.ntypes:
+            if len(g.ntypes) > 1:
+                ndata_name = "orig_id"
+                ntype_id = g.get_ntype_id(ntype)
+                inner_node_mask = _get_inner_node_mask(part, ntype_id)
+                # This is global node IDs.
+                local_nodes = F.boolean_mask(
+                    part.ndata[ndata_name], inner_node_mask
+                )
+                local_nodes = F.gather_row(sim_g.ndata[NID], local_nodes)
+            else:
+                local_nodes = sim_g.ndata[NID]
+            for name in g.nodes[ntype].data:
+                if name in [NID, "inner_node"]:
+                    continue
+                node_feats[ntype + "/" + name] = F.gather_row(
+                    g.nodes[ntype].data[name], local_nodes
+                )
+        for etype in g.canonical_etypes:
+            if not g.is_homogeneous:
+                edata_name = "orig_id"
+                etype_id = g.get_etype_id(etype)
+                inner_edge_mask = _get_inner_edge_mask(part, etype_id)
+                # This is global edge IDs.
+                local_edges = F.boolean_mask(
+                    part.edata[edata_name], inner_edge_mask
+                )
+                local_edges = F.gather_row(sim_g.edata[EID], local_edges)
+            else:
+                local_edges = sim_g.edata[EID]
+            for name in g.edges[etype].data:
+                if name in [EID, "inner_edge"]:
+                    continue
+                edge_feats[
+                    _etype_tuple_to_str(etype) + "/" + name
+                ] = F.gather_row(g.edges[etype].data[name], local_edges)
+    # delete `orig_id` from ndata/edata
+    del part.ndata["orig_id"]
+    del part.edata["orig_id"]
+
+    part_dir = os.path.join(out_path, "part" + str(part_id))
+    node_feat_file = os.path.join(part_dir, "node_feat.dgl")
+    edge_feat_file = os.path.join(part_dir, "edge_feat.dgl")
+    part_graph_file = os.path.join(part_dir, "graph.dgl")
+    os.makedirs(part_dir, mode=0o775, exist_ok=True)
+    save_tensors(node_feat_file, node_feats)
+    save_tensors(edge_feat_file, edge_feats)
+
+    sort_etypes = len(g.etypes) > 1
+    _save_graphs(
+        part_graph_file,
+        [part],
+        formats=graph_formats,
+        sort_etypes=sort_etypes,
+    )
+    if use_graphbolt:
+        # As only this function requires GraphBolt for now, let's import here.
+        from .. import graphbolt
+
+        src, dst = part.edges()
+        type_per_edge = (
+            F.asnumpy(part.edata[ETYPE]) if not g.is_homogeneous else None
+        )
+        csc_graph = _create_csc_sampling_graph(
+            F.asnumpy(src),
+            F.asnumpy(dst),
+            type_per_edge,
+            part.num_nodes(),
+            {ntype: g.get_ntype_id(ntype) for ntype in g.ntypes},
+            {etype: g.get_etype_id(etype) for etype in g.canonical_etypes},
+        )
+        graphbolt.save_csc_sampling_graph(
+            csc_graph, os.path.join(part_dir, "csc_sampling_graph.tar")
+        )
+    return {
+        "node_map": node_map,
+        "edge_map": edge_map,
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "num_inner_edges": num_inner_edges,
+        "files": {
+            "node_feats": os.path.relpath(node_feat_file, out_path),
+            "edge_feats": os.path.relpath(edge_feat_file, out_path),
+            "part_graph": os.path.relpath(part_graph_file, out_path),
+        },
+    }
+
+
+# The states of `partition_graph` shared with its worker processes. They are
+# inherited by fork() rather than pickled for each partition.
+_PARTITION_WORKER_STATE = None
+
+
+def _build_and_save_partition(part_id):
+    """Construct and save a partition in a worker process."""
+    state = _PARTITION_WORKER_STATE
+    # Share the CPU cores among the worker processes.
+    utils.set_num_threads(state["num_threads"])
+    g, sim_g = state["g"], state["sim_g"]
+    part = _partition_part_with_halo(
+        state["shuffled_g"], state["node_parts"], part_id, state["num_hops"]
+    )
+    if not g.is_homogeneous:
+        _set_part_types(g, sim_g, part)
+    res = _save_partition(
+        g,
+        sim_g,
+        part,
+        part_id,
+        state["num_parts"],
+        state["out_path"],
+        state["graph_formats"],
+        state["use_graphbolt"],
+    )
+    return part_id, res
+
+
+def _run_partition_worker(part_id):
+    # Run in a new thread to work around
+    # https://github.com/pytorch/pytorch/issues/17199 so that OpenMP works in
+    # the forked process.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_build_and_save_partition, part_id).result()
+
+
 def partition_graph(
     g,
     graph_name,
@@ -546,6 +923,8 @@ def partition_graph(
     num_trainers_per_machine=1,
     objtype="cut",
     graph_formats=None,
+    num_workers=0,
+    use_graphbolt=False,
 ):
     """Partition a graph for distributed training and store the partitions on files.
 
@@ -615,7 +994,7 @@ def partition_graph(
 
     * ``graph_name`` is the name of the graph given by a user.
     * ``part_method`` is the method used to assign nodes to partitions.
-      Currently, it supports "random" and "metis".
+      Currently, it supports "random", "metis" and "multilevel".
     * ``num_parts`` is the number of partitions.
     * ``halo_hops`` is the number of hops of nodes we include in a partition as HALO nodes.
     * ``node_map`` is the node assignment map, which tells the partition ID a node is assigned to.
@@ -692,16 +1071,20 @@ def partition_graph(
         The number of hops of HALO nodes we construct on a partition graph structure.
         The default value is 1.
     part_method : str, optional
-        The partition method. It supports "random" and "metis". The default value is "metis".
+        The partition method. It supports "random", "metis" and "multilevel". The default value
+        is "metis". "multilevel" uses :func:`~dgl.multilevel_partition_assignment`, which
+        coarsens the graph with DGL's own edge coarsening and refines the partitions with label
+        propagation instead of calling Metis.
     balance_ntypes : tensor, optional
         Node type of each node. This is a 1D-array of integers. Its values indicates the node
-        type of each node. This argument is used by Metis partition. When the argument is
-        specified, the Metis algorithm will try to partition the input graph into partitions where
-        each partition has roughly the same number of nodes for each node type. The default value
-        is None, which means Metis partitions the graph to only balance the number of nodes.
+        type of each node. This argument is used by the Metis and multilevel partitions. When
+        the argument is specified, the algorithm will try to partition the input graph into
+        partitions where each partition has roughly the same number of nodes for each node type.
+        The default value is None, which means the graph is partitioned to only balance the
+        number of nodes.
     balance_edges : bool
         Indicate whether to balance the edges in each partition. This argument is used by
-        the Metis algorithm.
+        the Metis and multilevel algorithms.
     return_mapping : bool
         Indicate whether to return the mapping between shuffled node/edge IDs and the original
         node/edge IDs.
@@ -719,6 +1102,23 @@ def partition_graph(
         ``csc`` and ``csr``. If not specified, save one format only according to what
         format is available. If multiple formats are available, selection priority
         from high to low is ``coo``, ``csc``, ``csr``.
+    num_workers : int, optional
+        The number of worker processes to construct and save the partitions
+        with. If greater than 1, each partition is built, split and written
+        to files by a forked worker process, so that the features of a
+        partition are streamed to disk instead of the features of all
+        partitions being held in the main process. The workers share the
+        CPU cores evenly. The default value is 0, which constructs and saves
+        the partitions sequentially in the main process. Only applies to the
+        ``metis``, ``multilevel`` and ``random`` methods with more than one
+        partition.
+    use_graphbolt : bool, optional
+        Whether to also save each partition as a ``CSCSamplingGraph`` of
+        GraphBolt in ``csc_sampling_graph.tar`` next to ``graph.dgl``. The
+        CSC and the edge types are computed from the partition in memory,
+        which avoids calling
+        :func:`~dgl.distributed.convert_dgl_partition_to_csc_sampling_graph`
+        afterwards. The default value is False.
 
     Returns
     -------
@@ -808,16 +1208,24 @@ def partition_graph(
             # First partition the whole graph to each trainer and save the trainer ids in
             # the node feature "trainer_id".
             start = time.time()
-            node_parts = metis_partition_assignment(
-                sim_g,
-                num_parts * num_trainers_per_machine,
-                balance_ntypes=balance_ntypes,
-                balance_edges=balance_edges,
-                mode="k-way",
-            )
+            if part_method == "multilevel":
+                node_parts = multilevel_partition_assignment(
+                    sim_g,
+                    num_parts * num_trainers_per_machine,
+                    balance_ntypes=balance_ntypes,
+                    balance_edges=balance_edges,
+                )
+            else:
+                node_parts = metis_partition_assignment(
+                    sim_g,
+                    num_parts * num_trainers_per_machine,
+                    balance_ntypes=balance_ntypes,
+                    balance_edges=balance_edges,
+                    mode="k-way",
+                )
             _set_trainer_ids(g, sim_g, node_parts)
             print(
-                "Assigning nodes to METIS partitions takes {:.3f}s, peak mem: {:.3f} GB".format(
+                "Assigning nodes to trainer partitions takes {:.3f}s, peak mem: {:.3f} GB".format(
                     time.time() - start, get_peak_mem()
                 )
             )
@@ -852,7 +1260,7 @@ def partition_graph(
             RESERVED_FIELD_DTYPE["inner_edge"],
             F.cpu(),
         )
-    elif part_method in ("metis", "random"):
+    elif part_method in ("metis", "multilevel", "random"):
         start = time.time()
         sim_g, balance_ntypes = get_homogeneous(g, balance_ntypes)
         print(
@@ -892,12 +1300,45 @@ def partition_graph(
                     time.time() - start, get_peak_mem()
                 )
             )
+        elif part_method == "multilevel":
+            assert num_trainers_per_machine >= 1
+            start = time.time()
+            if num_trainers_per_machine > 1:
+                # As with Metis, partition the graph to each trainer first and
+                # coalesce the partitions of the trainers on the same machine.
+                node_parts = multilevel_partition_assignment(
+                    sim_g,
+                    num_parts * num_trainers_per_machine,
+                    balance_ntypes=balance_ntypes,
+                    balance_edges=balance_edges,
+                )
+                _set_trainer_ids(g, sim_g, node_parts)
+                node_parts = F.floor_div(node_parts, num_trainers_per_machine)
+            else:
+                node_parts = multilevel_partition_assignment(
+                    sim_g,
+                    num_parts,
+                    balance_ntypes=balance_ntypes,
+                    balance_edges=balance_edges,
+                )
+            print(
+                "Assigning nodes to multilevel partitions takes {:.3f}s, peak mem: {:.3f} GB".format(
+                    time.time() - start, get_peak_mem()
+                )
+            )
         else:
             node_parts = random_choice(num_parts, sim_g.num_nodes())
         start = time.time()
-        parts, orig_nids, orig_eids = partition_graph_with_halo(
-            sim_g, node_parts, num_hops, reshuffle=True
-        )
+        if num_workers > 1:
+            # The partitions are constructed by the worker processes.
+            shuffled_g, node_parts = reshuffle_graph(sim_g, node_parts)
+            orig_nids = shuffled_g.ndata["orig_id"]
+            orig_eids = shuffled_g.edata["orig_id"]
+            parts = None
+        else:
+            parts, orig_nids, orig_eids = partition_graph_with_halo(
+                sim_g, node_parts, num_hops, reshuffle=True
+            )
         print(
             "Splitting the graph into partitions takes {:.3f}s, peak mem: {:.3f} GB".format(
                 time.time() - start, get_peak_mem()
@@ -908,136 +1349,88 @@ def partition_graph(
     else:
         raise Exception("Unknown partitioning method: " + part_method)
 
-    # If the input is a heterogeneous graph, get the original node types and original node IDs.
-    # `part' has three types of node data at this point.
-    # NTYPE: the node type.
-    # orig_id: the global node IDs in the homogeneous version of input graph.
-    # NID: the global node IDs in the reshuffled homogeneous version of the input graph.
-    if not g.is_homogeneous:
-        for name in parts:
-            orig_ids = parts[name].ndata["orig_id"]
-            ntype = F.gather_row(sim_g.ndata[NTYPE], orig_ids)
-            parts[name].ndata[NTYPE] = F.astype(
-                ntype, RESERVED_FIELD_DTYPE[NTYPE]
-            )
-            assert np.all(
-                F.asnumpy(ntype) == F.asnumpy(parts[name].ndata[NTYPE])
-            )
-            # Get the original edge types and original edge IDs.
-            orig_ids = parts[name].edata["orig_id"]
-            etype = F.gather_row(sim_g.edata[ETYPE], orig_ids)
-            parts[name].edata[ETYPE] = F.astype(
-                etype, RESERVED_FIELD_DTYPE[ETYPE]
-            )
-            assert np.all(
-                F.asnumpy(etype) == F.asnumpy(parts[name].edata[ETYPE])
-            )
-
-            # Calculate the global node IDs to per-node IDs mapping.
-            inner_ntype = F.boolean_mask(
-                parts[name].ndata[NTYPE], parts[name].ndata["inner_node"] == 1
-            )
-            inner_nids = F.boolean_mask(
-                parts[name].ndata[NID], parts[name].ndata["inner_node"] == 1
-            )
-            for ntype in g.ntypes:
-                inner_ntype_mask = inner_ntype == g.get_ntype_id(ntype)
-                typed_nids = F.boolean_mask(inner_nids, inner_ntype_mask)
-                # inner node IDs are in a contiguous ID range.
-                expected_range = np.arange(
-                    int(F.as_scalar(typed_nids[0])),
-                    int(F.as_scalar(typed_nids[-1])) + 1,
-                )
-                assert np.all(F.asnumpy(typed_nids) == expected_range)
-            # Calculate the global edge IDs to per-edge IDs mapping.
-            inner_etype = F.boolean_mask(
-                parts[name].edata[ETYPE], parts[name].edata["inner_edge"] == 1
-            )
-            inner_eids = F.boolean_mask(
-                parts[name].edata[EID], parts[name].edata["inner_edge"] == 1
-            )
-            for etype in g.canonical_etypes:
-                inner_etype_mask = inner_etype == g.get_etype_id(etype)
-                typed_eids = np.sort(
-                    F.asnumpy(F.boolean_mask(inner_eids, inner_etype_mask))
-                )
-                assert np.all(
-                    typed_eids
-                    == np.arange(int(typed_eids[0]), int(typed_eids[-1]) + 1)
-                )
-
     os.makedirs(out_path, mode=0o775, exist_ok=True)
     tot_num_inner_edges = 0
     out_path = os.path.abspath(out_path)
 
+    start = time.time()
+    if parts is None:
+        # Build, split and save each partition in a worker process. The input
+        # graph is inherited by fork() so that only the partition statistics
+        # are sent back to the parent process.
+        global _PARTITION_WORKER_STATE  # pylint: disable=global-statement
+        shuffled_g.create_formats_()
+        _PARTITION_WORKER_STATE = {
+            "g": g,
+            "sim_g": sim_g,
+            "shuffled_g": shuffled_g,
+            "node_parts": node_parts,
+            "num_hops": num_hops,
+            "num_parts": num_parts,
+            "out_path": out_path,
+            "graph_formats": graph_formats,
+            "use_graphbolt": use_graphbolt,
+            "num_threads": max(1, (os.cpu_count() or 1) // num_workers),
+        }
+        part_results = {}
+        try:
+            ctx = mp.get_context("fork")
+            num_procs = min(num_workers, num_parts)
+            with ctx.Pool(num_procs, maxtasksperchild=1) as pool:
+                for part_id, res in pool.imap_unordered(
+                    _run_partition_worker, range(num_parts)
+                ):
+                    part_results[part_id] = res
+        finally:
+            _PARTITION_WORKER_STATE = None
+        del shuffled_g
+    else:
+        part_results = {}
+        for part_id in range(num_parts):
+            # Release the partition once it has been saved.
+            part = parts.pop(part_id)
+            if not g.is_homogeneous:
+                _set_part_types(g, sim_g, part)
+            part_results[part_id] = _save_partition(
+                g,
+                sim_g,
+                part,
+                part_id,
+                num_parts,
+                out_path,
+                graph_formats,
+                use_graphbolt,
+            )
+    print(
+        "Save partitions: {:.3f} seconds, peak memory: {:.3f} GB".format(
+            time.time() - start, get_peak_mem()
+        )
+    )
+
+    node_map_val = {
+        ntype: [part_results[i]["node_map"][ntype] for i in range(num_parts)]
+        for ntype in g.ntypes
+    }
+    edge_map_val = {
+        etype: [part_results[i]["edge_map"][etype] for i in range(num_parts)]
+        for etype in g.canonical_etypes
+    }
     # With reshuffling, we can ensure that all nodes and edges are reshuffled
     # and are in contiguous ID space.
     if num_parts > 1:
-        node_map_val = {}
-        edge_map_val = {}
         for ntype in g.ntypes:
-            ntype_id = g.get_ntype_id(ntype)
-            val = []
-            node_map_val[ntype] = []
-            for i in parts:
-                inner_node_mask = _get_inner_node_mask(parts[i], ntype_id)
-                val.append(
-                    F.as_scalar(F.sum(F.astype(inner_node_mask, F.int64), 0))
-                )
-                inner_nids = F.boolean_mask(
-                    parts[i].ndata[NID], inner_node_mask
-                )
-                node_map_val[ntype].append(
-                    [
-                        int(F.as_scalar(inner_nids[0])),
-                        int(F.as_scalar(inner_nids[-1])) + 1,
-                    ]
-                )
+            val = [
+                part_results[i]["num_nodes"][ntype] for i in range(num_parts)
+            ]
             val = np.cumsum(val).tolist()
             assert val[-1] == g.num_nodes(ntype)
         for etype in g.canonical_etypes:
-            etype_id = g.get_etype_id(etype)
-            val = []
-            edge_map_val[etype] = []
-            for i in parts:
-                inner_edge_mask = _get_inner_edge_mask(parts[i], etype_id)
-                val.append(
-                    F.as_scalar(F.sum(F.astype(inner_edge_mask, F.int64), 0))
-                )
-                inner_eids = np.sort(
-                    F.asnumpy(
-                        F.boolean_mask(parts[i].edata[EID], inner_edge_mask)
-                    )
-                )
-                edge_map_val[etype].append(
-                    [int(inner_eids[0]), int(inner_eids[-1]) + 1]
-                )
+            val = [
+                part_results[i]["num_edges"][etype] for i in range(num_parts)
+            ]
             val = np.cumsum(val).tolist()
             assert val[-1] == g.num_edges(etype)
     else:
-        node_map_val = {}
-        edge_map_val = {}
-        for ntype in g.ntypes:
-            ntype_id = g.get_ntype_id(ntype)
-            inner_node_mask = _get_inner_node_mask(parts[0], ntype_id)
-            inner_nids = F.boolean_mask(parts[0].ndata[NID], inner_node_mask)
-            node_map_val[ntype] = [
-                [
-                    int(F.as_scalar(inner_nids[0])),
-                    int(F.as_scalar(inner_nids[-1])) + 1,
-                ]
-            ]
-        for etype in g.canonical_etypes:
-            etype_id = g.get_etype_id(etype)
-            inner_edge_mask = _get_inner_edge_mask(parts[0], etype_id)
-            inner_eids = F.boolean_mask(parts[0].edata[EID], inner_edge_mask)
-            edge_map_val[etype] = [
-                [
-                    int(F.as_scalar(inner_eids[0])),
-                    int(F.as_scalar(inner_eids[-1])) + 1,
-                ]
-            ]
-
         # Double check that the node IDs in the global ID space are sorted.
         for ntype in node_map_val:
             val = np.concatenate([np.array(l) for l in node_map_val[ntype]])
@@ -1046,7 +1439,6 @@ def partition_graph(
             val = np.concatenate([np.array(l) for l in edge_map_val[etype]])
             assert np.all(val[:-1] <= val[1:])
 
-    start = time.time()
     ntypes = {ntype: g.get_ntype_id(ntype) for ntype in g.ntypes}
     etypes = {etype: g.get_etype_id(etype) for etype in g.canonical_etypes}
     part_metadata = {
@@ -1062,149 +1454,9 @@ def partition_graph(
         "etypes": etypes,
     }
     for part_id in range(num_parts):
-        part = parts[part_id]
-
-        # Get the node/edge features of each partition.
-        node_feats = {}
-        edge_feats = {}
-        if num_parts > 1:
-            for ntype in g.ntypes:
-                ntype_id = g.get_ntype_id(ntype)
-                # To get the edges in the input graph, we should use original node IDs.
-                # Both orig_id and NID stores the per-node-type IDs.
-                ndata_name = "orig_id"
-                inner_node_mask = _get_inner_node_mask(part, ntype_id)
-                # This is global node IDs.
-                local_nodes = F.boolean_mask(
-                    part.ndata[ndata_name], inner_node_mask
-                )
-                if len(g.ntypes) > 1:
-                    # If the input is a heterogeneous graph.
-                    local_nodes = F.gather_row(sim_g.ndata[NID], local_nodes)
-                    print(
-                        "part {} has {} nodes of type {} and {} are inside the partition".format(
-                            part_id,
-                            F.as_scalar(
-                                F.sum(part.ndata[NTYPE] == ntype_id, 0)
-                            ),
-                            ntype,
-                            len(local_nodes),
-                        )
-                    )
-                else:
-                    print(
-                        "part {} has {} nodes and {} are inside the partition".format(
-                            part_id, part.num_nodes(), len(local_nodes)
-                        )
-                    )
-
-                for name in g.nodes[ntype].data:
-                    if name in [NID, "inner_node"]:
-                        continue
-                    node_feats[ntype + "/" + name] = F.gather_row(
-                        g.nodes[ntype].data[name], local_nodes
-                    )
-
-            for etype in g.canonical_etypes:
-                etype_id = g.get_etype_id(etype)
-                edata_name = "orig_id"
-                inner_edge_mask = _get_inner_edge_mask(part, etype_id)
-                # This is global edge IDs.
-                local_edges = F.boolean_mask(
-                    part.edata[edata_name], inner_edge_mask
-                )
-                if not g.is_homogeneous:
-                    local_edges = F.gather_row(sim_g.edata[EID], local_edges)
-                    print(
-                        "part {} has {} edges of type {} and {} are inside the partition".format(
-                            part_id,
-                            F.as_scalar(
-                                F.sum(part.edata[ETYPE] == etype_id, 0)
-                            ),
-                            etype,
-                            len(local_edges),
-                        )
-                    )
-                else:
-                    print(
-                        "part {} has {} edges and {} are inside the partition".format(
-                            part_id, part.num_edges(), len(local_edges)
-                        )
-                    )
-                tot_num_inner_edges += len(local_edges)
-
-                for name in g.edges[etype].data:
-                    if name in [EID, "inner_edge"]:
-                        continue
-                    edge_feats[
-                        _etype_tuple_to_str(etype) + "/" + name
-                    ] = F.gather_row(g.edges[etype].data[name], local_edges)
-        else:
-            for ntype in g.ntypes:
-                if len(g.ntypes) > 1:
-                    ndata_name = "orig_id"
-                    ntype_id = g.get_ntype_id(ntype)
-                    inner_node_mask = _get_inner_node_mask(part, ntype_id)
-                    # This is global node IDs.
-                    local_nodes = F.boolean_mask(
-                        part.ndata[ndata_name], inner_node_mask
-                    )
-                    local_nodes = F.gather_row(sim_g.ndata[NID], local_nodes)
-                else:
-                    local_nodes = sim_g.ndata[NID]
-                for name in g.nodes[ntype].data:
-                    if name in [NID, "inner_node"]:
-                        continue
-                    node_feats[ntype + "/" + name] = F.gather_row(
-                        g.nodes[ntype].data[name], local_nodes
-                    )
-            for etype in g.canonical_etypes:
-                if not g.is_homogeneous:
-                    edata_name = "orig_id"
-                    etype_id = g.get_etype_id(etype)
-                    inner_edge_mask = _get_inner_edge_mask(part, etype_id)
-                    # This is global edge IDs.
-                    local_edges = F.boolean_mask(
-                        part.edata[edata_name], inner_edge_mask
-                    )
-                    local_edges = F.gather_row(sim_g.edata[EID], local_edges)
-                else:
-                    local_edges = sim_g.edata[EID]
-                for name in g.edges[etype].data:
-                    if name in [EID, "inner_edge"]:
-                        continue
-                    edge_feats[
-                        _etype_tuple_to_str(etype) + "/" + name
-                    ] = F.gather_row(g.edges[etype].data[name], local_edges)
-        # delete `orig_id` from ndata/edata
-        del part.ndata["orig_id"]
-        del part.edata["orig_id"]
-
-        part_dir = os.path.join(out_path, "part" + str(part_id))
-        node_feat_file = os.path.join(part_dir, "node_feat.dgl")
-        edge_feat_file = os.path.join(part_dir, "edge_feat.dgl")
-        part_graph_file = os.path.join(part_dir, "graph.dgl")
-        part_metadata["part-{}".format(part_id)] = {
-            "node_feats": os.path.relpath(node_feat_file, out_path),
-            "edge_feats": os.path.relpath(edge_feat_file, out_path),
-            "part_graph": os.path.relpath(part_graph_file, out_path),
-        }
-        os.makedirs(part_dir, mode=0o775, exist_ok=True)
-        save_tensors(node_feat_file, node_feats)
-        save_tensors(edge_feat_file, edge_feats)
-
-        sort_etypes = len(g.etypes) > 1
-        _save_graphs(
-            part_graph_file,
-            [part],
-            formats=graph_formats,
-            sort_etypes=sort_etypes,
-        )
-    print(
-        "Save partitions: {:.3f} seconds, peak memory: {:.3f} GB".format(
-            time.time() - start, get_peak_mem()
-        )
-    )
+        res = part_results[part_id]
+        part_metadata["part-{}".format(part_id)] = res["files"]
+        tot_num_inner_edges += res["num_inner_edges"]
 
     _dump_part_config(f"{out_path}/{graph_name}.json", part_metadata)
 
@@ -1230,6 +1482,8 @@ def convert_dgl_partition_to_csc_sampling_graph(part_config):
 
     In the near future, partitions are supposed to be saved as
     `CSCSamplingGraph` directly. At that time, this API should be deprecated.
+    :func:`~dgl.distributed.partition_graph` already does so if
+    ``use_graphbolt=True``.
 
     Parameters
     ----------
@@ -1273,3 +1527,869 @@ def convert_dgl_partition_to_csc_sampling_graph(part_config):
             os.path.dirname(orig_graph_path), "csc_sampling_graph.tar"
         )
         graphbolt.save_csc_sampling_graph(csc_graph, csc_graph_path)
+
+
+def _assign_to_trainers(costs, loads):
+    """Assign weighted items to trainers, heaviest first, in rounds.
+
+    Every round hands one item to each trainer, so the numbers of items of
+    two trainers differ by at most one, and the heaviest remaining items go
+    to the trainers with the smallest loads. ``loads`` is updated in place.
+    """
+    num_trainers = len(loads)
+    order = np.argsort(-costs, kind="stable")
+    assignment = np.empty(len(costs), dtype=np.int64)
+    for start in range(0, len(order), num_trainers):
+        idx = order[start : start + num_trainers]
+        trainers = np.argsort(loads, kind="stable")[: len(idx)]
+        assignment[idx] = trainers
+        loads[trainers] += costs[idx]
+    return assignment
+
+
+def _balance_machines(costs, machines, num_parts):
+    """Move seeds from machines above the average cost to those below it.
+
+    The heaviest seeds of an overloaded machine move first as long as they
+    fit in its excess, which keeps the number of seeds leaving their home
+    machine small. Returns the new machine of each seed.
+    """
+    machines = machines.copy()
+    machine_costs = np.bincount(machines, weights=costs, minlength=num_parts)
+    target = machine_costs.sum() / num_parts
+    moved = []
+    for part_id in np.nonzero(machine_costs > target)[0]:
+        idx = np.nonzero(machines == part_id)[0]
+        idx = idx[np.argsort(-costs[idx], kind="stable")]
+        excess = machine_costs[part_id] - target
+        moved.append(idx[np.cumsum(costs[idx]) <= excess])
+    moved = np.concatenate(moved) if moved else np.zeros(0, np.int64)
+    deficit = np.maximum(target - machine_costs, 0)
+    if len(moved) == 0 or deficit.sum() == 0:
+        return machines
+    # Lay the moved seeds out one after another and cut the sequence by the
+    # cumulative deficits of the receiving machines.
+    receivers = np.nonzero(deficit > 0)[0]
+    mid = np.cumsum(costs[moved]) - costs[moved] / 2
+    receiver = np.searchsorted(np.cumsum(deficit[receivers]), mid)
+    receiver = receivers[np.minimum(receiver, len(receivers) - 1)]
+    machines[moved] = receiver
+    return machines
+
+
+def rebalance_trainer_ids(
+    part_config,
+    num_trainers_per_machine,
+    train_mask="train_mask",
+    cost="degree",
+    fanouts=None,
+    balance_machines=False,
+):
+    """Rebalance the training seeds of existing partitions across trainers.
+
+    :func:`~dgl.distributed.partition_graph` can only assign trainer IDs when
+    the graph is partitioned, and :func:`~dgl.distributed.node_split` falls
+    back to an even split inside a partition otherwise, which balances the
+    number of seeds but not the cost of training on them. This API reassigns
+    the seeds of every partition to its trainers so that both the number of
+    seeds and their total cost are balanced, without repartitioning the graph.
+
+    The cost of a seed is estimated from its in-degree in the partition:
+
+    * ``"count"``: every seed costs the same.
+    * ``"degree"``: the in-degree of the seed plus one.
+    * ``"fanout"``: the expected number of nodes sampled with ``fanouts``,
+      using the in-degree of the seed for the first layer and the average
+      fanout of the graph for the others.
+    * A callable ``cost(ntype, in_degrees)`` that returns the cost of the
+      seeds of the node type from their in-degrees as a numpy array.
+
+    If ``balance_machines`` is True, seeds of machines whose total cost is
+    above the average are also moved to machines below it.
+
+    The new trainer IDs overwrite the ``trainer_id`` node data of the
+    partitions, and the ``trainer_id`` edge data if it exists, which
+    follows the destination nodes. The seeds of each trainer are also saved
+    in ``trainer_splits.dgl`` of the partition directory of its machine,
+    under the name ``<ntype>/<local trainer ID>``, and the file is recorded
+    in the partition configuration as ``trainer_splits``. The node IDs are
+    type-wise global IDs, so trainers can load them directly with
+    :func:`dgl.data.utils.load_tensors` instead of calling
+    :func:`~dgl.distributed.node_split`. Seeds moved to other machines are
+    only reflected in the split files, as :func:`~dgl.distributed.node_split`
+    always starts from the nodes of the local partition.
+
+    Parameters
+    ----------
+    part_config : str
+        The partition configuration JSON file.
+    num_trainers_per_machine : int
+        The number of trainers per machine.
+    train_mask : str, optional
+        The name of the node data that marks the training seeds. Node types
+        without it have no seeds. Default: ``"train_mask"``.
+    cost : str or callable, optional
+        The cost model of a seed, see above. Default: ``"degree"``.
+    fanouts : list[int], optional
+        The fanout of every sampling layer, from the seeds outwards. Required
+        if ``cost`` is ``"fanout"``.
+    balance_machines : bool, optional
+        Whether to move seeds across machines as well. Default: False.
+
+    Returns
+    -------
+    Tensor
+        The total cost of the seeds of each trainer, indexed by the trainer
+        ID ``part_id * num_trainers_per_machine + local trainer ID``.
+
+    Examples
+    --------
+    >>> dgl.distributed.rebalance_trainer_ids(
+    ...     'output/test.json', 4, cost='fanout', fanouts=[15, 10])
+    >>> splits = dgl.data.utils.load_tensors('output/part0/trainer_splits.dgl')
+    >>> train_nids = splits['_N/0']
+    """
+    if num_trainers_per_machine < 1:
+        raise DGLError("num_trainers_per_machine must be at least 1.")
+    if cost == "fanout" and not fanouts:
+        raise DGLError("fanouts are required to estimate the fanout cost.")
+    if not (callable(cost) or cost in ("count", "degree", "fanout")):
+        raise DGLError(f"Unknown cost model {cost}.")
+    config_path = os.path.dirname(part_config)
+    part_meta = _load_part_config(part_config)
+    num_parts = part_meta["num_parts"]
+
+    # Collect the seeds of all partitions, as type-wise node IDs, with their
+    # in-degrees.
+    seed_ntypes, seed_nids, seed_degs, seed_parts = [], [], [], []
+    fanout_sums = np.zeros(len(fanouts) if fanouts else 0)
+    num_inner_nodes = 0
+    for part_id in range(num_parts):
+        graph, _, _, gpb, _, _, _ = load_partition(
+            part_config, part_id, load_feats=False
+        )
+        node_feats, _ = load_partition_feats(
+            part_config, part_id, load_edges=False
+        )
+        in_degs = F.asnumpy(graph.in_degrees())
+        inner_degs = in_degs[F.asnumpy(graph.ndata["inner_node"]) == 1]
+        num_inner_nodes += len(inner_degs)
+        for i, fanout in enumerate(fanouts or []):
+            fanout_sums[i] += np.minimum(inner_degs, fanout).sum()
+        for ntype_id, ntype in enumerate(gpb.ntypes):
+            name = ntype + "/" + train_mask
+            if name not in node_feats:
+                continue
+            inner_nids = F.nonzero_1d(_get_inner_node_mask(graph, ntype_id))
+            _, typed_nids = gpb.map_to_per_ntype(
+                F.gather_row(graph.ndata[NID], inner_nids)
+            )
+            rows = F.asnumpy(gpb.nid2localnid(typed_nids, part_id, ntype))
+            is_seed = F.asnumpy(node_feats[name])[rows] != 0
+            seed_ntypes.append(np.full(is_seed.sum(), ntype_id))
+            seed_nids.append(F.asnumpy(typed_nids)[is_seed])
+            seed_degs.append(in_degs[F.asnumpy(inner_nids)][is_seed])
+            seed_parts.append(np.full(is_seed.sum(), part_id))
+    if len(seed_nids) == 0:
+        raise DGLError(f"No node type has the training mask {train_mask}.")
+    ntypes = gpb.ntypes
+    seed_ntypes = np.concatenate(seed_ntypes).astype(np.int64)
+    seed_nids = np.concatenate(seed_nids).astype(np.int64)
+    seed_degs = np.concatenate(seed_degs).astype(np.float64)
+    seed_parts = np.concatenate(seed_parts).astype(np.int64)
+
+    if callable(cost):
+        costs = np.zeros(len(seed_nids))
+        for ntype_id, ntype in enumerate(ntypes):
+            idx = seed_ntypes == ntype_id
+            costs[idx] = cost(ntype, seed_degs[idx])
+    elif cost == "count":
+        costs = np.ones(len(seed_nids))
+    elif cost == "degree":
+        costs = seed_degs + 1
+    else:
+        avg_fanouts = fanout_sums / max(num_inner_nodes, 1)
+        frontier = np.minimum(seed_degs, fanouts[0])
+        costs = 1 + frontier
+        for avg_fanout in avg_fanouts[1:]:
+            frontier = frontier * avg_fanout
+            costs += frontier
+
+    seed_machines = seed_parts
+    if balance_machines and num_parts > 1:
+        seed_machines = _balance_machines(costs, seed_parts, num_parts)
+    trainer_ids = np.empty(len(seed_nids), dtype=np.int64)
+    loads = np.zeros((num_parts, num_trainers_per_machine))
+    for part_id in range(num_parts):
+        for ntype_id in range(len(ntypes)):
+            idx = np.nonzero(
+                (seed_machines == part_id) & (seed_ntypes == ntype_id)
+            )[0]
+            trainer_ids[idx] = part_id * num_trainers_per_machine
+            trainer_ids[idx] += _assign_to_trainers(costs[idx], loads[part_id])
+
+    # Write the new trainer IDs back to the partitions and save the splits.
+    for part_id in range(num_parts):
+        graph, _, _, gpb, _, _, _ = load_partition(
+            part_config, part_id, load_feats=False
+        )
+        node_feats, edge_feats = load_partition_feats(part_config, part_id)
+        part_files = part_meta[f"part-{part_id}"]
+        new_trainer_ids = {}
+        for ntype_id, ntype in enumerate(ntypes):
+            num_inner = len(F.nonzero_1d(_get_inner_node_mask(graph, ntype_id)))
+            name = ntype + "/trainer_id"
+            if name in node_feats:
+                # Keep the non-seed nodes on the trainer they had.
+                trainer_id = F.asnumpy(node_feats[name]).astype(np.int64)
+                trainer_id = trainer_id % num_trainers_per_machine
+            else:
+                trainer_id = np.arange(num_inner) % num_trainers_per_machine
+            trainer_id += part_id * num_trainers_per_machine
+            idx = (seed_parts == part_id) & (seed_ntypes == ntype_id)
+            rows = gpb.nid2localnid(F.tensor(seed_nids[idx]), part_id, ntype)
+            trainer_id[F.asnumpy(rows)] = trainer_ids[idx]
+            new_trainer_ids[ntype] = trainer_id
+            node_feats[name] = F.tensor(trainer_id)
+        for etype_id, c_etype in enumerate(gpb.canonical_etypes):
+            name = _etype_tuple_to_str(c_etype) + "/trainer_id"
+            if name not in edge_feats:
+                continue
+            # An edge belongs to the trainer of its destination node, which
+            # is always an inner node of the partition.
+            inner_eids = F.nonzero_1d(_get_inner_edge_mask(graph, etype_id))
+            _, typed_eids = gpb.map_to_per_etype(
+                F.gather_row(graph.edata[EID], inner_eids)
+            )
+            rows = F.asnumpy(gpb.eid2localeid(typed_eids, part_id, c_etype))
+            dst = F.gather_row(graph.edges()[1], inner_eids)
+            _, dst_nids = gpb.map_to_per_ntype(
+                F.gather_row(graph.ndata[NID], dst)
+            )
+            dst_rows = gpb.nid2localnid(dst_nids, part_id, c_etype[2])
+            edge_trainer_id = np.empty(len(rows), dtype=np.int64)
+            edge_trainer_id[rows] = new_trainer_ids[c_etype[2]][
+                F.asnumpy(dst_rows)
+            ]
+            edge_feats[name] = F.tensor(edge_trainer_id)
+        save_tensors(
+            os.path.join(config_path, part_files["node_feats"]), node_feats
+        )
+        save_tensors(
+            os.path.join(config_path, part_files["edge_feats"]), edge_feats
+        )
+
+        splits = {}
+        for ntype_id, ntype in enumerate(ntypes):
+            idx = (seed_machines == part_id) & (seed_ntypes == ntype_id)
+            for i in range(num_trainers_per_machine):
+                trainer_id = part_id * num_trainers_per_machine + i
+                nids = np.sort(seed_nids[idx & (trainer_ids == trainer_id)])
+                splits[f"{ntype}/{i}"] = F.tensor(nids)
+        split_file = os.path.join(
+            os.path.dirname(part_files["node_feats"]), "trainer_splits.dgl"
+        )
+        save_tensors(os.path.join(config_path, split_file), splits)
+        part_files["trainer_splits"] = split_file
+    _dump_part_config(part_config, part_meta)
+    return F.tensor(loads.reshape(-1))
+
+
+def _grow_id_ranges(id_ranges, num_added):
+    """Lay out the ID ranges after appending IDs to every partition and type.
+
+    Parameters
+    ----------
+    id_ranges : list[numpy.ndarray]
+        The ``(num_parts, 2)`` ID ranges of each type.
+    num_added : numpy.ndarray
+        The number of IDs appended to each partition and type.
+
+    Returns
+    -------
+    tuple
+        The old starts, the new starts and the old sizes of the ranges as
+        ``(num_parts, num_types)`` arrays, and the order of the types inside
+        a partition, which is the order of their first ranges as in
+        :class:`~dgl.distributed.RangePartitionBook`.
+    """
+    ranges = np.stack(id_ranges, 1).astype(np.int64)
+    num_parts, num_types, _ = ranges.shape
+    sizes = ranges[:, :, 1] - ranges[:, :, 0]
+    type_order = np.array(
+        sorted(range(num_types), key=lambda i: ranges[0, i, 0]), np.int64
+    )
+    new_sizes = (sizes + num_added)[:, type_order].reshape(-1)
+    new_starts = np.zeros_like(sizes)
+    new_starts[:, type_order] = (np.cumsum(new_sizes) - new_sizes).reshape(
+        num_parts, num_types
+    )
+    return ranges[:, :, 0], new_starts, sizes, type_order
+
+
+def _find_id_ranges(ids, starts, sizes, type_order):
+    """Find the partition and the type of the ranges holding the IDs."""
+    num_types = len(type_order)
+    ends = (starts + sizes)[:, type_order].reshape(-1)
+    block = np.searchsorted(ends, ids, side="right")
+    return block // num_types, type_order[block % num_types]
+
+
+def _assign_new_nodes(new_ids, nbr_new_ids, nbr_parts, num_new, loads, slack):
+    """Assign new nodes to the partitions holding most of their neighbors.
+
+    The neighbors are given as pairs of a new node ``new_ids[i]`` and either
+    another new node ``nbr_new_ids[i]`` or, if it is negative, the partition
+    ``nbr_parts[i]`` of an existing node. New nodes only connected to other
+    new nodes are assigned in later rounds, once their neighbors are. The
+    scores are discounted by the loads of the partitions as in linear
+    deterministic greedy, and the nodes left are spread over the least
+    loaded partitions.
+    """
+    num_parts = len(loads)
+    loads = loads.astype(np.float64)
+    capacity = slack * (loads.sum() + num_new) / num_parts
+    assignment = np.full(num_new, -1, dtype=np.int64)
+    if num_new == 0:
+        return assignment
+    while True:
+        parts = np.where(
+            nbr_new_ids >= 0,
+            assignment[np.maximum(nbr_new_ids, 0)],
+            nbr_parts,
+        )
+        valid = (assignment[new_ids] < 0) & (parts >= 0)
+        if not np.any(valid):
+            break
+        nodes, idx = np.unique(new_ids[valid], return_inverse=True)
+        counts = np.zeros((len(nodes), num_parts))
+        np.add.at(counts, (idx, parts[valid]), 1)
+        scores = counts * np.maximum(1 - loads / capacity, 0)
+        has_room = scores.max(1) > 0
+        if not np.any(has_room):
+            break
+        nodes = nodes[has_room]
+        assignment[nodes] = np.argmax(scores[has_room], 1)
+        loads += np.bincount(assignment[nodes], minlength=num_parts)
+    rest = np.nonzero(assignment < 0)[0]
+    order = np.argsort(loads, kind="stable")
+    assignment[rest] = order[np.arange(len(rest)) % num_parts]
+    return assignment
+
+
+def _rank_in_groups(groups, num_groups):
+    """Rank the elements inside their groups, in their original order."""
+    counts = np.bincount(groups, minlength=num_groups)
+    order = np.argsort(groups, kind="stable")
+    ranks = np.empty(len(groups), dtype=np.int64)
+    ranks[order] = np.arange(len(groups)) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return ranks
+
+
+def _extend_partition(
+    graph, nids, eids, add_nids, src, dst, add_eids, add_etypes, node_layout
+):
+    """Add new inner nodes and in-edges of inner nodes to a partition.
+
+    ``nids`` and ``eids`` are the new global IDs of the nodes and edges
+    already in the partition. The sources of the new edges that are not in
+    the partition yet become HALO nodes. As in the partitions created by
+    :func:`~dgl.distributed.partition_graph`, the inner nodes and edges are
+    placed first, in the order of their global IDs.
+    """
+    unknown = set(graph.ndata) - {NID, NTYPE, "inner_node", "part_id"}
+    unknown |= set(graph.edata) - {EID, ETYPE, "inner_edge"}
+    if unknown:
+        raise DGLError(f"Cannot extend the partition data {sorted(unknown)}.")
+    halo_nids = np.setdiff1d(src, np.concatenate([nids, add_nids]))
+    all_nids = np.concatenate([nids, add_nids, halo_nids])
+    inner_node = np.concatenate(
+        [
+            F.asnumpy(graph.ndata["inner_node"]) == 1,
+            np.ones(len(add_nids), dtype=bool),
+            np.zeros(len(halo_nids), dtype=bool),
+        ]
+    )
+    inner_idx = np.nonzero(inner_node)[0]
+    inner_idx = inner_idx[np.argsort(all_nids[inner_idx], kind="stable")]
+    node_order = np.concatenate([inner_idx, np.nonzero(~inner_node)[0]])
+    local_ids = np.empty(len(all_nids), dtype=np.int64)
+    local_ids[node_order] = np.arange(len(all_nids))
+    sorter = np.argsort(all_nids)
+    to_local = lambda ids: local_ids[
+        sorter[np.searchsorted(all_nids, ids, sorter=sorter)]
+    ]
+
+    old_src, old_dst = graph.edges()
+    all_src = np.concatenate([local_ids[F.asnumpy(old_src)], to_local(src)])
+    all_dst = np.concatenate([local_ids[F.asnumpy(old_dst)], to_local(dst)])
+    all_eids = np.concatenate([eids, add_eids])
+    inner_edge = np.concatenate(
+        [
+            F.asnumpy(graph.edata["inner_edge"]) == 1,
+            np.ones(len(add_eids), dtype=bool),
+        ]
+    )
+    inner_idx = np.nonzero(inner_edge)[0]
+    inner_idx = inner_idx[np.argsort(all_eids[inner_idx], kind="stable")]
+    edge_order = np.concatenate([inner_idx, np.nonzero(~inner_edge)[0]])
+    if ETYPE in graph.edata:
+        all_etypes = np.concatenate([F.asnumpy(graph.edata[ETYPE]), add_etypes])
+    else:
+        all_etypes = np.zeros(len(all_eids), dtype=np.int64)
+
+    new_graph = dgl_graph(
+        (F.tensor(all_src[edge_order]), F.tensor(all_dst[edge_order])),
+        num_nodes=len(all_nids),
+        idtype=graph.idtype,
+    )
+    node_parts, node_types = _find_id_ranges(all_nids, *node_layout)
+    node_data = {
+        NID: all_nids,
+        NTYPE: node_types,
+        "inner_node": inner_node,
+        "part_id": node_parts,
+    }
+    for name, data in node_data.items():
+        if name in graph.ndata:
+            new_graph.ndata[name] = F.astype(
+                F.tensor(data[node_order]), F.dtype(graph.ndata[name])
+            )
+    edge_data = {EID: all_eids, ETYPE: all_etypes, "inner_edge": inner_edge}
+    for name, data in edge_data.items():
+        if name in graph.edata:
+            new_graph.edata[name] = F.astype(
+                F.tensor(data[edge_order]), F.dtype(graph.edata[name])
+            )
+    return new_graph
+
+
+def update_partitions(
+    part_config,
+    new_edges,
+    num_new_nodes=None,
+    new_node_feats=None,
+    new_edge_feats=None,
+    slack=1.1,
+):
+    """Add new nodes and edges to the partitions of a graph in place.
+
+    Instead of partitioning the whole graph again, every new node is
+    assigned to the partition that holds most of its neighbors, discounted
+    by the size of the partition as in linear deterministic greedy
+    partitioning, and every new edge to the partition of its destination
+    node. Only the partitions that get new nodes or edges have their graph
+    and feature files rebuilt.
+
+    The IDs are type-wise IDs of the partitioned graph, i.e., the IDs after
+    reshuffling. New nodes of a type are numbered after the existing ones
+    in the input, starting from the number of nodes of the type. As the
+    IDs of a partition form a contiguous range, new nodes and edges are
+    appended to the ranges of their partitions and the IDs of the
+    partitions after them shift: an existing node of partition ``i`` gets
+    its ID plus the number of new nodes of its type in partitions ``0`` to
+    ``i - 1``, and so do edges. The partitions with shifted IDs only have
+    the IDs in their graph files rewritten, and the partition configuration
+    is updated with the new ID ranges.
+
+    Parameters
+    ----------
+    part_config : str
+        The partition configuration JSON file.
+    new_edges : dict[(str, str, str), (Tensor, Tensor)] or (Tensor, Tensor)
+        The source and destination nodes of the new edges of each canonical
+        edge type. A pair of tensors for homogeneous graphs.
+    num_new_nodes : dict[str, int] or int, optional
+        The number of new nodes of each node type, including those without
+        new edges. If not given, it is inferred from the largest node IDs
+        in ``new_edges``.
+    new_node_feats : dict[str, dict[str, Tensor]], optional
+        The features of the new nodes of each node type, which must include
+        all the node features of the type in the partitions, except for
+        ``trainer_id``. If not given, the ``trainer_id`` of the new nodes of
+        a partition are spread over the trainers of the partition. The node
+        type may be omitted for homogeneous graphs.
+    new_edge_feats : dict[(str, str, str), dict[str, Tensor]], optional
+        The features of the new edges of each canonical edge type, which
+        must include all the edge features of the type in the partitions,
+        except for ``trainer_id``. If not given, the ``trainer_id`` of a new
+        edge is that of its destination node. The edge type may be omitted
+        for homogeneous graphs.
+    slack : float, optional
+        The number of nodes of a partition that is considered full, relative
+        to the average. Nodes are not assigned to full partitions based on
+        their neighbors. Default: 1.1.
+
+    Returns
+    -------
+    dict[str, Tensor] or Tensor
+        The new IDs of the new nodes of each node type. A tensor for
+        homogeneous graphs.
+    dict[(str, str, str), Tensor] or Tensor
+        The new IDs of the new edges of each canonical edge type. A tensor
+        for homogeneous graphs.
+
+    Notes
+    -----
+    Only the in-edges of the inner nodes and their HALO nodes are added to
+    a partition, which is what partitions created with the default
+    ``num_hops=1`` keep.
+
+    Examples
+    --------
+    Add a node connected to node 0 and node 5 of a partitioned homogeneous
+    graph with 100 nodes.
+
+    >>> src, dst = torch.tensor([100, 5]), torch.tensor([0, 100])
+    >>> new_nids, new_eids = dgl.distributed.update_partitions(
+    ...     'output/test.json', (src, dst),
+    ...     new_node_feats={'feat': torch.randn(1, 16)},
+    ...     new_edge_feats={'weight': torch.ones(2)})
+    """
+    config_path = os.path.dirname(part_config)
+    part_meta = _load_part_config(part_config)
+    num_parts = part_meta["num_parts"]
+    _, _, ntypes, etypes = load_partition_book(part_config, 0)
+    ntype_list = sorted(ntypes, key=ntypes.get)
+    etype_list = sorted(etypes, key=etypes.get)
+    is_homo = len(ntype_list) == 1 and len(etype_list) == 1
+    if not isinstance(new_edges, dict):
+        new_edges = {etype_list[0]: new_edges}
+    if num_new_nodes is None:
+        num_new_nodes = {}
+    elif not isinstance(num_new_nodes, dict):
+        num_new_nodes = {ntype_list[0]: num_new_nodes}
+    new_node_feats = new_node_feats or {}
+    new_edge_feats = new_edge_feats or {}
+    if is_homo and new_node_feats and ntype_list[0] not in new_node_feats:
+        new_node_feats = {ntype_list[0]: new_node_feats}
+    if is_homo and new_edge_feats and etype_list[0] not in new_edge_feats:
+        new_edge_feats = {etype_list[0]: new_edge_feats}
+    to_numpy = lambda ids: F.asnumpy(F.astype(F.tensor(ids), F.int64))
+    edges = {}
+    for c_etype, (src, dst) in new_edges.items():
+        if c_etype not in etypes:
+            raise DGLError(f"Unknown canonical edge type {c_etype}.")
+        edges[c_etype] = (to_numpy(src), to_numpy(dst))
+
+    node_map = _get_part_ranges(part_meta["node_map"])
+    edge_map = _get_part_ranges(part_meta["edge_map"])
+    node_sizes = np.stack(
+        [node_map[ntype][:, 1] - node_map[ntype][:, 0] for ntype in ntype_list],
+        1,
+    )
+    typed_ends = np.cumsum(node_sizes, 0)
+    typed_starts = typed_ends - node_sizes
+    num_nodes = typed_ends[-1]
+    num_added = np.zeros(len(ntype_list), dtype=np.int64)
+    for ntype, num in num_new_nodes.items():
+        num_added[ntypes[ntype]] = num
+    for (src_type, _, dst_type), (src, dst) in edges.items():
+        for ntype, ids in ((src_type, src), (dst_type, dst)):
+            if len(ids) == 0:
+                continue
+            ntype_id = ntypes[ntype]
+            num = ids.max() + 1 - num_nodes[ntype_id]
+            if ntype in num_new_nodes and num > num_added[ntype_id]:
+                raise DGLError(
+                    f"The new edges have more new {ntype} nodes than "
+                    f"{num_added[ntype_id]}."
+                )
+            num_added[ntype_id] = max(num_added[ntype_id], num)
+    new_offsets = np.cumsum(num_added) - num_added
+    num_new = int(num_added.sum())
+    find_part = lambda ids, ntype_id: np.searchsorted(
+        typed_ends[:, ntype_id], ids, side="right"
+    )
+    to_new_index = lambda ids, ntype_id: (
+        ids - num_nodes[ntype_id] + new_offsets[ntype_id]
+    )
+
+    # Assign the new nodes to partitions by their neighbors.
+    new_ids = [np.zeros(0, dtype=np.int64)]
+    nbr_new_ids = [np.zeros(0, dtype=np.int64)]
+    nbr_parts = [np.zeros(0, dtype=np.int64)]
+    for (src_type, _, dst_type), (src, dst) in edges.items():
+        src_type, dst_type = ntypes[src_type], ntypes[dst_type]
+        for ids, ntype_id, nbrs, nbr_type in (
+            (src, src_type, dst, dst_type),
+            (dst, dst_type, src, src_type),
+        ):
+            is_new = ids >= num_nodes[ntype_id]
+            nbrs = nbrs[is_new]
+            nbr_is_new = nbrs >= num_nodes[nbr_type]
+            new_ids.append(to_new_index(ids[is_new], ntype_id))
+            nbr_new_ids.append(
+                np.where(nbr_is_new, to_new_index(nbrs, nbr_type), -1)
+            )
+            nbr_parts.append(
+                np.where(nbr_is_new, -1, find_part(nbrs, nbr_type))
+            )
+    node_parts = _assign_new_nodes(
+        np.concatenate(new_ids),
+        np.concatenate(nbr_new_ids),
+        np.concatenate(nbr_parts),
+        num_new,
+        node_sizes.sum(1),
+        slack,
+    )
+    new_ntypes = np.repeat(np.arange(len(ntype_list)), num_added)
+    node_index = np.arange(num_new) - new_offsets[new_ntypes]
+    added_nodes = np.zeros_like(node_sizes)
+    np.add.at(added_nodes, (node_parts, new_ntypes), 1)
+    old_nstarts, new_nstarts, _, ntype_order = _grow_id_ranges(
+        [node_map[ntype] for ntype in ntype_list], added_nodes
+    )
+    node_ranks = _rank_in_groups(
+        node_parts * len(ntype_list) + new_ntypes, num_parts * len(ntype_list)
+    )
+    node_offsets = node_sizes[node_parts, new_ntypes] + node_ranks
+    new_node_nids = new_nstarts[node_parts, new_ntypes] + node_offsets
+    new_typed_starts = np.cumsum(node_sizes + added_nodes, 0) - (
+        node_sizes + added_nodes
+    )
+    new_node_typed_nids = new_typed_starts[node_parts, new_ntypes]
+    new_node_typed_nids += node_offsets
+
+    def locate(ids, ntype_id):
+        """Get the new global IDs and the partitions of type-wise node IDs."""
+        is_new = ids >= num_nodes[ntype_id]
+        parts = find_part(ids, ntype_id)
+        nids = ids - typed_starts[np.minimum(parts, num_parts - 1), ntype_id]
+        nids += new_nstarts[np.minimum(parts, num_parts - 1), ntype_id]
+        new_idx = to_new_index(ids[is_new], ntype_id)
+        nids[is_new] = new_node_nids[new_idx]
+        parts[is_new] = node_parts[new_idx]
+        return nids, parts
+
+    # Every new edge goes to the partition of its destination node.
+    new_src = [np.zeros(0, dtype=np.int64)]
+    new_dst = [np.zeros(0, dtype=np.int64)]
+    new_etypes = [np.zeros(0, dtype=np.int64)]
+    edge_parts = [np.zeros(0, dtype=np.int64)]
+    edge_index = [np.zeros(0, dtype=np.int64)]
+    # The rows of the destination nodes in the node features of their type
+    # in their partition, once the new nodes are appended.
+    dst_rows = [np.zeros(0, dtype=np.int64)]
+    for c_etype, (src, dst) in edges.items():
+        dst_type = ntypes[c_etype[2]]
+        src_nids, _ = locate(src, ntypes[c_etype[0]])
+        dst_nids, dst_parts = locate(dst, dst_type)
+        new_src.append(src_nids)
+        new_dst.append(dst_nids)
+        new_etypes.append(np.full(len(src), etypes[c_etype]))
+        edge_parts.append(dst_parts)
+        edge_index.append(np.arange(len(src)))
+        is_new = dst >= num_nodes[dst_type]
+        rows = (
+            dst - typed_starts[np.minimum(dst_parts, num_parts - 1), dst_type]
+        )
+        rows[is_new] = node_offsets[to_new_index(dst[is_new], dst_type)]
+        dst_rows.append(rows)
+    new_src, new_dst, new_etypes, edge_parts, edge_index, dst_rows = map(
+        np.concatenate,
+        (new_src, new_dst, new_etypes, edge_parts, edge_index, dst_rows),
+    )
+    edge_sizes = np.stack(
+        [edge_map[etype][:, 1] - edge_map[etype][:, 0] for etype in etype_list],
+        1,
+    )
+    added_edges = np.zeros_like(edge_sizes)
+    np.add.at(added_edges, (edge_parts, new_etypes), 1)
+    old_estarts, new_estarts, _, etype_order = _grow_id_ranges(
+        [edge_map[etype] for etype in etype_list], added_edges
+    )
+    edge_ranks = _rank_in_groups(
+        edge_parts * len(etype_list) + new_etypes, num_parts * len(etype_list)
+    )
+    edge_offsets = edge_sizes[edge_parts, new_etypes] + edge_ranks
+    new_edge_eids = new_estarts[edge_parts, new_etypes] + edge_offsets
+    new_typed_starts = np.cumsum(edge_sizes + added_edges, 0) - (
+        edge_sizes + added_edges
+    )
+    new_edge_typed_eids = new_typed_starts[edge_parts, new_etypes]
+    new_edge_typed_eids += edge_offsets
+
+    def remap(ids, old_starts, new_starts, sizes, type_order):
+        """Map the old global IDs to the new ones."""
+        parts, types = _find_id_ranges(ids, old_starts, sizes, type_order)
+        return ids - old_starts[parts, types] + new_starts[parts, types]
+
+    node_layout = (new_nstarts, node_sizes + added_nodes, ntype_order)
+    for part_id in range(num_parts):
+        part_files = part_meta[f"part-{part_id}"]
+        graph_file = os.path.join(config_path, part_files["part_graph"])
+        graph = load_graphs(graph_file)[0][0]
+        formats = graph.formats()["created"]
+        nids = F.asnumpy(graph.ndata[NID])
+        eids = F.asnumpy(graph.edata[EID])
+        new_nids = remap(
+            nids, old_nstarts, new_nstarts, node_sizes, ntype_order
+        )
+        new_eids = remap(
+            eids, old_estarts, new_estarts, edge_sizes, etype_order
+        )
+        node_idx = np.nonzero(node_parts == part_id)[0]
+        edge_idx = np.nonzero(edge_parts == part_id)[0]
+        if len(node_idx) == 0 and len(edge_idx) == 0:
+            if np.array_equal(nids, new_nids) and np.array_equal(
+                eids, new_eids
+            ):
+                continue
+            # Only the IDs are shifted, the structure stays the same.
+            graph.ndata[NID] = F.tensor(new_nids)
+            graph.edata[EID] = F.tensor(new_eids)
+            _save_graphs(
+                graph_file,
+                [graph],
+                formats=formats,
+                sort_etypes=len(etype_list) > 1,
+            )
+            continue
+
+        graph = _extend_partition(
+            graph,
+            new_nids,
+            new_eids,
+            new_node_nids[node_idx],
+            new_src[edge_idx],
+            new_dst[edge_idx],
+            new_edge_eids[edge_idx],
+            new_etypes[edge_idx],
+            node_layout,
+        )
+        _save_graphs(
+            graph_file,
+            [graph],
+            formats=formats,
+            sort_etypes=len(etype_list) > 1,
+        )
+        csc_graph_file = os.path.join(
+            os.path.dirname(graph_file), "csc_sampling_graph.tar"
+        )
+        if os.path.exists(csc_graph_file):
+            # GraphBolt is only needed if the partitions are saved with it.
+            from .. import graphbolt
+
+            src, dst = graph.edges()
+            csc_graph = _create_csc_sampling_graph(
+                F.asnumpy(src),
+                F.asnumpy(dst),
+                F.asnumpy(graph.edata[ETYPE]) if not is_homo else None,
+                graph.num_nodes(),
+                ntypes,
+                etypes,
+            )
+            graphbolt.save_csc_sampling_graph(csc_graph, csc_graph_file)
+
+        # The features of the new nodes and edges are appended to those of
+        # their types, following the order of the new IDs.
+        node_feats, edge_feats = load_partition_feats(part_config, part_id)
+        trainer_ids = [
+            F.asnumpy(feat)
+            for name, feat in node_feats.items()
+            if name.endswith("/trainer_id")
+        ]
+        trainer_ids = np.unique(np.concatenate(trainer_ids or [[]]))
+        for ntype_id, ntype in enumerate(ntype_list):
+            idx = node_idx[new_ntypes[node_idx] == ntype_id]
+            if len(idx) == 0:
+                continue
+            feats = new_node_feats.get(ntype, {})
+            for name in node_feats:
+                if not name.startswith(ntype + "/"):
+                    continue
+                feat_name = name[len(ntype) + 1 :]
+                if feat_name in feats:
+                    new_feat = F.gather_row(
+                        feats[feat_name], F.tensor(node_index[idx])
+                    )
+                elif feat_name == "trainer_id" and len(trainer_ids) > 0:
+                    # Spread the new nodes over the trainers of the partition.
+                    new_feat = F.tensor(
+                        trainer_ids[node_ranks[idx] % len(trainer_ids)]
+                    )
+                else:
+                    raise DGLError(
+                        f"The node feature {feat_name} of the new {ntype} "
+                        "nodes is missing. New nodes must have all the node "
+                        "features of their type in the partitions."
+                    )
+                node_feats[name] = F.cat(
+                    [
+                        node_feats[name],
+                        F.astype(new_feat, F.dtype(node_feats[name])),
+                    ],
+                    0,
+                )
+        for etype_id, c_etype in enumerate(etype_list):
+            idx = edge_idx[new_etypes[edge_idx] == etype_id]
+            if len(idx) == 0:
+                continue
+            feats = new_edge_feats.get(c_etype, {})
+            prefix = _etype_tuple_to_str(c_etype) + "/"
+            for name in edge_feats:
+                if not name.startswith(prefix):
+                    continue
+                feat_name = name[len(prefix) :]
+                dst_trainer_name = c_etype[2] + "/trainer_id"
+                if feat_name in feats:
+                    new_feat = F.gather_row(
+                        feats[feat_name], F.tensor(edge_index[idx])
+                    )
+                elif (
+                    feat_name == "trainer_id" and dst_trainer_name in node_feats
+                ):
+                    # Edges belong to the trainers of their destination nodes.
+                    new_feat = F.gather_row(
+                        node_feats[dst_trainer_name], F.tensor(dst_rows[idx])
+                    )
+                else:
+                    raise DGLError(
+                        f"The edge feature {feat_name} of the new {c_etype} "
+                        "edges is missing. New edges must have all the edge "
+                        "features of their type in the partitions."
+                    )
+                edge_feats[name] = F.cat(
+                    [
+                        edge_feats[name],
+                        F.astype(new_feat, F.dtype(edge_feats[name])),
+                    ],
+                    0,
+                )
+        save_tensors(
+            os.path.join(config_path, part_files["node_feats"]), node_feats
+        )
+        save_tensors(
+            os.path.join(config_path, part_files["edge_feats"]), edge_feats
+        )
+
+    new_node_sizes = node_sizes + added_nodes
+    for ntype_id, ntype in enumerate(ntype_list):
+        start = new_nstarts[:, ntype_id]
+        part_meta["node_map"][ntype] = np.stack(
+            [start, start + new_node_sizes[:, ntype_id]], 1
+        ).tolist()
+    new_edge_sizes = edge_sizes + added_edges
+    for etype_id, c_etype in enumerate(etype_list):
+        start = new_estarts[:, etype_id]
+        part_meta["edge_map"][c_etype] = np.stack(
+            [start, start + new_edge_sizes[:, etype_id]], 1
+        ).tolist()
+    part_meta["num_nodes"] = int(new_node_sizes.sum())
+    part_meta["num_edges"] = int(new_edge_sizes.sum())
+    _dump_part_config(part_config, part_meta)
+
+    new_nids = {
+        ntype: F.tensor(new_node_typed_nids[new_ntypes == ntype_id])
+        for ntype_id, ntype in enumerate(ntype_list)
+    }
+    new_eids = {
+        c_etype: F.tensor(new_edge_typed_eids[new_etypes == etype_id])
+        for etype_id, c_etype in enumerate(etype_list)
+    }
+    if is_homo:
+        return new_nids[ntype_list[0]], new_eids[etype_list[0]]
+    return new_nids, new_eids
@@ -1124,6 +1124,7 @@ def fast_pull(
     client_id,
     local_data,
     policy,
+    local_id=None,
 ):
     """Fast-pull api used by kvstore.
 
@@ -1149,16 +1150,23 @@ def fast_pull(
         local data tensor
     policy : PartitionPolicy
         store the partition information
+    local_id : tensor, optional
+        local ID of id_tensor within its partition. If given, the local IDs
+        of the data in the current machine are taken from it instead of
+        being looked up in the partition policy.
     """
     msg_seq = incr_msg_seq()
     pickle_data = bytearray(pickle.dumps(([0], [name])))
-    global_id = _CAPI_DGLRPCGetGlobalIDFromLocalPartition(
-        F.zerocopy_to_dgl_ndarray(id_tensor),
-        F.zerocopy_to_dgl_ndarray(part_id),
-        machine_id,
-    )
-    global_id = F.zerocopy_from_dgl_ndarray(global_id)
-    g2l_id = policy.to_local(global_id)
+    if local_id is None:
+        global_id = _CAPI_DGLRPCGetGlobalIDFromLocalPartition(
+            F.zerocopy_to_dgl_ndarray(id_tensor),
+            F.zerocopy_to_dgl_ndarray(part_id),
+            machine_id,
+        )
+        global_id = F.zerocopy_from_dgl_ndarray(global_id)
+        g2l_id = policy.to_local(global_id)
+    else:
+        g2l_id = F.boolean_mask(local_id, part_id == machine_id)
     res_tensor = _CAPI_DGLRPCFastPull(
         name,
         int(machine_id),
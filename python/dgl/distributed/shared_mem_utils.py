@@ -15,6 +15,11 @@ def _get_edata_path(graph_name, edata_name):
     return "/" + graph_name + "_edge_" + edata_name
 
 
+def _get_gpb_path(graph_name, gpb_name):
+    # Unlike node and edge data, this cannot collide with a feature name.
+    return "/" + graph_name + "_gpb_" + gpb_name
+
+
 def _to_shared_mem(arr, name):
     dlpack = F.zerocopy_to_dlpack(arr)
     dgl_tensor = nd.from_dlpack(dlpack)
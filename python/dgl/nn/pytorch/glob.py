@@ -4,15 +4,15 @@ import numpy as np
 import torch as th
 import torch.nn as nn
 
-from ...backend import pytorch as F
 from ...base import dgl_warning
+from ...convert import create_block
+from ...ops import edge_softmax, segment_topk, u_dot_v, u_mul_e_sum
 from ...readout import (
     broadcast_nodes,
     max_nodes,
     mean_nodes,
     softmax_nodes,
     sum_nodes,
-    topk_nodes,
 )
 
 __all__ = [
@@ -357,15 +357,12 @@ class SortPooling(nn.Module):
             The output feature with shape :math:`(B, k * D)`, where :math:`B` refers
             to the batch size of input graphs.
         """
-        with graph.local_scope():
-            # Sort the feature of each node in ascending order.
-            feat, _ = feat.sort(dim=-1)
-            graph.ndata["h"] = feat
-            # Sort nodes according to their last features.
-            ret = topk_nodes(graph, "h", self.k, sortby=-1)[0].view(
-                -1, self.k * feat.shape[-1]
-            )
-            return ret
+        # Sort the feature of each node in ascending order.
+        feat, _ = feat.sort(dim=-1)
+        # Sort nodes according to their last features, graph by graph
+        # without padding to the largest graph.
+        ret, _ = segment_topk(graph.batch_num_nodes(), feat, self.k, sortby=-1)
+        return ret.view(-1, self.k * feat.shape[-1])
 
 
 class GlobalAttentionPooling(nn.Module):
@@ -624,37 +621,42 @@ class Set2Set(nn.Module):
         return summary.format(**self.__dict__)
 
 
-def _gen_mask(lengths_x, lengths_y, max_len_x, max_len_y):
-    """Generate binary mask array for given x and y input pairs.
+def _segment_pair_graph(lengths_src, lengths_dst):
+    """Generate the bipartite graph connecting every source element to every
+    destination element of the same segment.
 
     Parameters
     ----------
-    lengths_x : Tensor
-        The int tensor indicates the segment information of x.
-    lengths_y : Tensor
-        The int tensor indicates the segment information of y.
-    max_len_x : int
-        The maximum element in lengths_x.
-    max_len_y : int
-        The maximum element in lengths_y.
+    lengths_src : Tensor
+        The int tensor indicates the segment information of the sources.
+    lengths_dst : Tensor
+        The int tensor indicates the segment information of the destinations.
 
     Returns
     -------
-    Tensor
-        the mask tensor with shape (batch_size, 1, max_len_x, max_len_y)
+    DGLBlock
+        The graph whose edges are all the (source, destination) pairs within
+        each segment, grouped by destination.
     """
-    device = lengths_x.device
-    # x_mask: (batch_size, max_len_x)
-    x_mask = th.arange(max_len_x, device=device).unsqueeze(
-        0
-    ) < lengths_x.unsqueeze(1)
-    # y_mask: (batch_size, max_len_y)
-    y_mask = th.arange(max_len_y, device=device).unsqueeze(
-        0
-    ) < lengths_y.unsqueeze(1)
-    # mask: (batch_size, 1, max_len_x, max_len_y)
-    mask = (x_mask.unsqueeze(-1) & y_mask.unsqueeze(-2)).unsqueeze(1)
-    return mask
+    device = lengths_src.device
+    num_src = int(lengths_src.sum())
+    num_dst = int(lengths_dst.sum())
+    src_offsets = th.cumsum(lengths_src, 0) - lengths_src
+    # Segment of each destination and thus its in-degree.
+    dst_seg = th.repeat_interleave(
+        th.arange(len(lengths_dst), device=device), lengths_dst
+    )
+    deg = lengths_src[dst_seg]
+    edge_offsets = th.cumsum(deg, 0) - deg
+    dst = th.repeat_interleave(th.arange(num_dst, device=device), deg)
+    # The i-th in-edge of a destination comes from the i-th source of its
+    # segment.
+    src = th.arange(int(deg.sum()), device=device) - th.repeat_interleave(
+        edge_offsets - src_offsets[dst_seg], deg
+    )
+    return create_block(
+        (src, dst), num_src_nodes=num_src, num_dst_nodes=num_dst
+    )
 
 
 class MultiHeadAttention(nn.Module):
@@ -725,9 +727,6 @@ class MultiHeadAttention(nn.Module):
         lengths_mem : list
             The array of node numbers, used to segment mem.
         """
-        batch_size = len(lengths_x)
-        max_len_x = max(lengths_x)
-        max_len_mem = max(lengths_mem)
         device = x.device
         lengths_x = th.as_tensor(lengths_x, dtype=th.int64, device=device)
         lengths_mem = th.as_tensor(lengths_mem, dtype=th.int64, device=device)
@@ -736,36 +735,23 @@ class MultiHeadAttention(nn.Module):
         keys = self.proj_k(mem).view(-1, self.num_heads, self.d_head)
         values = self.proj_v(mem).view(-1, self.num_heads, self.d_head)
 
-        # padding to (B, max_len_x/mem, num_heads, d_head)
-        queries = F.pad_packed_tensor(queries, lengths_x, 0)
-        keys = F.pad_packed_tensor(keys, lengths_mem, 0)
-        values = F.pad_packed_tensor(values, lengths_mem, 0)
+        # Attend the queries of each segment to the memory of the same
+        # segment only, on the packed tensors without padding.
+        attn_graph = _segment_pair_graph(lengths_mem, lengths_x)
 
-        # attention score with shape (B, num_heads, max_len_x, max_len_mem)
-        e = th.einsum("bxhd,byhd->bhxy", queries, keys)
+        # attention score with shape (num_pairs, num_heads, 1)
+        e = u_dot_v(attn_graph, keys, queries)
         # normalize
         e = e / np.sqrt(self.d_head)
 
-        # generate mask
-        mask = _gen_mask(lengths_x, lengths_mem, max_len_x, max_len_mem)
-        e = e.masked_fill(mask == 0, -float("inf"))
-
-        # apply softmax
-        alpha = th.softmax(e, dim=-1)
-        # the following line addresses the NaN issue, see
-        # https://github.com/dmlc/dgl/issues/2657
-        alpha = alpha.masked_fill(mask == 0, 0.0)
+        # apply softmax over the memory of each query; queries with empty
+        # memory have no edges and get zero output
+        alpha = edge_softmax(attn_graph, e)
 
         # sum of value weighted by alpha
-        out = th.einsum("bhxy,byhd->bxhd", alpha, values)
+        out = u_mul_e_sum(attn_graph, values, alpha)
         # project to output
-        out = self.proj_o(
-            out.contiguous().view(
-                batch_size, max_len_x, self.num_heads * self.d_head
-            )
-        )
-        # pack tensor
-        out = F.pack_padded_tensor(out, lengths_x)
+        out = self.proj_o(out.view(-1, self.num_heads * self.d_head))
 
         # intra norm
         x = self.norm_in(x + out)
@@ -226,6 +226,43 @@ class DeepWalk(nn.Module):
 
         return torch.mean(pos_score + neg_score)
 
+    def pair_loss(self, pos_u, pos_v, neg_v):
+        """Compute the loss for a batch of skip-gram pairs, such as the ones
+        from :class:`~dgl.dataloading.SkipGramDataLoader`
+
+        Parameters
+        ----------
+        pos_u : torch.Tensor
+            Positive center nodes
+        pos_v : torch.Tensor
+            Positive context nodes
+        neg_v : torch.Tensor
+            Negative context nodes of shape :attr:`(len(pos_u), negative_size)`
+
+        Returns
+        -------
+        torch.Tensor
+            Loss value
+        """
+        device = self.node_embed.weight.device
+        emb_u = self.node_embed(pos_u.to(device, non_blocking=True))
+        emb_v = self.context_embed(pos_v.to(device, non_blocking=True))
+        emb_neg_v = self.context_embed(neg_v.to(device, non_blocking=True))
+
+        pos_score = torch.sum(torch.mul(emb_u, emb_v), dim=1)
+        pos_score = torch.clamp(pos_score, max=6, min=-6)
+        pos_score = torch.mean(-F.logsigmoid(pos_score))
+
+        neg_score = torch.bmm(emb_neg_v, emb_u.unsqueeze(2)).squeeze(2)
+        neg_score = torch.clamp(neg_score, max=6, min=-6)
+        neg_score = (
+            torch.mean(-F.logsigmoid(-neg_score))
+            * neg_v.shape[1]
+            * self.neg_weight
+        )
+
+        return pos_score + neg_score
+
 
 class MetaPath2Vec(nn.Module):
     r"""metapath2vec module from `metapath2vec: Scalable Representation Learning for
@@ -3,7 +3,7 @@
 from .. import backend as F
 from ..base import DGLError
 
-__all__ = ["segment_reduce", "segment_softmax", "segment_mm"]
+__all__ = ["segment_reduce", "segment_softmax", "segment_topk", "segment_mm"]
 
 
 def segment_reduce(seglen, value, reducer="sum"):
@@ -103,6 +103,92 @@ def segment_softmax(seglen, value):
     return value / F.repeat(value_sum, seglen, dim=0)
 
 
+def segment_topk(seglen, value, k, sortby=-1, descending=True):
+    """Select the top-k rows of each segment ranked by one column.
+
+    The first argument ``seglen`` stores the length of each segment. Its
+    summation must be equal to the first dimension of the ``value`` tensor.
+    Zero-length segments are allowed.
+
+    Unlike :func:`dgl.topk_nodes`, the segments are never padded to the
+    longest one, so the cost is linear in the total number of rows.
+
+    Parameters
+    ----------
+    seglen : Tensor
+        Segment lengths.
+    value : Tensor
+        Value tensor of shape ``(N, D)``.
+    k : int
+        The number of rows to select from each segment.
+    sortby : int, optional
+        The column to rank the rows by. Default: -1.
+    descending : bool, optional
+        Whether to select the largest rows instead of the smallest.
+        Default: True.
+
+    Returns
+    -------
+    Tensor
+        The selected rows of shape ``(len(seglen), k, D)``, in rank order.
+        Segments shorter than ``k`` are padded with zeros.
+    Tensor
+        The indices of the selected rows within their segments, of shape
+        ``(len(seglen), k)``. The values for the padded rows are zero.
+
+    Examples
+    --------
+
+    >>> import dgl
+    >>> import torch as th
+    >>> val = th.tensor([[1., 3.], [2., 1.], [0., 2.], [5., 0.]])
+    >>> seg = th.tensor([3, 1])  # 2 segments
+    >>> dgl.ops.segment_topk(seg, val, 2)
+    (tensor([[[1., 3.],
+              [0., 2.]],
+
+             [[5., 0.],
+              [0., 0.]]]),
+     tensor([[0, 2],
+             [0, 0]]))
+    """
+    num_rows = F.shape(value)[0]
+    batch_size = F.shape(seglen)[0]
+    ctx = F.context(value)
+    seglen = F.copy_to(F.astype(seglen, F.int64), ctx)
+    offsets = F.cumsum(seglen, 0) - seglen
+    seg_ids = F.repeat(F.arange(0, batch_size, F.int64, ctx), seglen, dim=0)
+    sortby = sortby % F.shape(value)[1]
+    keys = F.squeeze(F.slice_axis(value, 1, sortby, sortby + 1), 1)
+    # The global rank of each row breaks ties between the rows of a segment,
+    # so one sort of (segment, rank) groups the rows by segment in order.
+    order = F.argsort(keys, 0, descending)
+    rank = F.scatter_row(
+        F.zeros((num_rows,), F.int64, ctx),
+        order,
+        F.arange(0, num_rows, F.int64, ctx),
+    )
+    perm = F.argsort(seg_ids * num_rows + rank, 0, False)
+    pos = F.arange(0, num_rows, F.int64, ctx) - F.repeat(offsets, seglen, dim=0)
+    keep = pos < k
+    sel = F.boolean_mask(perm, keep)
+    sel_seg = F.boolean_mask(seg_ids, keep)
+    slots = sel_seg * k + F.boolean_mask(pos, keep)
+
+    out = F.zeros(
+        (batch_size * k,) + tuple(F.shape(value)[1:]), F.dtype(value), ctx
+    )
+    out = F.scatter_row(out, slots, F.gather_row(value, sel))
+    indices = F.zeros((batch_size * k,), F.int64, ctx)
+    indices = F.scatter_row(
+        indices, slots, sel - F.gather_row(offsets, sel_seg)
+    )
+    return (
+        F.reshape(out, (batch_size, k) + tuple(F.shape(value)[1:])),
+        F.reshape(indices, (batch_size, k)),
+    )
+
+
 def segment_mm(a, b, seglen_a):
     r"""Performs matrix multiplication according to segments.
 
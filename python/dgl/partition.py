@@ -4,6 +4,8 @@ import re
 import time
 
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse import csgraph
 
 from . import backend as F, utils
 from ._ffi.function import _init_api
@@ -15,6 +17,7 @@ from .subgraph import edge_subgraph
 __all__ = [
     "metis_partition",
     "metis_partition_assignment",
+    "multilevel_partition_assignment",
     "partition_graph_with_halo",
 ]
 
@@ -191,66 +194,14 @@ def partition_graph_with_halo(g, node_part, extra_cached_hops, reshuffle=False):
     subg_dict = {}
     node_part = node_part.tousertensor()
     start = time.time()
-
-    # This function determines whether an edge belongs to a partition.
-    # An edge is assigned to a partition based on its destination node. If its destination node
-    # is assigned to a partition, we assign the edge to the partition as well.
-    def get_inner_edge(subg, inner_node):
-        inner_edge = F.zeros((subg.num_edges(),), F.int8, F.cpu())
-        inner_nids = F.nonzero_1d(inner_node)
-        # TODO(zhengda) we need to fix utils.toindex() to avoid the dtype cast below.
-        inner_nids = F.astype(inner_nids, F.int64)
-        inner_eids = subg.in_edges(inner_nids, form="eid")
-        inner_edge = F.scatter_row(
-            inner_edge,
-            inner_eids,
-            F.ones((len(inner_eids),), F.dtype(inner_edge), F.cpu()),
-        )
-        return inner_edge
-
-    # This creaets a subgraph from subgraphs returned from the CAPI above.
-    def create_subgraph(subg, induced_nodes, induced_edges, inner_node):
-        subg1 = DGLGraph(gidx=subg.graph, ntypes=["_N"], etypes=["_E"])
-        # If IDs are shuffled, we should shuffled edges. This will help us collect edge data
-        # from the distributed graph after training.
-        if reshuffle:
-            # When we shuffle edges, we need to make sure that the inner edges are assigned with
-            # contiguous edge IDs and their ID range starts with 0. In other words, we want to
-            # place these edge IDs in the front of the edge list. To ensure that, we add the IDs
-            # of outer edges with a large value, so we will get the sorted list as we want.
-            max_eid = F.max(induced_edges[0], 0) + 1
-            inner_edge = get_inner_edge(subg1, inner_node)
-            eid = F.astype(induced_edges[0], F.int64) + max_eid * F.astype(
-                inner_edge == 0, F.int64
-            )
-
-            _, index = F.sort_1d(eid)
-            subg1 = edge_subgraph(subg1, index, relabel_nodes=False)
-            subg1.ndata[NID] = induced_nodes[0]
-            subg1.edata[EID] = F.gather_row(induced_edges[0], index)
-        else:
-            subg1.ndata[NID] = induced_nodes[0]
-            subg1.edata[EID] = induced_edges[0]
-        return subg1
-
     for i, subg in enumerate(subgs):
-        inner_node = _get_halo_heterosubgraph_inner_node(subg)
-        inner_node = F.zerocopy_from_dlpack(inner_node.to_dlpack())
-        subg = create_subgraph(
-            subg, subg.induced_nodes, subg.induced_edges, inner_node
+        subg_dict[i] = _construct_halo_subgraph(
+            subg,
+            node_part,
+            extra_cached_hops,
+            orig_nids if reshuffle else None,
+            orig_eids if reshuffle else None,
         )
-        subg.ndata["inner_node"] = inner_node
-        subg.ndata["part_id"] = F.gather_row(node_part, subg.ndata[NID])
-        if reshuffle:
-            subg.ndata["orig_id"] = F.gather_row(orig_nids, subg.ndata[NID])
-            subg.edata["orig_id"] = F.gather_row(orig_eids, subg.edata[EID])
-
-        if extra_cached_hops >= 1:
-            inner_edge = get_inner_edge(subg, inner_node)
-        else:
-            inner_edge = F.ones((subg.num_edges(),), F.int8, F.cpu())
-        subg.edata["inner_edge"] = inner_edge
-        subg_dict[i] = subg
     print("Construct subgraphs: {:.3f} seconds".format(time.time() - start))
     if reshuffle:
         return subg_dict, orig_nids, orig_eids
@@ -258,6 +209,112 @@ def partition_graph_with_halo(g, node_part, extra_cached_hops, reshuffle=False):
         return subg_dict, None, None
 
 
+def _partition_part_with_halo(g, node_part, part_id, extra_cached_hops):
+    """Construct the subgraph of a single partition of a reshuffled graph.
+
+    This is the per-partition counterpart of :func:`partition_graph_with_halo`
+    with ``reshuffle=True``, so that partitions can be built independently of
+    each other, e.g., in different processes.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph returned by :func:`reshuffle_graph`.
+    node_part : Tensor
+        The partition IDs of the nodes in the reshuffled graph.
+    part_id : int
+        The partition to construct.
+    extra_cached_hops : int
+        The number of hops a HALO node can be accessed.
+
+    Returns
+    -------
+    DGLGraph
+        The DGLGraph of the partition.
+    """
+    nodes = F.astype(F.nonzero_1d(node_part == part_id), F.int64)
+    subg = _CAPI_DGLGetSubgraphWithHalo_Hetero(
+        g._graph, F.to_dgl_nd(nodes), extra_cached_hops
+    )
+    return _construct_halo_subgraph(
+        subg,
+        node_part,
+        extra_cached_hops,
+        g.ndata["orig_id"],
+        g.edata["orig_id"],
+    )
+
+
+def _get_inner_edge(subg, inner_node):
+    """Determine whether an edge belongs to a partition.
+
+    An edge is assigned to a partition based on its destination node. If its
+    destination node is assigned to a partition, we assign the edge to the
+    partition as well.
+    """
+    inner_edge = F.zeros((subg.num_edges(),), F.int8, F.cpu())
+    inner_nids = F.nonzero_1d(inner_node)
+    # TODO(zhengda) we need to fix utils.toindex() to avoid the dtype cast below.
+    inner_nids = F.astype(inner_nids, F.int64)
+    inner_eids = subg.in_edges(inner_nids, form="eid")
+    inner_edge = F.scatter_row(
+        inner_edge,
+        inner_eids,
+        F.ones((len(inner_eids),), F.dtype(inner_edge), F.cpu()),
+    )
+    return inner_edge
+
+
+def _construct_halo_subgraph(
+    halo_subg, node_part, extra_cached_hops, orig_nids=None, orig_eids=None
+):
+    """Create a partition DGLGraph from a subgraph returned by the CAPIs.
+
+    The node/edge IDs are reshuffled ones if ``orig_nids`` and ``orig_eids``
+    are given, in which case the partition also stores the original IDs in
+    ``orig_id``.
+    """
+    reshuffle = orig_nids is not None
+    inner_node = _get_halo_heterosubgraph_inner_node(halo_subg)
+    inner_node = F.zerocopy_from_dlpack(inner_node.to_dlpack())
+    induced_nodes = halo_subg.induced_nodes
+    induced_edges = halo_subg.induced_edges
+    subg = DGLGraph(gidx=halo_subg.graph, ntypes=["_N"], etypes=["_E"])
+    # If IDs are shuffled, we should shuffled edges. This will help us collect edge data
+    # from the distributed graph after training.
+    if reshuffle:
+        # When we shuffle edges, we need to make sure that the inner edges are assigned with
+        # contiguous edge IDs and their ID range starts with 0. In other words, we want to
+        # place these edge IDs in the front of the edge list. To ensure that, we add the IDs
+        # of outer edges with a large value, so we will get the sorted list as we want.
+        max_eid = F.max(induced_edges[0], 0) + 1
+        inner_edge = _get_inner_edge(subg, inner_node)
+        eid = F.astype(induced_edges[0], F.int64) + max_eid * F.astype(
+            inner_edge == 0, F.int64
+        )
+
+        _, index = F.sort_1d(eid)
+        subg = edge_subgraph(subg, index, relabel_nodes=False)
+        subg.ndata[NID] = induced_nodes[0]
+        subg.edata[EID] = F.gather_row(induced_edges[0], index)
+    else:
+        subg.ndata[NID] = induced_nodes[0]
+        subg.edata[EID] = induced_edges[0]
+
+    subg.ndata["inner_node"] = inner_node
+    subg.ndata["part_id"] = F.gather_row(node_part, subg.ndata[NID])
+    if reshuffle:
+        subg.ndata["orig_id"] = F.gather_row(orig_nids, subg.ndata[NID])
+        subg.edata["orig_id"] = F.gather_row(orig_eids, subg.edata[EID])
+
+    if extra_cached_hops >= 1:
+        inner_edge = _get_inner_edge(subg, inner_node)
+    else:
+        inner_edge = F.ones((subg.num_edges(),), F.int8, F.cpu())
+    subg.edata["inner_edge"] = inner_edge
+    return subg
+
+
 def get_peak_mem():
     """Get the peak memory size.
 
@@ -397,6 +454,530 @@ def metis_partition_assignment(
         return node_part.tousertensor()
 
 
+def _match_two_hops(adj, cmap):
+    """Pair the nodes left unmatched by the neighbor matching that share their
+    first neighbor, and the isolated nodes, so that graphs with many leaves
+    keep shrinking."""
+    sizes = np.bincount(cmap)
+    single = np.nonzero(sizes[cmap] == 1)[0]
+    if len(single) < 2:
+        return cmap
+    keys = np.full((len(single),), -1, dtype=np.int64)
+    has_nbrs = adj.indptr[single + 1] > adj.indptr[single]
+    keys[has_nbrs] = adj.indices[adj.indptr[single[has_nbrs]]]
+    order = np.argsort(keys, kind="stable")
+    single, keys = single[order], keys[order]
+    ranks = np.arange(len(keys)) - np.searchsorted(keys, keys)
+    odd = np.nonzero(ranks % 2 == 1)[0]
+    cmap = cmap.copy()
+    cmap[single[odd]] = cmap[single[odd - 1]]
+    return np.unique(cmap, return_inverse=True)[1]
+
+
+def _coarsen_once(adj, vwgt, max_vwgt):
+    """Coarsen a weighted symmetric graph by collapsing matched node pairs.
+
+    The nodes of a match weighing more than ``max_vwgt`` in a constraint are
+    left unmatched, so that the coarse graph can still be balanced.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .convert import graph as dgl_graph
+    from .geometry.capi import _neighbor_matching
+
+    num_nodes = adj.shape[0]
+    # The matching reads the edge weights in CSR order, so the graph is built
+    # from the CSR directly.
+    g = dgl_graph(
+        ("csr", (adj.indptr, adj.indices, [])),
+        num_nodes=num_nodes,
+        idtype=F.int64,
+    )
+    cmap = _neighbor_matching(
+        g._graph, num_nodes, F.zerocopy_from_numpy(adj.data), True
+    )
+    cmap = _match_two_hops(adj, F.asnumpy(cmap))
+    coarse_vwgt = np.zeros((int(cmap.max()) + 1, vwgt.shape[1]))
+    np.add.at(coarse_vwgt, cmap, vwgt)
+    heavy = np.any(coarse_vwgt > max_vwgt, 1) & (np.bincount(cmap) > 1)
+    split = heavy[cmap]
+    cmap = cmap.copy()
+    cmap[split] = cmap.max() + 1 + np.arange(split.sum())
+    cmap = np.unique(cmap, return_inverse=True)[1].reshape(-1)
+    num_coarse = int(cmap.max()) + 1
+    proj = sp.csr_matrix(
+        (np.ones(num_nodes), (np.arange(num_nodes), cmap)),
+        shape=(num_nodes, num_coarse),
+    )
+    coarse_adj = (proj.T @ adj @ proj).tocsr()
+    coarse_adj.setdiag(0)
+    coarse_adj.eliminate_zeros()
+    coarse_adj.sort_indices()
+    return coarse_adj, proj.T @ vwgt, cmap
+
+
+def _initial_partition(adj, vwgt, k):
+    """Greedily grow the partitions of the coarsest graph in BFS order.
+
+    Each node goes to the partition it is most connected to among those with
+    room left for it in every constraint, and the partitions are filled one
+    after another when there is a tie. Nodes that do not fit anywhere go to
+    the least loaded partition.
+    """
+    num_nodes = adj.shape[0]
+    target = vwgt.sum(0) / k * (1 + 1e-9)
+    scale = 1 / np.maximum(target, 1e-12)
+    parts = np.full((num_nodes,), -1, dtype=np.int64)
+    loads = np.zeros((k, vwgt.shape[1]))
+    for u in csgraph.reverse_cuthill_mckee(adj, symmetric_mode=True):
+        nbrs = adj.indices[adj.indptr[u] : adj.indptr[u + 1]]
+        nbr_parts = parts[nbrs]
+        assigned = nbr_parts >= 0
+        conn = np.bincount(
+            nbr_parts[assigned],
+            adj.data[adj.indptr[u] : adj.indptr[u + 1]][assigned],
+            minlength=k,
+        )
+        fits = np.all(loads + vwgt[u] <= target, axis=1)
+        if np.any(fits):
+            best = fits & (conn == conn[fits].max())
+            fill = np.where(best, (loads * scale).max(1), -1)
+            part = np.argmax(fill)
+        else:
+            part = np.argmin(((loads + vwgt[u]) * scale).max(1))
+        parts[u] = part
+        loads[part] += vwgt[u]
+    return parts
+
+
+def _cumsum_in_groups(groups, weights):
+    """Compute the cumulative sums of the rows of ``weights`` inside the runs
+    of equal values of the sorted ``groups``, excluding the row itself."""
+    cum = np.concatenate([np.zeros((1, weights.shape[1])), weights.cumsum(0)])
+    return cum[:-1] - cum[np.searchsorted(groups, groups)]
+
+
+def _refine_partition(adj, vwgt, parts, caps, num_iters):
+    """Refine a partitioning with size-constrained label propagation.
+
+    In each round, all the boundary nodes are evaluated at once and moved to
+    the neighboring partition with the largest positive gain in cut weight,
+    as long as the partition stays within ``caps``. Rounds alternate between
+    moves to higher and to lower partition IDs, so that two neighbors never
+    swap partitions in the same round. Boundary nodes of the partitions
+    exceeding ``caps`` are moved regardless of their gain, until the excess
+    is gone.
+    """
+    num_nodes = adj.shape[0]
+    k = len(caps)
+    src = np.repeat(np.arange(num_nodes), np.diff(adj.indptr))
+    dst, weight = adj.indices, adj.data
+    loads = np.zeros((k, vwgt.shape[1]))
+    np.add.at(loads, parts, vwgt)
+    idle_rounds = 0
+    for i in range(num_iters):
+        src_parts, dst_parts = parts[src], parts[dst]
+        same = src_parts == dst_parts
+        internal = np.bincount(src[same], weight[same], minlength=num_nodes)
+        cross = ~same
+        keys, inverse = np.unique(
+            src[cross] * k + dst_parts[cross], return_inverse=True
+        )
+        conn = np.bincount(inverse, weight[cross], minlength=len(keys))
+        nodes, dests = keys // k, keys % k
+        gains = conn - internal[nodes]
+        upward = dests > parts[nodes]
+        improve = (gains > 0) & (upward if i % 2 == 0 else ~upward)
+        excess = np.maximum(loads - caps, 0)
+        relieve = np.any((excess[parts[nodes]] > 0) & (vwgt[nodes] > 0), 1)
+        keep = improve | relieve
+        nodes, dests, gains = nodes[keep], dests[keep], gains[keep]
+        improve = improve[keep]
+
+        # Keep the best move of each node.
+        order = np.lexsort((-gains, nodes))
+        nodes, dests, gains = nodes[order], dests[order], gains[order]
+        improve = improve[order]
+        best = np.ones((len(nodes),), dtype=bool)
+        best[1:] = nodes[1:] != nodes[:-1]
+        nodes, dests, gains = nodes[best], dests[best], gains[best]
+        improve = improve[best]
+
+        # Only move the nodes needed to remove the excess of a partition.
+        froms = parts[nodes]
+        order = np.lexsort((-gains, froms))
+        nodes, dests, gains = nodes[order], dests[order], gains[order]
+        froms, improve = froms[order], improve[order]
+        outgoing = _cumsum_in_groups(froms, vwgt[nodes] * ~improve[:, None])
+        needed = np.any((outgoing < excess[froms]) & (vwgt[nodes] > 0), 1)
+        keep = improve | needed
+        nodes, dests, gains = nodes[keep], dests[keep], gains[keep]
+
+        # Accept the moves into each partition by decreasing gain, as long as
+        # they fit in its capacity.
+        order = np.lexsort((-gains, dests))
+        nodes, dests = nodes[order], dests[order]
+        incoming = _cumsum_in_groups(dests, vwgt[nodes]) + vwgt[nodes]
+        fits = np.all(
+            (loads[dests] + incoming <= caps[dests]) | (vwgt[nodes] == 0), 1
+        )
+        nodes, dests = nodes[fits], dests[fits]
+
+        if len(nodes) == 0:
+            idle_rounds += 1
+            if idle_rounds == 2:
+                break
+            continue
+        idle_rounds = 0
+        np.subtract.at(loads, parts[nodes], vwgt[nodes])
+        np.add.at(loads, dests, vwgt[nodes])
+        parts[nodes] = dests
+    return parts
+
+
+def _balance_partition(adj, vwgt, parts, caps, num_iters):
+    """Move nodes out of the partitions exceeding ``caps``.
+
+    In each round, every node of a partition exceeding ``caps`` in a
+    constraint it has weight in is evaluated at once, and moved to the
+    partition with room left for it that has the largest gain in cut weight,
+    whether it is a boundary node or not. The nodes of a partition are moved
+    by decreasing gain until its excess is gone, and accepted into each
+    partition as long as they fit in its capacity.
+
+    When moves do not remove the excess, e.g. because the partitions with room
+    left in the exceeded constraint are full in another one, the nodes are
+    swapped with the lightest nodes of the partitions within ``caps`` that
+    have weight in the same constraints, so that both partitions keep their
+    weights in the other constraints. When neither helps, single nodes are
+    moved to partitions where they add less excess than they remove. Every
+    round reduces the total excess, so the nodes never cycle.
+    """
+    num_nodes = adj.shape[0]
+    k = len(caps)
+    loads = np.zeros((k, vwgt.shape[1]))
+    np.add.at(loads, parts, vwgt)
+
+    def _move():
+        excess = np.maximum(loads - caps, 0)
+        nodes = np.nonzero(np.any((excess[parts] > 0) & (vwgt > 0), 1))[0]
+        if len(nodes) == 0:
+            return 0
+        onehot = sp.csr_matrix(
+            (np.ones((num_nodes,)), (np.arange(num_nodes), parts)),
+            shape=(num_nodes, k),
+        )
+        conn = (adj[nodes] @ onehot).toarray()
+        froms = parts[nodes]
+        gains = conn - conn[np.arange(len(nodes)), froms][:, None]
+        weights = vwgt[nodes]
+        for q in range(k):
+            fits = np.all((loads[q] + weights <= caps[q]) | (weights == 0), 1)
+            gains[~fits | (froms == q), q] = -np.inf
+        dests = np.argmax(gains, 1)
+        gains = gains[np.arange(len(nodes)), dests]
+        keep = np.isfinite(gains)
+        nodes, froms, dests = nodes[keep], froms[keep], dests[keep]
+        gains = gains[keep]
+
+        # Only move the nodes needed to remove the excess of a partition.
+        order = np.lexsort((-gains, froms))
+        nodes, froms, dests = nodes[order], froms[order], dests[order]
+        gains = gains[order]
+        outgoing = _cumsum_in_groups(froms, vwgt[nodes])
+        needed = np.any((outgoing < excess[froms]) & (vwgt[nodes] > 0), 1)
+        nodes, dests, gains = nodes[needed], dests[needed], gains[needed]
+
+        # Accept the moves into each partition by decreasing gain, as long as
+        # they fit in its capacity.
+        order = np.lexsort((-gains, dests))
+        nodes, dests = nodes[order], dests[order]
+        incoming = _cumsum_in_groups(dests, vwgt[nodes]) + vwgt[nodes]
+        fits = np.all(
+            (loads[dests] + incoming <= caps[dests]) | (vwgt[nodes] == 0),
+            1,
+        )
+        nodes, dests = nodes[fits], dests[fits]
+        np.subtract.at(loads, parts[nodes], vwgt[nodes])
+        np.add.at(loads, dests, vwgt[nodes])
+        parts[nodes] = dests
+        return len(nodes)
+
+    def _swap():
+        excess = np.maximum(loads - caps, 0)
+        over = np.any(excess > 0, 1)
+        nodes = np.nonzero(np.any((excess[parts] > 0) & (vwgt > 0), 1))[0]
+        # The partners of the nodes are the nodes of the partitions within
+        # caps having weight in the same constraints, lightest first.
+        patterns = np.unique(vwgt > 0, axis=0, return_inverse=True)[1]
+        patterns = patterns.reshape(-1)
+        num_patterns = int(patterns.max()) + 1
+        keys = parts * num_patterns + patterns
+        size = (vwgt / np.maximum(caps[0], 1e-12)).sum(1)
+        by_key = np.lexsort((size, keys))
+        key_counts = np.bincount(keys, minlength=k * num_patterns)
+        key_starts = np.cumsum(key_counts) - key_counts
+        lightest = np.where(key_counts > 0, by_key[key_starts % num_nodes], -1)
+
+        onehot = sp.csr_matrix(
+            (np.ones((num_nodes,)), (np.arange(num_nodes), parts)),
+            shape=(num_nodes, k),
+        )
+        conn = (adj[nodes] @ onehot).toarray()
+        light_conn = (adj[np.maximum(lightest, 0)] @ onehot).toarray()
+        froms = parts[nodes]
+        weights = vwgt[nodes]
+        src_excess = excess[froms].sum(1)
+        gains = np.full((len(nodes), k), -np.inf)
+        for q in np.nonzero(~over)[0]:
+            others = q * num_patterns + patterns[nodes]
+            diff = weights - vwgt[lightest[others]]
+            # The source loses excess and the destination stays within caps.
+            src_loads = loads[froms] - diff
+            ok = lightest[others] >= 0
+            ok &= np.all(src_loads <= np.maximum(loads[froms], caps[froms]), 1)
+            ok &= np.maximum(src_loads - caps[froms], 0).sum(1) < src_excess
+            ok &= np.all(loads[q] + diff <= caps[q], 1)
+            gains[ok, q] = (
+                conn[:, q]
+                - conn[np.arange(len(nodes)), froms]
+                + light_conn[others, froms]
+                - light_conn[others, q]
+            )[ok]
+        dests = np.argmax(gains, 1)
+        keep = np.isfinite(gains[np.arange(len(nodes)), dests])
+        nodes, froms, dests = nodes[keep], froms[keep], dests[keep]
+        gains = gains[keep, dests]
+
+        # The nodes swapped into the same partition get heavier and heavier
+        # partners, by decreasing gain.
+        others = dests * num_patterns + patterns[nodes]
+        order = np.lexsort((-gains, others))
+        nodes, froms, dests = nodes[order], froms[order], dests[order]
+        gains, others = gains[order], others[order]
+        ranks = np.arange(len(nodes)) - np.searchsorted(others, others)
+        keep = ranks < key_counts[others]
+        nodes, froms, dests, gains = (
+            nodes[keep],
+            froms[keep],
+            dests[keep],
+            gains[keep],
+        )
+        partners = by_key[key_starts[others[keep]] + ranks[keep]]
+        diff = vwgt[nodes] - vwgt[partners]
+
+        # Only swap the nodes needed to remove the excess of a partition, and
+        # as long as both partitions stay within caps. The checks only count
+        # the weight added to a partition by each swap, so that they hold
+        # whichever swaps are kept.
+        order = np.lexsort((-gains, froms))
+        nodes, froms, dests = nodes[order], froms[order], dests[order]
+        gains, partners, diff = gains[order], partners[order], diff[order]
+        outgoing = _cumsum_in_groups(froms, np.maximum(diff, 0))
+        needed = np.any((outgoing < excess[froms]) & (diff > 0), 1)
+        added = _cumsum_in_groups(froms, np.maximum(-diff, 0))
+        added += np.maximum(-diff, 0)
+        needed &= np.all(
+            loads[froms] + added <= np.maximum(loads[froms], caps[froms]), 1
+        )
+        nodes, froms, dests = nodes[needed], froms[needed], dests[needed]
+        gains, partners, diff = gains[needed], partners[needed], diff[needed]
+        order = np.lexsort((-gains, dests))
+        nodes, froms, dests = nodes[order], froms[order], dests[order]
+        partners, diff = partners[order], diff[order]
+        added = _cumsum_in_groups(dests, np.maximum(diff, 0))
+        added += np.maximum(diff, 0)
+        fits = np.all(loads[dests] + added <= caps[dests], 1)
+        nodes, froms, dests = nodes[fits], froms[fits], dests[fits]
+        partners, diff = partners[fits], diff[fits]
+
+        np.subtract.at(loads, froms, diff)
+        np.add.at(loads, dests, diff)
+        parts[nodes], parts[partners] = dests, froms
+        return len(nodes)
+
+    def _trade():
+        excess = np.maximum(loads - caps, 0)
+        nodes = np.nonzero(np.any((excess[parts] > 0) & (vwgt > 0), 1))[0]
+        scale = 1 / np.maximum(caps[0], 1e-12)
+        onehot = sp.csr_matrix(
+            (np.ones((num_nodes,)), (np.arange(num_nodes), parts)),
+            shape=(num_nodes, k),
+        )
+        conn = (adj[nodes] @ onehot).toarray()
+        froms = parts[nodes]
+        weights = vwgt[nodes]
+        removed = (np.minimum(weights, excess[froms]) * scale).sum(1)
+        scores = np.full((len(nodes), k), -np.inf)
+        for q in range(k):
+            added = np.maximum(loads[q] + weights - caps[q], 0) - excess[q]
+            scores[froms != q, q] = (removed - (added * scale).sum(1))[
+                froms != q
+            ]
+        dests = np.argmax(scores, 1)
+        scores = scores[np.arange(len(nodes)), dests]
+        gains = conn[np.arange(len(nodes)), dests]
+        gains -= conn[np.arange(len(nodes)), froms]
+        keep = scores > 1e-12
+        nodes, froms, dests = nodes[keep], froms[keep], dests[keep]
+
+        # Each partition sends or receives at most one node per round, so
+        # that every move reduces the total excess.
+        order = np.lexsort((-gains[keep], -scores[keep]))
+        nodes, froms, dests = nodes[order], froms[order], dests[order]
+        first = np.unique(froms, return_index=True)[1]
+        first = np.sort(first)
+        nodes, froms, dests = nodes[first], froms[first], dests[first]
+        first = np.sort(np.unique(dests, return_index=True)[1])
+        nodes, froms, dests = nodes[first], froms[first], dests[first]
+        keep = ~np.isin(dests, froms)
+        nodes, froms, dests = nodes[keep], froms[keep], dests[keep]
+        np.subtract.at(loads, froms, vwgt[nodes])
+        np.add.at(loads, dests, vwgt[nodes])
+        parts[nodes] = dests
+        return len(nodes)
+
+    for _ in range(num_iters):
+        if not np.any(loads > caps):
+            break
+        moved = _move()
+        if np.any(loads > caps):
+            moved += _swap()
+        if moved == 0:
+            moved = _trade()
+        if moved == 0:
+            break
+    return parts
+
+
+def multilevel_partition_assignment(
+    g,
+    k,
+    balance_ntypes=None,
+    balance_edges=False,
+    imbalance=1.03,
+    num_iters=10,
+):
+    """This assigns nodes to different partitions with a multilevel
+    partitioning algorithm that does not depend on Metis.
+
+    The graph is coarsened by repeatedly collapsing the pairs of nodes found by
+    :func:`~dgl.geometry.neighbor_matching` (heavy-edge matching), the
+    coarsest graph is partitioned greedily, and the partitioning is projected
+    back to the input graph and refined on every level with size-constrained
+    label propagation, whose rounds evaluate all the nodes at once. Before
+    the refinement of each level, nodes are moved or swapped out of the
+    partitions that exceed the imbalance. The coarse nodes are kept light
+    enough for the partitions to be balanced, even on graphs with skewed
+    degrees.
+
+    It supports the same constraints as :func:`metis_partition_assignment`.
+    By default, it balances the number of nodes in each partition.
+
+    * `balance_ntypes` balances the number of nodes of different types in each partition.
+    * `balance_edges` balances the number of edges in each partition.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph to be partitioned
+    k : int
+        The number of partitions.
+    balance_ntypes : tensor, optional
+        Node type of each node
+    balance_edges : bool, optional
+        Indicate whether to balance the edges.
+    imbalance : float, optional
+        The maximum ratio between the weight of a partition and the average
+        weight, for each constraint. It is only exceeded when no move or
+        swap of nodes can reduce the excess within ``num_iters`` rounds.
+    num_iters : int, optional
+        The maximum number of balancing and refinement rounds on each level.
+
+    Returns
+    -------
+    a 1-D tensor
+        A vector with each element that indicates the partition ID of a vertex.
+    """
+    assert imbalance >= 1, "'imbalance' should be at least 1"
+    num_nodes = g.num_nodes()
+    if k == 1:
+        return F.zeros((num_nodes,), F.int64, F.cpu())
+
+    # The matching works on the symmetric graph, and a node pair connected in
+    # both directions is weighted by the number of edges between them.
+    start = time.time()
+    src, dst = g.edges()
+    src, dst = F.asnumpy(src), F.asnumpy(dst)
+    adj = sp.csr_matrix(
+        (np.ones((len(src),)), (src, dst)), shape=(num_nodes, num_nodes)
+    )
+    adj = (adj + adj.T).tocsr()
+    adj.setdiag(0)
+    adj.eliminate_zeros()
+    adj.sort_indices()
+
+    # The vertex weights are built as in metis_partition_assignment.
+    vwgt = []
+    if balance_ntypes is not None:
+        assert (
+            len(balance_ntypes) == num_nodes
+        ), "The length of balance_ntypes should be equal to #nodes in the graph"
+        balance_ntypes = F.asnumpy(F.tensor(balance_ntypes))
+        uniq_ntypes = np.unique(balance_ntypes)
+        for ntype in uniq_ntypes:
+            vwgt.append(balance_ntypes == ntype)
+    else:
+        vwgt.append(np.ones((num_nodes,)))
+    if balance_edges:
+        degs = F.asnumpy(g.in_degrees())
+        if balance_ntypes is None:
+            vwgt.append(degs)
+        else:
+            for ntype in uniq_ntypes:
+                vwgt.append(np.where(balance_ntypes == ntype, degs, 0))
+    vwgt = np.stack(vwgt, 1).astype(np.float64)
+    caps = vwgt.sum(0) / k * imbalance
+    caps = np.broadcast_to(caps, (k, len(caps)))
+    print(
+        "Convert a graph into a weighted symmetric graph: {:.3f} seconds, peak memory: {:.3f} GB".format(
+            time.time() - start, get_peak_mem()
+        )
+    )
+
+    # Coarsen until the graph is small enough to partition greedily, or until
+    # the matching stops shrinking it.
+    start = time.time()
+    levels = []
+    coarsen_to = max(20 * k, 1000)
+    max_vwgt = 1.5 * vwgt.sum(0) / coarsen_to
+    while adj.shape[0] > coarsen_to:
+        coarse_adj, coarse_vwgt, cmap = _coarsen_once(adj, vwgt, max_vwgt)
+        if coarse_adj.shape[0] > 0.95 * adj.shape[0]:
+            break
+        levels.append((adj, vwgt, cmap))
+        adj, vwgt = coarse_adj, coarse_vwgt
+    print(
+        "Coarsen the graph to {} nodes in {} levels: {:.3f} seconds, peak memory: {:.3f} GB".format(
+            adj.shape[0], len(levels), time.time() - start, get_peak_mem()
+        )
+    )
+
+    start = time.time()
+    parts = _initial_partition(adj, vwgt, k)
+    parts = _balance_partition(adj, vwgt, parts, caps, num_iters)
+    parts = _refine_partition(adj, vwgt, parts, caps, num_iters)
+    while levels:
+        adj, vwgt, cmap = levels.pop()
+        parts = _balance_partition(adj, vwgt, parts[cmap], caps, num_iters)
+        parts = _refine_partition(adj, vwgt, parts, caps, num_iters)
+    print(
+        "Partition and refine the graph: {:.3f} seconds, peak memory: {:.3f} GB".format(
+            time.time() - start, get_peak_mem()
+        )
+    )
+    return F.zerocopy_from_numpy(parts)
+
+
 def metis_partition(
     g,
     k,
@@ -1,13 +1,19 @@
 """Negative sampling APIs"""
 
+import math
+import weakref
+
 from numpy.polynomial import polynomial
 
 from .. import backend as F, utils
 from .._ffi.function import _init_api
+from ..base import DGLError
 from ..heterograph import DGLGraph
 
 __all__ = ["global_uniform_negative_sampling"]
 
+_BLOOM_FILTERS = weakref.WeakKeyDictionary()
+
 
 def _calc_redundancy(
     k_hat, num_edges, num_pairs, r=3
@@ -36,6 +42,33 @@ def _calc_redundancy(
     return redundancy
 
 
+def _get_bloom_filter(g, etype_id, false_positive_rate):
+    """Get the bloom filter of the edges with the given type.
+
+    The filter is built on first use and cached for the graph.  It is rebuilt
+    if the graph structure has been replaced since.
+
+    Returns
+    -------
+    tuple[NDArray, int]
+        The bit words of the filter and the number of hash functions.
+    """
+    filters = _BLOOM_FILTERS.setdefault(g, {})
+    entry = filters.get((etype_id, false_positive_rate))
+    if entry is None or entry[0] is not g._graph:
+        num_edges = max(g._graph.num_edges(etype_id), 1)
+        # Optimal size and number of hash functions for the target rate.
+        num_bits = -num_edges * math.log(false_positive_rate) / math.log(2) ** 2
+        num_bits = max(int(math.ceil(num_bits / 64)), 1) * 64
+        num_hashes = max(int(round(num_bits / num_edges * math.log(2))), 1)
+        bits = _CAPI_DGLBuildEdgeBloomFilter(
+            g._graph, etype_id, num_bits, num_hashes
+        )
+        entry = (g._graph, (bits, num_hashes))
+        filters[(etype_id, false_positive_rate)] = entry
+    return entry[1]
+
+
 def global_uniform_negative_sampling(
     g,
     num_samples,
@@ -43,6 +76,8 @@ def global_uniform_negative_sampling(
     replace=False,
     etype=None,
     redundancy=None,
+    use_bloom_filter=False,
+    false_positive_rate=0.01,
 ):
     """Performs negative sampling, which generate source-destination pairs such that
     edges with the given type do not exist.
@@ -85,6 +120,18 @@ def global_uniform_negative_sampling(
         samples, but will also take more time and memory.
 
         (Default: automatically determined by the density of graph)
+    use_bloom_filter : bool, optional
+        If True, check the candidate pairs against a bloom filter of the edges
+        instead of the graph structure, and draw them in parallel with one
+        random stream per chunk so that the result only depends on
+        :func:`dgl.seed`.  The filter is built on first use and cached for
+        the graph, which pays off when sampling repeatedly from the same
+        graph.  Only supported on CPU.  (Default: False)
+    false_positive_rate : float, optional
+        The false positive rate of the bloom filter, i.e. the fraction of the
+        negative pairs that are wrongly rejected.  A lower rate makes the
+        filter larger.  It never lets an existing edge through.  Only used
+        if :attr:`use_bloom_filter` is True.  (Default: 0.01)
 
     Returns
     -------
@@ -102,11 +149,32 @@ def global_uniform_negative_sampling(
     utype, _, vtype = g.to_canonical_etype(etype)
     exclude_self_loops = exclude_self_loops and (utype == vtype)
 
-    redundancy = _calc_redundancy(
-        num_samples, g.num_edges(etype), g.num_nodes(utype) * g.num_nodes(vtype)
-    )
-
+    num_edges = g.num_edges(etype)
+    num_pairs = g.num_nodes(utype) * g.num_nodes(vtype)
     etype_id = g.get_etype_id(etype)
+    if use_bloom_filter:
+        if g.device != F.cpu():
+            raise DGLError("Bloom filter negative sampling only supports CPU.")
+        if not 0 < false_positive_rate < 1:
+            raise DGLError("false_positive_rate must be in (0, 1).")
+        # The false positives reject some more candidates.
+        num_edges += (num_pairs - num_edges) * false_positive_rate
+        redundancy = _calc_redundancy(num_samples, num_edges, num_pairs)
+        bits, num_hashes = _get_bloom_filter(g, etype_id, false_positive_rate)
+        src, dst = _CAPI_DGLBloomFilterNegativeSampling(
+            g._graph,
+            etype_id,
+            bits,
+            num_hashes,
+            num_samples,
+            3,
+            exclude_self_loops,
+            replace,
+            redundancy,
+        )
+        return F.from_dgl_nd(src), F.from_dgl_nd(dst)
+
+    redundancy = _calc_redundancy(num_samples, num_edges, num_pairs)
     src, dst = _CAPI_DGLGlobalUniformNegativeSampling(
         g._graph,
         etype_id,
@@ -2,6 +2,8 @@
 
 from .. import backend as F, ndarray as nd, utils
 from .._ffi.function import _init_api
+from ..base import DGLError
+from .randomwalks import _get_alias_table
 
 # pylint: disable=invalid-name
 
@@ -9,7 +11,14 @@ __all__ = ["node2vec_random_walk"]
 
 
 def node2vec_random_walk(
-    g, nodes, p, q, walk_length, prob=None, return_eids=False
+    g,
+    nodes,
+    p,
+    q,
+    walk_length,
+    prob=None,
+    return_eids=False,
+    use_alias_table=False,
 ):
     """
     Generate random walk traces from an array of starting nodes based on the node2vec model.
@@ -51,6 +60,14 @@ def node2vec_random_walk(
     return_eids : bool, optional
         If True, additionally return the edge IDs traversed.
 
+        Default: False.
+    use_alias_table : bool, optional
+        If True, draw the neighbors proposed to the second-order rejection sampler
+        from alias tables of :attr:`prob`, which takes constant time per proposal
+        regardless of the node degree.  The tables are built on the first call and
+        reused by later calls on the same graph until the graph or the feature
+        tensor changes.
+
         Default: False.
 
     Returns
@@ -85,13 +102,18 @@ def node2vec_random_walk(
     gidx = g._graph
     nodes = F.to_dgl_nd(utils.prepare_tensor(g, nodes, "nodes"))
 
+    accept_nd = alias_nd = nd.array([], ctx=nodes.ctx)
     if prob is None:
         prob_nd = nd.array([], ctx=nodes.ctx)
     else:
         prob_nd = F.to_dgl_nd(g.edata[prob])
+        if use_alias_table:
+            if g.device != F.cpu():
+                raise DGLError("Alias tables are only supported on CPU.")
+            accept_nd, alias_nd = _get_alias_table(g, 0, prob)
 
     traces, eids = _CAPI_DGLSamplingNode2vec(
-        gidx, nodes, p, q, walk_length, prob_nd
+        gidx, nodes, p, q, walk_length, prob_nd, accept_nd, alias_nd
     )
 
     traces = F.from_dgl_nd(traces)
@@ -24,6 +24,31 @@ def _select_pinsage_neighbors(src, dst, num_samples_per_node, k):
     return (src, dst, counts)
 
 
+def _pinsage_neighbors(
+    g, seeds, metapath, num_random_walks, num_traversals, termination_prob, k
+):
+    """Run the random walks from the given seeds and determine their neighbors
+    for PinSAGE algorithm on CPU.
+
+    This is fusing ``random_walk()`` with ``_select_pinsage_neighbors()``: the visits
+    are counted while walking, so the traces are never materialized.
+    """
+    metapath = F.to_dgl_nd(F.astype(F.tensor(metapath), g.idtype))
+    src, dst, counts = _CAPI_DGLSamplingPinSageNeighbors(
+        g._graph,
+        F.to_dgl_nd(seeds),
+        metapath,
+        num_random_walks,
+        num_traversals,
+        float(termination_prob),
+        k,
+    )
+    src = F.from_dgl_nd(src)
+    dst = F.from_dgl_nd(dst)
+    counts = F.from_dgl_nd(counts)
+    return (src, dst, counts)
+
+
 class RandomWalkNeighborSampler(object):
     """PinSage-like neighbor sampler extended to any heterogeneous graphs.
 
@@ -90,6 +115,7 @@ class RandomWalkNeighborSampler(object):
         self.num_random_walks = num_random_walks
         self.num_neighbors = num_neighbors
         self.num_traversals = num_traversals
+        self.termination_prob = termination_prob
 
         if metapath is None:
             if len(G.ntypes) > 1 or len(G.etypes) > 1:
@@ -107,6 +133,7 @@ class RandomWalkNeighborSampler(object):
 
         self.metapath_hops = len(metapath)
         self.metapath = metapath
+        self.metapath_ids = [G.get_etype_id(etype) for etype in metapath]
         self.full_metapath = metapath * num_traversals
         restart_prob = np.zeros(self.metapath_hops * num_traversals)
         restart_prob[
@@ -134,6 +161,18 @@ class RandomWalkNeighborSampler(object):
             to the algorithm above.
         """
         seed_nodes = utils.prepare_tensor(self.G, seed_nodes, "seed_nodes")
+        if F.context(seed_nodes) == F.cpu():
+            src, dst, counts = _pinsage_neighbors(
+                self.G,
+                seed_nodes,
+                self.metapath_ids,
+                self.num_random_walks,
+                self.num_traversals,
+                self.termination_prob,
+                self.num_neighbors,
+            )
+            return self._build_neighbor_graph(src, dst, counts)
+
         self.restart_prob = F.copy_to(self.restart_prob, F.context(seed_nodes))
 
         seed_nodes = F.repeat(seed_nodes, self.num_random_walks, 0)
@@ -154,6 +193,9 @@ class RandomWalkNeighborSampler(object):
             (self.num_random_walks * self.num_traversals),
             self.num_neighbors,
         )
+        return self._build_neighbor_graph(src, dst, counts)
+
+    def _build_neighbor_graph(self, src, dst, counts):
         neighbor_graph = convert.heterograph(
             {(self.ntype, "_E", self.ntype): (src, dst)},
             {self.ntype: self.G.num_nodes(self.ntype)},
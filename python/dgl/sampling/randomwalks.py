@@ -1,5 +1,6 @@
 """Random walk routines
 """
+import weakref
 
 from .. import backend as F, ndarray as nd, utils
 from .._ffi.function import _init_api
@@ -7,6 +8,39 @@ from ..base import DGLError
 
 __all__ = ["random_walk", "pack_traces"]
 
+# Alias tables by graph, then by (edge type ID, feature name).
+_ALIAS_TABLES = weakref.WeakKeyDictionary()
+
+
+def _get_alias_table(g, etype_id, prob):
+    """Get the alias table of the given edge type and probability feature.
+
+    The table is built on first use and cached for the graph.  It is rebuilt if
+    the graph structure or the feature tensor has been replaced since, or if
+    the tensor has been updated in place (detected for PyTorch only).
+
+    Returns
+    -------
+    tuple[NDArray, NDArray]
+        The acceptance probabilities and the aliases, aligned with the CSR.
+    """
+    data = g.edges[g.canonical_etypes[etype_id]].data[prob]
+    version = getattr(data, "_version", None)
+    tables = _ALIAS_TABLES.setdefault(g, {})
+    entry = tables.get((etype_id, prob))
+    if (
+        entry is None
+        or entry[0] is not g._graph
+        or entry[1] is not data
+        or entry[2] != version
+    ):
+        accept, alias = _CAPI_DGLSamplingBuildAliasTable(
+            g._graph, etype_id, F.to_dgl_nd(data)
+        )
+        entry = (g._graph, data, version, (accept, alias))
+        tables[(etype_id, prob)] = entry
+    return entry[3]
+
 
 def random_walk(
     g,
@@ -16,7 +50,8 @@ def random_walk(
     length=None,
     prob=None,
     restart_prob=None,
-    return_eids=False
+    return_eids=False,
+    use_alias_table=False
 ):
     """Generate random walk traces from an array of starting nodes based on the given metapath.
 
@@ -80,6 +115,13 @@ def random_walk(
     return_eids : bool, optional
         If True, additionally return the edge IDs traversed.
 
+        Default: False.
+    use_alias_table : bool, optional
+        If True, sample the weighted transitions from alias tables of :attr:`prob`,
+        which takes constant time per step regardless of the node degree.  The tables
+        are built on the first call and reused by later calls on the same graph until
+        the graph or the feature tensor changes.  Only supported on CPU.
+
         Default: False.
 
     Returns
@@ -190,8 +232,37 @@ def random_walk(
     #       and keep it on CPU to make max_nodes sanity check easier.
     metapath = F.to_dgl_nd(F.astype(F.tensor(metapath), g.idtype))
 
-    # Load the probability tensor from the edge frames
     ctx = utils.to_dgl_context(g.device)
+    if use_alias_table and prob is not None:
+        if g.device != F.cpu():
+            raise DGLError("Alias tables are only supported on CPU.")
+        accept_nd, alias_nd = [], []
+        for etype_id, etype in enumerate(g.canonical_etypes):
+            if prob in g.edges[etype].data:
+                accept, alias = _get_alias_table(g, etype_id, prob)
+            else:
+                accept, alias = nd.array([], ctx=ctx), nd.array([], ctx=ctx)
+            accept_nd.append(accept)
+            alias_nd.append(alias)
+        if restart_prob is None:
+            restart_prob = nd.array([], ctx=ctx)
+        elif F.is_tensor(restart_prob):
+            restart_prob = F.to_dgl_nd(restart_prob)
+        elif isinstance(restart_prob, float):
+            restart_prob = F.to_dgl_nd(
+                F.full_1d(metapath.shape[0], restart_prob, F.float64, F.cpu())
+            )
+        else:
+            raise TypeError("restart_prob should be float or Tensor.")
+        traces, eids, types = _CAPI_DGLSamplingRandomWalkWithAlias(
+            gidx, nodes, metapath, accept_nd, alias_nd, restart_prob
+        )
+        traces = F.from_dgl_nd(traces)
+        types = F.from_dgl_nd(types)
+        eids = F.from_dgl_nd(eids)
+        return (traces, eids, types) if return_eids else (traces, types)
+
+    # Load the probability tensor from the edge frames
     if prob is None:
         p_nd = [nd.array([], ctx=ctx) for _ in g.canonical_etypes]
     else:
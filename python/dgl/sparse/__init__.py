@@ -8,6 +8,7 @@ from .._ffi import libinfo
 from .broadcast import *
 from .elementwise_op import *
 from .elementwise_op_sp import *
+from .lazy import *
 from .matmul import *
 from .reduction import *  # pylint: disable=W0622
 from .sddmm import *
@@ -0,0 +1,188 @@
+"""Lazy evaluation of operator chains on SparseMatrix"""
+# pylint: disable=invalid-name
+from typing import Union
+
+import torch
+
+from .matmul import matmul, spmm
+from .reduction import smax
+from .sparse_matrix import SparseMatrix, val_like
+from .utils import is_scalar, Scalar
+
+__all__ = ["LazySparseMatrix"]
+
+
+def _same_sparsity(A: SparseMatrix, B: SparseMatrix) -> bool:
+    """Whether the non-zero entries of A and B are at the same positions and
+    in the same order."""
+    if A is B:
+        return True
+    if A.shape != B.shape or A.nnz != B.nnz:
+        return False
+    # Matrices created with val_like share the tensors of their sparse
+    # formats, so that the positions are only compared on a mismatch.
+    A_coo, B_coo = A.coo(), B.coo()
+    if all(a.data_ptr() == b.data_ptr() for a, b in zip(A_coo, B_coo)):
+        return True
+    return all(torch.equal(a, b) for a, b in zip(A_coo, B_coo))
+
+
+class LazySparseMatrix:
+    r"""Sparse matrix whose operators are deferred until it is multiplied by
+    a dense matrix or evaluated.
+
+    A lazy sparse matrix is created by :meth:`SparseMatrix.lazy`. It keeps
+    the sparse structure of that matrix and records the operators applied to
+    the non-zero values instead of creating a new sparse matrix for each of
+    them:
+
+    * Multiplying or dividing by a scalar, and multiplying by a sparse matrix
+      of the same sparsity, only computes the new non-zero values, without
+      the sparsity intersection done by :func:`mul`.
+    * Row-wise :meth:`softmax` of scalar values is deferred. The
+      normalization is fused into the multiplication by a dense matrix,
+      which divides the rows of the SpMM result by the row sums instead of
+      normalizing the non-zero values.
+
+    All the intermediate results share the sparse formats of the original
+    matrix, which can be created up front with
+    :meth:`SparseMatrix.materialize`.
+
+    Examples
+    --------
+
+    >>> indices = torch.tensor([[0, 0, 1], [0, 1, 1]])
+    >>> A = dglsp.spmatrix(indices, torch.randn(3))
+    >>> B = dglsp.val_like(A, torch.rand(3))
+    >>> X = torch.randn(2, 4)
+    >>> Y = (A.lazy().softmax() * B) @ X
+    >>> torch.allclose(Y, (A.softmax() * B) @ X)
+    True
+    """
+
+    def __init__(
+        self,
+        mat: SparseMatrix,
+        val: torch.Tensor = None,
+        denom_val: torch.Tensor = None,
+    ):
+        self._mat = mat
+        self._val = mat.val if val is None else val
+        # Non-zero values whose row sums divide the rows of the matrix, from a
+        # deferred softmax.
+        self._denom_val = denom_val
+
+    @property
+    def shape(self):
+        """Shape of the sparse matrix."""
+        return self._mat.shape
+
+    @property
+    def nnz(self) -> int:
+        """The number of non-zero elements of the sparse matrix."""
+        return self._mat.nnz
+
+    def evaluate(self) -> SparseMatrix:
+        """Applies the deferred operators and returns the resulting sparse
+        matrix.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix, which shares the sparse formats of the matrix
+            the lazy matrix was created from
+        """
+        val = self._val
+        if self._denom_val is not None:
+            denom = val_like(self._mat, self._denom_val).sum(1)
+            val = val / denom[self._mat.row]
+        return val_like(self._mat, val)
+
+    def softmax(self, dim: int = 1):
+        """Applies softmax to the non-zero elements of the sparse matrix on
+        the dimension :attr:`dim`. See :func:`softmax`.
+
+        Row-wise softmax of scalar values is deferred; other cases are
+        evaluated eagerly.
+
+        Parameters
+        ----------
+        dim : int
+            0 for column-wise and 1 for row-wise softmax
+
+        Returns
+        -------
+        LazySparseMatrix
+            The lazy sparse matrix
+        """
+        if dim != 1 or self._val.dim() != 1 or self._denom_val is not None:
+            return LazySparseMatrix(self.evaluate().softmax(dim))
+        # Softmax is invariant to the shift by the row maximum, which only
+        # keeps the exponentials from overflowing.
+        row_max = smax(val_like(self._mat, self._val.detach()), 1)
+        exp_val = torch.exp(self._val - row_max[self._mat.row])
+        return LazySparseMatrix(self._mat, exp_val, exp_val)
+
+    def __mul__(self, other: Union[SparseMatrix, "LazySparseMatrix", Scalar]):
+        if is_scalar(other):
+            return LazySparseMatrix(
+                self._mat, self._val * other, self._denom_val
+            )
+        if isinstance(other, LazySparseMatrix):
+            other = other.evaluate()
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        if not _same_sparsity(self._mat, other):
+            return LazySparseMatrix(self.evaluate() * other)
+        return LazySparseMatrix(
+            self._mat, self._val * other.val, self._denom_val
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Scalar):
+        if not is_scalar(other):
+            return NotImplemented
+        return LazySparseMatrix(self._mat, self._val / other, self._denom_val)
+
+    def __matmul__(self, other: Union[torch.Tensor, SparseMatrix]):
+        if not isinstance(other, torch.Tensor):
+            return matmul(self.evaluate(), other)
+        if self._denom_val is None:
+            return spmm(val_like(self._mat, self._val), other)
+        X = other.reshape(other.shape[0], -1)
+        out = spmm(val_like(self._mat, self._val), X)
+        denom = val_like(self._mat, self._denom_val).sum(1).reshape(-1, 1)
+        # Empty rows have zero sums and zero normalizers.
+        out = out / torch.where(denom == 0, torch.ones_like(denom), denom)
+        return out.reshape((out.shape[0],) + other.shape[1:])
+
+
+def lazy(A: SparseMatrix) -> LazySparseMatrix:
+    """Returns a lazy view of the sparse matrix, which defers the operators
+    applied to it. See :class:`LazySparseMatrix`.
+
+    Parameters
+    ----------
+    A : SparseMatrix
+        The sparse matrix
+
+    Returns
+    -------
+    LazySparseMatrix
+        The lazy sparse matrix
+
+    Examples
+    --------
+
+    >>> indices = torch.tensor([[0, 0, 1], [0, 1, 1]])
+    >>> A = dglsp.spmatrix(indices, torch.randn(3)).materialize("csr", "csc")
+    >>> X = torch.randn(2, 4)
+    >>> Y = A.lazy().softmax() @ X
+    >>> torch.allclose(Y, A.softmax() @ X)
+    True
+    """
+    return LazySparseMatrix(A)
+
+
+SparseMatrix.lazy = lazy
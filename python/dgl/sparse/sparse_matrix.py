@@ -200,6 +200,51 @@ class SparseMatrix:
         """
         return self.c_sparse_matrix.csc()
 
+    def materialize(self, *formats: str):
+        r"""Creates the given sparse formats of the sparse matrix in place and
+        returns the sparse matrix itself.
+
+        The sparse formats of a sparse matrix are created lazily and cached.
+        Sparse matrices derived from it, e.g., by :func:`val_like`,
+        :meth:`transpose` or :func:`softmax`, share all the formats that exist
+        at that time. Materializing the formats needed by the subsequent
+        operators (e.g., both ``"csr"`` and ``"csc"`` for an SpMM in the
+        forward and backward pass) before building a chain of operators thus
+        converts the sparse structure only once.
+
+        Parameters
+        ----------
+        formats : str
+            The sparse formats to create, each of which is ``"coo"``, ``"csr"``
+            or ``"csc"``.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix itself
+
+        Examples
+        --------
+
+        >>> indices = torch.tensor([[1, 2, 1], [2, 4, 3]])
+        >>> A = dglsp.spmatrix(indices).materialize("csr", "csc")
+        >>> B = dglsp.val_like(A, torch.randn(3))
+        >>> B.csr()[0].data_ptr() == A.csr()[0].data_ptr()
+        True
+        """
+        for fmt in formats:
+            if fmt == "coo":
+                self.c_sparse_matrix.coo()
+            elif fmt == "csr":
+                self.c_sparse_matrix.csr()
+            elif fmt == "csc":
+                self.c_sparse_matrix.csc()
+            else:
+                raise ValueError(
+                    f"Expect format to be 'coo', 'csr' or 'csc', got {fmt}."
+                )
+        return self
+
     def to_dense(self) -> torch.Tensor:
         """Returns a copy in dense matrix format of the sparse matrix.
 
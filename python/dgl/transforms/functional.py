@@ -48,6 +48,7 @@ from ..heterograph_index import (
 from ..partition import (
     metis_partition,
     metis_partition_assignment,
+    multilevel_partition_assignment,
     partition_graph_with_halo,
 )
 from ..sampling.neighbor import sample_neighbors
@@ -75,11 +76,14 @@ __all__ = [
     "sort_csr_by_tag",
     "sort_csc_by_tag",
     "metis_partition_assignment",
+    "multilevel_partition_assignment",
     "partition_graph_with_halo",
     "metis_partition",
     "adj_product_graph",
     "adj_sum_graph",
     "reorder_graph",
+    "optimize_layout",
+    "restore_node_order",
     "norm_by_dst",
     "radius_graph",
     "random_walk_pe",
@@ -3098,8 +3102,8 @@ def reorder_graph(
     g : DGLGraph
         The homogeneous graph.
     node_permute_algo: str, optional
-        The permutation algorithm to re-order nodes. If given, the options are ``rcmk`` or
-        ``metis`` or ``custom``.
+        The permutation algorithm to re-order nodes. If given, the options are ``rcmk``,
+        ``metis``, ``degree`` or ``custom``.
 
         * ``None``: Keep the current node order.
         * ``rcmk``: Use the `Reverse Cuthill–McKee <https://docs.scipy.org/doc/scipy/reference/
@@ -3111,6 +3115,8 @@ def reorder_graph(
           DGL then sorts the assignment array so the new node order will put nodes of
           the same cluster together. Please note that the generated nodes permutation
           of ``metis`` is non-deterministic due to algorithm's nature.
+        * ``degree``: Sort nodes by their in-degrees in descending order so that hub
+          nodes are clustered at the front and their features share cache lines.
         * ``custom``: Reorder the graph according to the user-provided node permutation
           array (provided in :attr:`permute_config`).
     edge_permute_algo: str, optional
@@ -3127,7 +3133,7 @@ def reorder_graph(
     permute_config: dict, optional
         Additional key-value config data for the specified permutation algorithm.
 
-        * For ``rcmk``, this argument is not required.
+        * For ``rcmk`` and ``degree``, this argument is not required.
         * For ``metis``, users should specify the number of partitions ``k`` (e.g.,
           ``permute_config={'k':10}`` to partition the graph to 10 clusters).
         * For ``custom`` node reordering, users should provide a node permutation
@@ -3249,7 +3255,7 @@ def reorder_graph(
     # sanity checks
     if not g.is_homogeneous:
         raise DGLError("Only homogeneous graphs are supported.")
-    expected_node_algo = ["rcmk", "metis", "custom"]
+    expected_node_algo = ["rcmk", "metis", "degree", "custom"]
     if (
         node_permute_algo is not None
         and node_permute_algo not in expected_node_algo
@@ -3280,6 +3286,9 @@ def reorder_graph(
             )
         nodes_perm = metis_perm(g, permute_config["k"])
         rg = subgraph.node_subgraph(g, nodes_perm, store_ids=False)
+    elif node_permute_algo == "degree":
+        nodes_perm = degree_perm(g)
+        rg = subgraph.node_subgraph(g, nodes_perm, store_ids=False)
     elif node_permute_algo == "custom":
         if permute_config is None or "nodes_perm" not in permute_config:
             raise DGLError(
@@ -3341,6 +3350,120 @@ def reorder_graph(
 DGLGraph.reorder_graph = utils.alias_func(reorder_graph)
 
 
+def optimize_layout(
+    g,
+    ids=None,
+    node_permute_algo="rcmk",
+    edge_permute_algo="dst",
+    permute_config=None,
+):
+    r"""Reorder a graph, its features and a set of node IDs for memory locality
+    in one call.
+
+    Support homogeneous graph only for the moment.
+
+    This is a convenience wrapper of :func:`~dgl.reorder_graph`. Besides the
+    re-ordered graph, whose node and edge features are permuted accordingly,
+    it relabels the given node ID sets (e.g., training/validation/test seed
+    nodes) to the new node order so that they can be fed to
+    :class:`~dgl.dataloading.DataLoader` directly. The original node and edge
+    IDs are always stored in ``dgl.NID`` and ``dgl.EID`` of the result, so
+    predictions can be mapped back with :func:`~dgl.restore_node_order`.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The homogeneous graph.
+    ids : Tensor or dict[str, Tensor], optional
+        Node IDs in the original graph to relabel. Either a tensor or a
+        dictionary of tensors such as ``{'train': train_nids, 'val': val_nids}``.
+    node_permute_algo : str, optional
+        The permutation algorithm to re-order nodes. See
+        :func:`~dgl.reorder_graph`. Default: ``rcmk``.
+    edge_permute_algo : str, optional
+        The permutation algorithm to reorder edges. See
+        :func:`~dgl.reorder_graph`. The default ``dst`` makes the in-edges of
+        each node contiguous, which matches the traversal order of message
+        passing.
+    permute_config : dict, optional
+        Additional key-value config data for the specified permutation
+        algorithm. See :func:`~dgl.reorder_graph`.
+
+    Returns
+    -------
+    DGLGraph
+        The re-ordered graph.
+    Tensor or dict[str, Tensor] or None
+        The relabeled node IDs in the same structure as :attr:`ids`, or None
+        if :attr:`ids` is not given.
+
+    Examples
+    --------
+    >>> import dgl
+    >>> import torch
+    >>> g = dgl.graph((torch.tensor([0, 1, 2, 3, 4]), torch.tensor([2, 2, 3, 2, 3])))
+    >>> g.ndata['h'] = torch.arange(g.num_nodes())
+    >>> rg, new_ids = dgl.optimize_layout(
+    ...     g, {'train': torch.tensor([0, 1])}, node_permute_algo='degree')
+    >>> rg.ndata['h'][new_ids['train']]
+    tensor([0, 1])
+
+    Map predictions on the re-ordered graph back to the original node order.
+
+    >>> pred = rg.ndata['h'] * 10
+    >>> dgl.restore_node_order(rg, pred)
+    tensor([ 0, 10, 20, 30, 40])
+    """
+    rg = reorder_graph(
+        g,
+        node_permute_algo=node_permute_algo,
+        edge_permute_algo=edge_permute_algo,
+        store_ids=True,
+        permute_config=permute_config,
+    )
+    if ids is None:
+        return rg, None
+    # The inverse of the node permutation maps old node IDs to new ones.
+    new_of_old = F.argsort(rg.ndata[NID], 0, False)
+    if isinstance(ids, Mapping):
+        new_ids = {
+            k: F.gather_row(
+                new_of_old, F.copy_to(F.tensor(v, rg.idtype), rg.device)
+            )
+            for k, v in ids.items()
+        }
+    else:
+        new_ids = F.gather_row(
+            new_of_old, F.copy_to(F.tensor(ids, rg.idtype), rg.device)
+        )
+    return rg, new_ids
+
+
+def restore_node_order(g, data):
+    r"""Map node data of a re-ordered graph back to the original node order.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph returned by :func:`~dgl.optimize_layout` or
+        :func:`~dgl.reorder_graph` with ``store_ids=True``.
+    data : Tensor
+        The node data on :attr:`g`, whose first dimension is the number of
+        nodes of :attr:`g`.
+
+    Returns
+    -------
+    Tensor
+        The node data in the original node order.
+    """
+    if NID not in g.ndata:
+        raise DGLError(
+            "The graph does not store the original node IDs in ndata[dgl.NID]."
+        )
+    rev = F.argsort(F.copy_to(g.ndata[NID], F.context(data)), 0, False)
+    return F.gather_row(data, rev)
+
+
 def metis_perm(g, k):
     r"""Return nodes permutation according to ``'metis'`` algorithm.
 
@@ -3389,6 +3512,25 @@ def rcmk_perm(g):
     return perm.copy()
 
 
+def degree_perm(g):
+    r"""Return nodes permutation according to ``'degree'`` algorithm.
+
+    For internal use.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The homogeneous graph.
+
+    Returns
+    -------
+    iterable[int]
+        The nodes permutation.
+    """
+    degs = F.asnumpy(g.in_degrees())
+    return np.argsort(-degs, kind="stable").copy()
+
+
 def norm_by_dst(g, etype=None):
     r"""Calculate normalization coefficient per edge based on destination node degree.
 
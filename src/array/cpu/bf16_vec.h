@@ -0,0 +1,128 @@
+/**
+ *  Copyright (c) 2023 by Contributors
+ * @file array/cpu/bf16_vec.h
+ * @brief Vectorized BFloat16 <-> float conversion helpers for CPU kernels.
+ */
+#ifndef DGL_ARRAY_CPU_BF16_VEC_H_
+#define DGL_ARRAY_CPU_BF16_VEC_H_
+
+#include <dgl/runtime/bfloat16.h>
+#include <stdint.h>
+#include <string.h>
+
+#if !defined(_WIN32) && defined(__GNUC__) && \
+    (defined(__x86_64__) || defined(__i386__))
+#define DGL_BF16_VEC_AVX512
+#include <immintrin.h>
+#endif
+
+namespace dgl {
+namespace aten {
+namespace cpu {
+namespace bf16 {
+
+/**
+ * @brief Rebind a templated operator to another data type, e.g.
+ *        `op::Add<BFloat16>` to `op::Add<float>`.
+ */
+template <typename Op, typename T>
+struct Rebind;
+
+template <template <typename> class OpT, typename DType, typename T>
+struct Rebind<OpT<DType>, T> {
+  typedef OpT<T> type;
+};
+
+/** @brief Whether the running CPU supports AVX-512F instructions. */
+inline bool HasAVX512() {
+#ifdef DGL_BF16_VEC_AVX512
+  static const bool has_avx512 = __builtin_cpu_supports("avx512f");
+  return has_avx512;
+#else
+  return false;
+#endif
+}
+
+/** @brief Scalar BFloat16 to float conversion. */
+inline void ToFloatScalar(const BFloat16* src, float* dst, int64_t len) {
+  const uint16_t* raw = reinterpret_cast<const uint16_t*>(src);
+  for (int64_t i = 0; i < len; ++i) {
+    const uint32_t bits = static_cast<uint32_t>(raw[i]) << 16;
+    memcpy(dst + i, &bits, sizeof(float));
+  }
+}
+
+/** @brief Scalar float to BFloat16 conversion with round-to-nearest-even. */
+inline void FromFloatScalar(const float* src, BFloat16* dst, int64_t len) {
+  for (int64_t i = 0; i < len; ++i) dst[i] = BFloat16(src[i]);
+}
+
+#ifdef DGL_BF16_VEC_AVX512
+__attribute__((target("avx512f"))) inline void ToFloatAVX512(
+    const BFloat16* src, float* dst, int64_t len) {
+  int64_t i = 0;
+  for (; i + 16 <= len; i += 16) {
+    const __m256i raw =
+        _mm256_loadu_si256(reinterpret_cast<const __m256i*>(src + i));
+    const __m512i bits = _mm512_slli_epi32(_mm512_cvtepu16_epi32(raw), 16);
+    _mm512_storeu_ps(dst + i, _mm512_castsi512_ps(bits));
+  }
+  ToFloatScalar(src + i, dst + i, len - i);
+}
+
+__attribute__((target("avx512f"))) inline void FromFloatAVX512(
+    const float* src, BFloat16* dst, int64_t len) {
+  const __m512i ones = _mm512_set1_epi32(1);
+  const __m512i bias = _mm512_set1_epi32(0x7FFF);
+  const __m512i nan = _mm512_set1_epi32(0x7FC0);
+  int64_t i = 0;
+  for (; i + 16 <= len; i += 16) {
+    const __m512 val = _mm512_loadu_ps(src + i);
+    const __m512i bits = _mm512_castps_si512(val);
+    // Round to nearest even, matching the scalar BFloat16 constructor.
+    const __m512i lsb = _mm512_and_si512(_mm512_srli_epi32(bits, 16), ones);
+    __m512i rounded = _mm512_srli_epi32(
+        _mm512_add_epi32(bits, _mm512_add_epi32(bias, lsb)), 16);
+    const __mmask16 is_nan = _mm512_cmp_ps_mask(val, val, _CMP_UNORD_Q);
+    rounded = _mm512_mask_mov_epi32(rounded, is_nan, nan);
+    _mm256_storeu_si256(
+        reinterpret_cast<__m256i*>(dst + i), _mm512_cvtepi32_epi16(rounded));
+  }
+  FromFloatScalar(src + i, dst + i, len - i);
+}
+#endif  // DGL_BF16_VEC_AVX512
+
+/**
+ * @brief Convert a BFloat16 buffer to float. Uses AVX-512 when the CPU
+ *        supports it.
+ */
+inline void ToFloat(const BFloat16* src, float* dst, int64_t len) {
+#ifdef DGL_BF16_VEC_AVX512
+  if (HasAVX512()) {
+    ToFloatAVX512(src, dst, len);
+    return;
+  }
+#endif  // DGL_BF16_VEC_AVX512
+  ToFloatScalar(src, dst, len);
+}
+
+/**
+ * @brief Convert a float buffer to BFloat16. Uses AVX-512 when the CPU
+ *        supports it.
+ */
+inline void FromFloat(const float* src, BFloat16* dst, int64_t len) {
+#ifdef DGL_BF16_VEC_AVX512
+  if (HasAVX512()) {
+    FromFloatAVX512(src, dst, len);
+    return;
+  }
+#endif  // DGL_BF16_VEC_AVX512
+  FromFloatScalar(src, dst, len);
+}
+
+}  // namespace bf16
+}  // namespace cpu
+}  // namespace aten
+}  // namespace dgl
+
+#endif  // DGL_ARRAY_CPU_BF16_VEC_H_
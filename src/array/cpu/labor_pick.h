@@ -182,6 +182,8 @@ std::pair<COOMatrix, FloatArray> CSRLaborPick(
 
   IdxType max_degree = 1;
   IdxType hop_size = 0;
+  // Offsets of the rows in the picked arrays before compaction.
+  std::vector<IdxType> row_offsets(num_rows + 1, 0);
   for (int64_t i = 0; i < num_rows; ++i) {
     const IdxType rid = rows_data[i];
     const auto act_degree = indptr[rid + 1] - indptr[rid];
@@ -194,6 +196,7 @@ std::pair<COOMatrix, FloatArray> CSRLaborPick(
     cs[i] = num_picks / d;
     ds[i] = d;
     hop_size += act_degree;
+    row_offsets[i + 1] = hop_size;
   }
 
   phmap::flat_hash_map<IdxType, FloatType> hop_map;
@@ -220,45 +223,82 @@ std::pair<COOMatrix, FloatArray> CSRLaborPick(
           ? RandomEngine::ThreadLocal()->RandInt(1000000000)
           : random_seed_arr.Ptr<int64_t>()[0];
 
-  // compute number of edges first and do sampling
-  IdxType num_edges = 0;
-  for (int64_t i = 0; i < num_rows; i++) {
-    const IdxType rid = rows_data[i];
-    const auto c = cs[i];
-
-    FloatType norm_inv_p = 0;
-    const auto off = num_edges;
-    for (auto j = indptr[rid]; j < indptr[rid + 1]; j++) {
-      const auto v = indices[j];
-      const auto t = nids ? nids[v] : v;  // t in the paper
-      pcg32 ng(random_seed, t);
-      std::uniform_real_distribution<FloatType> uni;
-      // rolled random number r_t is a function of the random_seed and t
-      const auto rnd = uni(ng);
-      const auto w = (weighted ? A[j] : 1);
-      // if hop_map is initialized, get ps from there, otherwise get it from the
-      // alternative.
-      const auto ps = std::min(
-          ONE, importance_sampling - weighted ? c * hop_map[v] : c * w);
-      if (rnd <= ps) {
-        picked_rdata[num_edges] = rid;
-        picked_cdata[num_edges] = v;
-        picked_idata[num_edges] = data ? data[j] : j;
-        if (importance_sampling) {
-          const auto edge_weight = w / ps;
-          norm_inv_p += edge_weight;
-          picked_imp_data[num_edges] = edge_weight;
+  // Sample each row into its own slot of the picked arrays in parallel. The
+  // random number of an edge only depends on the seed and its source node, so
+  // the result does not depend on the number of threads.
+  std::vector<IdxType> row_counts(num_rows, 0);
+  runtime::parallel_for_nnz(
+      0, num_rows, row_offsets.data(), [&](size_t b, size_t e) {
+        for (size_t i = b; i < e; i++) {
+          const IdxType rid = rows_data[i];
+          const auto c = cs[i];
+
+          FloatType norm_inv_p = 0;
+          const auto off = row_offsets[i];
+          IdxType cnt = 0;
+          for (auto j = indptr[rid]; j < indptr[rid + 1]; j++) {
+            const auto v = indices[j];
+            const auto t = nids ? nids[v] : v;  // t in the paper
+            pcg32 ng(random_seed, t);
+            std::uniform_real_distribution<FloatType> uni;
+            // rolled random number r_t is a function of the random_seed and t
+            const auto rnd = uni(ng);
+            const auto w = (weighted ? A[j] : 1);
+            // if hop_map is initialized, get ps from there, otherwise get it
+            // from the alternative. The map must not be modified here since it
+            // is shared by the threads.
+            FloatType hop_v = 0;
+            if (importance_sampling - weighted) {
+              const auto it = hop_map.find(v);
+              if (it != hop_map.end()) hop_v = it->second;
+            }
+            const auto ps = std::min(
+                ONE, importance_sampling - weighted ? c * hop_v : c * w);
+            if (rnd <= ps) {
+              picked_rdata[off + cnt] = rid;
+              picked_cdata[off + cnt] = v;
+              picked_idata[off + cnt] = data ? data[j] : j;
+              if (importance_sampling) {
+                const auto edge_weight = w / ps;
+                norm_inv_p += edge_weight;
+                picked_imp_data[off + cnt] = edge_weight;
+              }
+              cnt++;
+            }
+          }
+
+          if (importance_sampling) {
+            const auto norm_factor = cnt / norm_inv_p;
+            for (auto k = off; k < off + cnt; k++)
+              // so that fn.mean can be used
+              picked_imp_data[k] *= norm_factor;
+          }
+          row_counts[i] = cnt;
         }
-        num_edges++;
-      }
-    }
+      });
 
-    if (importance_sampling) {
-      const auto norm_factor = (num_edges - off) / norm_inv_p;
-      for (auto i = off; i < num_edges; i++)
-        // so that fn.mean can be used
-        picked_imp_data[i] *= norm_factor;
+  // Compact the sampled edges of all rows to the front of the arrays. Moving
+  // the rows in order is safe since a row never moves past its own slot.
+  IdxType num_edges = 0;
+  for (int64_t i = 0; i < num_rows; i++) {
+    const auto off = row_offsets[i];
+    const auto cnt = row_counts[i];
+    if (num_edges != off) {
+      std::copy(
+          picked_rdata + off, picked_rdata + off + cnt,
+          picked_rdata + num_edges);
+      std::copy(
+          picked_cdata + off, picked_cdata + off + cnt,
+          picked_cdata + num_edges);
+      std::copy(
+          picked_idata + off, picked_idata + off + cnt,
+          picked_idata + num_edges);
+      if (importance_sampling)
+        std::copy(
+            picked_imp_data + off, picked_imp_data + off + cnt,
+            picked_imp_data + num_edges);
     }
+    num_edges += cnt;
   }
 
   picked_row = picked_row.CreateView({num_edges}, picked_row->dtype);
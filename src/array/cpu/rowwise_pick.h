@@ -135,6 +135,16 @@ COOMatrix CSRRowWisePick(
   const int num_threads = runtime::compute_num_threads(0, num_rows, 1);
   std::vector<int64_t> global_prefix(num_threads + 1, 0);
 
+  // Balance the rows among threads by their number of nonzeros, since a few
+  // hub rows dominate the cost on power-law graphs.
+  std::vector<int64_t> row_nnz_prefix(num_rows + 1, 0);
+  for (int64_t i = 0; i < num_rows; ++i) {
+    const IdxType rid = rows_data[i];
+    row_nnz_prefix[i + 1] = row_nnz_prefix[i] + indptr[rid + 1] - indptr[rid];
+  }
+  const std::vector<size_t> bounds = runtime::nnz_balanced_partition(
+      0, num_rows, row_nnz_prefix.data(), num_threads);
+
   // TODO(BarclayII) Using OMP parallel directly instead of using
   // runtime::parallel_for does not handle exceptions well (directly aborts when
   // an exception pops up). It runs faster though because there is less
@@ -144,12 +154,8 @@ COOMatrix CSRRowWisePick(
   {
     const int thread_id = omp_get_thread_num();
 
-    const int64_t start_i =
-        thread_id * (num_rows / num_threads) +
-        std::min(static_cast<int64_t>(thread_id), num_rows % num_threads);
-    const int64_t end_i =
-        (thread_id + 1) * (num_rows / num_threads) +
-        std::min(static_cast<int64_t>(thread_id + 1), num_rows % num_threads);
+    const int64_t start_i = bounds[thread_id];
+    const int64_t end_i = bounds[thread_id + 1];
     assert(thread_id + 1 < num_threads || end_i == num_rows);
 
     const int64_t num_local = end_i - start_i;
@@ -251,7 +257,9 @@ COOMatrix CSRRowWisePerEtypePick(
     }
   }
 
-  runtime::parallel_for(0, num_rows, [&](size_t b, size_t e) {
+  // Rows are claimed dynamically by the threads since the cost of a row
+  // depends on its degree and on the number of edge types it spans.
+  runtime::parallel_for_dynamic(0, num_rows, 64, [&](size_t b, size_t e) {
     for (size_t i = b; i < e; ++i) {
       const IdxType rid = rows_data[i];
       CHECK_LT(rid, mat.num_rows);
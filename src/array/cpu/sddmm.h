@@ -10,7 +10,10 @@
 #include <dgl/bcast.h>
 #include <dgl/runtime/parallel_for.h>
 
+#include <vector>
+
 #include "../selector.h"
+#include "./bf16_vec.h"
 
 namespace dgl {
 namespace aten {
@@ -29,7 +32,8 @@ namespace cpu {
 template <
     typename IdType, typename DType, typename Op, int LhsTarget = 0,
     int RhsTarget = 2>
-void SDDMMCsr(
+typename std::enable_if<!std::is_same<DType, BFloat16>::value, void>::type
+SDDMMCsr(
     const BcastOff& bcast, const CSRMatrix& csr, NDArray lhs, NDArray rhs,
     NDArray out) {
   const bool has_idx = !IsNullArray(csr.data);
@@ -68,6 +72,84 @@ void SDDMMCsr(
   });
 }
 
+/**
+ * @brief Compute g-SDDMM on one edge for BFloat16 in float precision.
+ * @param bcast Broadcast information.
+ * @param lhs_off The left hand side operand row of the edge.
+ * @param rhs_off The right hand side operand row of the edge.
+ * @param out_off The result row of the edge.
+ * @param lhs_buf Float buffer of size `bcast.lhs_len`.
+ * @param rhs_buf Float buffer of size `bcast.rhs_len`.
+ * @param out_buf Float buffer of size `bcast.out_len`.
+ * @note The operands are converted to float with vectorized loads, reductions
+ *       (e.g. dot) accumulate in float, and the result is rounded back to
+ *       BFloat16 once.
+ */
+template <typename Op>
+inline void SDDMMEdgeBF16(
+    const BcastOff& bcast, const BFloat16* lhs_off, const BFloat16* rhs_off,
+    BFloat16* out_off, float* lhs_buf, float* rhs_buf, float* out_buf) {
+  typedef typename bf16::Rebind<Op, float>::type FloatOp;
+  const int64_t dim = bcast.out_len, reduce_size = bcast.reduce_size;
+  if (Op::use_lhs) bf16::ToFloat(lhs_off, lhs_buf, bcast.lhs_len);
+  if (Op::use_rhs) bf16::ToFloat(rhs_off, rhs_buf, bcast.rhs_len);
+  for (int64_t k = 0; k < dim; ++k) {
+    const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
+    const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
+    out_buf[k] = FloatOp::Call(
+        Op::use_lhs ? lhs_buf + lhs_add * reduce_size : nullptr,
+        Op::use_rhs ? rhs_buf + rhs_add * reduce_size : nullptr, reduce_size);
+  }
+  bf16::FromFloat(out_buf, out_off, dim);
+}
+
+/**
+ * @brief CPU kernel of g-SDDMM on Csr format for BFloat16.
+ * @param bcast Broadcast information.
+ * @param csr The Csr matrix.
+ * @param lhs The left hand side operand feature.
+ * @param rhs The right hand size operand feature.
+ * @param out The result feature on edges.
+ * @note it uses node parallel strategy, different threads are responsible
+ *       for the computation of different nodes.
+ */
+template <
+    typename IdType, typename DType, typename Op, int LhsTarget = 0,
+    int RhsTarget = 2>
+typename std::enable_if<std::is_same<DType, BFloat16>::value, void>::type
+SDDMMCsr(
+    const BcastOff& bcast, const CSRMatrix& csr, NDArray lhs, NDArray rhs,
+    NDArray out) {
+  const bool has_idx = !IsNullArray(csr.data);
+  const IdType* indptr = csr.indptr.Ptr<IdType>();
+  const IdType* indices = csr.indices.Ptr<IdType>();
+  const IdType* edges = csr.data.Ptr<IdType>();
+  const DType* X = lhs.Ptr<DType>();
+  const DType* Y = rhs.Ptr<DType>();
+  const int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len,
+                rhs_dim = bcast.rhs_len;
+  DType* O = out.Ptr<DType>();
+  runtime::parallel_for(0, csr.num_rows, [&](IdType b, IdType e) {
+    std::vector<float> lhs_buf(Op::use_lhs ? lhs_dim : 0);
+    std::vector<float> rhs_buf(Op::use_rhs ? rhs_dim : 0);
+    std::vector<float> out_buf(dim);
+    for (auto rid = b; rid < e; ++rid) {
+      const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
+      for (IdType j = row_start; j < row_end; ++j) {
+        const IdType cid = indices[j];
+        const IdType eid = has_idx ? edges[j] : j;
+        SDDMMEdgeBF16<Op>(
+            bcast,
+            Op::use_lhs ? X + Selector<LhsTarget>::Call(rid, eid, cid) * lhs_dim
+                        : nullptr,
+            Op::use_rhs ? Y + Selector<RhsTarget>::Call(rid, eid, cid) * rhs_dim
+                        : nullptr,
+            O + eid * dim, lhs_buf.data(), rhs_buf.data(), out_buf.data());
+      }
+    }
+  });
+}
+
 /**
  * @brief CPU kernel of g-SDDMM on Coo format.
  * @param bcast Broadcast information.
@@ -81,7 +163,8 @@ void SDDMMCsr(
 template <
     typename IdType, typename DType, typename Op, int LhsTarget = 0,
     int RhsTarget = 2>
-void SDDMMCoo(
+typename std::enable_if<!std::is_same<DType, BFloat16>::value, void>::type
+SDDMMCoo(
     const BcastOff& bcast, const COOMatrix& coo, NDArray lhs, NDArray rhs,
     NDArray out) {
   const bool has_idx = !IsNullArray(coo.data);
@@ -115,6 +198,51 @@ void SDDMMCoo(
   }
 }
 
+/**
+ * @brief CPU kernel of g-SDDMM on Coo format for BFloat16.
+ * @param bcast Broadcast information.
+ * @param coo The COO matrix.
+ * @param lhs The left hand side operand feature.
+ * @param rhs The right hand size operand feature.
+ * @param out The result feature on edges.
+ * @note it uses edge parallel strategy, different threads are responsible
+ *       for the computation of different edges.
+ */
+template <
+    typename IdType, typename DType, typename Op, int LhsTarget = 0,
+    int RhsTarget = 2>
+typename std::enable_if<std::is_same<DType, BFloat16>::value, void>::type
+SDDMMCoo(
+    const BcastOff& bcast, const COOMatrix& coo, NDArray lhs, NDArray rhs,
+    NDArray out) {
+  const bool has_idx = !IsNullArray(coo.data);
+  const IdType* row = coo.row.Ptr<IdType>();
+  const IdType* col = coo.col.Ptr<IdType>();
+  const IdType* edges = coo.data.Ptr<IdType>();
+  const DType* X = lhs.Ptr<DType>();
+  const DType* Y = rhs.Ptr<DType>();
+  const int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len,
+                rhs_dim = bcast.rhs_len;
+  DType* O = out.Ptr<DType>();
+  runtime::parallel_for(0, coo.row->shape[0], [&](int64_t b, int64_t e) {
+    std::vector<float> lhs_buf(Op::use_lhs ? lhs_dim : 0);
+    std::vector<float> rhs_buf(Op::use_rhs ? rhs_dim : 0);
+    std::vector<float> out_buf(dim);
+    for (int64_t i = b; i < e; ++i) {
+      const IdType rid = row[i];
+      const IdType cid = col[i];
+      const IdType eid = has_idx ? edges[i] : i;
+      SDDMMEdgeBF16<Op>(
+          bcast,
+          Op::use_lhs ? X + Selector<LhsTarget>::Call(rid, eid, cid) * lhs_dim
+                      : nullptr,
+          Op::use_rhs ? Y + Selector<RhsTarget>::Call(rid, eid, cid) * rhs_dim
+                      : nullptr,
+          O + eid * dim, lhs_buf.data(), rhs_buf.data(), out_buf.data());
+    }
+  });
+}
+
 namespace op {
 
 ////////////////////////// binary operators on CPU /////////////////////////////
@@ -17,6 +17,7 @@
 #include <memory>
 #include <vector>
 
+#include "bf16_vec.h"
 #include "spmm_binary_ops.h"
 #if !defined(_WIN32)
 #ifdef USE_LIBXSMM
@@ -52,7 +53,7 @@ SpMMSumCsrNaive(
   const IdType* indices = csr.indices.Ptr<IdType>();
   const IdType* edges = csr.data.Ptr<IdType>();
   int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len, rhs_dim = bcast.rhs_len;
-  runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
     for (auto rid = b; rid < e; ++rid) {
       const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
       DType* out_off = O + rid * dim;
@@ -73,36 +74,112 @@ SpMMSumCsrNaive(
   });
 }
 
-// Naive implementation with additional accumulator, which prevents accuracy
-// degradation in less precise data types, like bfloat16.
+// Implementation for BFloat16, which converts the gathered operand rows to
+// float with vectorized loads and accumulates in float. The result is rounded
+// back to BFloat16 only once per output row, which prevents accuracy
+// degradation and avoids per-element conversions.
 template <typename IdType, typename DType, typename Op>
 typename std::enable_if<std::is_same<DType, BFloat16>::value, void>::type
 SpMMSumCsrNaive(
     const BcastOff& bcast, const CSRMatrix& csr, const DType* X, const DType* W,
     DType* O) {
+  typedef typename bf16::Rebind<Op, float>::type FloatOp;
   const bool has_idx = !IsNullArray(csr.data);
   const IdType* indptr = csr.indptr.Ptr<IdType>();
   const IdType* indices = csr.indices.Ptr<IdType>();
   const IdType* edges = csr.data.Ptr<IdType>();
   int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len, rhs_dim = bcast.rhs_len;
-  runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
+    std::vector<float> acc(dim);
+    std::vector<float> lhs_buf(Op::use_lhs ? lhs_dim : 0);
+    std::vector<float> rhs_buf(Op::use_rhs ? rhs_dim : 0);
     for (auto rid = b; rid < e; ++rid) {
       const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
+      if (row_start == row_end) continue;
       DType* out_off = O + rid * dim;
-      for (int64_t k = 0; k < dim; ++k) {
-        AccType<DType> acc = 0.;
+      bf16::ToFloat(out_off, acc.data(), dim);
+      for (IdType j = row_start; j < row_end; ++j) {
+        const IdType cid = indices[j];
+        const IdType eid = has_idx ? edges[j] : j;
+        if (Op::use_lhs)
+          bf16::ToFloat(X + cid * lhs_dim, lhs_buf.data(), lhs_dim);
+        if (Op::use_rhs)
+          bf16::ToFloat(W + eid * rhs_dim, rhs_buf.data(), rhs_dim);
+        for (int64_t k = 0; k < dim; ++k) {
+          const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
+          const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
+          const float* lhs_off =
+              Op::use_lhs ? lhs_buf.data() + lhs_add : nullptr;
+          const float* rhs_off =
+              Op::use_rhs ? rhs_buf.data() + rhs_add : nullptr;
+          acc[k] += FloatOp::Call(lhs_off, rhs_off);
+        }
+      }
+      bf16::FromFloat(acc.data(), out_off, dim);
+    }
+  });
+}
+
+/**
+ * @brief Size in bytes of a feature tile in the tiled SpMM kernel. A tile of
+ *        the output row and of every gathered row should stay in L1 cache.
+ */
+constexpr int64_t kSpMMFeatTileBytes = 1024;
+
+/**
+ * @brief Number of feature elements per tile of the tiled SpMM kernel, or
+ *        zero if the feature is narrow enough to be processed as a whole.
+ * @param bcast Broadcast information.
+ */
+template <typename DType>
+int64_t SpMMFeatTileLen(const BcastOff& bcast) {
+  // The BFloat16 kernel already accumulates each row in a float buffer.
+  if (std::is_same<DType, BFloat16>::value) return 0;
+  const int64_t tile_len = kSpMMFeatTileBytes / sizeof(DType);
+  return bcast.out_len > 2 * tile_len ? tile_len : 0;
+}
+
+/**
+ * @brief Feature-tiled CPU kernel of SpMM on Csr format for wide features.
+ * @param bcast Broadcast information.
+ * @param csr The Csr matrix.
+ * @param X The feature on source nodes.
+ * @param W The feature on edges.
+ * @param O The result feature on destination nodes.
+ * @param tile_len Number of feature elements per tile.
+ * @note it uses node parallel strategy, different threads are responsible
+ *       for the computation of different nodes. Each thread sweeps its rows
+ *       once per feature tile, so that only a tile of the gathered rows is
+ *       streamed into cache at a time instead of the full feature dimension.
+ */
+template <typename IdType, typename DType, typename Op>
+void SpMMSumCsrTiled(
+    const BcastOff& bcast, const CSRMatrix& csr, const DType* X, const DType* W,
+    DType* O, int64_t tile_len) {
+  const bool has_idx = !IsNullArray(csr.data);
+  const IdType* indptr = csr.indptr.Ptr<IdType>();
+  const IdType* indices = csr.indices.Ptr<IdType>();
+  const IdType* edges = csr.data.Ptr<IdType>();
+  int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len, rhs_dim = bcast.rhs_len;
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
+    for (int64_t tile_start = 0; tile_start < dim; tile_start += tile_len) {
+      const int64_t tile_end = std::min(tile_start + tile_len, dim);
+      for (auto rid = b; rid < e; ++rid) {
+        const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
+        DType* out_off = O + rid * dim;
         for (IdType j = row_start; j < row_end; ++j) {
           const IdType cid = indices[j];
           const IdType eid = has_idx ? edges[j] : j;
-          const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
-          const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
-          const DType* lhs_off =
-              Op::use_lhs ? X + cid * lhs_dim + lhs_add : nullptr;
-          const DType* rhs_off =
-              Op::use_rhs ? W + eid * rhs_dim + rhs_add : nullptr;
-          acc += Op::Call(lhs_off, rhs_off);
+          for (int64_t k = tile_start; k < tile_end; ++k) {
+            const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
+            const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
+            const DType* lhs_off =
+                Op::use_lhs ? X + cid * lhs_dim + lhs_add : nullptr;
+            const DType* rhs_off =
+                Op::use_rhs ? W + eid * rhs_dim + rhs_add : nullptr;
+            out_off[k] += Op::Call(lhs_off, rhs_off);
+          }
         }
-        out_off[k] += acc;
       }
     }
   });
@@ -151,7 +228,12 @@ void SpMMSumCsr(
   } else {
 #endif  // USE_LIBXSMM
 #endif  // _WIN32
-    SpMMSumCsrNaive<IdType, DType, Op>(bcast, csr, X, W, O);
+    const int64_t tile_len = SpMMFeatTileLen<DType>(bcast);
+    if (tile_len > 0) {
+      SpMMSumCsrTiled<IdType, DType, Op>(bcast, csr, X, W, O, tile_len);
+    } else {
+      SpMMSumCsrNaive<IdType, DType, Op>(bcast, csr, X, W, O);
+    }
 #if !defined(_WIN32)
 #ifdef USE_LIBXSMM
   }
@@ -217,6 +299,112 @@ SpMMSumCoo(
   LOG(FATAL) << "Unsupported CPU kernel for SpMMSumCoo for BF16.";
 }
 
+/**
+ * @brief Naive CPU kernel of SpMM-Min/Max on Csr format.
+ * @param bcast Broadcast information.
+ * @param csr The Csr matrix.
+ * @param X The feature on source nodes.
+ * @param W The feature on edges.
+ * @param O The result feature on destination nodes.
+ * @param argX Arg-Min/Max on source nodes.
+ * @param argW Arg-Min/Max on edges.
+ * @note it uses node parallel strategy, different threads are responsible
+ *       for the computation of different nodes.
+ */
+template <typename IdType, typename DType, typename Op, typename Cmp>
+typename std::enable_if<!std::is_same<DType, BFloat16>::value, void>::type
+SpMMCmpCsrNaive(
+    const BcastOff& bcast, const CSRMatrix& csr, const DType* X, const DType* W,
+    DType* O, IdType* argX, IdType* argW) {
+  const bool has_idx = !IsNullArray(csr.data);
+  const IdType* indptr = static_cast<IdType*>(csr.indptr->data);
+  const IdType* indices = static_cast<IdType*>(csr.indices->data);
+  const IdType* edges =
+      has_idx ? static_cast<IdType*>(csr.data->data) : nullptr;
+  const int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len,
+                rhs_dim = bcast.rhs_len;
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
+    for (auto rid = b; rid < e; ++rid) {
+      const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
+      DType* out_off = O + rid * dim;
+      IdType* argx_off = argX + rid * dim;
+      IdType* argw_off = argW + rid * dim;
+      for (IdType j = row_start; j < row_end; ++j) {
+        const IdType cid = indices[j];
+        const IdType eid = has_idx ? edges[j] : j;
+        for (int64_t k = 0; k < dim; ++k) {
+          const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
+          const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
+          const DType* lhs_off =
+              Op::use_lhs ? X + cid * lhs_dim + lhs_add : nullptr;
+          const DType* rhs_off =
+              Op::use_rhs ? W + eid * rhs_dim + rhs_add : nullptr;
+          const DType val = Op::Call(lhs_off, rhs_off);
+          if (Cmp::Call(out_off[k], val)) {
+            out_off[k] = val;
+            if (Op::use_lhs) argx_off[k] = cid;
+            if (Op::use_rhs) argw_off[k] = eid;
+          }
+        }
+      }
+    }
+  });
+}
+
+// Implementation for BFloat16, which compares in float on vectorized-converted
+// operand rows and rounds the result back to BFloat16 once per output row.
+template <typename IdType, typename DType, typename Op, typename Cmp>
+typename std::enable_if<std::is_same<DType, BFloat16>::value, void>::type
+SpMMCmpCsrNaive(
+    const BcastOff& bcast, const CSRMatrix& csr, const DType* X, const DType* W,
+    DType* O, IdType* argX, IdType* argW) {
+  typedef typename bf16::Rebind<Op, float>::type FloatOp;
+  typedef typename bf16::Rebind<Cmp, float>::type FloatCmp;
+  const bool has_idx = !IsNullArray(csr.data);
+  const IdType* indptr = static_cast<IdType*>(csr.indptr->data);
+  const IdType* indices = static_cast<IdType*>(csr.indices->data);
+  const IdType* edges =
+      has_idx ? static_cast<IdType*>(csr.data->data) : nullptr;
+  const int64_t dim = bcast.out_len, lhs_dim = bcast.lhs_len,
+                rhs_dim = bcast.rhs_len;
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
+    std::vector<float> acc(dim);
+    std::vector<float> lhs_buf(Op::use_lhs ? lhs_dim : 0);
+    std::vector<float> rhs_buf(Op::use_rhs ? rhs_dim : 0);
+    for (auto rid = b; rid < e; ++rid) {
+      const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
+      if (row_start == row_end) continue;
+      DType* out_off = O + rid * dim;
+      IdType* argx_off = argX + rid * dim;
+      IdType* argw_off = argW + rid * dim;
+      bf16::ToFloat(out_off, acc.data(), dim);
+      for (IdType j = row_start; j < row_end; ++j) {
+        const IdType cid = indices[j];
+        const IdType eid = has_idx ? edges[j] : j;
+        if (Op::use_lhs)
+          bf16::ToFloat(X + cid * lhs_dim, lhs_buf.data(), lhs_dim);
+        if (Op::use_rhs)
+          bf16::ToFloat(W + eid * rhs_dim, rhs_buf.data(), rhs_dim);
+        for (int64_t k = 0; k < dim; ++k) {
+          const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
+          const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
+          const float* lhs_off =
+              Op::use_lhs ? lhs_buf.data() + lhs_add : nullptr;
+          const float* rhs_off =
+              Op::use_rhs ? rhs_buf.data() + rhs_add : nullptr;
+          const float val = FloatOp::Call(lhs_off, rhs_off);
+          if (FloatCmp::Call(acc[k], val)) {
+            acc[k] = val;
+            if (Op::use_lhs) argx_off[k] = cid;
+            if (Op::use_rhs) argw_off[k] = eid;
+          }
+        }
+      }
+      bf16::FromFloat(acc.data(), out_off, dim);
+    }
+  });
+}
+
 /**
  * @brief CPU kernel of SpMM-Min/Max on Csr format.
  * @param bcast Broadcast information.
@@ -277,33 +465,7 @@ void SpMMCmpCsr(
   } else {
 #endif  // USE_LIBXSMM
 #endif  // _WIN32
-
-    runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
-      for (auto rid = b; rid < e; ++rid) {
-        const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
-        DType* out_off = O + rid * dim;
-        IdType* argx_off = argX + rid * dim;
-        IdType* argw_off = argW + rid * dim;
-        for (IdType j = row_start; j < row_end; ++j) {
-          const IdType cid = indices[j];
-          const IdType eid = has_idx ? edges[j] : j;
-          for (int64_t k = 0; k < dim; ++k) {
-            const int64_t lhs_add = bcast.use_bcast ? bcast.lhs_offset[k] : k;
-            const int64_t rhs_add = bcast.use_bcast ? bcast.rhs_offset[k] : k;
-            const DType* lhs_off =
-                Op::use_lhs ? X + cid * lhs_dim + lhs_add : nullptr;
-            const DType* rhs_off =
-                Op::use_rhs ? W + eid * rhs_dim + rhs_add : nullptr;
-            const DType val = Op::Call(lhs_off, rhs_off);
-            if (Cmp::Call(out_off[k], val)) {
-              out_off[k] = val;
-              if (Op::use_lhs) argx_off[k] = cid;
-              if (Op::use_rhs) argw_off[k] = eid;
-            }
-          }
-        }
-      }
-    });
+    SpMMCmpCsrNaive<IdType, DType, Op, Cmp>(bcast, csr, X, W, O, argX, argW);
 #if !defined(_WIN32)
 #ifdef USE_LIBXSMM
   }
@@ -371,7 +533,7 @@ void SpMMCmpCsrHetero(
     CHECK_NOTNULL(argW);
   }
   // TODO(Israt): Use LIBXSMM. Homogeneous graph uses LIBXMM when enabled.
-  runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
     for (auto rid = b; rid < e; ++rid) {
       const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
       DType* out_off = O + rid * dim;
@@ -491,7 +653,7 @@ void Edge_softmax_csr_forward(
       has_idx ? static_cast<IdType*>(csr.data->data) : nullptr;
   const DType* W = Op::use_rhs ? static_cast<DType*>(efeat->data) : nullptr;
   const int64_t dim = bcast.out_len, rhs_dim = bcast.rhs_len;
-  runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
     for (auto rid = b; rid < e; ++rid) {
       const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
       std::vector<AccType<DType>> data_e(row_end - row_start, 0);
@@ -542,7 +704,7 @@ void Edge_softmax_csr_backward(
   const DType* W_out = Op::use_rhs ? static_cast<DType*>(out->data) : nullptr;
   const DType* W_sds = Op::use_rhs ? static_cast<DType*>(sds->data) : nullptr;
   const int64_t dim = bcast.out_len, rhs_dim = bcast.rhs_len;
-  runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+  runtime::parallel_for_nnz(0, csr.num_rows, indptr, [&](size_t b, size_t e) {
     for (auto rid = b; rid < e; ++rid) {
       const IdType row_start = indptr[rid], row_end = indptr[rid + 1];
       for (int64_t k = 0; k < dim; ++k) {
@@ -0,0 +1,93 @@
+/**
+ *  Copyright (c) 2023 by Contributors
+ * @file graph/sampling/negative/bloom_filter.h
+ * @brief Bloom filters over the edges of a graph for negative sampling.
+ */
+
+#ifndef DGL_GRAPH_SAMPLING_NEGATIVE_BLOOM_FILTER_H_
+#define DGL_GRAPH_SAMPLING_NEGATIVE_BLOOM_FILTER_H_
+
+#include <dgl/array.h>
+
+#include <utility>
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+/** @brief The SplitMix64 finalizer, used to hash the edge keys. */
+inline uint64_t BloomHash(uint64_t x) {
+  x += 0x9e3779b97f4a7c15ULL;
+  x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+  x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+  return x ^ (x >> 31);
+}
+
+/**
+ * @brief Compute the two base hashes of the pair (u, v).
+ *
+ * The i-th bit of the pair is <tt>(h1 + i * h2) % num_bits</tt> (double
+ * hashing); \c h2 is odd so that the bits of a pair never coincide when
+ * \c num_bits is a power of two.
+ */
+inline std::pair<uint64_t, uint64_t> BloomBaseHashes(
+    uint64_t u, uint64_t v, uint64_t num_cols) {
+  const uint64_t h1 = BloomHash(u * num_cols + v);
+  const uint64_t h2 = BloomHash(h1) | 1;
+  return {h1, h2};
+}
+
+/** @brief Whether the pair (u, v) may be in the filter. */
+inline bool BloomMayContain(
+    const uint64_t *words, uint64_t num_bits, int num_hashes, uint64_t u,
+    uint64_t v, uint64_t num_cols) {
+  const auto h = BloomBaseHashes(u, v, num_cols);
+  for (int i = 0; i < num_hashes; ++i) {
+    const uint64_t bit = (h.first + i * h.second) % num_bits;
+    if (!(words[bit >> 6] & (1ULL << (bit & 63)))) return false;
+  }
+  return true;
+}
+
+/**
+ * @brief Build a bloom filter of the edges of a sparse matrix.
+ *
+ * @param csr The CSR matrix, or the CSC matrix if \c transpose is true.
+ * @param num_cols The number of destination nodes.
+ * @param num_bits The number of bits of the filter; a multiple of 64.
+ * @param num_hashes The number of hash functions.
+ * @param transpose Whether \c csr is a CSC matrix.
+ * @return The bit words of the filter as an int64 array.
+ */
+template <DGLDeviceType XPU, typename IdxType>
+IdArray BuildEdgeBloomFilter(
+    const CSRMatrix &csr, int64_t num_cols, int64_t num_bits, int num_hashes,
+    bool transpose);
+
+/**
+ * @brief Uniformly sample source-destination pairs rejected by the filter.
+ *
+ * The candidates are drawn in fixed-size chunks, each with its own random
+ * stream derived from \c seed, so the result only depends on the seed and
+ * not on the number of threads.
+ *
+ * @return The pair of source and destination tensors.
+ */
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<IdArray, IdArray> BloomFilterNegativeSampling(
+    int64_t num_rows, int64_t num_cols, const IdArray &filter, int num_hashes,
+    int64_t num_samples, int num_trials, bool exclude_self_loops, bool replace,
+    double redundancy, uint64_t seed);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
+
+#endif  // DGL_GRAPH_SAMPLING_NEGATIVE_BLOOM_FILTER_H_
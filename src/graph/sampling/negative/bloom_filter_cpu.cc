@@ -0,0 +1,151 @@
+/**
+ *  Copyright (c) 2023 by Contributors
+ * @file graph/sampling/negative/bloom_filter_cpu.cc
+ * @brief Bloom-filter based global uniform negative sampling on CPU.
+ */
+
+#include <dgl/array.h>
+#include <dgl/array_iterator.h>
+#include <dgl/random.h>
+#include <dgl/runtime/parallel_for.h>
+
+#include <algorithm>
+#include <atomic>
+#include <memory>
+#include <utility>
+
+#include "bloom_filter.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+namespace {
+
+// Number of candidates drawn from one random stream.
+constexpr int64_t kSampleChunkSize = 4096;
+
+};  // namespace
+
+template <DGLDeviceType XPU, typename IdxType>
+IdArray BuildEdgeBloomFilter(
+    const CSRMatrix &csr, int64_t num_cols, int64_t num_bits, int num_hashes,
+    bool transpose) {
+  CHECK_EQ(num_bits % 64, 0) << "The number of bits must be a multiple of 64";
+  const int64_t num_words = num_bits / 64;
+  const IdxType *indptr = csr.indptr.Ptr<IdxType>();
+  const IdxType *indices = csr.indices.Ptr<IdxType>();
+
+  std::unique_ptr<std::atomic<uint64_t>[]> words(
+      new std::atomic<uint64_t>[num_words]);
+  parallel_for(0, num_words, [&](int64_t b, int64_t e) {
+    for (int64_t i = b; i < e; ++i)
+      words[i].store(0, std::memory_order_relaxed);
+  });
+
+  parallel_for(0, csr.num_rows, [&](int64_t b, int64_t e) {
+    for (int64_t row = b; row < e; ++row) {
+      for (IdxType j = indptr[row]; j < indptr[row + 1]; ++j) {
+        const uint64_t u = transpose ? indices[j] : row;
+        const uint64_t v = transpose ? row : indices[j];
+        const auto h = BloomBaseHashes(u, v, num_cols);
+        for (int i = 0; i < num_hashes; ++i) {
+          const uint64_t bit = (h.first + i * h.second) % num_bits;
+          words[bit >> 6].fetch_or(
+              1ULL << (bit & 63), std::memory_order_relaxed);
+        }
+      }
+    }
+  });
+
+  IdArray filter = NewIdArray(num_words, csr.indptr->ctx, 64);
+  uint64_t *filter_data = static_cast<uint64_t *>(filter->data);
+  parallel_for(0, num_words, [&](int64_t b, int64_t e) {
+    for (int64_t i = b; i < e; ++i)
+      filter_data[i] = words[i].load(std::memory_order_relaxed);
+  });
+  return filter;
+}
+
+template IdArray BuildEdgeBloomFilter<kDGLCPU, int32_t>(
+    const CSRMatrix &, int64_t, int64_t, int, bool);
+template IdArray BuildEdgeBloomFilter<kDGLCPU, int64_t>(
+    const CSRMatrix &, int64_t, int64_t, int, bool);
+
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<IdArray, IdArray> BloomFilterNegativeSampling(
+    int64_t num_rows, int64_t num_cols, const IdArray &filter, int num_hashes,
+    int64_t num_samples, int num_trials, bool exclude_self_loops, bool replace,
+    double redundancy, uint64_t seed) {
+  const int64_t num_actual_samples =
+      static_cast<int64_t>(num_samples * (1 + redundancy));
+  const uint64_t num_bits = filter->shape[0] * 64;
+  const uint64_t *words = static_cast<const uint64_t *>(filter->data);
+  IdArray row = Full<IdxType>(-1, num_actual_samples, filter->ctx);
+  IdArray col = Full<IdxType>(-1, num_actual_samples, filter->ctx);
+  IdxType *row_data = row.Ptr<IdxType>();
+  IdxType *col_data = col.Ptr<IdxType>();
+
+  const int64_t num_chunks =
+      (num_actual_samples + kSampleChunkSize - 1) / kSampleChunkSize;
+  parallel_for(0, num_chunks, 1, [&](int64_t b, int64_t e) {
+    for (int64_t chunk = b; chunk < e; ++chunk) {
+      RandomEngine rng(seed, chunk);
+      const int64_t begin = chunk * kSampleChunkSize;
+      const int64_t end =
+          std::min(begin + kSampleChunkSize, num_actual_samples);
+      for (int64_t i = begin; i < end; ++i) {
+        for (int trial = 0; trial < num_trials; ++trial) {
+          IdxType u = rng.RandInt<IdxType>(num_rows);
+          IdxType v = rng.RandInt<IdxType>(num_cols);
+          if (!(exclude_self_loops && (u == v)) &&
+              !BloomMayContain(words, num_bits, num_hashes, u, v, num_cols)) {
+            row_data[i] = u;
+            col_data[i] = v;
+            break;
+          }
+        }
+      }
+    }
+  });
+
+  PairIterator<IdxType> begin(row_data, col_data);
+  PairIterator<IdxType> end = std::remove_if(
+      begin, begin + num_actual_samples,
+      [](const std::pair<IdxType, IdxType> &val) { return val.first == -1; });
+  if (!replace) {
+    std::sort(
+        begin, end,
+        [](const std::pair<IdxType, IdxType> &a,
+           const std::pair<IdxType, IdxType> &b) {
+          return a.first < b.first ||
+                 (a.first == b.first && a.second < b.second);
+        });
+    end = std::unique(begin, end);
+  }
+  int64_t num_sampled =
+      std::min(static_cast<int64_t>(end - begin), num_samples);
+  return {
+      row.CreateView({num_sampled}, row->dtype),
+      col.CreateView({num_sampled}, col->dtype)};
+}
+
+template std::pair<IdArray, IdArray>
+BloomFilterNegativeSampling<kDGLCPU, int32_t>(
+    int64_t, int64_t, const IdArray &, int, int64_t, int, bool, bool, double,
+    uint64_t);
+template std::pair<IdArray, IdArray>
+BloomFilterNegativeSampling<kDGLCPU, int64_t>(
+    int64_t, int64_t, const IdArray &, int, int64_t, int, bool, bool, double,
+    uint64_t);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
@@ -7,12 +7,14 @@
 #include <dgl/array.h>
 #include <dgl/base_heterograph.h>
 #include <dgl/packed_func_ext.h>
+#include <dgl/random.h>
 #include <dgl/runtime/container.h>
 #include <dgl/sampling/negative.h>
 
 #include <utility>
 
 #include "../../../c_api_common.h"
+#include "bloom_filter.h"
 
 using namespace dgl::runtime;
 using namespace dgl::aten;
@@ -43,6 +45,49 @@ std::pair<IdArray, IdArray> GlobalUniformNegativeSampling(
   }
 }
 
+IdArray BuildEdgeBloomFilter(
+    HeteroGraphPtr hg, dgl_type_t etype, int64_t num_bits, int num_hashes) {
+  CHECK_EQ(hg->Context().device_type, kDGLCPU)
+      << "Bloom filter negative sampling only supports CPU graphs";
+  CHECK_GT(num_bits, 0) << "Number of bits must be positive";
+  CHECK_GT(num_hashes, 0) << "Number of hash functions must be positive";
+  const dgl_type_t dst_type = hg->GetEndpointTypes(etype).second;
+  const int64_t num_cols = hg->NumVertices(dst_type);
+  auto format = hg->SelectFormat(etype, CSC_CODE | CSR_CODE);
+  const bool transpose = (format == SparseFormat::kCSC);
+  CSRMatrix csr = transpose ? hg->GetCSCMatrix(etype) : hg->GetCSRMatrix(etype);
+  IdArray filter;
+  ATEN_ID_TYPE_SWITCH(hg->DataType(), IdxType, {
+    filter = impl::BuildEdgeBloomFilter<kDGLCPU, IdxType>(
+        csr, num_cols, num_bits, num_hashes, transpose);
+  });
+  return filter;
+}
+
+std::pair<IdArray, IdArray> BloomFilterNegativeSampling(
+    HeteroGraphPtr hg, dgl_type_t etype, IdArray filter, int num_hashes,
+    int64_t num_samples, int num_trials, bool exclude_self_loops, bool replace,
+    double redundancy) {
+  CHECK_EQ(hg->Context().device_type, kDGLCPU)
+      << "Bloom filter negative sampling only supports CPU graphs";
+  CHECK_GT(num_samples, 0) << "Number of samples must be positive";
+  CHECK_GT(num_trials, 0) << "Number of sampling trials must be positive";
+  const auto endpoint_types = hg->GetEndpointTypes(etype);
+  const int64_t num_rows = hg->NumVertices(endpoint_types.first);
+  const int64_t num_cols = hg->NumVertices(endpoint_types.second);
+  // Draw the base seed from the caller's engine so that dgl.seed() makes the
+  // result reproducible.
+  const uint64_t seed =
+      RandomEngine::ThreadLocal()->RandInt<int64_t>(1LL << 62);
+  std::pair<IdArray, IdArray> result;
+  ATEN_ID_TYPE_SWITCH(hg->DataType(), IdxType, {
+    result = impl::BloomFilterNegativeSampling<kDGLCPU, IdxType>(
+        num_rows, num_cols, filter, num_hashes, num_samples, num_trials,
+        exclude_self_loops, replace, redundancy, seed);
+  });
+  return result;
+}
+
 DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLGlobalUniformNegativeSampling")
     .set_body([](DGLArgs args, DGLRetValue* rv) {
       HeteroGraphRef hg = args[0];
@@ -62,5 +107,36 @@ DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLGlobalUniformNegativeSampling")
       *rv = result;
     });
 
+DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLBuildEdgeBloomFilter")
+    .set_body([](DGLArgs args, DGLRetValue* rv) {
+      HeteroGraphRef hg = args[0];
+      dgl_type_t etype = args[1];
+      CHECK_LE(etype, hg->NumEdgeTypes()) << "invalid edge type " << etype;
+      int64_t num_bits = args[2];
+      int num_hashes = args[3];
+      *rv = BuildEdgeBloomFilter(hg.sptr(), etype, num_bits, num_hashes);
+    });
+
+DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLBloomFilterNegativeSampling")
+    .set_body([](DGLArgs args, DGLRetValue* rv) {
+      HeteroGraphRef hg = args[0];
+      dgl_type_t etype = args[1];
+      CHECK_LE(etype, hg->NumEdgeTypes()) << "invalid edge type " << etype;
+      IdArray filter = args[2];
+      int num_hashes = args[3];
+      int64_t num_samples = args[4];
+      int num_trials = args[5];
+      bool exclude_self_loops = args[6];
+      bool replace = args[7];
+      double redundancy = args[8];
+      List<Value> result;
+      std::pair<IdArray, IdArray> ret = BloomFilterNegativeSampling(
+          hg.sptr(), etype, filter, num_hashes, num_samples, num_trials,
+          exclude_self_loops, replace, redundancy);
+      result.push_back(Value(MakeValue(ret.first)));
+      result.push_back(Value(MakeValue(ret.second)));
+      *rv = result;
+    });
+
 };  // namespace sampling
 };  // namespace dgl
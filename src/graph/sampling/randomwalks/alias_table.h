@@ -0,0 +1,63 @@
+/**
+ *  Copyright (c) 2023 by Contributors
+ * @file graph/sampling/randomwalks/alias_table.h
+ * @brief DGL sampler - alias tables for weighted random walks on CPU.
+ */
+
+#ifndef DGL_GRAPH_SAMPLING_RANDOMWALKS_ALIAS_TABLE_H_
+#define DGL_GRAPH_SAMPLING_RANDOMWALKS_ALIAS_TABLE_H_
+
+#include <dgl/array.h>
+#include <dgl/random.h>
+
+#include <utility>
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+/**
+ * @brief Build the alias tables of the out-edges of every node.
+ *
+ * The tables are aligned with the indices of the CSR: for the \c j-th
+ * out-edge of node \c u at position \c indptr[u] + j, \c accept holds the
+ * probability to keep \c j and \c alias holds the out-edge index within \c u
+ * to pick otherwise.  A row whose weights are all zero is sampled uniformly.
+ *
+ * @param csr The CSR matrix of an edge type.
+ * @param prob The unnormalized transition probability of each edge, indexed
+ *        by edge ID.
+ * @return A float32 array of the acceptance probabilities and an ID array of
+ *         the aliases, both of shape (nnz,).
+ */
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<FloatArray, IdArray> BuildAliasTable(
+    const CSRMatrix &csr, const FloatArray &prob);
+
+/**
+ * @brief Draw an out-edge of a node with its alias table in O(1).
+ * @param accept The acceptance probabilities of the node's out-edges.
+ * @param alias The aliases of the node's out-edges.
+ * @param size The out-degree of the node, which must be positive.
+ * @return The index of the drawn out-edge within the node.
+ */
+template <typename IdxType>
+inline IdxType AliasDraw(
+    const float *accept, const IdxType *alias, int64_t size) {
+  RandomEngine *rng = RandomEngine::ThreadLocal();
+  const IdxType idx = rng->RandInt<IdxType>(static_cast<IdxType>(size));
+  return (rng->Uniform<float>() < accept[idx]) ? idx : alias[idx];
+}
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
+
+#endif  // DGL_GRAPH_SAMPLING_RANDOMWALKS_ALIAS_TABLE_H_
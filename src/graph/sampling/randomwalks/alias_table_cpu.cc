@@ -0,0 +1,99 @@
+/**
+ *  Copyright (c) 2023 by Contributors
+ * @file graph/sampling/randomwalks/alias_table_cpu.cc
+ * @brief DGL sampler - CPU implementation of alias table construction.
+ */
+
+#include <dgl/array.h>
+#include <dgl/runtime/parallel_for.h>
+
+#include <utility>
+#include <vector>
+
+#include "alias_table.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<FloatArray, IdArray> BuildAliasTable(
+    const CSRMatrix &csr, const FloatArray &prob) {
+  const int64_t nnz = csr.indices->shape[0];
+  FloatArray accept =
+      FloatArray::Empty({nnz}, DGLDataType{kDGLFloat, 32, 1}, csr.indptr->ctx);
+  IdArray alias = IdArray::Empty({nnz}, csr.indptr->dtype, csr.indptr->ctx);
+  const IdxType *indptr = csr.indptr.Ptr<IdxType>();
+  const IdxType *eids = CSRHasData(csr) ? csr.data.Ptr<IdxType>() : nullptr;
+  float *accept_data = accept.Ptr<float>();
+  IdxType *alias_data = alias.Ptr<IdxType>();
+
+  ATEN_FLOAT_TYPE_SWITCH(prob->dtype, DType, "probability", {
+    const DType *prob_data = prob.Ptr<DType>();
+    runtime::parallel_for(0, csr.num_rows, [&](size_t b, size_t e) {
+      // Vose's method.  The buffers are reused across the rows of a task.
+      std::vector<double> scaled;
+      std::vector<IdxType> small, large;
+      for (auto u = b; u < e; ++u) {
+        const IdxType off = indptr[u];
+        const int64_t size = indptr[u + 1] - off;
+        if (size == 0) continue;
+        scaled.resize(size);
+        double total = 0;
+        for (int64_t j = 0; j < size; ++j) {
+          const IdxType eid = eids ? eids[off + j] : (off + j);
+          scaled[j] = static_cast<double>(prob_data[eid]);
+          total += scaled[j];
+        }
+        small.clear();
+        large.clear();
+        for (int64_t j = 0; j < size; ++j) {
+          scaled[j] = (total > 0) ? scaled[j] * size / total : 1.;
+          if (scaled[j] < 1.)
+            small.push_back(j);
+          else
+            large.push_back(j);
+        }
+        while (!small.empty() && !large.empty()) {
+          const IdxType s = small.back(), l = large.back();
+          small.pop_back();
+          large.pop_back();
+          accept_data[off + s] = static_cast<float>(scaled[s]);
+          alias_data[off + s] = l;
+          scaled[l] -= 1. - scaled[s];
+          if (scaled[l] < 1.)
+            small.push_back(l);
+          else
+            large.push_back(l);
+        }
+        // The leftovers are 1 up to rounding errors.
+        for (const IdxType j : small) {
+          accept_data[off + j] = 1.f;
+          alias_data[off + j] = j;
+        }
+        for (const IdxType j : large) {
+          accept_data[off + j] = 1.f;
+          alias_data[off + j] = j;
+        }
+      }
+    });
+  });
+
+  return std::make_pair(accept, alias);
+}
+
+template std::pair<FloatArray, IdArray> BuildAliasTable<kDGLCPU, int32_t>(
+    const CSRMatrix &csr, const FloatArray &prob);
+template std::pair<FloatArray, IdArray> BuildAliasTable<kDGLCPU, int64_t>(
+    const CSRMatrix &csr, const FloatArray &prob);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
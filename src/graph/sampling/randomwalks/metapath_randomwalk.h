@@ -16,6 +16,7 @@
 #include <utility>
 #include <vector>
 
+#include "alias_table.h"
 #include "randomwalks_cpu.h"
 #include "randomwalks_impl.h"
 
@@ -150,6 +151,58 @@ std::tuple<dgl_id_t, dgl_id_t, bool> MetapathRandomWalkStepUniform(
   return std::make_tuple(succ[idx], eid, terminate(data, curr, len));
 }
 
+/**
+ * @brief Select one successor of metapath-based random walk, given the path
+ *     generated so far, with precomputed alias tables.
+ *
+ * @param data The path generated so far, of type \c IdxType.
+ * @param curr The last node ID generated.
+ * @param len The number of nodes generated so far.  Note that the seed node is
+ *     always included as \c data[0], and the successors start from \c data[1].
+ *
+ * @param edges_by_type Vector of results from \c GetAdj() by edge type.
+ * @param metapath_data Edge types of given metapath.
+ * @param alias_accept Acceptance probabilities of the alias tables per edge
+ *     type.  An empty array assumes uniform transition.
+ * @param alias Aliases of the alias tables per edge type.
+ * @param terminate Predicate for terminating the current random walk path.
+ *
+ * @return A tuple of ID of next successor (-1 if not exist), the last traversed
+ *     edge ID, as well as whether to terminate.
+ */
+template <DGLDeviceType XPU, typename IdxType>
+std::tuple<dgl_id_t, dgl_id_t, bool> MetapathRandomWalkStepAlias(
+    IdxType *data, dgl_id_t curr, int64_t len,
+    const std::vector<CSRMatrix> &edges_by_type,
+    const std::vector<bool> &csr_has_data, const IdxType *metapath_data,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, TerminatePredicate<IdxType> terminate) {
+  dgl_type_t etype = metapath_data[len];
+
+  const CSRMatrix &csr = edges_by_type[etype];
+  const IdxType *offsets = csr.indptr.Ptr<IdxType>();
+  const IdxType *all_succ = csr.indices.Ptr<IdxType>();
+  const IdxType *all_eids =
+      csr_has_data[etype] ? csr.data.Ptr<IdxType>() : nullptr;
+  const IdxType *succ = all_succ + offsets[curr];
+  const IdxType *eids = all_eids ? (all_eids + offsets[curr]) : nullptr;
+
+  const int64_t size = offsets[curr + 1] - offsets[curr];
+  if (size == 0) return std::make_tuple(-1, -1, true);
+
+  IdxType idx = 0;
+  if (IsNullArray(alias_accept[etype])) {
+    idx = RandomEngine::ThreadLocal()->RandInt(size);
+  } else {
+    idx = AliasDraw<IdxType>(
+        alias_accept[etype].Ptr<float>() + offsets[curr],
+        alias[etype].Ptr<IdxType>() + offsets[curr], size);
+  }
+  dgl_id_t eid = eids ? eids[idx] : (idx + offsets[curr]);
+
+  return std::make_tuple(succ[idx], eid, terminate(data, curr, len));
+}
+
 /**
  * @brief Metapath-based random walk.
  * @param hg The heterograph.
@@ -160,14 +213,18 @@ std::tuple<dgl_id_t, dgl_id_t, bool> MetapathRandomWalkStepUniform(
  *     probability of each edge by edge type.  An empty float array assumes
  *     uniform transition.
  * @param terminate Predicate for terminating a random walk path.
+ * @param alias_accept Acceptance probabilities of the alias tables per edge
+ *     type built by \c BuildAliasTable().  If given, \c prob is ignored.
+ * @param alias Aliases of the alias tables per edge type.
  * @return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs,
  *     and A 2D array of shape (len(seeds), len(metapath)) with edge IDs.
  */
 template <DGLDeviceType XPU, typename IdxType>
 std::pair<IdArray, IdArray> MetapathBasedRandomWalk(
     const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
-    const std::vector<FloatArray> &prob,
-    TerminatePredicate<IdxType> terminate) {
+    const std::vector<FloatArray> &prob, TerminatePredicate<IdxType> terminate,
+    const std::vector<FloatArray> &alias_accept = {},
+    const std::vector<IdArray> &alias = {}) {
   int64_t max_num_steps = metapath->shape[0];
   const IdxType *metapath_data = static_cast<IdxType *>(metapath->data);
   const int64_t begin_ntype =
@@ -188,6 +245,18 @@ std::pair<IdArray, IdArray> MetapathBasedRandomWalk(
     csr_has_data[etype] = CSRHasData(csr);
   }
 
+  if (!alias_accept.empty()) {
+    StepFunc<IdxType> step = [&edges_by_type, &csr_has_data, metapath_data,
+                              &alias_accept, &alias, terminate](
+                                 IdxType *data, dgl_id_t curr, int64_t len) {
+      return MetapathRandomWalkStepAlias<XPU, IdxType>(
+          data, curr, len, edges_by_type, csr_has_data, metapath_data,
+          alias_accept, alias, terminate);
+    };
+    return GenericRandomWalk<XPU, IdxType>(
+        seeds, max_num_steps, step, max_nodes);
+  }
+
   // Hoist the check for Uniform vs Non uniform edge distribution
   // to avoid putting it on the hot path
   bool isUniform = true;
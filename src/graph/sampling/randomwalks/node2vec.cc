@@ -31,13 +31,21 @@ void CheckNode2vecInputs(
 
 std::pair<IdArray, IdArray> Node2vec(
     const HeteroGraphPtr hg, const IdArray seeds, const double p,
-    const double q, const int64_t walk_length, const FloatArray &prob) {
+    const double q, const int64_t walk_length, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias) {
   CheckNode2vecInputs(hg, seeds, p, q, walk_length, prob);
+  if (!IsNullArray(alias_accept)) {
+    CHECK_EQ(alias_accept->shape[0], hg->NumEdges(0))
+        << "Expected one alias table entry per edge.";
+    CHECK_EQ(alias->shape[0], hg->NumEdges(0))
+        << "Expected one alias table entry per edge.";
+  }
 
   std::pair<IdArray, IdArray> result;
   ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "Node2vec", {
     ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
-      result = impl::Node2vec<XPU, IdxType>(hg, seeds, p, q, walk_length, prob);
+      result = impl::Node2vec<XPU, IdxType>(
+          hg, seeds, p, q, walk_length, prob, alias_accept, alias);
     });
   });
 
@@ -52,9 +60,11 @@ DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingNode2vec")
       double q = args[3];
       int64_t walk_length = args[4];
       FloatArray prob = args[5];
+      FloatArray alias_accept = args[6];
+      IdArray alias = args[7];
 
-      auto result =
-          sampling::Node2vec(hg.sptr(), seeds, p, q, walk_length, prob);
+      auto result = sampling::Node2vec(
+          hg.sptr(), seeds, p, q, walk_length, prob, alias_accept, alias);
 
       List<Value> ret;
       ret.push_back(Value(MakeValue(result.first)));
@@ -23,20 +23,23 @@ namespace impl {
 template <DGLDeviceType XPU, typename IdxType>
 std::pair<IdArray, IdArray> Node2vec(
     const HeteroGraphPtr hg, const IdArray seeds, const double p,
-    const double q, const int64_t walk_length, const FloatArray &prob) {
+    const double q, const int64_t walk_length, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias) {
   TerminatePredicate<IdxType> terminate = [](IdxType *data, dgl_id_t curr,
                                              int64_t len) { return false; };
 
   return Node2vecRandomWalk<XPU, IdxType>(
-      hg, seeds, p, q, walk_length, prob, terminate);
+      hg, seeds, p, q, walk_length, prob, alias_accept, alias, terminate);
 }
 
 template std::pair<IdArray, IdArray> Node2vec<kDGLCPU, int32_t>(
     const HeteroGraphPtr hg, const IdArray seeds, const double p,
-    const double q, const int64_t walk_length, const FloatArray &prob);
+    const double q, const int64_t walk_length, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias);
 template std::pair<IdArray, IdArray> Node2vec<kDGLCPU, int64_t>(
     const HeteroGraphPtr hg, const IdArray seeds, const double p,
-    const double q, const int64_t walk_length, const FloatArray &prob);
+    const double q, const int64_t walk_length, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias);
 
 };  // namespace impl
 
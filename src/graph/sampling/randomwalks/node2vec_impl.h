@@ -38,13 +38,17 @@ namespace impl {
  * @param prob A vector of 1D float arrays, indicating the transition
  *        probability of each edge by edge type.  An empty float array assumes
  * uniform transition.
+ * @param alias_accept Acceptance probabilities of the alias tables of \c prob
+ * built by \c BuildAliasTable(), or an empty array to sample from \c prob.
+ * @param alias Aliases of the alias tables of \c prob.
  * @return A 2D array of shape (len(seeds), len(walk_length)
  * + 1) with node IDs.  The paths that terminated early are padded with -1.
  */
 template <DGLDeviceType XPU, typename IdxType>
 std::pair<IdArray, IdArray> Node2vec(
     const HeteroGraphPtr hg, const IdArray seeds, const double p,
-    const double q, const int64_t walk_length, const FloatArray &prob);
+    const double q, const int64_t walk_length, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias);
 
 };  // namespace impl
 
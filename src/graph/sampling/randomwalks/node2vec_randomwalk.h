@@ -18,6 +18,7 @@
 #include <utility>
 #include <vector>
 
+#include "alias_table.h"
 #include "metapath_randomwalk.h"  // for TerminatePredicate
 #include "node2vec_impl.h"
 #include "randomwalks_cpu.h"
@@ -59,6 +60,10 @@ bool has_edge_between(const CSRMatrix &csr, dgl_id_t u, dgl_id_t v) {
  * always included as \c data[0], and the successors start from \c data[1].
  * @param csr The CSR matrix
  * @param prob Transition probability
+ * @param alias_accept Acceptance probabilities of the alias tables of \c prob.
+ *        If given, the first-order proposals are drawn in O(1) from the alias
+ *        tables instead of \c prob.
+ * @param alias Aliases of the alias tables of \c prob.
  * @param terminate Predicate for terminating the current random walk path.
  * @return A tuple of ID of next successor (-1 if not exist), the edge ID
  * traversed, as well as whether to terminate.
@@ -68,7 +73,8 @@ template <DGLDeviceType XPU, typename IdxType>
 std::tuple<dgl_id_t, dgl_id_t, bool> Node2vecRandomWalkStep(
     IdxType *data, dgl_id_t curr, dgl_id_t pre, const double p, const double q,
     int64_t len, const CSRMatrix &csr, bool csr_has_data,
-    const FloatArray &probs, TerminatePredicate<IdxType> terminate) {
+    const FloatArray &probs, const FloatArray &alias_accept,
+    const IdArray &alias, TerminatePredicate<IdxType> terminate) {
   const IdxType *offsets = csr.indptr.Ptr<IdxType>();
   const IdxType *all_succ = csr.indices.Ptr<IdxType>();
   const IdxType *all_eids = csr_has_data ? csr.data.Ptr<IdxType>() : nullptr;
@@ -92,9 +98,28 @@ std::tuple<dgl_id_t, dgl_id_t, bool> Node2vecRandomWalkStep(
   // rejection prob for visiting the node with the distance of 2 between the
   // previous node
   double prob2 = 1 / q / max_prob;
+  // Proposals with r below all three are accepted without the edge lookup.
+  double prob_min = std::min({prob0, prob1, prob2});
   dgl_id_t next_node;
   double r;  // rejection probability.
-  if (IsNullArray(probs)) {
+  if (!IsNullArray(alias_accept)) {
+    const float *accept_data = alias_accept.Ptr<float>() + offsets[curr];
+    const IdxType *alias_data = alias.Ptr<IdxType>() + offsets[curr];
+    while (true) {
+      idx = AliasDraw<IdxType>(accept_data, alias_data, size);
+      next_node = succ[idx];
+      if (len == 0) break;
+      r = RandomEngine::ThreadLocal()->Uniform(0., 1.);
+      if (r < prob_min) break;
+      if (next_node == pre) {
+        if (r < prob0) break;
+      } else if (has_edge_between<IdxType>(csr, next_node, pre)) {
+        if (r < prob1) break;
+      } else if (r < prob2) {
+        break;
+      }
+    }
+  } else if (IsNullArray(probs)) {
     if (len == 0) {
       idx = RandomEngine::ThreadLocal()->RandInt(size);
       next_node = succ[idx];
@@ -150,15 +175,18 @@ template <DGLDeviceType XPU, typename IdxType>
 std::pair<IdArray, IdArray> Node2vecRandomWalk(
     const HeteroGraphPtr g, const IdArray seeds, const double p, const double q,
     const int64_t max_num_steps, const FloatArray &prob,
+    const FloatArray &alias_accept, const IdArray &alias,
     TerminatePredicate<IdxType> terminate) {
   const CSRMatrix &edges = g->GetCSRMatrix(0);  // homogeneous graph.
   bool csr_has_data = CSRHasData(edges);
 
-  StepFunc<IdxType> step = [&edges, csr_has_data, &prob, p, q, terminate](
+  StepFunc<IdxType> step = [&edges, csr_has_data, &prob, &alias_accept, &alias,
+                            p, q, terminate](
                                IdxType *data, dgl_id_t curr, int64_t len) {
     dgl_id_t pre = (len != 0) ? data[len - 1] : curr;
     return Node2vecRandomWalkStep<XPU, IdxType>(
-        data, curr, pre, p, q, len, edges, csr_has_data, prob, terminate);
+        data, curr, pre, p, q, len, edges, csr_has_data, prob, alias_accept,
+        alias, terminate);
   };
 
   return GenericRandomWalk<XPU, IdxType>(
@@ -7,9 +7,13 @@
 
 #include <dgl/array.h>
 #include <dgl/base_heterograph.h>
+#include <dgl/random.h>
 #include <dgl/runtime/device_api.h>
+#include <dgl/runtime/parallel_for.h>
 
 #include <algorithm>
+#include <functional>
+#include <unordered_map>
 #include <utility>
 #include <vector>
 
@@ -101,6 +105,98 @@ std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
   return std::make_tuple(res_src, res_dst, res_cnt);
 }
 
+template <DGLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const int64_t num_random_walks, const int64_t num_traversals,
+    const double termination_prob, const int64_t k) {
+  const int64_t num_seeds = seeds->shape[0];
+  const int64_t num_hops = metapath->shape[0];
+  const IdxType *seed_data = seeds.Ptr<IdxType>();
+  const IdxType *metapath_data = metapath.Ptr<IdxType>();
+  const int64_t max_nodes =
+      hg->NumVertices(hg->meta_graph()->FindEdge(metapath_data[0]).first);
+
+  // Materialize the CSRs of the metapath before the parallel loop; otherwise
+  // data races will happen.
+  std::vector<CSRMatrix> csrs(num_hops);
+  std::vector<const IdxType *> indptr(num_hops), indices(num_hops);
+  for (int64_t h = 0; h < num_hops; ++h) {
+    csrs[h] = hg->GetCSRMatrix(metapath_data[h]);
+    indptr[h] = csrs[h].indptr.Ptr<IdxType>();
+    indices[h] = csrs[h].indices.Ptr<IdxType>();
+  }
+
+  // Each seed selects at most k neighbors, so the results are written to
+  // fixed slots first and compacted afterwards.
+  std::vector<IdxType> slot_src(num_seeds * k), slot_cnt(num_seeds * k);
+  std::vector<int64_t> num_selected(num_seeds + 1, 0);
+
+  runtime::parallel_for(0, num_seeds, [&](size_t seed_begin, size_t seed_end) {
+    RandomEngine *rng = RandomEngine::ThreadLocal();
+    // Visit counts of the current seed.  Only the nodes reached at the end of
+    // a traversal are counted, so the map stays much smaller than the traces.
+    std::unordered_map<IdxType, IdxType> visits;
+    std::vector<std::pair<IdxType, IdxType>> ranked;
+    for (auto i = seed_begin; i < seed_end; ++i) {
+      const IdxType seed = seed_data[i];
+      CHECK_LT(seed, max_nodes)
+          << "Seed node ID exceeds the maximum number of nodes.";
+      visits.clear();
+      for (int64_t w = 0; w < num_random_walks; ++w) {
+        IdxType curr = seed;
+        for (int64_t t = 0; t < num_traversals; ++t) {
+          if (t > 0 && rng->Uniform<double>() < termination_prob) break;
+          int64_t h = 0;
+          for (; h < num_hops; ++h) {
+            const IdxType *offsets = indptr[h];
+            const int64_t size = offsets[curr + 1] - offsets[curr];
+            if (size == 0) break;
+            curr = indices[h][offsets[curr] + rng->RandInt(size)];
+          }
+          if (h < num_hops) break;
+          ++visits[curr];
+        }
+      }
+
+      ranked.clear();
+      for (const auto &visit : visits)
+        ranked.emplace_back(visit.second, visit.first);
+      const int64_t len = std::min(static_cast<int64_t>(ranked.size()), k);
+      // Same order as SelectPinSageNeighbors: by count, then by node ID.
+      std::partial_sort(
+          ranked.begin(), ranked.begin() + len, ranked.end(),
+          std::greater<std::pair<IdxType, IdxType>>());
+      for (int64_t j = 0; j < len; ++j) {
+        slot_cnt[i * k + j] = ranked[j].first;
+        slot_src[i * k + j] = ranked[j].second;
+      }
+      num_selected[i + 1] = len;
+    }
+  });
+
+  for (int64_t i = 0; i < num_seeds; ++i)
+    num_selected[i + 1] += num_selected[i];
+  const int64_t num_edges = num_selected[num_seeds];
+  IdArray res_src = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray res_dst = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray res_cnt = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdxType *res_src_data = res_src.Ptr<IdxType>();
+  IdxType *res_dst_data = res_dst.Ptr<IdxType>();
+  IdxType *res_cnt_data = res_cnt.Ptr<IdxType>();
+  runtime::parallel_for(0, num_seeds, [&](size_t seed_begin, size_t seed_end) {
+    for (auto i = seed_begin; i < seed_end; ++i) {
+      const int64_t out = num_selected[i];
+      const int64_t len = num_selected[i + 1] - out;
+      std::copy_n(slot_src.begin() + i * k, len, res_src_data + out);
+      std::copy_n(slot_cnt.begin() + i * k, len, res_cnt_data + out);
+      std::fill_n(res_dst_data + out, len, seed_data[i]);
+    }
+  });
+
+  return std::make_tuple(res_src, res_dst, res_cnt);
+}
+
 template std::pair<IdArray, IdArray> RandomWalk<kDGLCPU, int32_t>(
     const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
     const std::vector<FloatArray> &prob);
@@ -117,6 +213,17 @@ SelectPinSageNeighbors<kDGLCPU, int64_t>(
     const IdArray src, const IdArray dst, const int64_t num_samples_per_node,
     const int64_t k);
 
+template std::tuple<IdArray, IdArray, IdArray>
+PinSageNeighbors<kDGLCPU, int32_t>(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const int64_t num_random_walks, const int64_t num_traversals,
+    const double termination_prob, const int64_t k);
+template std::tuple<IdArray, IdArray, IdArray>
+PinSageNeighbors<kDGLCPU, int64_t>(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const int64_t num_random_walks, const int64_t num_traversals,
+    const double termination_prob, const int64_t k);
+
 };  // namespace impl
 
 };  // namespace sampling
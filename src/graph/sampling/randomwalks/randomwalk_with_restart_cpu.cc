@@ -73,6 +73,43 @@ RandomWalkWithStepwiseRestart<kDGLCPU, int64_t>(
     const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
     const std::vector<FloatArray> &prob, FloatArray restart_prob);
 
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<IdArray, IdArray> RandomWalkWithAlias(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, FloatArray restart_prob) {
+  const std::vector<FloatArray> prob(alias_accept.size());
+  if (IsNullArray(restart_prob)) {
+    TerminatePredicate<IdxType> terminate = [](IdxType *data, dgl_id_t curr,
+                                               int64_t len) { return false; };
+    return MetapathBasedRandomWalk<XPU, IdxType>(
+        hg, seeds, metapath, prob, terminate, alias_accept, alias);
+  }
+
+  std::pair<IdArray, IdArray> result;
+  ATEN_FLOAT_TYPE_SWITCH(restart_prob->dtype, DType, "restart probability", {
+    DType *restart_prob_data = static_cast<DType *>(restart_prob->data);
+    TerminatePredicate<IdxType> terminate =
+        [restart_prob_data](IdxType *data, dgl_id_t curr, int64_t len) {
+          return RandomEngine::ThreadLocal()->Uniform<DType>() <
+                 restart_prob_data[len];
+        };
+    result = MetapathBasedRandomWalk<XPU, IdxType>(
+        hg, seeds, metapath, prob, terminate, alias_accept, alias);
+  });
+
+  return result;
+}
+
+template std::pair<IdArray, IdArray> RandomWalkWithAlias<kDGLCPU, int32_t>(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, FloatArray restart_prob);
+template std::pair<IdArray, IdArray> RandomWalkWithAlias<kDGLCPU, int64_t>(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, FloatArray restart_prob);
+
 };  // namespace impl
 
 };  // namespace sampling
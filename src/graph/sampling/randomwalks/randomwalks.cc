@@ -14,6 +14,7 @@
 #include <vector>
 
 #include "../../../c_api_common.h"
+#include "alias_table.h"
 #include "randomwalks_impl.h"
 
 using namespace dgl::runtime;
@@ -118,6 +119,49 @@ std::tuple<IdArray, IdArray, TypeArray> RandomWalkWithStepwiseRestart(
   return std::make_tuple(result.first, result.second, vtypes);
 }
 
+std::tuple<IdArray, IdArray, TypeArray> RandomWalkWithAlias(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, FloatArray restart_prob) {
+  CheckRandomWalkInputs(hg, seeds, metapath, alias_accept);
+  CHECK_EQ(alias_accept.size(), alias.size())
+      << "Expected one alias array per acceptance probability array.";
+
+  TypeArray vtypes;
+  std::pair<IdArray, IdArray> result;
+  ATEN_XPU_SWITCH(seeds->ctx.device_type, XPU, "RandomWalkWithAlias", {
+    ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
+      vtypes = impl::GetNodeTypesFromMetapath<XPU, IdxType>(hg, metapath);
+      result = impl::RandomWalkWithAlias<XPU, IdxType>(
+          hg, seeds, metapath, alias_accept, alias, restart_prob);
+    });
+  });
+
+  return std::make_tuple(result.first, result.second, vtypes);
+}
+
+std::pair<FloatArray, IdArray> BuildAliasTable(
+    const HeteroGraphPtr hg, dgl_type_t etype, const FloatArray prob) {
+  CHECK_FLOAT(prob, "probability");
+  CHECK_NDIM(prob, 1, "probability");
+  CHECK_EQ(prob->shape[0], hg->NumEdges(etype))
+      << "Expected one probability per edge.";
+  CHECK_EQ(hg->Context(), prob->ctx)
+      << "Expected prob (" << prob->ctx << ")"
+      << " to have the same "
+      << "context as graph (" << hg->Context() << ").";
+
+  std::pair<FloatArray, IdArray> result;
+  ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "BuildAliasTable", {
+    ATEN_ID_TYPE_SWITCH(hg->DataType(), IdxType, {
+      result =
+          impl::BuildAliasTable<XPU, IdxType>(hg->GetCSRMatrix(etype), prob);
+    });
+  });
+
+  return result;
+}
+
 std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
     const IdArray src, const IdArray dst, const int64_t num_samples_per_node,
     const int64_t k) {
@@ -137,6 +181,27 @@ std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
   return result;
 }
 
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const int64_t num_random_walks, const int64_t num_traversals,
+    const double termination_prob, const int64_t k) {
+  CheckRandomWalkInputs(hg, seeds, metapath, {});
+  CHECK(termination_prob >= 0 && termination_prob <= 1)
+      << "termination probability must belong to [0, 1]";
+  CHECK_GE(k, 0) << "the number of neighbors must be non-negative";
+  std::tuple<IdArray, IdArray, IdArray> result;
+
+  ATEN_XPU_SWITCH(seeds->ctx.device_type, XPU, "PinSageNeighbors", {
+    ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
+      result = impl::PinSageNeighbors<XPU, IdxType>(
+          hg, seeds, metapath, num_random_walks, num_traversals,
+          termination_prob, k);
+    });
+  });
+
+  return result;
+}
+
 };  // namespace sampling
 
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalk")
@@ -173,6 +238,27 @@ DGL_REGISTER_GLOBAL("sampling.pinsage._CAPI_DGLSamplingSelectPinSageNeighbors")
       *rv = ret;
     });
 
+DGL_REGISTER_GLOBAL("sampling.pinsage._CAPI_DGLSamplingPinSageNeighbors")
+    .set_body([](DGLArgs args, DGLRetValue *rv) {
+      HeteroGraphRef hg = args[0];
+      IdArray seeds = args[1];
+      TypeArray metapath = args[2];
+      int64_t num_random_walks = args[3];
+      int64_t num_traversals = args[4];
+      double termination_prob = args[5];
+      int64_t k = args[6];
+
+      auto result = sampling::PinSageNeighbors(
+          hg.sptr(), seeds, metapath, num_random_walks, num_traversals,
+          termination_prob, k);
+
+      List<Value> ret;
+      ret.push_back(Value(MakeValue(std::get<0>(result))));
+      ret.push_back(Value(MakeValue(std::get<1>(result))));
+      ret.push_back(Value(MakeValue(std::get<2>(result))));
+      *rv = ret;
+    });
+
 DGL_REGISTER_GLOBAL(
     "sampling.randomwalks._CAPI_DGLSamplingRandomWalkWithRestart")
     .set_body([](DGLArgs args, DGLRetValue *rv) {
@@ -213,6 +299,42 @@ DGL_REGISTER_GLOBAL(
       *rv = ret;
     });
 
+DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalkWithAlias")
+    .set_body([](DGLArgs args, DGLRetValue *rv) {
+      HeteroGraphRef hg = args[0];
+      IdArray seeds = args[1];
+      TypeArray metapath = args[2];
+      List<Value> alias_accept = args[3];
+      List<Value> alias = args[4];
+      FloatArray restart_prob = args[5];
+
+      const auto &alias_accept_vec =
+          ListValueToVector<FloatArray>(alias_accept);
+      const auto &alias_vec = ListValueToVector<IdArray>(alias);
+
+      auto result = sampling::RandomWalkWithAlias(
+          hg.sptr(), seeds, metapath, alias_accept_vec, alias_vec,
+          restart_prob);
+      List<Value> ret;
+      ret.push_back(Value(MakeValue(std::get<0>(result))));
+      ret.push_back(Value(MakeValue(std::get<1>(result))));
+      ret.push_back(Value(MakeValue(std::get<2>(result))));
+      *rv = ret;
+    });
+
+DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingBuildAliasTable")
+    .set_body([](DGLArgs args, DGLRetValue *rv) {
+      HeteroGraphRef hg = args[0];
+      dgl_type_t etype = args[1];
+      FloatArray prob = args[2];
+
+      auto result = sampling::BuildAliasTable(hg.sptr(), etype, prob);
+      List<Value> ret;
+      ret.push_back(Value(MakeValue(result.first)));
+      ret.push_back(Value(MakeValue(result.second)));
+      *rv = ret;
+    });
+
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingPackTraces")
     .set_body([](DGLArgs args, DGLRetValue *rv) {
       IdArray vids = args[0];
@@ -116,11 +116,60 @@ std::pair<IdArray, IdArray> RandomWalkWithStepwiseRestart(
     const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
     const std::vector<FloatArray> &prob, FloatArray restart_prob);
 
+/**
+ * @brief Metapath-based random walk with precomputed alias tables and optional
+ *        stepwise restart probability.
+ * @param hg The heterograph.
+ * @param seeds A 1D array of seed nodes, with the type the source type of the
+ * first edge type in the metapath.
+ * @param metapath A 1D array of edge types
+ * representing the metapath.
+ * @param alias_accept A vector of 1D float32 arrays by edge type, the
+ * acceptance probabilities of the alias tables built by \c BuildAliasTable().
+ * An empty float array assumes uniform transition.
+ * @param alias A vector of 1D arrays by edge type, the aliases of the alias
+ * tables.
+ * @param restart_prob Restart probability array which has the same number of
+ * elements as \c metapath, or an empty array for no restart.
+ * @return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.
+ * The paths that terminated early are padded with -1. A 2D array of shape
+ * (len(seeds), len(metapath)) with edge IDs.  The paths that terminated early
+ * are padded with -1.
+ */
+template <DGLDeviceType XPU, typename IdxType>
+std::pair<IdArray, IdArray> RandomWalkWithAlias(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const std::vector<FloatArray> &alias_accept,
+    const std::vector<IdArray> &alias, FloatArray restart_prob);
+
 template <DGLDeviceType XPU, typename IdxType>
 std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
     const IdArray src, const IdArray dst, const int64_t num_samples_per_node,
     const int64_t k);
 
+/**
+ * @brief Run multiple metapath-based random walks from each seed and select
+ *        the most commonly visited nodes as its neighbors, without
+ *        materializing the random walk traces.  Useful for PinSAGE-like
+ *        models.
+ * @param hg The heterograph.
+ * @param seeds A 1D array of seed nodes, with the type the source type of the
+ * first edge type in the metapath.
+ * @param metapath A 1D array of edge types of a single traversal, which must
+ * start and end at the same node type.
+ * @param num_random_walks The number of random walks from each seed.
+ * @param num_traversals The maximum number of traversals of a random walk.
+ * @param termination_prob The probability to terminate after each traversal.
+ * @param k The maximum number of neighbors to select for each seed.
+ * @return The neighbors, the seeds they are selected for, and the number of
+ * visits, ordered by seed and then by the number of visits descendingly.
+ */
+template <DGLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg, const IdArray seeds, const TypeArray metapath,
+    const int64_t num_random_walks, const int64_t num_traversals,
+    const double termination_prob, const int64_t k);
+
 };  // namespace impl
 
 };  // namespace sampling
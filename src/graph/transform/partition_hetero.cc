@@ -273,6 +273,20 @@ DGL_REGISTER_GLOBAL("partition._CAPI_DGLPartitionWithHalo_Hetero")
       *rv = ret_list;
     });
 
+DGL_REGISTER_GLOBAL("partition._CAPI_DGLGetSubgraphWithHalo_Hetero")
+    .set_body([](DGLArgs args, DGLRetValue *rv) {
+      HeteroGraphRef g = args[0];
+      auto hgptr = std::dynamic_pointer_cast<HeteroGraph>(g.sptr());
+      CHECK(hgptr) << "Invalid HeteroGraph object";
+      CHECK_EQ(hgptr->relation_graphs().size(), 1)
+          << "Metis partition only supports HomoGraph";
+      IdArray nodes = args[1];
+      int num_hops = args[2];
+      std::shared_ptr<HaloHeteroSubgraph> subg_ptr(
+          new HaloHeteroSubgraph(GetSubgraphWithHalo(hgptr, nodes, num_hops)));
+      *rv = HeteroSubgraphRef(subg_ptr);
+    });
+
 template <class IdType>
 struct EdgeProperty {
   IdType eid;
@@ -1,4 +1,5 @@
 #include <dgl/array.h>
+#include <dgl/runtime/parallel_for.h>
 #include <gtest/gtest.h>
 
 #include "./common.h"
@@ -1435,3 +1436,24 @@ TEST(ArrayTest, BFloatCast) {
     ASSERT_FLOAT_EQ(a, a_casted);
   }
 }
+
+TEST(ParallelForTest, NNZBalancedPartition) {
+  // A hub row (0) and a hub row (5) among short rows.
+  std::vector<int64_t> indptr({0, 100, 100, 101, 102, 103, 300, 301});
+  auto bounds = nnz_balanced_partition<int64_t>(0, 7, indptr.data(), 4);
+  ASSERT_EQ(bounds, std::vector<size_t>({0, 1, 6, 6, 7}));
+
+  std::vector<int> visited(7, 0);
+  parallel_for_nnz<int64_t>(0, 7, indptr.data(), [&](size_t b, size_t e) {
+    for (size_t i = b; i < e; ++i) ++visited[i];
+  });
+  ASSERT_EQ(visited, std::vector<int>(7, 1));
+}
+
+TEST(ParallelForTest, Dynamic) {
+  std::vector<int> visited(1000, 0);
+  parallel_for_dynamic(0, 1000, 7, [&](size_t b, size_t e) {
+    for (size_t i = b; i < e; ++i) ++visited[i];
+  });
+  ASSERT_EQ(visited, std::vector<int>(1000, 1));
+}
@@ -241,4 +241,55 @@ TEST(SpmmTest, TestSpmmDiv) {
   _TestSpmmDiv<double>();
   _TestSpmmDiv<BFloat16>();
 }
+
+template <typename IDX, typename DType>
+void _TestSpmmSumCsrTiled() {
+  IdArray indptr = NDArray::FromVector(std::vector<IDX>({0, 2, 3, 3, 5}));
+  IdArray indices = NDArray::FromVector(std::vector<IDX>({0, 1, 1, 2, 3}));
+  IdArray data = NDArray::FromVector(std::vector<IDX>({2, 3, 0, 1, 4}));
+  aten::CSRMatrix csr(4, 4, indptr, indices, data);
+  for (int dim : {1, 33, 257, 1030}) {
+    BcastOff bcast;
+    bcast.use_bcast = false;
+    bcast.lhs_len = bcast.rhs_len = bcast.out_len = dim;
+    bcast.reduce_size = 1;
+    std::vector<DType> lhs(4 * dim), rhs(5 * dim);
+    std::vector<DType> exp(4 * dim, 0), out(4 * dim, 0);
+    GenerateRandomData(lhs.data(), 4 * dim);
+    GenerateRandomData(rhs.data(), 5 * dim);
+
+    dgl::aten::cpu::SpMMSumCsrNaive<IDX, DType, ns_op::Mul<DType>>(
+        bcast, csr, lhs.data(), rhs.data(), exp.data());
+    dgl::aten::cpu::SpMMSumCsrTiled<IDX, DType, ns_op::Mul<DType>>(
+        bcast, csr, lhs.data(), rhs.data(), out.data(), 16);
+
+    CheckResult(exp.data(), out.data(), 4 * dim);
+  }
+}
+
+TEST(SpmmTest, TestSpmmSumCsrTiled) {
+  _TestSpmmSumCsrTiled<int32_t, float>();
+  _TestSpmmSumCsrTiled<int64_t, float>();
+  _TestSpmmSumCsrTiled<int64_t, double>();
+}
+
+TEST(SpmmTest, TestBF16Conversion) {
+  for (size_t i = 0; i < sizeof(sizes) / sizeof(int); i++) {
+    int dim = sizes[i];
+    float src[dim], dst[dim];
+    BFloat16 exp[dim], out[dim];
+    GenerateRandomData(src, dim);
+    for (int k = 0; k < dim; k++) {
+      src[k] = src[k] / 3.f - 7.f;
+      exp[k] = src[k];
+    }
+
+    dgl::aten::cpu::bf16::FromFloat(src, out, dim);
+    dgl::aten::cpu::bf16::ToFloat(out, dst, dim);
+    for (int k = 0; k < dim; k++) {
+      ASSERT_EQ(static_cast<float>(exp[k]), static_cast<float>(out[k]));
+      ASSERT_EQ(static_cast<float>(exp[k]), dst[k]);
+    }
+  }
+}
 #endif  // _WIN32
@@ -14,12 +14,16 @@ from dgl.distributed import (
     load_partition_book,
     load_partition_feats,
     partition_graph,
+    rebalance_trainer_ids,
+    update_partitions,
 )
+from dgl.data.utils import load_tensors
 from dgl.distributed.graph_partition_book import (
     _etype_tuple_to_str,
     DEFAULT_ETYPE,
     DEFAULT_NTYPE,
     EdgePartitionPolicy,
+    get_shared_mem_partition_book,
     HeteroDataName,
     NodePartitionPolicy,
     RangePartitionBook,
@@ -209,6 +213,7 @@ def check_hetero_partition(
     num_trainers_per_machine=1,
     load_feats=True,
     graph_formats=None,
+    num_workers=0,
 ):
     test_ntype = "n1"
     test_etype = ("n1", "r1", "n2")
@@ -232,6 +237,7 @@ def check_hetero_partition(
         return_mapping=True,
         num_trainers_per_machine=num_trainers_per_machine,
         graph_formats=graph_formats,
+        num_workers=num_workers,
     )
     assert len(orig_nids) == len(hg.ntypes)
     assert len(orig_eids) == len(hg.canonical_etypes)
@@ -334,6 +340,7 @@ def check_partition(
     num_trainers_per_machine=1,
     load_feats=True,
     graph_formats=None,
+    num_workers=0,
 ):
     g.ndata["labels"] = F.arange(0, g.num_nodes())
     g.ndata["feats"] = F.tensor(np.random.randn(g.num_nodes(), 10), F.float32)
@@ -352,6 +359,7 @@ def check_partition(
         return_mapping=True,
         num_trainers_per_machine=num_trainers_per_machine,
         graph_formats=graph_formats,
+        num_workers=num_workers,
     )
     part_sizes = []
     shuffled_labels = []
@@ -502,7 +510,7 @@ def check_partition(
     assert np.all(F.asnumpy(eid2pid) == edge_map)
 
 
-@pytest.mark.parametrize("part_method", ["metis", "random"])
+@pytest.mark.parametrize("part_method", ["metis", "multilevel", "random"])
 @pytest.mark.parametrize("num_parts", [1, 4])
 @pytest.mark.parametrize("num_trainers_per_machine", [1, 4])
 @pytest.mark.parametrize("load_feats", [True, False])
@@ -540,6 +548,335 @@ def test_partition(
     reset_envs()
 
 
+@pytest.mark.parametrize("part_method", ["metis", "random"])
+@pytest.mark.parametrize("num_trainers_per_machine", [1, 4])
+def test_partition_num_workers(part_method, num_trainers_per_machine):
+    os.environ["DGL_DIST_DEBUG"] = "1"
+    if part_method == "random":
+        num_trainers_per_machine = 1
+    g = create_random_graph(1000)
+    check_partition(
+        g,
+        part_method,
+        num_trainers_per_machine=num_trainers_per_machine,
+        graph_formats=["coo", "csc"],
+        num_workers=2,
+    )
+    hg = create_random_hetero()
+    check_hetero_partition(
+        hg,
+        part_method,
+        num_trainers_per_machine=num_trainers_per_machine,
+        graph_formats=["coo", "csc"],
+        num_workers=2,
+    )
+    reset_envs()
+
+
+@pytest.mark.parametrize("balance_machines", [False, True])
+def test_rebalance_trainer_ids(balance_machines):
+    num_parts = 2
+    num_trainers_per_machine = 2
+    g = create_random_graph(1000)
+    train_mask = th.zeros(g.num_nodes(), dtype=th.bool)
+    train_mask[th.randperm(g.num_nodes())[:300]] = True
+    g.ndata["train_mask"] = train_mask
+    with tempfile.TemporaryDirectory() as test_dir:
+        partition_graph(
+            g,
+            "test",
+            num_parts,
+            test_dir,
+            num_trainers_per_machine=num_trainers_per_machine,
+        )
+        part_config = os.path.join(test_dir, "test.json")
+        loads = rebalance_trainer_ids(
+            part_config,
+            num_trainers_per_machine,
+            balance_machines=balance_machines,
+        )
+        # The default cost of a seed is its in-degree plus one.
+        expect_cost = (g.in_degrees()[train_mask] + 1).sum().item()
+        assert len(loads) == num_parts * num_trainers_per_machine
+        assert np.isclose(F.asnumpy(loads).sum(), expect_cost)
+
+        with open(part_config) as f:
+            part_meta = json.load(f)
+        trainer_ids, seeds = [], []
+        splits = {}
+        for part_id in range(num_parts):
+            node_feats, edge_feats = load_partition_feats(part_config, part_id)
+            trainer_ids.append(node_feats["_N/trainer_id"])
+            seeds.append(node_feats["_N/train_mask"])
+            split_file = part_meta[f"part-{part_id}"]["trainer_splits"]
+            part_splits = load_tensors(os.path.join(test_dir, split_file))
+            counts = []
+            for i in range(num_trainers_per_machine):
+                trainer_id = part_id * num_trainers_per_machine + i
+                splits[trainer_id] = part_splits[f"_N/{i}"]
+                counts.append(len(splits[trainer_id]))
+            assert max(counts) - min(counts) <= 1
+            # Edges follow the trainers of their destination nodes.
+            part_g, _, _, gpb, _, _, _ = load_partition(
+                part_config, part_id, load_feats=False
+            )
+            inner_eids = part_g.edata["inner_edge"] == 1
+            eids = gpb.eid2localeid(part_g.edata[dgl.EID][inner_eids], part_id)
+            dst = part_g.ndata[dgl.NID][part_g.edges()[1][inner_eids]]
+            dst = gpb.nid2localnid(dst, part_id)
+            edge_trainer_id = edge_feats[
+                _etype_tuple_to_str(DEFAULT_ETYPE) + "/trainer_id"
+            ]
+            assert th.equal(
+                edge_trainer_id[eids], node_feats["_N/trainer_id"][dst]
+            )
+        trainer_ids = th.cat(trainer_ids)
+        seeds = th.nonzero(th.cat(seeds)).squeeze(1)
+        split_seeds = th.cat(list(splits.values()))
+        assert th.equal(th.sort(split_seeds)[0], seeds)
+        for trainer_id, nids in splits.items():
+            if not balance_machines:
+                part_id = trainer_id // num_trainers_per_machine
+                assert th.all(
+                    trainer_ids[nids] // num_trainers_per_machine == part_id
+                )
+            assert th.all(trainer_ids[nids] == trainer_id)
+
+
+@pytest.mark.parametrize("part_method", ["metis", "random"])
+def test_update_partitions(part_method):
+    num_parts = 2
+    g = create_random_graph(1000)
+    g.ndata["label"] = th.arange(g.num_nodes())
+    g.edata["label"] = th.arange(g.num_edges())
+    with tempfile.TemporaryDirectory() as test_dir:
+        orig_nids, _ = partition_graph(
+            g,
+            "test",
+            num_parts,
+            test_dir,
+            part_method=part_method,
+            return_mapping=True,
+        )
+        part_config = os.path.join(test_dir, "test.json")
+        # 50 new nodes: 100 edges to and from the existing nodes and 20
+        # edges among the new nodes.
+        num_new_nodes = 50
+        src = th.cat(
+            [
+                th.randint(1000, 1050, (50,)),
+                th.randint(0, 1000, (50,)),
+                th.randint(1000, 1050, (20,)),
+            ]
+        )
+        dst = th.cat(
+            [
+                th.randint(0, 1000, (50,)),
+                th.randint(1000, 1050, (50,)),
+                th.randint(1000, 1050, (20,)),
+            ]
+        )
+        new_nids, new_eids = update_partitions(
+            part_config,
+            (src, dst),
+            num_new_nodes=num_new_nodes,
+            new_node_feats={"label": th.arange(1000, 1050)},
+            new_edge_feats={"label": th.arange(10**6, 10**6 + len(src))},
+        )
+        assert len(new_nids) == num_new_nodes
+        assert len(new_eids) == len(src)
+
+        # Collect the inner edges and the features of all partitions in the
+        # order of the new IDs, and compare them by their labels.
+        node_labels, edges = [], []
+        gpb = None
+        for part_id in range(num_parts):
+            part_g, node_feats, edge_feats, gpb, _, _, _ = load_partition(
+                part_config, part_id
+            )
+            num_inner = int(part_g.ndata["inner_node"].sum())
+            nids = part_g.ndata[dgl.NID][:num_inner]
+            assert th.equal(nids, th.arange(nids[0], nids[0] + num_inner))
+            assert th.all(part_g.ndata["inner_node"][:num_inner] == 1)
+            assert len(node_feats["_N/label"]) == num_inner
+            node_labels.append(node_feats["_N/label"])
+            inner_eids = th.nonzero(part_g.edata["inner_edge"]).squeeze(1)
+            eids = part_g.edata[dgl.EID][inner_eids]
+            assert th.equal(eids, th.arange(eids[0], eids[0] + len(eids)))
+            u, v = part_g.find_edges(inner_eids)
+            edges.append(
+                th.stack(
+                    [
+                        part_g.ndata[dgl.NID][u],
+                        part_g.ndata[dgl.NID][v],
+                        edge_feats["_N:_E:_N/label"],
+                    ],
+                    1,
+                )
+            )
+        node_labels = th.cat(node_labels)
+        edges = th.cat(edges)
+        assert len(node_labels) == g.num_nodes() + num_new_nodes
+        assert len(edges) == g.num_edges() + len(src)
+        assert th.equal(
+            node_labels[new_nids], th.arange(1000, 1000 + num_new_nodes)
+        )
+        assert gpb._num_nodes() == g.num_nodes() + num_new_nodes
+        assert gpb._num_edges() == g.num_edges() + len(src)
+
+        # The labels of the endpoints of every edge match the input graph.
+        orig_src, orig_dst = g.edges()
+        labels = th.cat([orig_nids, th.arange(1000, 1000 + num_new_nodes)])
+        is_old = edges[:, 2] < 10**6
+        old_eids = edges[is_old, 2]
+        assert th.equal(node_labels[edges[is_old, 0]], orig_src[old_eids])
+        assert th.equal(node_labels[edges[is_old, 1]], orig_dst[old_eids])
+        new_idx = edges[~is_old, 2] - 10**6
+        assert th.equal(node_labels[edges[~is_old, 0]], labels[src[new_idx]])
+        assert th.equal(node_labels[edges[~is_old, 1]], labels[dst[new_idx]])
+
+
+@pytest.mark.parametrize("part_method", ["metis", "random"])
+def test_update_partitions_hetero(part_method):
+    num_parts = 2
+    num_trainers_per_machine = 2
+    g = create_random_hetero()
+    for ntype in g.ntypes:
+        g.nodes[ntype].data["label"] = th.arange(g.num_nodes(ntype))
+    for c_etype in g.canonical_etypes:
+        g.edges[c_etype].data["label"] = th.arange(g.num_edges(c_etype))
+    with tempfile.TemporaryDirectory() as test_dir:
+        orig_nids, _ = partition_graph(
+            g,
+            "test",
+            num_parts,
+            test_dir,
+            part_method=part_method,
+            num_trainers_per_machine=num_trainers_per_machine,
+            return_mapping=True,
+        )
+        part_config = os.path.join(test_dir, "test.json")
+        # 20 new n1 nodes and 10 new n3 nodes, connected to new and existing
+        # nodes. The trainer IDs of the new nodes and edges are not given.
+        num_new_nodes = {"n1": 20, "n3": 10}
+        new_edges = {
+            ("n1", "r1", "n2"): (
+                th.randint(1000, 1020, (30,)),
+                th.randint(0, 1010, (30,)),
+            ),
+            ("n1", "r2", "n3"): (
+                th.randint(0, 1020, (30,)),
+                th.randint(1000, 1030, (30,)),
+            ),
+        }
+        new_node_feats = {
+            ntype: {
+                "label": th.arange(g.num_nodes(ntype), g.num_nodes(ntype) + num)
+            }
+            for ntype, num in num_new_nodes.items()
+        }
+        new_edge_feats = {
+            c_etype: {"label": th.arange(10**6, 10**6 + len(src))}
+            for c_etype, (src, _) in new_edges.items()
+        }
+        new_nids, new_eids = update_partitions(
+            part_config,
+            new_edges,
+            num_new_nodes=num_new_nodes,
+            new_node_feats=new_node_feats,
+            new_edge_feats=new_edge_feats,
+        )
+        for ntype in g.ntypes:
+            assert len(new_nids[ntype]) == num_new_nodes.get(ntype, 0)
+        for c_etype in g.canonical_etypes:
+            num = len(new_edges[c_etype][0]) if c_etype in new_edges else 0
+            assert len(new_eids[c_etype]) == num
+
+        # The features of each type in all partitions in the order of the new
+        # type-wise IDs, and the inner edges with their endpoints.
+        node_feats = {ntype: {} for ntype in g.ntypes}
+        edges = {c_etype: [] for c_etype in g.canonical_etypes}
+        edge_trainer_ids = {c_etype: [] for c_etype in g.canonical_etypes}
+        for part_id in range(num_parts):
+            part_g, part_nfeats, part_efeats, gpb, _, _, _ = load_partition(
+                part_config, part_id
+            )
+            for ntype in g.ntypes:
+                num_inner = int(
+                    _get_inner_node_mask(part_g, g.get_ntype_id(ntype)).sum()
+                )
+                trainer_ids = part_nfeats[ntype + "/trainer_id"]
+                assert len(trainer_ids) == num_inner
+                assert th.all(
+                    trainer_ids // num_trainers_per_machine == part_id
+                )
+                for name in ["label", "trainer_id"]:
+                    node_feats[ntype].setdefault(name, []).append(
+                        part_nfeats[ntype + "/" + name]
+                    )
+            for c_etype in g.canonical_etypes:
+                mask = _get_inner_edge_mask(part_g, g.get_etype_id(c_etype))
+                inner_eids = th.nonzero(mask).squeeze(1)
+                order = th.argsort(part_g.edata[dgl.EID][inner_eids])
+                u, v = part_g.find_edges(inner_eids[order])
+                _, src = gpb.map_to_per_ntype(part_g.ndata[dgl.NID][u])
+                _, dst = gpb.map_to_per_ntype(part_g.ndata[dgl.NID][v])
+                prefix = _etype_tuple_to_str(c_etype) + "/"
+                edges[c_etype].append(
+                    th.stack([src, dst, part_efeats[prefix + "label"]], 1)
+                )
+                edge_trainer_ids[c_etype].append(
+                    part_efeats[prefix + "trainer_id"]
+                )
+        for ntype in g.ntypes:
+            for name, feats in node_feats[ntype].items():
+                node_feats[ntype][name] = th.cat(feats)
+            num = g.num_nodes(ntype) + num_new_nodes.get(ntype, 0)
+            assert len(node_feats[ntype]["label"]) == num
+            if ntype in num_new_nodes:
+                assert th.equal(
+                    node_feats[ntype]["label"][new_nids[ntype]],
+                    new_node_feats[ntype]["label"],
+                )
+
+        # The labels of the endpoints of every edge match the input, and the
+        # edges belong to the trainers of their destination nodes.
+        for c_etype in g.canonical_etypes:
+            src_type, _, dst_type = c_etype
+            part_edges = th.cat(edges[c_etype])
+            src_labels = node_feats[src_type]["label"][part_edges[:, 0]]
+            dst_labels = node_feats[dst_type]["label"][part_edges[:, 1]]
+            assert th.equal(
+                th.cat(edge_trainer_ids[c_etype]),
+                node_feats[dst_type]["trainer_id"][part_edges[:, 1]],
+            )
+            orig_src, orig_dst = g.edges(etype=c_etype)
+            is_old = part_edges[:, 2] < 10**6
+            old_eids = part_edges[is_old, 2]
+            assert th.equal(src_labels[is_old], orig_src[old_eids])
+            assert th.equal(dst_labels[is_old], orig_dst[old_eids])
+            if c_etype not in new_edges:
+                assert th.all(is_old)
+                continue
+            src, dst = new_edges[c_etype]
+            assert th.sum(~is_old) == len(src)
+            labels = {
+                ntype: th.cat(
+                    [
+                        orig_nids[ntype],
+                        th.arange(
+                            g.num_nodes(ntype),
+                            g.num_nodes(ntype) + num_new_nodes.get(ntype, 0),
+                        ),
+                    ]
+                )
+                for ntype in (src_type, dst_type)
+            }
+            new_idx = part_edges[~is_old, 2] - 10**6
+            assert th.equal(src_labels[~is_old], labels[src_type][src[new_idx]])
+            assert th.equal(dst_labels[~is_old], labels[dst_type][dst[new_idx]])
+
+
 def test_RangePartitionBook():
     part_id = 1
     num_parts = 2
@@ -626,6 +963,9 @@ def test_RangePartitionBook():
     global_ids = local_ids + 1000
     assert th.equal(node_policy.to_local(global_ids), local_ids)
     assert th.all(node_policy.to_partid(global_ids) == part_id)
+    partid, local_nids = node_policy.to_partid_and_local(global_ids)
+    assert th.all(partid == part_id)
+    assert th.equal(local_nids, local_ids)
     assert node_policy.get_part_size() == 1000
     assert node_policy.get_size() == 2000
 
@@ -640,6 +980,9 @@ def test_RangePartitionBook():
     global_ids = local_ids + 5000
     assert th.equal(edge_policy.to_local(global_ids), local_ids)
     assert th.all(edge_policy.to_partid(global_ids) == part_id)
+    partid, local_eids = edge_policy.to_partid_and_local(global_ids)
+    assert th.all(partid == part_id)
+    assert th.equal(local_eids, local_ids)
     assert edge_policy.get_part_size() == 5000
     assert edge_policy.get_size() == 10000
 
@@ -653,6 +996,90 @@ def test_RangePartitionBook():
     assert data_name.get_type() == c_etype
 
 
+def _create_hetero_range_maps():
+    # 3 partitions of 2 node types and 2 edge types, whose homogeneous IDs
+    # are laid out per partition and per type, with uneven sizes.
+    num_nodes = {"n1": [3, 5, 2], "n2": [4, 1, 6]}
+    c_etypes = [("n1", "e1", "n2"), ("n2", "e2", "n1")]
+    num_edges = {c_etypes[0]: [7, 2, 9], c_etypes[1]: [3, 8, 4]}
+
+    def _ranges(sizes):
+        maps = {key: [] for key in sizes}
+        start = 0
+        for partid in range(3):
+            for key, size in sizes.items():
+                maps[key].append([start, start + size[partid]])
+                start += size[partid]
+        return {key: F.tensor(ranges) for key, ranges in maps.items()}
+
+    ntypes = {ntype: i for i, ntype in enumerate(num_nodes)}
+    etypes = {c_etype: i for i, c_etype in enumerate(c_etypes)}
+    return _ranges(num_nodes), _ranges(num_edges), ntypes, etypes
+
+
+def test_RangePartitionBook_partid_and_local():
+    node_map, edge_map, ntypes, etypes = _create_hetero_range_maps()
+    for part_id in range(3):
+        gpb = RangePartitionBook(part_id, 3, node_map, edge_map, ntypes, etypes)
+        for ntype in [DEFAULT_NTYPE] + list(ntypes):
+            nids = th.arange(gpb._num_nodes(ntype))
+            partids, local_nids = gpb.nid2partid_and_local(nids, ntype)
+            assert th.equal(partids, gpb.nid2partid(nids, ntype))
+            inner = partids == part_id
+            assert th.equal(
+                local_nids[inner],
+                gpb.nid2localnid(nids[inner], part_id, ntype),
+            )
+        for etype in [DEFAULT_ETYPE] + list(etypes):
+            eids = th.arange(gpb._num_edges(etype))
+            partids, local_eids = gpb.eid2partid_and_local(eids, etype)
+            assert th.equal(partids, gpb.eid2partid(eids, etype))
+            inner = partids == part_id
+            assert th.equal(
+                local_eids[inner],
+                gpb.eid2localeid(eids[inner], part_id, etype),
+            )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Do not support windows yet")
+def test_RangePartitionBook_shared_memory():
+    node_map, edge_map, ntypes, etypes = _create_hetero_range_maps()
+    gpb = RangePartitionBook(1, 3, node_map, edge_map, ntypes, etypes)
+    gpb.shared_memory("test_gpb_shared_memory")
+    shared_gpb = get_shared_mem_partition_book("test_gpb_shared_memory")
+    assert shared_gpb.partid == gpb.partid
+    assert shared_gpb.num_partitions() == gpb.num_partitions()
+    assert shared_gpb.ntypes == gpb.ntypes
+    assert shared_gpb.canonical_etypes == gpb.canonical_etypes
+    assert np.array_equal(shared_gpb._flat_nid_range, gpb._flat_nid_range)
+    assert np.array_equal(shared_gpb._flat_eid_range, gpb._flat_eid_range)
+
+    nids = th.arange(gpb._num_nodes())
+    for ids, ref in zip(
+        shared_gpb.map_to_per_ntype(nids), gpb.map_to_per_ntype(nids)
+    ):
+        assert th.equal(ids, ref)
+    eids = th.arange(gpb._num_edges())
+    for ids, ref in zip(
+        shared_gpb.map_to_per_etype(eids), gpb.map_to_per_etype(eids)
+    ):
+        assert th.equal(ids, ref)
+    for ntype in [DEFAULT_NTYPE] + list(ntypes):
+        nids = th.arange(gpb._num_nodes(ntype))
+        for ids, ref in zip(
+            shared_gpb.nid2partid_and_local(nids, ntype),
+            gpb.nid2partid_and_local(nids, ntype),
+        ):
+            assert th.equal(ids, ref)
+    for etype in [DEFAULT_ETYPE] + list(etypes):
+        eids = th.arange(gpb._num_edges(etype))
+        for ids, ref in zip(
+            shared_gpb.eid2partid_and_local(eids, etype),
+            gpb.eid2partid_and_local(eids, etype),
+        ):
+            assert th.equal(ids, ref)
+
+
 def test_UnknownPartitionBook():
     node_map = {"_N": {0: 0, 1: 1, 2: 2}}
     edge_map = {"_N:_E:_N": {0: 0, 1: 1, 2: 2}}
@@ -739,6 +1166,60 @@ def test_convert_dgl_partition_to_csc_sampling_graph_hetero(
             assert th.equal(orig_g.edata[dgl.ETYPE], new_g.type_per_edge)
 
 
+@pytest.mark.parametrize("part_method", ["metis", "random"])
+@pytest.mark.parametrize("num_parts", [1, 4])
+@pytest.mark.parametrize("is_homo", [True, False])
+def test_partition_graph_use_graphbolt(part_method, num_parts, is_homo):
+    with tempfile.TemporaryDirectory() as test_dir:
+        g = create_random_graph(1000) if is_homo else create_random_hetero()
+        graph_name = "test"
+        partition_graph(
+            g,
+            graph_name,
+            num_parts,
+            test_dir,
+            part_method=part_method,
+            use_graphbolt=True,
+        )
+        for part_id in range(num_parts):
+            orig_g = dgl.load_graphs(
+                os.path.join(test_dir, f"part{part_id}/graph.dgl")
+            )[0][0]
+            new_g = dgl.graphbolt.load_csc_sampling_graph(
+                os.path.join(test_dir, f"part{part_id}/csc_sampling_graph.tar")
+            )
+            assert new_g.node_type_offset is None
+            for node_type, type_id in new_g.metadata.node_type_to_id.items():
+                assert g.get_ntype_id(node_type) == type_id
+            for edge_type, type_id in new_g.metadata.edge_type_to_id.items():
+                assert g.get_etype_id(edge_type) == type_id
+            # The in-edges of a node may be in a different order, so compare
+            # the sorted edges with their types.
+            orig_indptr, _, _ = orig_g.adj_tensors("csc")
+            assert th.equal(orig_indptr, new_g.csc_indptr)
+            src, dst = orig_g.edges()
+            if is_homo:
+                etype = th.zeros_like(src)
+            else:
+                etype = orig_g.edata[dgl.ETYPE]
+            new_dst = th.repeat_interleave(
+                th.arange(new_g.num_nodes), new_g.csc_indptr.diff()
+            )
+            orig_edges = np.stack(
+                [F.asnumpy(dst), F.asnumpy(src), F.asnumpy(etype)]
+            )
+            new_edges = np.stack(
+                [
+                    F.asnumpy(new_dst),
+                    F.asnumpy(new_g.indices),
+                    F.asnumpy(new_g.type_per_edge),
+                ]
+            )
+            orig_edges = orig_edges[:, np.lexsort(orig_edges[::-1])]
+            new_edges = new_edges[:, np.lexsort(new_edges[::-1])]
+            assert np.array_equal(orig_edges, new_edges)
+
+
 def test_not_sorted_node_edge_map():
     # Partition configure file which includes not sorted node/edge map.
     part_config_str = """
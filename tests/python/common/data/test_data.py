@@ -814,6 +814,36 @@ def _test_DefaultDataParser():
         except:
             expect_except = True
         assert expect_except
+    # strings of numeric scalars and of empty lists
+    dp = DefaultDataParser()
+    dt = dp(
+        pd.DataFrame(
+            {"scalar": ["1", "-2.5", "3e2"], "empty": ["[]", "[]", "[]"]}
+        )
+    )
+    assert dt["scalar"].shape == (3,)
+    assert np.array_equal(dt["scalar"], [1.0, -2.5, 300.0])
+    assert dt["empty"].shape == (3, 0)
+    # strings of nested lists keep their dimensions
+    dt = dp(pd.DataFrame({"nested": ["[[1, 2]]", "[[3, 4]]"]}))
+    assert dt["nested"].shape == (2, 1, 2)
+    assert np.array_equal(dt["nested"], [[[1, 2]], [[3, 4]]])
+    # list-valued cells, as read from parquet, are stacked
+    dt = dp(
+        pd.DataFrame(
+            {
+                "feat": [np.array([0.5, 1.0]), np.array([1.5, 2.0])],
+                "nested": [
+                    np.array([np.array([1, 2])], dtype=object),
+                    np.array([np.array([3, 4])], dtype=object),
+                ],
+            }
+        )
+    )
+    assert dt["feat"].dtype == np.float64
+    assert np.array_equal(dt["feat"], [[0.5, 1.0], [1.5, 2.0]])
+    assert dt["nested"].dtype == np.int64
+    assert np.array_equal(dt["nested"], [[[1, 2]], [[3, 4]]])
     # csv has index column which is ignored as it's unnamed
     with tempfile.TemporaryDirectory() as test_dir:
         csv_path = os.path.join(test_dir, "nodes.csv")
@@ -1424,6 +1454,66 @@ def _test_CSVDataset_multiple():
                     )
 
 
+def _test_CSVDataset_chunked():
+    with tempfile.TemporaryDirectory() as test_dir:
+        meta_yaml_path = os.path.join(test_dir, "meta.yaml")
+        nodes_csv_path = os.path.join(test_dir, "test_nodes.csv")
+        edges_csv_path = os.path.join(test_dir, "test_edges.csv")
+        meta_yaml_data = {
+            "dataset_name": "default_name",
+            "node_data": [{"file_name": os.path.basename(nodes_csv_path)}],
+            "edge_data": [{"file_name": os.path.basename(edges_csv_path)}],
+        }
+        with open(meta_yaml_path, "w") as f:
+            yaml.dump(meta_yaml_data, f, sort_keys=False)
+        num_nodes = 100
+        num_edges = 1000
+        node_ids = np.random.permutation(num_nodes) + 10
+        feat_ndata = np.random.rand(num_nodes, 3)
+        pd.DataFrame(
+            {
+                "node_id": node_ids,
+                "label": np.random.randint(2, size=num_nodes),
+                "feat": [line.tolist() for line in feat_ndata],
+            }
+        ).to_csv(nodes_csv_path, index=False)
+        pd.DataFrame(
+            {
+                "src_id": np.random.choice(node_ids, num_edges),
+                "dst_id": np.random.choice(node_ids, num_edges),
+                "label": np.random.randint(2, size=num_edges),
+                "weight": np.random.rand(num_edges),
+            }
+        ).to_csv(edges_csv_path, index=False)
+
+        g0 = data.CSVDataset(test_dir, force_reload=True)[0]
+        csv_dataset = data.CSVDataset(
+            test_dir,
+            force_reload=True,
+            ndata_columns=["feat"],
+            edata_columns=["weight"],
+            chunk_size=64,
+            num_workers=2,
+        )
+        g = csv_dataset[0]
+        assert set(g.ndata.keys()) == {"feat"}
+        assert set(g.edata.keys()) == {"weight"}
+        assert g.num_nodes() == g0.num_nodes()
+        for u, u0 in zip(g.edges(), g0.edges()):
+            assert F.array_equal(u, u0)
+        assert F.array_equal(g.ndata["feat"], g0.ndata["feat"])
+        assert F.array_equal(g.edata["weight"], g0.edata["weight"])
+
+        # The full and the projected datasets are cached separately.
+        g = data.CSVDataset(test_dir)[0]
+        assert set(g.ndata.keys()) == set(g0.ndata.keys())
+        assert set(g.edata.keys()) == set(g0.edata.keys())
+        g = data.CSVDataset(test_dir, ndata_columns=["label"])[0]
+        assert set(g.ndata.keys()) == {"label"}
+        assert set(g.edata.keys()) == set(g0.edata.keys())
+        assert F.array_equal(g.ndata["label"], g0.ndata["label"])
+
+
 def _test_CSVDataset_customized_data_parser():
     with tempfile.TemporaryDirectory() as test_dir:
         # generate YAML/CSVs
@@ -1682,6 +1772,7 @@ def test_csvdataset():
     _test_CSVDataset_single()
     _test_CSVDataset_multiple()
     _test_CSVDataset_customized_data_parser()
+    _test_CSVDataset_chunked()
 
 
 @unittest.skipIf(
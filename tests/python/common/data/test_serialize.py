@@ -445,3 +445,40 @@ def test_deserialize_old_graph():
     assert "csc" in g.formats()["not created"]
     assert num_nodes == g.num_nodes()
     assert num_edges == g.num_edges()
+
+
+@unittest.skipIf(F._default_context_str == "gpu", reason="GPU not implemented")
+def test_graph_file_view():
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+    g_list0 = construct_graph(10, True) + create_heterographs2(F.int32)
+    labels = {"label": F.arange(0, len(g_list0))}
+    dgl.save_graphs(path, g_list0, labels, version=3)
+
+    view = dgl.data.utils.GraphFileView(path)
+    assert len(view) == len(g_list0)
+    assert F.array_equal(view.labels["label"], labels["label"])
+    for i in [0, 9, 10, len(g_list0) - 1]:
+        g, g0 = view[i], g_list0[i]
+        assert g.idtype == g0.idtype
+        assert g.canonical_etypes == g0.canonical_etypes
+        for ntype in g0.ntypes:
+            assert g.num_nodes(ntype) == g0.num_nodes(ntype)
+            for k, v in g0.nodes[ntype].data.items():
+                assert F.array_equal(g.nodes[ntype].data[k], v)
+        for etype in g0.canonical_etypes:
+            src, dst = g.edges(etype=etype)
+            src0, dst0 = g0.edges(etype=etype)
+            assert F.array_equal(src, src0) and F.array_equal(dst, dst0)
+            for k, v in g0.edges[etype].data.items():
+                assert F.array_equal(g.edges[etype].data[k], v)
+
+    # load_graphs dispatches version 3 files to the memory-mapped loader.
+    g_list, label_dict = dgl.load_graphs(path, [3])
+    assert len(g_list) == 1
+    assert F.array_equal(g_list[0].ndata["n1"], g_list0[3].ndata["n1"])
+    assert F.array_equal(label_dict["label"], labels["label"])
+    assert F.array_equal(load_labels(path)["label"], labels["label"])
+    del view, g_list, label_dict
+    os.unlink(path)
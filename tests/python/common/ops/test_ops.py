@@ -7,7 +7,7 @@ import dgl
 import numpy as np
 import pytest
 import torch
-from dgl.ops import gather_mm, gsddmm, gspmm, segment_reduce
+from dgl.ops import gather_mm, gsddmm, gspmm, segment_reduce, segment_topk
 from utils import parametrize_idtype
 from utils.graph_cases import get_cases
 
@@ -324,6 +324,24 @@ def test_segment_reduce(reducer):
         print("backward passed")
 
 
+@pytest.mark.parametrize("descending", [True, False])
+def test_segment_topk(descending):
+    value = torch.randn(10, 4)
+    seglen = torch.tensor([2, 3, 0, 4, 1, 0])
+    k = 3
+    out, idx = segment_topk(seglen, value, k, sortby=1, descending=descending)
+    assert out.shape == (len(seglen), k, 4) and idx.shape == (len(seglen), k)
+    offset = 0
+    for i, n in enumerate(seglen.tolist()):
+        seg = value[offset : offset + n]
+        order = seg[:, 1].argsort(descending=descending)[:k]
+        m = len(order)
+        assert torch.equal(out[i, :m], seg[order])
+        assert torch.equal(idx[i, :m], order)
+        assert torch.all(out[i, m:] == 0)
+        offset += n
+
+
 @unittest.skipIf(
     dgl.backend.backend_name != "pytorch", reason="Only support PyTorch for now"
 )
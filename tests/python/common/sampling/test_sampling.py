@@ -284,6 +284,65 @@ def test_node2vec():
     check_random_walk(g2, ["follow"] * 4, traces, ntypes, "p", trace_eids=eids)
 
 
+@unittest.skipIf(
+    F._default_context_str == "gpu", reason="Alias tables are CPU only"
+)
+def test_alias_table_random_walk():
+    g4 = dgl.heterograph(
+        {
+            ("user", "follow", "user"): ([0, 1, 1, 2, 3], [1, 2, 3, 0, 0]),
+            ("user", "view", "item"): ([0, 0, 1, 2, 3, 3], [0, 1, 1, 2, 2, 1]),
+            ("item", "viewed-by", "user"): (
+                [0, 1, 1, 2, 2, 1],
+                [0, 0, 1, 2, 3, 3],
+            ),
+        }
+    )
+    g4.edges["follow"].data["p"] = F.tensor([3, 0, 3, 3, 3], dtype=F.float32)
+    g4.edges["viewed-by"].data["p"] = F.tensor(
+        [1, 1, 1, 1, 1, 1], dtype=F.float32
+    )
+    seeds = F.tensor([0, 1, 2, 3, 0, 1, 2, 3], dtype=g4.idtype)
+    metapath = ["follow", "view", "viewed-by"] * 2
+    for restart_prob in [None, 0.0, F.zeros((6,), F.float32, F.cpu())]:
+        traces, eids, ntypes = dgl.sampling.random_walk(
+            g4,
+            seeds,
+            metapath=metapath,
+            prob="p",
+            restart_prob=restart_prob,
+            return_eids=True,
+            use_alias_table=True,
+        )
+        check_random_walk(g4, metapath, traces, ntypes, "p", trace_eids=eids)
+
+    # The zero-probability edge 1 -> 2 is never taken after the feature is
+    # replaced, so the cached table must have been rebuilt.
+    g4.edges["follow"].data["p"] = F.tensor([3, 3, 0, 3, 3], dtype=F.float32)
+    traces, ntypes = dgl.sampling.random_walk(
+        g4, seeds, metapath=["follow"] * 4, prob="p", use_alias_table=True
+    )
+    check_random_walk(g4, ["follow"] * 4, traces, ntypes, "p")
+
+    g2 = dgl.graph(([0, 1, 1, 2, 3], [1, 2, 3, 0, 0]))
+    g2.edata["p"] = F.tensor([3, 0, 3, 3, 3], dtype=F.float32)
+    ntypes = F.zeros((5,), dtype=F.int64)
+    for p, q in [(1, 1), (0.5, 2), (4, 0.25)]:
+        traces, eids = dgl.sampling.node2vec_random_walk(
+            g2,
+            [0, 1, 2, 3, 0, 1, 2, 3],
+            p,
+            q,
+            4,
+            prob="p",
+            return_eids=True,
+            use_alias_table=True,
+        )
+        check_random_walk(
+            g2, g2.etypes * 4, traces, ntypes, "p", trace_eids=eids
+        )
+
+
 @unittest.skipIf(
     F._default_context_str == "gpu", reason="GPU pack traces not implemented"
 )
@@ -393,6 +452,33 @@ def test_pinsage_sampling(use_uva):
             g.unpin_memory_()
 
 
+@unittest.skipIf(
+    F._default_context_str == "gpu", reason="Fused PinSAGE sampling on CPU."
+)
+def test_pinsage_sampling_counts():
+    # Item 3 has no buyer, so its walks end before the first visit.
+    g = dgl.heterograph(
+        {
+            ("item", "bought-by", "user"): ([0, 1, 2, 2], [0, 0, 1, 1]),
+            ("user", "bought", "item"): ([0, 1], [1, 2]),
+        },
+        num_nodes_dict={"item": 4, "user": 2},
+    )
+    sampler = dgl.sampling.PinSAGESampler(g, "item", "user", 3, 0.0, 5, 2)
+    neighbor_g = sampler(F.tensor([0, 2, 3], dtype=g.idtype))
+    u, v = neighbor_g.all_edges(form="uv", order="eid")
+    assert F.array_equal(u, F.tensor([1, 2], dtype=g.idtype))
+    assert F.array_equal(v, F.tensor([0, 2], dtype=g.idtype))
+    assert F.array_equal(
+        neighbor_g.edata["weights"], F.tensor([15, 15], dtype=g.idtype)
+    )
+
+    # Every walk visits the deterministic neighbor at least once.
+    sampler = dgl.sampling.PinSAGESampler(g, "item", "user", 3, 0.5, 5, 2)
+    weights = sampler(F.tensor([0], dtype=g.idtype)).edata["weights"]
+    assert 5 <= F.asnumpy(weights).item() <= 15
+
+
 def _gen_neighbor_sampling_test_graph(hypersparse, reverse):
     if hypersparse:
         # should crash if allocated a CSR
@@ -1571,6 +1657,54 @@ def test_global_uniform_negative_sampling(dtype):
     assert not F.asnumpy(g.has_edges_between(src, dst, etype="AB")).any()
 
 
+@unittest.skipIf(
+    F._default_context_str == "gpu",
+    reason="Bloom filter negative sampling is only supported on CPU",
+)
+def test_global_uniform_negative_sampling_bloom_filter():
+    g = dgl.graph(
+        (np.random.randint(0, 20, (300,)), np.random.randint(0, 20, (300,)))
+    )
+    src, dst = dgl.sampling.global_uniform_negative_sampling(
+        g, 20, False, False, use_bloom_filter=True
+    )
+    assert len(src) > 0
+    assert not F.asnumpy(g.has_edges_between(src, dst)).any()
+    s = set(zip(F.asnumpy(src).tolist(), F.asnumpy(dst).tolist()))
+    assert len(s) == len(src)
+
+    # Reproducible given the seed.
+    dgl.seed(42)
+    src1, dst1 = dgl.sampling.global_uniform_negative_sampling(
+        g, 20, True, True, use_bloom_filter=True
+    )
+    assert not F.asnumpy(src1 == dst1).any()
+    dgl.seed(42)
+    src2, dst2 = dgl.sampling.global_uniform_negative_sampling(
+        g, 20, True, True, use_bloom_filter=True
+    )
+    assert F.array_equal(src1, src2)
+    assert F.array_equal(dst1, dst2)
+
+    g = dgl.heterograph(
+        {
+            ("A", "AB", "B"): (
+                np.random.randint(0, 20, (300,)),
+                np.random.randint(0, 40, (300,)),
+            ),
+            ("B", "BA", "A"): (
+                np.random.randint(0, 40, (200,)),
+                np.random.randint(0, 20, (200,)),
+            ),
+        }
+    )
+    for etype in ["AB", "BA"]:
+        src, dst = dgl.sampling.global_uniform_negative_sampling(
+            g, 20, False, etype=etype, use_bloom_filter=True
+        )
+        assert not F.asnumpy(g.has_edges_between(src, dst, etype=etype)).any()
+
+
 if __name__ == "__main__":
     from itertools import product
 
@@ -1585,6 +1719,7 @@ if __name__ == "__main__":
     test_uniform_random_walk(False)
     test_pack_traces()
     test_pinsage_sampling(False)
+    test_pinsage_sampling_counts()
     test_sample_neighbors_outedge()
     test_sample_neighbors_topk()
     test_sample_neighbors_topk_outedge()
@@ -1595,3 +1730,4 @@ if __name__ == "__main__":
     test_sample_neighbors_exclude_edges_homoG("int32")
     test_global_uniform_negative_sampling("int32")
     test_global_uniform_negative_sampling("int64")
+    test_global_uniform_negative_sampling_bloom_filter()
@@ -514,6 +514,59 @@ def test_slice_batch(idtype):
                     )
 
 
+@parametrize_idtype
+def test_batched_graph_view(idtype):
+    g1 = dgl.heterograph(
+        {
+            ("user", "follows", "user"): ([0, 1], [1, 2]),
+            ("user", "plays", "game"): ([], []),
+        },
+        idtype=idtype,
+        device=F.ctx(),
+    )
+    g2 = dgl.heterograph(
+        {
+            ("user", "follows", "user"): ([0], [3]),
+            ("user", "plays", "game"): ([0, 1], [0, 2]),
+        },
+        idtype=idtype,
+        device=F.ctx(),
+    )
+    g_list = [g1, g2, g1]
+    bg = dgl.batch(g_list)
+    bg.nodes["user"].data["h"] = F.randn((bg.num_nodes("user"), 2))
+    bg.edges["plays"].data["w"] = F.randn((bg.num_edges("plays"), 3))
+    view = dgl.BatchedGraphView(bg)
+    assert len(view) == 3
+    assert view.node_offsets("user") == [0, 3, 7, 10]
+    assert view.edge_offsets("plays") == [0, 0, 2, 2]
+
+    unbatched = dgl.unbatch(bg)
+    for g_i, g_view, g_unbatch in zip(g_list, view, unbatched):
+        check_graph_equal(g_view, g_unbatch)
+        assert g_view.idtype == g_i.idtype
+        for ety in g_i.canonical_etypes:
+            u, v = g_view.edges(etype=ety, order="eid")
+            u_i, v_i = g_i.edges(etype=ety, order="eid")
+            assert F.array_equal(u, u_i) and F.array_equal(v, v_i)
+    assert view[-1].num_nodes("game") == g1.num_nodes("game")
+    assert len(view[1:]) == 2
+
+    hs = view.split_nodes(bg.nodes["user"].data["h"], "user")
+    ws = view.split_edges(bg.edges["plays"].data["w"], "plays")
+    for i, g_unbatch in enumerate(unbatched):
+        assert F.array_equal(hs[i], g_unbatch.nodes["user"].data["h"])
+        assert F.array_equal(ws[i], g_unbatch.edges["plays"].data["w"])
+
+    # Edges crossing the given splits are rejected.
+    with pytest.raises(dgl.DGLError):
+        dgl.unbatch(
+            dgl.graph(([0], [3]), idtype=idtype, device=F.ctx()),
+            node_split=F.tensor([2, 2]),
+            edge_split=F.tensor([1, 0]),
+        )
+
+
 @parametrize_idtype
 def test_batch_keeps_empty_data(idtype):
     g1 = (
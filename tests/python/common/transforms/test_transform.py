@@ -16,6 +16,7 @@
 
 import math
 import os
+import time
 import unittest
 
 import backend as F
@@ -738,6 +739,81 @@ def test_metis_partition(idtype):
         assert assert_fail
 
 
+@unittest.skipIf(
+    F._default_context_str == "gpu", reason="Multilevel partition is CPU only"
+)
+@pytest.mark.parametrize("balance_edges", [False, True])
+def test_multilevel_partition_assignment(balance_edges):
+    g = create_large_graph(1000)
+    ntypes = np.zeros((g.num_nodes(),), dtype=np.int64)
+    ntypes[0 : int(g.num_nodes() / 4)] = 1
+    ntypes[int(g.num_nodes() * 3 / 4) :] = 2
+    for balance_ntypes in [None, ntypes]:
+        parts = dgl.multilevel_partition_assignment(
+            g, 4, balance_ntypes=balance_ntypes, balance_edges=balance_edges
+        )
+        parts = F.asnumpy(parts)
+        assert parts.shape == (g.num_nodes(),)
+        assert np.all((parts >= 0) & (parts < 4))
+        # Every partition gets a share of each node type.
+        for ntype in np.unique(ntypes):
+            counts = np.bincount(parts[ntypes == ntype], minlength=4)
+            assert np.all(counts > 0)
+        # No partition exceeds the default imbalance in any constraint.
+        if balance_ntypes is None:
+            vwgt = [np.ones((g.num_nodes(),))]
+        else:
+            vwgt = [balance_ntypes == ntype for ntype in np.unique(ntypes)]
+        if balance_edges:
+            degs = F.asnumpy(g.in_degrees())
+            vwgt += [degs * w for w in vwgt]
+        vwgt = np.stack(vwgt, 1).astype(np.float64)
+        loads = np.zeros((4, vwgt.shape[1]))
+        np.add.at(loads, parts, vwgt)
+        assert np.all(loads.max(0) <= 1.03 * vwgt.sum(0) / 4 + 1e-9)
+
+    # A graph of 4 disconnected cliques is split along the cliques.
+    src, dst = np.nonzero(np.ones((25, 25)))
+    offsets = np.repeat(np.arange(4) * 25, len(src))
+    g = dgl.graph((np.tile(src, 4) + offsets, np.tile(dst, 4) + offsets))
+    parts = F.asnumpy(dgl.multilevel_partition_assignment(g, 4))
+    src, dst = g.edges()
+    assert np.all(parts[F.asnumpy(src)] == parts[F.asnumpy(dst)])
+    assert np.all(np.bincount(parts, minlength=4) == 25)
+
+
+@unittest.skipIf(
+    F._default_context_str == "gpu", reason="Multilevel partition is CPU only"
+)
+@pytest.mark.parametrize("balance_ntypes", [False, True])
+def test_multilevel_partition_assignment_skewed_degrees(balance_ntypes):
+    # A power-law graph, whose hubs make the edge constraints hard to meet.
+    num_nodes, k = 5000, 8
+    rng = np.random.default_rng(0)
+    prob = np.arange(1, num_nodes + 1) ** (-2 / 3)
+    prob /= prob.sum()
+    src = rng.choice(num_nodes, 5 * num_nodes, p=prob)
+    dst = rng.choice(num_nodes, 5 * num_nodes, p=prob)
+    g = dgl.graph((src, dst), num_nodes=num_nodes)
+    ntypes = np.arange(num_nodes) % 3 if balance_ntypes else None
+    start = time.time()
+    parts = dgl.multilevel_partition_assignment(
+        g, k, balance_ntypes=ntypes, balance_edges=True
+    )
+    assert time.time() - start < 30
+    parts = F.asnumpy(parts)
+    if ntypes is None:
+        vwgt = [np.ones((num_nodes,))]
+    else:
+        vwgt = [ntypes == ntype for ntype in range(3)]
+    degs = F.asnumpy(g.in_degrees())
+    vwgt += [degs * w for w in vwgt]
+    vwgt = np.stack(vwgt, 1).astype(np.float64)
+    loads = np.zeros((k, vwgt.shape[1]))
+    np.add.at(loads, parts, vwgt)
+    assert np.all(loads.max(0) <= 1.03 * vwgt.sum(0) / k + 1e-9)
+
+
 def check_metis_partition_with_constraint(g):
     ntypes = np.zeros((g.num_nodes(),), dtype=np.int32)
     ntypes[0 : int(g.num_nodes() / 4)] = 1
@@ -2376,6 +2452,11 @@ def test_reorder_graph(idtype):
         raise_error = True
     assert raise_error
 
+    # call with 'degree' node_permute_algo
+    rg = dgl.reorder_graph(g, node_permute_algo="degree")
+    degs = F.asnumpy(rg.in_degrees())
+    assert np.array_equal(degs, np.sort(degs)[::-1])
+
     # TODO: shall we fix them?
     # add 'csc' format if needed
     # fg = g.formats('csr')
@@ -2384,6 +2465,43 @@ def test_reorder_graph(idtype):
     # assert 'csc' in sum(rfg.formats().values(), [])
 
 
+@parametrize_idtype
+def test_optimize_layout(idtype):
+    g = dgl.graph(
+        ([0, 1, 2, 3, 4], [2, 2, 3, 2, 3]), idtype=idtype, device=F.ctx()
+    )
+    g.ndata["h"] = F.copy_to(F.randn((g.num_nodes(), 3)), ctx=F.ctx())
+    g.edata["w"] = F.copy_to(F.randn((g.num_edges(), 2)), ctx=F.ctx())
+    train_nids = F.tensor([0, 3], dtype=idtype)
+    val_nids = F.tensor([4], dtype=idtype)
+
+    for algo in ["rcmk", "degree"]:
+        rg, new_ids = dgl.optimize_layout(
+            g, {"train": train_nids, "val": val_nids}, node_permute_algo=algo
+        )
+        dst = F.asnumpy(rg.edges()[1])
+        assert np.array_equal(dst, np.sort(dst))
+        assert F.array_equal(
+            F.gather_row(rg.ndata["h"], new_ids["train"]),
+            F.gather_row(g.ndata["h"], train_nids),
+        )
+        assert F.array_equal(
+            F.gather_row(rg.ndata["h"], new_ids["val"]),
+            F.gather_row(g.ndata["h"], val_nids),
+        )
+        assert F.array_equal(
+            dgl.restore_node_order(rg, rg.ndata["h"]), g.ndata["h"]
+        )
+
+    rg, new_ids = dgl.optimize_layout(g, train_nids, node_permute_algo="degree")
+    assert F.array_equal(
+        F.gather_row(rg.ndata["h"], new_ids),
+        F.gather_row(g.ndata["h"], train_nids),
+    )
+    rg, new_ids = dgl.optimize_layout(g)
+    assert new_ids is None
+
+
 @unittest.skipIf(
     dgl.backend.backend_name == "tensorflow",
     reason="TF doesn't support a slicing operation",
@@ -34,6 +34,76 @@ def test_graph_dataloader(batch_size):
             assert F.asnumpy(label).ndim == 0
 
 
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_packed_graph_dataloader(shuffle):
+    graphs = []
+    for i in range(10):
+        g = dgl.rand_graph(3 + i, 2 * i)
+        g.ndata["h"] = torch.randn(g.num_nodes(), 4)
+        g.edata["w"] = torch.randn(g.num_edges())
+        graphs.append(g)
+    labels = torch.arange(10)
+    dataset = dgl.dataloading.PackedGraphDataset.from_graphs(graphs, labels)
+    assert len(dataset) == 10
+
+    g, label = dataset[3]
+    assert g.batch_size == 1 and label.tolist() == [3]
+    assert torch.equal(g.ndata["h"], graphs[3].ndata["h"])
+
+    data_loader = dgl.dataloading.GraphDataLoader(
+        dataset, batch_size=4, shuffle=shuffle
+    )
+    seen = []
+    for bg, label in data_loader:
+        expected = dgl.batch([graphs[i] for i in label.tolist()])
+        assert torch.equal(bg.batch_num_nodes(), expected.batch_num_nodes())
+        assert torch.equal(bg.batch_num_edges(), expected.batch_num_edges())
+        src, dst = bg.edges()
+        exp_src, exp_dst = expected.edges()
+        assert torch.equal(src, exp_src) and torch.equal(dst, exp_dst)
+        assert torch.equal(bg.ndata["h"], expected.ndata["h"])
+        assert torch.equal(bg.edata["w"], expected.edata["w"])
+        seen.extend(label.tolist())
+    assert sorted(seen) == list(range(10))
+
+
+@pytest.mark.parametrize("dynamic_window", [True, False])
+def test_skip_gram_dataloader(dynamic_window):
+    # On a directed ring every walk is deterministic, so the distance of each
+    # pair on the ring is within the window.
+    num_nodes, walk_length, window_size = 20, 6, 2
+    g = dgl.graph(
+        (torch.arange(num_nodes), (torch.arange(num_nodes) + 1) % num_nodes)
+    )
+    dataloader = dgl.dataloading.SkipGramDataLoader(
+        g,
+        batch_size=16,
+        walk_length=walk_length,
+        window_size=window_size,
+        negative_size=3,
+        walks_per_node=2,
+        dynamic_window=dynamic_window,
+        num_workers=3,
+        walk_batch_size=7,
+    )
+    num_pairs = 0
+    for center, context, negatives in dataloader:
+        assert center.shape[0] <= 16
+        assert negatives.shape == (center.shape[0], 3)
+        dist = (context - center) % num_nodes
+        forward = (dist >= 1) & (dist <= window_size)
+        backward = dist >= num_nodes - window_size
+        assert (forward | backward).all()
+        assert ((negatives >= 0) & (negatives < num_nodes)).all()
+        num_pairs += center.shape[0]
+    full = 2 * sum(walk_length - d for d in range(1, window_size + 1))
+    if dynamic_window:
+        assert 0 < num_pairs <= full * num_nodes * 2
+    else:
+        assert num_pairs == full * num_nodes * 2
+        assert len(dataloader) == (num_pairs + 15) // 16
+
+
 @unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
 @pytest.mark.parametrize("num_workers", [0, 4])
 def test_cluster_gcn(num_workers):
@@ -573,6 +643,62 @@ def test_edge_dataloader(idtype, sampler_name, neg_sampler, mode, use_ddp):
         dist.destroy_process_group()
 
 
+@parametrize_idtype
+def test_edge_dataloader_shared_negatives(idtype):
+    g1 = dgl.graph(([0, 0, 0, 1, 1, 5], [1, 2, 3, 3, 4, 4])).astype(idtype)
+    g1 = g1.to(F.ctx())
+    neg_sampler = dgl.dataloading.negative_sampler.SharedNegatives(10)
+    src, dst = neg_sampler(g1, F.copy_to(F.tensor([0, 1], idtype), F.ctx()))
+    assert F.array_equal(
+        F.slice_axis(dst, 0, 0, 10), F.slice_axis(dst, 0, 10, 20)
+    )
+    assert set(F.asnumpy(src).tolist()) == {0}
+
+    sampler = dgl.dataloading.as_edge_prediction_sampler(
+        dgl.dataloading.MultiLayerFullNeighborSampler(2),
+        negative_sampler=neg_sampler,
+    )
+    dataloader = dgl.dataloading.DataLoader(
+        g1, g1.edges(form="eid"), sampler, device=F.ctx(), batch_size=3
+    )
+    in_deg = F.asnumpy(g1.in_degrees())
+    for input_nodes, pair_graph, neg_dst, blocks in dataloader:
+        assert F.shape(neg_dst) == (10,)
+        _check_device(neg_dst)
+        nodes = F.asnumpy(pair_graph.ndata[dgl.NID])
+        # Only the nodes with incoming edges can be negatives.
+        assert (in_deg[nodes[F.asnumpy(neg_dst)]] > 0).all()
+        assert F.array_equal(
+            blocks[-1].dstdata[dgl.NID], pair_graph.ndata[dgl.NID]
+        )
+
+    g2 = dgl.heterograph(
+        {
+            ("user", "follow", "user"): ([0, 0, 1, 2], [1, 2, 3, 0]),
+            ("user", "play", "game"): ([0, 1, 1, 3], [0, 1, 2, 0]),
+            ("user", "buy", "game"): ([2, 3], [1, 1]),
+        }
+    ).astype(idtype)
+    g2 = g2.to(F.ctx())
+    sampler = dgl.dataloading.as_edge_prediction_sampler(
+        dgl.dataloading.MultiLayerFullNeighborSampler(1),
+        negative_sampler=neg_sampler,
+    )
+    dataloader = dgl.dataloading.DataLoader(
+        g2,
+        {ety: g2.edges(form="eid", etype=ety) for ety in g2.canonical_etypes},
+        sampler,
+        device=F.ctx(),
+        batch_size=4,
+    )
+    for input_nodes, pair_graph, neg_dst, blocks in dataloader:
+        for etype, local in neg_dst.items():
+            assert F.shape(local) == (10,)
+            nodes = F.asnumpy(pair_graph.nodes[etype[2]].data[dgl.NID])
+            in_deg = F.asnumpy(g2.in_degrees(etype=etype))
+            assert (in_deg[nodes[F.asnumpy(local)]] > 0).all()
+
+
 def _create_homogeneous():
     s = torch.randint(0, 200, (1000,), device=F.ctx())
     d = torch.randint(0, 200, (1000,), device=F.ctx())
@@ -414,6 +414,36 @@ def test_set_trans():
     assert h2.shape[0] == 3 and h2.shape[1] == 200 and h2.dim() == 2
 
 
+def test_set_trans_segments():
+    ctx = F.ctx()
+    # The attention of a batch must not leak across graphs, so each graph of
+    # the batch gets the same result as on its own.
+    graphs = [dgl.rand_graph(n, 0).to(ctx) for n in [15, 1, 40, 3]]
+    bg = dgl.batch(graphs)
+    h0 = F.randn((bg.num_nodes(), 50))
+    st_enc = nn.SetTransformerEncoder(50, 5, 10, 100, 2, "isab", 3).to(ctx)
+    st_dec = nn.SetTransformerDecoder(50, 5, 10, 100, 2, 4).to(ctx)
+    st_enc.eval()
+    st_dec.eval()
+    h1 = st_enc(bg, h0)
+    h2 = st_dec(bg, h1)
+    offset = 0
+    for i, g in enumerate(graphs):
+        n = g.num_nodes()
+        h1_i = st_enc(g, h0[offset : offset + n])
+        assert F.allclose(h1[offset : offset + n], h1_i, atol=1e-5)
+        assert F.allclose(h2[i : i + 1], st_dec(g, h1_i), atol=1e-5)
+        offset += n
+
+    sort_pool = nn.SortPooling(4).to(ctx)
+    h3 = sort_pool(bg, h0)
+    offset = 0
+    for i, g in enumerate(graphs):
+        n = g.num_nodes()
+        assert F.allclose(h3[i : i + 1], sort_pool(g, h0[offset : offset + n]))
+        offset += n
+
+
 @parametrize_idtype
 @pytest.mark.parametrize("O", [1, 8, 32])
 def test_rgcn(idtype, O):
@@ -2386,6 +2416,14 @@ def test_DeepWalk():
     loss.backward()
     optim.step()
 
+    dataloader = dgl.dataloading.SkipGramDataLoader(
+        g, 4, walk_length=2, window_size=1, negative_size=5, num_workers=2
+    )
+    for center, context, negatives in dataloader:
+        loss = model.pair_loss(center, context, negatives)
+        loss.backward()
+        optim.step()
+
 
 @pytest.mark.parametrize("max_degree", [2, 6])
 @pytest.mark.parametrize("embedding_dim", [8, 16])
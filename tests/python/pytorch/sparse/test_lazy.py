@@ -0,0 +1,55 @@
+import backend as F
+import pytest
+import torch
+from dgl.sparse import from_coo, val_like
+
+
+def _create_matrix(ctx):
+    # Row 3 is empty.
+    row = torch.tensor([0, 0, 1, 2, 2, 2]).to(ctx)
+    col = torch.tensor([0, 3, 1, 0, 2, 3]).to(ctx)
+    val = torch.randn(len(row)).to(ctx)
+    return from_coo(row, col, val, shape=(4, 4))
+
+
+@pytest.mark.parametrize("X_shape", [(4,), (4, 3)])
+def test_lazy_softmax_spmm(X_shape):
+    ctx = F.ctx()
+    A = _create_matrix(ctx).materialize("csr", "csc")
+    B = val_like(A, torch.rand(A.nnz).to(ctx))
+    X = torch.randn(X_shape).to(ctx)
+
+    assert torch.allclose(A.lazy() @ X, A @ X, atol=1e-5)
+    assert torch.allclose(A.lazy().softmax() @ X, A.softmax() @ X, atol=1e-5)
+    assert torch.allclose(
+        (A.lazy().softmax() * B) @ X, (A.softmax() * B) @ X, atol=1e-5
+    )
+    assert torch.allclose(
+        (2 * A.lazy() * B / 4) @ X, ((A * B) * 0.5) @ X, atol=1e-5
+    )
+    assert torch.allclose(A.lazy().softmax(0) @ X, A.softmax(0) @ X, atol=1e-5)
+    C = A.lazy().softmax().evaluate()
+    assert torch.allclose(C.val, A.softmax().val, atol=1e-5)
+    assert C.csr()[0].data_ptr() == A.csr()[0].data_ptr()
+
+
+def test_lazy_grad():
+    ctx = F.ctx()
+    A = _create_matrix(ctx)
+    val = A.val.clone().requires_grad_()
+    X = torch.randn(4, 3).to(ctx)
+    (val_like(A, val).lazy().softmax() @ X).sum().backward()
+    lazy_grad = val.grad.clone()
+    val.grad = None
+    (val_like(A, val).softmax() @ X).sum().backward()
+    assert torch.allclose(lazy_grad, val.grad, atol=1e-5)
+
+
+def test_lazy_mul_different_sparsity():
+    ctx = F.ctx()
+    A = _create_matrix(ctx)
+    row = torch.tensor([0, 2]).to(ctx)
+    col = torch.tensor([3, 2]).to(ctx)
+    B = from_coo(row, col, torch.randn(2).to(ctx), shape=(4, 4))
+    X = torch.randn(4, 3).to(ctx)
+    assert torch.allclose((A.lazy() * B) @ X, (A * B) @ X, atol=1e-5)
@@ -400,6 +400,27 @@ def test_val_like(val_shape, shape):
     check_val_like(csc_A, csc_B)
 
 
+def test_materialize():
+    ctx = F.ctx()
+    row = torch.tensor([1, 1, 2]).to(ctx)
+    col = torch.tensor([2, 4, 3]).to(ctx)
+    val = torch.randn(3).to(ctx)
+    A = from_coo(row, col, val, shape=(3, 5))
+    assert A.materialize("csr", "csc") is A
+    indptr, indices, _ = A.csr()
+
+    # Derived matrices share the materialized formats.
+    B = val_like(A, torch.randn(3).to(ctx))
+    assert B.csr()[0].data_ptr() == indptr.data_ptr()
+    assert B.csr()[1].data_ptr() == indices.data_ptr()
+    assert A.T.csc()[0].data_ptr() == indptr.data_ptr()
+    assert A.T.csr()[0].data_ptr() == A.csc()[0].data_ptr()
+    assert torch.equal(torch.stack(A.T.coo()), torch.stack(A.coo()[::-1]))
+
+    with pytest.raises(ValueError):
+        A.materialize("dense")
+
+
 def test_coalesce():
     ctx = F.ctx()
 
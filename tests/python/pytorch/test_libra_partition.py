@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+
+import dgl
+import torch as th
+from dgl.distgnn.partition.libra_partition import (
+    _build_adjlist,
+    _build_replica_table,
+    _relabel_partition,
+    _set_lr,
+    partition_graph,
+)
+
+
+def test_libra_conversion():
+    # Partition 0 has the edges (0, 1), (1, 2) and partition 1 has the edges
+    # (2, 3), (3, 4), (0, 4), so nodes 0 and 2 are split.
+    part_u = [th.tensor([0, 1]), th.tensor([2, 3, 0])]
+    part_v = [th.tensor([1, 2]), th.tensor([3, 4, 4])]
+    relabeled = [_relabel_partition(u, v) for u, v in zip(part_u, part_v)]
+
+    # Nodes are numbered in the order of their first appearance.
+    ldt_keys = [r[0] for r in relabeled]
+    assert th.equal(ldt_keys[0], th.tensor([0, 1, 2]))
+    assert th.equal(ldt_keys[1], th.tensor([2, 3, 4, 0]))
+    assert th.equal(relabeled[0][1], th.tensor([0, 1]))
+    assert th.equal(relabeled[0][2], th.tensor([1, 2]))
+    assert th.equal(relabeled[1][1], th.tensor([0, 1, 3]))
+    assert th.equal(relabeled[1][2], th.tensor([1, 2, 2]))
+
+    node_map = th.cumsum(th.tensor([k.shape[0] for k in ldt_keys]), 0)
+    gdt_key, gdt_ptr, gdt_value = _build_replica_table(ldt_keys, node_map, 5)
+    assert th.equal(gdt_key, th.tensor([2, 1, 2, 1, 1]))
+    # Node k has the copy offset + i in a partition where it is the i-th node.
+    assert th.equal(gdt_value, th.tensor([0, 6, 1, 2, 3, 4, 5]))
+    lrtensor = _set_lr(gdt_key, gdt_ptr, gdt_value)
+    assert int(lrtensor[0]) in (0, 6)
+    assert int(lrtensor[2]) in (2, 3)
+
+    expected = [
+        (th.tensor([[6], [-1], [3]]), th.tensor([0, 1, 0])),
+        (th.tensor([[2], [-1], [-1], [0]]), th.tensor([0, 1, 1, 0])),
+    ]
+    for part_id, (adj_ref, inner_ref) in enumerate(expected):
+        adj, inner_node, lf = _build_adjlist(
+            ldt_keys[part_id],
+            gdt_key,
+            gdt_ptr,
+            gdt_value,
+            lrtensor,
+            part_id,
+            node_map,
+            2,
+        )
+        assert th.equal(adj, adj_ref)
+        assert th.equal(inner_node, inner_ref.int())
+        split = inner_ref == 0
+        assert th.equal(lf[split], lrtensor[ldt_keys[part_id][split]])
+        assert (lf[~split] == -200).all()
+
+
+def test_libra_partition_graph():
+    g = dgl.rand_graph(50, 300)
+    g.ndata["feat"] = th.randn(50, 4)
+    g.ndata["label"] = th.randint(0, 3, (50,))
+    for mask in ["train_mask", "val_mask", "test_mask"]:
+        g.ndata[mask] = th.rand(50) > 0.5
+
+    num_parts = 3
+    with tempfile.TemporaryDirectory() as test_dir:
+        partition_graph(num_parts, g, test_dir, num_workers=2)
+        out_dir = os.path.join(test_dir, "{}Communities".format(num_parts))
+        json_file = [f for f in os.listdir(out_dir) if f.endswith(".json")]
+        with open(os.path.join(out_dir, json_file[0])) as f:
+            meta = json.load(f)
+        node_map = th.tensor(meta["node_map"])
+
+        num_edges = 0
+        for part_id in range(num_parts):
+            files = meta["part-{}".format(part_id)]
+            part_g = dgl.load_graphs(files["part_graph"])[0][0]
+            num_edges += part_g.num_edges()
+            adj = part_g.ndata["adj"]
+            inner_node = part_g.ndata["inner_node"]
+            assert adj.shape == (part_g.num_nodes(), num_parts - 1)
+            # Split nodes have remote copies and unsplit nodes have none.
+            has_copy = (adj >= 0).any(1)
+            assert th.equal(has_copy, inner_node == 0)
+            copies = adj[adj >= 0]
+            assert (
+                th.searchsorted(node_map, copies, right=True) != part_id
+            ).all()
+            assert (part_g.ndata["lf"][inner_node == 1] == -200).all()
+        assert num_edges == g.num_edges()
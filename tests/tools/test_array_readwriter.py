@@ -23,3 +23,53 @@ def test_array_readwriter(format, shape):
 
         assert original_array.shape == array.shape
         assert np.array_equal(original_array, array)
+
+
+@pytest.mark.parametrize("shape", [[500], [300, 10], [200, 5, 5]])
+@pytest.mark.parametrize("format", ["numpy", "parquet", "csv"])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_read_arrays(format, shape, num_threads):
+    if format == "csv" and len(shape) > 2:
+        pytest.skip("CSV only stores 2D arrays.")
+    arrays = [np.random.rand(*([n] + shape[1:])) for n in [shape[0], 0, 77]]
+    fmt_meta = {"name": format}
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        paths = []
+        for i, arr in enumerate(arrays):
+            # Only the npy format stores arrays without rows.
+            if format != "numpy" and len(arr) == 0:
+                continue
+            paths.append(os.path.join(test_dir, f"nodes-{i}.{format}"))
+            array_readwriter.get_array_parser(**fmt_meta).write(paths[-1], arr)
+        array = array_readwriter.read_arrays(
+            fmt_meta, paths, num_threads=num_threads, chunk_rows=64
+        )
+        original_array = np.concatenate(arrays)
+        if format == "csv":
+            array = array.reshape(original_array.shape)
+        assert original_array.shape == array.shape
+        assert np.allclose(original_array, array)
+
+
+@pytest.mark.parametrize("format", ["numpy", "parquet"])
+def test_read_arrays_mixed_dtypes(format):
+    # Later files have wider data types than the first one.
+    arrays = [
+        np.arange(100, dtype=np.int32).reshape(50, 2),
+        np.arange(100, dtype=np.int64).reshape(50, 2) + 2**40,
+        np.random.rand(50, 2),
+    ]
+    fmt_meta = {"name": format}
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        paths = []
+        for i, arr in enumerate(arrays):
+            paths.append(os.path.join(test_dir, f"nodes-{i}.{format}"))
+            array_readwriter.get_array_parser(**fmt_meta).write(paths[-1], arr)
+        array = array_readwriter.read_arrays(
+            fmt_meta, paths, num_threads=2, chunk_rows=16
+        )
+        original_array = np.concatenate(arrays)
+        assert array.dtype == original_array.dtype
+        assert np.array_equal(original_array, array)
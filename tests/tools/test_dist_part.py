@@ -202,6 +202,37 @@ def test_chunk_graph_arbitrary_chunks(
     )
 
 
+def _verify_csc_sampling_graph(part_config, part_g, csc_graph):
+    with open(part_config, "r") as f:
+        part_meta = json.load(f)
+    for ntype, type_id in csc_graph.metadata.node_type_to_id.items():
+        assert part_meta["ntypes"][ntype] == type_id
+    for etype, type_id in csc_graph.metadata.edge_type_to_id.items():
+        assert part_meta["etypes"][_etype_tuple_to_str(etype)] == type_id
+    assert csc_graph.num_nodes == part_g.num_nodes()
+    indptr, _, _ = part_g.adj_tensors("csc")
+    assert torch.equal(indptr, csc_graph.csc_indptr)
+    # The in-edges of a node may be in a different order, so compare the
+    # sorted edges with their types.
+    src, dst = part_g.edges()
+    part_edges = np.stack(
+        [dst.numpy(), src.numpy(), part_g.edata[dgl.ETYPE].numpy()]
+    )
+    csc_dst = torch.repeat_interleave(
+        torch.arange(csc_graph.num_nodes), csc_graph.csc_indptr.diff()
+    )
+    csc_edges = np.stack(
+        [
+            csc_dst.numpy(),
+            csc_graph.indices.numpy(),
+            csc_graph.type_per_edge.numpy(),
+        ]
+    )
+    part_edges = part_edges[:, np.lexsort(part_edges[::-1])]
+    csc_edges = csc_edges[:, np.lexsort(csc_edges[::-1])]
+    assert np.array_equal(part_edges, csc_edges)
+
+
 def _test_pipeline(
     num_chunks,
     num_parts,
@@ -213,8 +244,8 @@ def _test_pipeline(
     num_chunks_node_data=None,
     num_chunks_edge_data=None,
     use_verify_partitions=False,
+    use_graphbolt=False,
 ):
-
     if num_parts % world_size != 0:
         # num_parts should be a multiple of world_size
         return
@@ -263,6 +294,7 @@ def _test_pipeline(
         cmd += " --save-orig-nids"
         cmd += " --save-orig-eids"
         cmd += f" --graph-formats {graph_formats}" if graph_formats else ""
+        cmd += " --use-graphbolt" if use_graphbolt else ""
         os.system(cmd)
 
         # check if verify_partitions.py is used for validation.
@@ -301,6 +333,11 @@ def _test_pipeline(
             verify_graph_feats(
                 g, gpb, part_g, node_feats, edge_feats, orig_nids, orig_eids
             )
+            if use_graphbolt:
+                csc_graph = dgl.graphbolt.load_csc_sampling_graph(
+                    os.path.join(out_dir, f"part{i}", "csc_sampling_graph.tar")
+                )
+                _verify_csc_sampling_graph(part_config, part_g, csc_graph)
 
 
 @pytest.mark.parametrize(
@@ -373,6 +410,11 @@ def test_pipeline_feature_format(data_fmt):
     _test_pipeline(4, 4, 4, data_fmt=data_fmt)
 
 
+@pytest.mark.parametrize("num_parts, world_size", [[4, 4], [4, 2]])
+def test_pipeline_use_graphbolt(num_parts, world_size):
+    _test_pipeline(4, num_parts, world_size, use_graphbolt=True)
+
+
 def test_utils_generate_read_list():
     read_list = generate_read_list(10, 4)
     assert np.array_equal(read_list[0], np.array([0, 1, 2]))
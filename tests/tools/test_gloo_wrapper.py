@@ -0,0 +1,70 @@
+import os
+from datetime import timedelta
+
+import numpy as np
+import pytest
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from tools.distpartitioning.gloo_wrapper import alltoallv_batched
+
+try:
+    mp.set_start_method("spawn", force=True)
+except RuntimeError:
+    pass
+
+
+def _make_message(src, dst):
+    # Skewed sizes, with an empty message and a missing tensor on rank 0.
+    num_rows = (src + 1) * (dst + 2) * 7 if src != dst + 1 else 0
+    ids = torch.arange(num_rows, dtype=torch.int64) + 1000 * src + dst
+    feats = torch.arange(num_rows * 3, dtype=torch.float32).reshape(-1, 3)
+    mask = ids % 3 == 0
+    return [ids, None if src == 0 else feats, mask.numpy()]
+
+
+def _run(port_num, rank, world_size, chunk_bytes):
+    os.environ["MASTER_ADDR"] = "127.0.0.1"
+    os.environ["MASTER_PORT"] = str(port_num)
+    dist.init_process_group(
+        backend="gloo",
+        rank=rank,
+        world_size=world_size,
+        timeout=timedelta(seconds=180),
+    )
+
+    input_lists = [_make_message(rank, dst) for dst in range(world_size)]
+    output_lists = alltoallv_batched(
+        rank, world_size, input_lists, chunk_bytes=chunk_bytes
+    )
+    assert len(output_lists) == world_size
+    for src, received in enumerate(output_lists):
+        expected = _make_message(src, rank)
+        assert len(received) == len(expected)
+        assert torch.equal(received[0], expected[0])
+        if expected[1] is None:
+            assert received[1] is None
+        else:
+            assert torch.equal(received[1], expected[1])
+        assert received[2].dtype == torch.bool
+        assert torch.equal(received[2], torch.from_numpy(expected[2]))
+
+
+@pytest.mark.parametrize("world_size", [1, 3])
+@pytest.mark.parametrize("chunk_bytes", [37, 1 << 20])
+def test_alltoallv_batched(world_size, chunk_bytes):
+    port_num = np.random.randint(10000, 20000, size=(1,), dtype=int)[0]
+    ctx = mp.get_context("spawn")
+    processes = []
+    for rank in range(world_size):
+        p = ctx.Process(
+            target=_run, args=(port_num, rank, world_size, chunk_bytes)
+        )
+        p.start()
+        processes.append(p)
+
+    for p in processes:
+        p.join()
+        assert p.exitcode == 0
+        p.close()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+import pytest
+from partition_algo.base import load_partition_meta
+
+from pytest_utils import create_chunked_dataset
+
+
+@pytest.mark.parametrize("algo", ["ldg", "fennel", "hdrf"])
+@pytest.mark.parametrize("num_parts", [2, 4])
+def test_streaming_partition(algo, num_parts):
+    with tempfile.TemporaryDirectory() as root_dir:
+        g = create_chunked_dataset(root_dir, 2)
+        in_dir = os.path.join(root_dir, "chunked-data")
+        out_dir = os.path.join(root_dir, "parted_data")
+        os.system(
+            "python3 tools/partition_algo/streaming_partition.py "
+            f"--in_dir {in_dir} --out_dir {out_dir} "
+            f"--num_partitions {num_parts} --algo {algo} --batch_size 1000"
+        )
+
+        num_nodes = 0
+        counts = np.zeros(num_parts, dtype=np.int64)
+        for ntype in g.ntypes:
+            fname = os.path.join(out_dir, f"{ntype}.txt")
+            part_ids = np.loadtxt(fname, dtype=np.int64)
+            assert part_ids.shape[0] == g.num_nodes(ntype)
+            assert np.all((part_ids >= 0) & (part_ids < num_parts))
+            counts += np.bincount(part_ids, minlength=num_parts)
+            num_nodes += g.num_nodes(ntype)
+        # Every partition gets a fair share of the nodes.
+        assert counts.min() > 0.5 * num_nodes / num_parts
+
+        part_meta = load_partition_meta(
+            os.path.join(out_dir, "partition_meta.json")
+        )
+        assert part_meta.num_parts == num_parts
+        assert part_meta.algo_name == algo
+
+
+def _create_community_graph(root_dir, num_nodes, num_comms, num_chunks):
+    # Each node has 90% of its edges inside its community, in random order.
+    rng = np.random.default_rng(0)
+    comms = rng.integers(0, num_comms, num_nodes)
+    src = rng.integers(0, num_nodes, num_nodes * 10)
+    dst = rng.integers(0, num_nodes, num_nodes * 10)
+    inside = rng.random(len(src)) < 0.9
+    for c in range(num_comms):
+        members = np.nonzero(comms == c)[0]
+        sel = inside & (comms[src] == c)
+        dst[sel] = rng.choice(members, sel.sum())
+
+    paths = []
+    for i, chunk in enumerate(
+        np.array_split(np.stack([src, dst], 1), num_chunks)
+    ):
+        path = os.path.join(root_dir, f"edges-{i}.csv")
+        np.savetxt(path, chunk, fmt="%d")
+        paths.append(path)
+    metadata = {
+        "graph_name": "community",
+        "node_type": ["n"],
+        "num_nodes_per_type": [num_nodes],
+        "edge_type": ["n:e:n"],
+        "num_edges_per_type": [len(src)],
+        "edges": {
+            "n:e:n": {
+                "format": {"name": "csv", "delimiter": " "},
+                "data": paths,
+            }
+        },
+    }
+    with open(os.path.join(root_dir, "metadata.json"), "w") as f:
+        json.dump(metadata, f)
+    return src, dst
+
+
+@pytest.mark.parametrize(
+    "algo, max_ratio", [("ldg", 0.6), ("fennel", 0.6), ("hdrf", 0.95)]
+)
+def test_streaming_partition_edge_cut(algo, max_ratio):
+    num_nodes, num_parts = 1000, 4
+    with tempfile.TemporaryDirectory() as root_dir:
+        src, dst = _create_community_graph(root_dir, num_nodes, num_parts, 3)
+        out_dir = os.path.join(root_dir, "parted_data")
+        os.system(
+            "python3 tools/partition_algo/streaming_partition.py "
+            f"--in_dir {root_dir} --out_dir {out_dir} "
+            f"--num_partitions {num_parts} --algo {algo} --batch_size 1000"
+        )
+        parts = np.loadtxt(os.path.join(out_dir, "n.txt"), dtype=np.int64)
+
+    # The communities are followed much more closely than by a random
+    # assignment with the same partition sizes.
+    fractions = np.bincount(parts, minlength=num_parts) / num_nodes
+    assert fractions.min() > 0.5 / num_parts
+    random_cut = 1 - np.sum(fractions**2)
+    assert np.mean(parts[src] != parts[dst]) < max_ratio * random_cut
@@ -78,6 +78,8 @@ def submit_jobs(args) -> str:
     argslist += (
         f"--graph-formats {args.graph_formats} " if args.graph_formats else ""
     )
+    argslist += "--use-graphbolt " if args.use_graphbolt else ""
+    argslist += "--num-io-threads {} ".format(args.num_io_threads)
 
     # (BarclayII) Is it safe to assume all the workers have the Python executable at the same path?
     pipeline_cmd = os.path.join(INSTALL_DIR, PIPELINE_SCRIPT)
@@ -168,6 +170,17 @@ def main():
         "what format is available. If multiple formats are available, selection priority "
         "from high to low is ``coo``, ``csc``, ``csr``.",
     )
+    parser.add_argument(
+        "--use-graphbolt",
+        action="store_true",
+        help="Also save partitions as CSCSamplingGraph of GraphBolt.",
+    )
+    parser.add_argument(
+        "--num-io-threads",
+        type=int,
+        default=4,
+        help="Number of threads per process to read input files in chunks.",
+    )
 
     args, _ = parser.parse_known_args()
 
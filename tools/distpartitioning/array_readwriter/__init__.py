@@ -1,2 +1,3 @@
 from . import csv, numpy_array, parquet
+from .parallel import read_arrays
 from .registry import get_array_parser, register_array_parser
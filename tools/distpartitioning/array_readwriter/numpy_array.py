@@ -17,6 +17,14 @@ class NumpyArrayParser(object):
         logging.debug("Done reading from %s" % path)
         return arr
 
+    def row_boundaries(self, path, chunk_rows):
+        num_rows = np.load(path, mmap_mode="r").shape[0]
+        return np.append(np.arange(0, num_rows, chunk_rows), num_rows)
+
+    def read_rows(self, path, start, end):
+        # Only the pages of the rows are read from the memory-mapped file.
+        return np.load(path, mmap_mode="r")[start:end]
+
     def write(self, path, arr):
         logging.debug("Writing to %s using numpy format" % path)
         # np.save would load the entire memmap array up into CPU.  So we manually open
@@ -0,0 +1,86 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .registry import get_array_parser
+
+# The default number of rows of a chunk read by one thread.
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+
+def read_arrays(fmt_meta, paths, num_threads=1, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Read the arrays in the files and concatenate them along the rows.
+
+    The files are split into chunks of rows, which are read by a pool of
+    threads directly into the preallocated output array, so a rank can
+    read a few large files with all its threads instead of one. Formats
+    whose parsers cannot read a range of rows, such as CSV, are read file
+    by file in the threads and concatenated.
+
+    Parameters:
+    -----------
+    fmt_meta : dict
+        The format of the files, as passed to ``get_array_parser``.
+    paths : list[str]
+        The files to read, in order.
+    num_threads : int
+        The number of reader threads.
+    chunk_rows : int
+        The number of rows of a chunk. Parquet files are split by row groups
+        instead.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The concatenated array, or an empty array if there is no file.
+    """
+    parser = get_array_parser(**fmt_meta)
+    if len(paths) == 0:
+        return np.array([])
+    if not hasattr(parser, "read_rows"):
+        with ThreadPoolExecutor(num_threads) as pool:
+            return np.concatenate(list(pool.map(parser.read, paths)))
+
+    pieces = []
+    num_rows = 0
+    for path in paths:
+        bounds = parser.row_boundaries(path, chunk_rows)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            pieces.append((path, start, end, num_rows + start))
+        num_rows += bounds[-1]
+    logging.debug(
+        "Reading %d rows from %d files in %d chunks with %d threads"
+        % (num_rows, len(paths), len(pieces), num_threads)
+    )
+    if len(pieces) == 0:
+        return parser.read_rows(paths[0], 0, 0)
+
+    def _read(piece):
+        path, start, end, _ = piece
+        return parser.read_rows(path, start, end)
+
+    def _read_into(piece):
+        path, start, end, offset = piece
+        out[offset : offset + end - start] = parser.read_rows(path, start, end)
+
+    # The first chunk of each file tells the shape of a row and the data type
+    # of the file, so that the output can hold the rows of all the files.
+    is_first = [
+        i == 0 or pieces[i - 1][0] != p[0] for i, p in enumerate(pieces)
+    ]
+    firsts = [p for p, first in zip(pieces, is_first) if first]
+    rests = [p for p, first in zip(pieces, is_first) if not first]
+    with ThreadPoolExecutor(num_threads) as pool:
+        arrays = list(pool.map(_read, firsts))
+        row_shapes = set(arr.shape[1:] for arr in arrays)
+        assert (
+            len(row_shapes) == 1
+        ), f"The files have rows of shapes {row_shapes}."
+        dtype = np.result_type(*[arr.dtype for arr in arrays])
+        out = np.empty((num_rows,) + arrays[0].shape[1:], dtype=dtype)
+        for piece, arr in zip(firsts, arrays):
+            out[piece[3] : piece[3] + len(arr)] = arr
+        del arrays
+        list(pool.map(_read_into, rests))
+    return out
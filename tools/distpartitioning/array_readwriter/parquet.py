@@ -13,19 +13,17 @@ class ParquetArrayParser(object):
     def __init__(self):
         pass
 
-    def read(self, path):
-        logging.debug("Reading from %s using parquet format" % path)
-        metadata = pyarrow.parquet.read_metadata(path)
+    def _read_shape(self, metadata):
         metadata = metadata.schema.to_arrow_schema().metadata
-
         # As parquet data are tabularized, we assume the dim of ndarray is 2.
         # If not, it should be explictly specified in the file as metadata.
         if metadata:
             shape = metadata.get(b"shape", None)
         else:
             shape = None
-        table = pyarrow.parquet.read_table(path, memory_map=True)
+        return tuple(eval(shape.decode())) if shape else None
 
+    def _to_numpy(self, table, path):
         data_types = table.schema.types
         # Spark ML feature processing produces single-column parquet files where each row is a vector object
         if len(data_types) == 1 and isinstance(data_types[0], pyarrow.ListType):
@@ -35,15 +33,45 @@ class ParquetArrayParser(object):
             )
         else:
             arr = table.to_pandas().to_numpy()
+        return arr
+
+    def read(self, path):
+        logging.debug("Reading from %s using parquet format" % path)
+        shape = self._read_shape(pyarrow.parquet.read_metadata(path))
+        table = pyarrow.parquet.read_table(path, memory_map=True)
+        arr = self._to_numpy(table, path)
         if not shape:
             logging.debug(
                 "Shape information not found in the metadata, read the data as "
                 "a 2 dim array."
             )
         logging.debug("Done reading from %s" % path)
-        shape = tuple(eval(shape.decode())) if shape else arr.shape
+        shape = shape if shape else arr.shape
         return arr.reshape(shape)
 
+    def row_boundaries(self, path, chunk_rows):
+        # A row group is the smallest unit that can be read from a file.
+        metadata = pyarrow.parquet.read_metadata(path)
+        num_rows = [
+            metadata.row_group(i).num_rows
+            for i in range(metadata.num_row_groups)
+        ]
+        return np.concatenate([[0], np.cumsum(num_rows, dtype=np.int64)])
+
+    def read_rows(self, path, start, end):
+        """Read the rows from ``start`` to ``end``, which must be the
+        boundaries of row groups."""
+        bounds = self.row_boundaries(path, None)
+        first, last = np.searchsorted(bounds, [start, end])
+        assert bounds[first] == start and bounds[last] == end
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        shape = self._read_shape(parquet_file.metadata)
+        table = parquet_file.read_row_groups(range(first, last))
+        arr = self._to_numpy(table, path)
+        if shape:
+            arr = arr.reshape((end - start,) + shape[1:])
+        return arr
+
     def write(self, path, array, vector_rows=False):
         logging.debug("Writing to %s using parquet format" % path)
         shape = array.shape
@@ -13,6 +13,7 @@ import pandas as pd
 import pyarrow
 import torch as th
 from dgl.distributed.partition import (
+    _create_csc_sampling_graph,
     _etype_str_to_tuple,
     _etype_tuple_to_str,
     RESERVED_FIELD_DTYPE,
@@ -185,6 +186,7 @@ def create_dgl_object(
     edge_typecounts,
     return_orig_nids=False,
     return_orig_eids=False,
+    use_graphbolt=False,
 ):
     """
     This function creates dgl objects for a given graph partition, as in function
@@ -248,6 +250,10 @@ def create_dgl_object(
         offset to be used when assigning edge global ids in the current partition
     return_orig_ids : bool, optional
         Indicates whether to return original node/edge IDs.
+    use_graphbolt : bool, optional
+        Indicates whether to also create the partition as a CSCSamplingGraph
+        of GraphBolt. The CSC and the edge types are computed from the edge
+        list of the partition directly.
 
     Returns:
     --------
@@ -269,6 +275,9 @@ def create_dgl_object(
         If `return_orig_eids=True`, return a dict of 1D tensors whose key is the edge type
         and value is a 1D tensor mapping between shuffled edge IDs and the original edge
         IDs for each edge type. Otherwise, ``None`` is returned.
+    CSCSamplingGraph
+        If `use_graphbolt=True`, return the graph partition for GraphBolt.
+        Otherwise, ``None`` is returned.
     """
     # create auxiliary data structures from the schema object
     memory_snapshot("CreateDGLObj_Begin", part_id)
@@ -460,6 +469,17 @@ def create_dgl_object(
         nid_map[part_local_dst_id],
     )
 
+    csc_graph = None
+    if use_graphbolt:
+        csc_graph = _create_csc_sampling_graph(
+            part_local_src_id,
+            part_local_dst_id,
+            etype_ids,
+            len(uniq_ids),
+            ntypes_map,
+            etypes_map,
+        )
+
     # create the graph here now.
     part_graph = dgl.graph(
         data=(part_local_src_id, part_local_dst_id), num_nodes=len(uniq_ids)
@@ -520,6 +540,7 @@ def create_dgl_object(
         etypes_map,
         orig_nids,
         orig_eids,
+        csc_graph,
     )
 
 
@@ -100,6 +100,17 @@ if __name__ == "__main__":
         type=str,
         help="Save partitions in specified formats.",
     )
+    parser.add_argument(
+        "--use-graphbolt",
+        action="store_true",
+        help="Also save partitions as CSCSamplingGraph of GraphBolt",
+    )
+    parser.add_argument(
+        "--num-io-threads",
+        type=int,
+        default=4,
+        help="Number of threads per process to read input files in chunks",
+    )
     params = parser.parse_args()
 
     # invoke the pipeline function
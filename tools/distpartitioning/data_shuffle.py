@@ -21,10 +21,13 @@ from globalids import (
     assign_shuffle_global_nids_nodes,
     lookup_shuffle_global_nids_edges,
 )
-from gloo_wrapper import allgather_sizes, alltoallv_cpu, gather_metadata_json
+from gloo_wrapper import (
+    allgather_sizes,
+    alltoallv_batched,
+    gather_metadata_json,
+)
 from utils import (
     augment_edge_data,
-    DATA_TYPE_ID,
     get_edge_types,
     get_etype_featnames,
     get_gid_offsets,
@@ -37,7 +40,6 @@ from utils import (
     memory_snapshot,
     read_json,
     read_ntype_partition_files,
-    REV_DATA_TYPE_ID,
     write_dgl_objects,
     write_metadata_json,
 )
@@ -179,7 +181,7 @@ def exchange_edge_data(rank, world_size, num_parts, edge_data, id_lookup):
     """
     Exchange edge_data among processes in the world.
     Prepare list of sliced data targeting each process and trigger
-    alltoallv_cpu to trigger messaging api
+    alltoallv_batched to trigger messaging api
 
     Parameters:
     -----------
@@ -252,38 +254,33 @@ def exchange_edge_data(rank, world_size, num_parts, edge_data, id_lookup):
             cur_etype_id = edge_data[constants.ETYPE_ID][chunk_start:chunk_end]
             cur_eid = edge_data[constants.GLOBAL_EID][chunk_start:chunk_end]
 
-            input_list = []
+            # The columns are sent as separate arrays in one batched
+            # alltoallv, which avoids stacking and padding them.
+            input_lists = []
             owner_ids = id_lookup.get_partition_ids(cur_dst_id)
             for idx in range(world_size):
                 send_idx = owner_ids == (idx + local_part_id * world_size)
                 send_idx = send_idx.reshape(cur_src_id.shape[0])
-                filt_data = np.column_stack(
-                    (
-                        cur_src_id[send_idx == 1],
-                        cur_dst_id[send_idx == 1],
-                        cur_type_eid[send_idx == 1],
-                        cur_etype_id[send_idx == 1],
-                        cur_eid[send_idx == 1],
-                    )
+                input_lists.append(
+                    [
+                        cur_src_id[send_idx],
+                        cur_dst_id[send_idx],
+                        cur_type_eid[send_idx],
+                        cur_etype_id[send_idx],
+                        cur_eid[send_idx],
+                    ]
                 )
-                if filt_data.shape[0] <= 0:
-                    input_list.append(torch.empty((0, 5), dtype=torch.int64))
-                else:
-                    input_list.append(torch.from_numpy(filt_data))
 
             # Now send newly formed chunk to others.
             dist.barrier()
-            output_list = alltoallv_cpu(
-                rank, world_size, input_list, retain_nones=False
-            )
+            output_lists = alltoallv_batched(rank, world_size, input_lists)
 
             # Replace the values of the edge_data, with the received data from all the other processes.
-            rcvd_edge_data = torch.cat(output_list).numpy()
-            local_src_ids.append(rcvd_edge_data[:, 0])
-            local_dst_ids.append(rcvd_edge_data[:, 1])
-            local_type_eids.append(rcvd_edge_data[:, 2])
-            local_etype_ids.append(rcvd_edge_data[:, 3])
-            local_eids.append(rcvd_edge_data[:, 4])
+            local_src_ids.extend([out[0].numpy() for out in output_lists])
+            local_dst_ids.extend([out[1].numpy() for out in output_lists])
+            local_type_eids.extend([out[2].numpy() for out in output_lists])
+            local_etype_ids.extend([out[3].numpy() for out in output_lists])
+            local_eids.extend([out[4].numpy() for out in output_lists])
 
         edge_data[
             constants.GLOBAL_SRC_ID + "/" + str(local_part_id)
@@ -328,7 +325,7 @@ def exchange_edge_data(rank, world_size, num_parts, edge_data, id_lookup):
     return edge_data
 
 
-def exchange_feature(
+def split_feature_by_owner(
     rank,
     data,
     id_lookup,
@@ -341,12 +338,9 @@ def exchange_feature(
     type_id_end,
     local_part_id,
     world_size,
-    num_parts,
-    cur_features,
-    cur_global_ids,
 ):
-    """This function is used to send/receive one feature for either nodes or
-    edges of the input graph dataset.
+    """This function is used to split one feature, of either nodes or edges
+    of the input graph dataset, into the slices owned by each process.
 
     Parameters:
     -----------
@@ -382,32 +376,22 @@ def exchange_feature(
         data belonging to this partition
     world_size : int
         total number of processes created
-    num_parts : int
-        total number of partitions
-    cur_features : dictionary
-        dictionary to store the feature data which belongs to the current
-        process
-    cur_global_ids : dictionary
-        dictionary to store global ids, of either nodes or edges, for which
-        the features stored in the cur_features dictionary
 
     Returns:
     -------
-    dictionary :
-        a dictionary is returned where keys are type names and
-        feature data are the values
+    string :
+        the key under which the received feature data is stored
     list :
-        a dictionary of global_ids either nodes or edges whose features are
-        received during the data shuffle process
+        list of feature slices, or None if the current process has no data
+        for this feature, to send to each process
+    list :
+        list of global_ids, of either nodes or edges, of the feature slices
+        to send to each process
     """
     # type_ids for this feature subset on the current rank
     gids_feat = np.arange(gid_start, gid_end)
-    tids_feat = np.arange(type_id_start, type_id_end)
     local_idx = np.arange(0, type_id_end - type_id_start)
 
-    feats_per_rank = []
-    global_id_per_rank = []
-
     tokens = feat_key.split("/")
     assert len(tokens) == 3
     local_feat_key = "/".join(tokens[:-1]) + "/" + str(local_part_id)
@@ -415,6 +399,8 @@ def exchange_feature(
     logging.debug(
         f"[Rank: {rank} feature: {feat_key}, gid_start - {gid_start} and gid_end - {gid_end}"
     )
+    if featdata_key is None:
+        return local_feat_key, [None] * world_size, [None] * world_size
 
     # Get the partition ids for the range of global nids.
     if feat_type == constants.STR_NODE_FEATURES:
@@ -449,98 +435,19 @@ def exchange_feature(
         assert np.all(global_eids == data[constants.GLOBAL_EID][idx1])
         partid_slice = id_lookup.get_partition_ids(global_dst_nids)
 
-    # determine the shape of the feature-data
-    # this is needed to so that ranks where feature-data is not present
-    # should use the correct shape for sending the padded vector.
-    # exchange length here.
-    feat_dim_len = 0
-    if featdata_key is not None:
-        feat_dim_len = len(featdata_key.shape)
-    all_lens = allgather_sizes(
-        [feat_dim_len], world_size, num_parts, return_sizes=True
-    )
-    if all_lens[0] <= 0:
-        logging.debug(
-            f"[Rank: {rank} No process has any feature data to shuffle for {local_feat_key}"
-        )
-        return cur_features, cur_global_ids
-
-    rank0_shape_len = all_lens[0]
-    for idx in range(1, world_size):
-        assert (all_lens[idx] == 0) or (all_lens[idx] == rank0_shape_len), (
-            f"feature: {local_feat_key} shapes does not match "
-            f"at rank - {idx} and rank - 0"
-        )
-
-    # exchange actual data here.
-    if featdata_key != None:
-        feat_dims_dtype = list(featdata_key.shape)
-        feat_dims_dtype.append(DATA_TYPE_ID[featdata_key.dtype])
-    else:
-        feat_dims_dtype = list(np.zeros((rank0_shape_len), dtype=np.int64))
-        feat_dims_dtype.append(DATA_TYPE_ID[torch.float32])
-
-    logging.debug(f"Sending the feature shape information - {feat_dims_dtype}")
-    all_dims_dtype = allgather_sizes(
-        feat_dims_dtype, world_size, num_parts, return_sizes=True
-    )
-
+    feats_per_rank = []
+    global_id_per_rank = []
     for idx in range(world_size):
         cond = partid_slice == (idx + local_part_id * world_size)
-        gids_per_partid = gids_feat[cond]
-        tids_per_partid = tids_feat[cond]
-        local_idx_partid = local_idx[cond]
-
-        if gids_per_partid.shape[0] == 0:
-            assert len(all_dims_dtype) % world_size == 0
-            dim_len = int(len(all_dims_dtype) / world_size)
-            rank0_shape = tuple(list(np.zeros((dim_len - 1), dtype=np.int32)))
-            rank0_dtype = REV_DATA_TYPE_ID[
-                all_dims_dtype[(dim_len - 1) : (dim_len)][0]
-            ]
-            data = torch.empty(rank0_shape, dtype=rank0_dtype)
-            feats_per_rank.append(data)
-            global_id_per_rank.append(torch.empty((0,), dtype=torch.int64))
-        else:
-            feats_per_rank.append(featdata_key[local_idx_partid])
-            global_id_per_rank.append(
-                torch.from_numpy(gids_per_partid).type(torch.int64)
-            )
+        feats_per_rank.append(featdata_key[local_idx[cond]])
+        global_id_per_rank.append(
+            torch.from_numpy(gids_feat[cond]).type(torch.int64)
+        )
     for idx, tt in enumerate(feats_per_rank):
         logging.debug(
             f"[Rank: {rank} features shape - {tt.shape} and ids - {global_id_per_rank[idx].shape}"
         )
-
-    # features (and global nids) per rank to be sent out are ready
-    # for transmission, perform alltoallv here.
-    output_feat_list = alltoallv_cpu(
-        rank, world_size, feats_per_rank, retain_nones=False
-    )
-    output_id_list = alltoallv_cpu(
-        rank, world_size, global_id_per_rank, retain_nones=False
-    )
-    logging.debug(
-        f"[Rank : {rank} feats - {output_feat_list}, ids - {output_id_list}"
-    )
-    assert len(output_feat_list) == len(output_id_list), (
-        "Length of feature list and id list are expected to be equal while "
-        f"got {len(output_feat_list)} and {len(output_id_list)}."
-    )
-
-    # stitch node_features together to form one large feature tensor
-    if len(output_feat_list) > 0:
-        output_feat_list = torch.cat(output_feat_list)
-        output_id_list = torch.cat(output_id_list)
-        if local_feat_key in cur_features:
-            temp = cur_features[local_feat_key]
-            cur_features[local_feat_key] = torch.cat([temp, output_feat_list])
-            temp = cur_global_ids[local_feat_key]
-            cur_global_ids[local_feat_key] = torch.cat([temp, output_id_list])
-        else:
-            cur_features[local_feat_key] = output_feat_list
-            cur_global_ids[local_feat_key] = output_id_list
-
-    return cur_features, cur_global_ids
+    return local_feat_key, feats_per_rank, global_id_per_rank
 
 
 def exchange_features(
@@ -614,71 +521,93 @@ def exchange_features(
     own_features = {}
     own_global_ids = {}
 
-    # To iterate over the node_types and associated node_features
-    for feat_key, type_info in feature_tids.items():
-        # To iterate over the feature data, of a given (node or edge )type
-        # type_info is a list of 3 elements (as shown below):
-        #   [feature-name, starting-idx, ending-idx]
-        #       feature-name is the name given to the feature-data,
-        #       read from the input metadata file
-        #       [starting-idx, ending-idx) specifies the range of indexes
-        #        associated with the features data
-        # Determine the owner process for these features.
-        # Note that the keys in the node features (and similarly edge features)
-        # dictionary is of the following format:
-        #   `node_type/feature_name/local_part_id`:
-        #    where node_type and feature_name are self-explanatory and
-        #    local_part_id denotes the partition-id, in the local process,
-        #    which will be used a suffix to store all the information of a
-        #    given partition which is processed by the current process. Its
-        #    values start from 0 onwards, for instance 0, 1, 2 ... etc.
-        #    local_part_id can be easily mapped to global partition id very
-        #    easily, using cyclic ordering. All local_part_ids = 0 from all
-        #    processes will form global partition-ids between 0 and world_size-1.
-        #    Similarly all local_part_ids = 1 from all processes will form
-        #    global partition ids in the range [world_size, 2*world_size-1] and
-        #    so on.
-        tokens = feat_key.split("/")
-        assert len(tokens) == 3
-        type_name = tokens[0]
-        feat_name = tokens[1]
-        logging.debug(f"[Rank: {rank}] processing feature: {feat_key}")
-
-        for feat_info in type_info:
-            # Compute the global_id range for this feature data
-            type_id_start = int(feat_info[0])
-            type_id_end = int(feat_info[1])
-            begin_global_id = type_id_map[type_name][0]
-            gid_start = begin_global_id + type_id_start
-            gid_end = begin_global_id + type_id_end
+    for local_part_id in range(num_parts // world_size):
+        # All the features of this local partition are sent in one batched
+        # alltoallv, instead of one padded alltoallv per feature.
+        feat_keys = []
+        input_lists = [[] for _ in range(world_size)]
+
+        # To iterate over the node_types and associated node_features
+        for feat_key, type_info in feature_tids.items():
+            # To iterate over the feature data, of a given (node or edge )type
+            # type_info is a list of 3 elements (as shown below):
+            #   [feature-name, starting-idx, ending-idx]
+            #       feature-name is the name given to the feature-data,
+            #       read from the input metadata file
+            #       [starting-idx, ending-idx) specifies the range of indexes
+            #        associated with the features data
+            # Determine the owner process for these features.
+            # Note that the keys in the node features (and similarly edge features)
+            # dictionary is of the following format:
+            #   `node_type/feature_name/local_part_id`:
+            #    where node_type and feature_name are self-explanatory and
+            #    local_part_id denotes the partition-id, in the local process,
+            #    which will be used a suffix to store all the information of a
+            #    given partition which is processed by the current process. Its
+            #    values start from 0 onwards, for instance 0, 1, 2 ... etc.
+            #    local_part_id can be easily mapped to global partition id very
+            #    easily, using cyclic ordering. All local_part_ids = 0 from all
+            #    processes will form global partition-ids between 0 and world_size-1.
+            #    Similarly all local_part_ids = 1 from all processes will form
+            #    global partition ids in the range [world_size, 2*world_size-1] and
+            #    so on.
+            tokens = feat_key.split("/")
+            assert len(tokens) == 3
+            type_name = tokens[0]
+            logging.debug(f"[Rank: {rank}] processing feature: {feat_key}")
 
             # Check if features exist for this type_name + feat_name.
             # This check should always pass, because feature_tids are built
             # by reading the input metadata json file for existing features.
             assert feat_key in feature_data
 
-            for local_part_id in range(num_parts // world_size):
-                featdata_key = feature_data[feat_key]
+            for feat_info in type_info:
+                # Compute the global_id range for this feature data
+                type_id_start = int(feat_info[0])
+                type_id_end = int(feat_info[1])
+                begin_global_id = type_id_map[type_name][0]
+                gid_start = begin_global_id + type_id_start
+                gid_end = begin_global_id + type_id_end
 
-                # Synchronize for each feature
-                dist.barrier()
-                own_features, own_global_ids = exchange_feature(
+                local_feat_key, feats, gids = split_feature_by_owner(
                     rank,
                     data,
                     id_lookup,
                     feat_type,
                     feat_key,
-                    featdata_key,
+                    feature_data[feat_key],
                     gid_start,
                     gid_end,
                     type_id_start,
                     type_id_end,
                     local_part_id,
                     world_size,
-                    num_parts,
-                    own_features,
-                    own_global_ids,
                 )
+                feat_keys.append(local_feat_key)
+                for idx in range(world_size):
+                    input_lists[idx].extend([feats[idx], gids[idx]])
+
+        # Every rank reads the same metadata, so the number of features
+        # exchanged here is the same on all of them.
+        dist.barrier()
+        output_lists = alltoallv_batched(rank, world_size, input_lists)
+
+        # stitch node_features together to form one large feature tensor
+        for k, local_feat_key in enumerate(feat_keys):
+            output_feat_list = []
+            output_id_list = []
+            for recv_list in output_lists:
+                feats, gids = recv_list[2 * k], recv_list[2 * k + 1]
+                if feats is not None and feats.shape[0] > 0:
+                    output_feat_list.append(feats)
+                    output_id_list.append(gids)
+            if len(output_feat_list) == 0:
+                continue
+            if local_feat_key in own_features:
+                output_feat_list.insert(0, own_features[local_feat_key])
+                output_id_list.insert(0, own_global_ids[local_feat_key])
+            own_features[local_feat_key] = torch.cat(output_feat_list)
+            own_global_ids[local_feat_key] = torch.cat(output_id_list)
 
     end = timer()
     logging.info(
@@ -887,6 +816,7 @@ def read_dataset(rank, world_size, id_lookup, params, schema_map, ntype_counts):
         params.num_parts,
         schema_map,
         ntype_counts,
+        params.num_io_threads,
     )
     # Synchronize so that everybody completes reading dataset from disk
     dist.barrier()
@@ -1309,6 +1239,7 @@ def gen_dist_partitions(rank, world_size, params):
             etypes_map,
             orig_nids,
             orig_eids,
+            csc_graph,
         ) = create_dgl_object(
             schema_map,
             rank + local_part_id * world_size,
@@ -1322,6 +1253,7 @@ def gen_dist_partitions(rank, world_size, params):
             edge_typecounts,
             params.save_orig_nids,
             params.save_orig_eids,
+            params.use_graphbolt,
         )
         sort_etypes = len(etypes_map) > 1
         local_node_features = prepare_local_data(
@@ -1340,6 +1272,7 @@ def gen_dist_partitions(rank, world_size, params):
             orig_eids,
             graph_formats,
             sort_etypes,
+            csc_graph,
         )
         memory_snapshot("DiskWriteDGLObjectsComplete: ", rank)
 
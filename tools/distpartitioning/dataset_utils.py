@@ -7,7 +7,6 @@ import constants
 
 import numpy as np
 import pyarrow
-import pyarrow.parquet as pq
 import torch
 import torch.distributed as dist
 from gloo_wrapper import alltoallv_cpu
@@ -90,7 +89,14 @@ def _broadcast_shape(
 
 
 def get_dataset(
-    input_dir, graph_name, rank, world_size, num_parts, schema_map, ntype_counts
+    input_dir,
+    graph_name,
+    rank,
+    world_size,
+    num_parts,
+    schema_map,
+    ntype_counts,
+    num_io_threads=1,
 ):
     """
     Function to read the multiple file formatted dataset.
@@ -110,6 +116,11 @@ def get_dataset(
     schema_map : dictionary
         this is the dictionary created by reading the graph metadata json file
         for the input graph dataset
+    ntype_counts : dictionary
+        the number of nodes of each node type
+    num_io_threads : int
+        number of threads used by the current process to read the chunks of
+        the feature and edge files
 
     Return:
     -------
@@ -240,7 +251,6 @@ def get_dataset(
 
                 # It is guaranteed that num_chunks is always greater
                 # than num_partitions.
-                node_data = []
                 num_files = len(feat_data[constants.STR_DATA])
                 if num_files == 0:
                     continue
@@ -248,19 +258,15 @@ def get_dataset(
                     "name": feat_data[constants.STR_FORMAT][constants.STR_NAME]
                 }
                 read_list = generate_read_list(num_files, world_size)
+                data_files = []
                 for idx in read_list[rank]:
                     data_file = feat_data[constants.STR_DATA][idx]
                     if not os.path.isabs(data_file):
                         data_file = os.path.join(input_dir, data_file)
-                    node_data.append(
-                        array_readwriter.get_array_parser(
-                            **reader_fmt_meta
-                        ).read(data_file)
-                    )
-                if len(node_data) > 0:
-                    node_data = np.concatenate(node_data)
-                else:
-                    node_data = np.array([])
+                    data_files.append(data_file)
+                node_data = array_readwriter.read_arrays(
+                    reader_fmt_meta, data_files, num_threads=num_io_threads
+                )
                 node_data = torch.from_numpy(node_data)
                 cur_tids = _broadcast_shape(
                     node_data,
@@ -374,7 +380,6 @@ def get_dataset(
                     constants.STR_PARQUET,
                 ]
 
-                edge_data = []
                 num_files = len(feat_data[constants.STR_DATA])
                 if num_files == 0:
                     continue
@@ -382,6 +387,7 @@ def get_dataset(
                     "name": feat_data[constants.STR_FORMAT][constants.STR_NAME]
                 }
                 read_list = generate_read_list(num_files, world_size)
+                data_files = []
                 for idx in read_list[rank]:
                     data_file = feat_data[constants.STR_DATA][idx]
                     if not os.path.isabs(data_file):
@@ -389,15 +395,10 @@ def get_dataset(
                     logging.debug(
                         f"[Rank: {rank}] Loading edges-feats of {etype_name}[{feat_name}] from {data_file}"
                     )
-                    edge_data.append(
-                        array_readwriter.get_array_parser(
-                            **reader_fmt_meta
-                        ).read(data_file)
-                    )
-                if len(edge_data) > 0:
-                    edge_data = np.concatenate(edge_data)
-                else:
-                    edge_data = np.array([])
+                    data_files.append(data_file)
+                edge_data = array_readwriter.read_arrays(
+                    reader_fmt_meta, data_files, num_threads=num_io_threads
+                )
                 edge_data = torch.from_numpy(edge_data)
 
                 # exchange the amount of data read from the disk.
@@ -529,18 +530,18 @@ def get_dataset(
 
         for idx in np.concatenate(curr_partids):
         """
+        edge_files = []
         for idx in read_list[rank]:
             edge_file = edge_info[idx]
             if not os.path.isabs(edge_file):
                 edge_file = os.path.join(input_dir, edge_file)
-            logging.debug(
-                f"[Rank: {rank}] Loading edges of etype[{etype_name}] from {edge_file}"
-            )
-
-            if (
-                etype_info[constants.STR_FORMAT][constants.STR_NAME]
-                == constants.STR_CSV
-            ):
+            edge_files.append(edge_file)
+        edge_fmt = etype_info[constants.STR_FORMAT][constants.STR_NAME]
+        if edge_fmt == constants.STR_CSV:
+            for edge_file in edge_files:
+                logging.debug(
+                    f"[Rank: {rank}] Loading edges of etype[{etype_name}] from {edge_file}"
+                )
                 read_options = pyarrow.csv.ReadOptions(
                     use_threads=True,
                     block_size=4096,
@@ -559,18 +560,23 @@ def get_dataset(
                         next_table = pyarrow.Table.from_batches([next_chunk])
                         src_ids.append(next_table["f0"].to_numpy())
                         dst_ids.append(next_table["f1"].to_numpy())
-            elif (
-                etype_info[constants.STR_FORMAT][constants.STR_NAME]
-                == constants.STR_PARQUET
-            ):
-                data_df = pq.read_table(edge_file)
-                data_df = data_df.rename_columns(["f0", "f1"])
-                src_ids.append(data_df["f0"].to_numpy())
-                dst_ids.append(data_df["f1"].to_numpy())
-            else:
-                raise ValueError(
-                    f"Unknown edge format {etype_info[constants.STR_FORMAT][constants.STR_NAME]} for edge type {etype_name}"
+        elif edge_fmt == constants.STR_PARQUET:
+            if len(edge_files) > 0:
+                # The row groups of all the files are read in parallel.
+                logging.debug(
+                    f"[Rank: {rank}] Loading edges of etype[{etype_name}] from {edge_files}"
+                )
+                data = array_readwriter.read_arrays(
+                    {"name": constants.STR_PARQUET},
+                    edge_files,
+                    num_threads=num_io_threads,
                 )
+                src_ids.append(data[:, 0])
+                dst_ids.append(data[:, 1])
+        else:
+            raise ValueError(
+                f"Unknown edge format {edge_fmt} for edge type {etype_name}"
+            )
 
         if len(src_ids) > 0:
             src_ids = np.concatenate(src_ids)
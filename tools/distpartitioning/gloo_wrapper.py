@@ -198,6 +198,178 @@ def alltoallv_cpu(rank, world_size, input_tensor_list, retain_nones=True):
     return return_vals
 
 
+# Upper bound, in bytes, of the message sent to each peer in one round of
+# ``alltoallv_batched``.
+DEFAULT_CHUNK_BYTES = 256 * 1024 * 1024
+
+
+def _as_bytes(tensor):
+    """Return the data of a tensor as a flat uint8 tensor."""
+    # TODO(#5002): Boolean tensors are sent as uint8, as in __alltoall_cpu.
+    if tensor.dtype == torch.bool:
+        tensor = tensor.to(torch.uint8)
+    return tensor.contiguous().reshape(-1).view(torch.uint8)
+
+
+def _message_bytes(meta):
+    """Return the number of bytes of the tensors described by ``meta``."""
+    num_bytes = 0
+    for tmeta in meta:
+        if tmeta is not None:
+            shape, dtype = tmeta
+            elem_size = torch.empty((0,), dtype=dtype).element_size()
+            num_bytes += int(np.prod(shape, dtype=np.int64)) * elem_size
+    return num_bytes
+
+
+def _copy_byte_range(segments, start, end, buf, to_buf=True):
+    """Copy the bytes ``[start, end)`` of logically concatenated byte
+    segments into ``buf``, or the other way around if ``to_buf`` is False.
+    """
+    offset = 0
+    for seg in segments:
+        seg_start = max(start - offset, 0)
+        seg_end = min(end - offset, seg.shape[0])
+        if seg_start < seg_end:
+            pos = offset + seg_start - start
+            if to_buf:
+                buf[pos : pos + seg_end - seg_start] = seg[seg_start:seg_end]
+            else:
+                seg[seg_start:seg_end] = buf[pos : pos + seg_end - seg_start]
+        offset += seg.shape[0]
+        if offset >= end:
+            break
+
+
+def alltoallv_batched(
+    rank, world_size, input_tensor_lists, chunk_bytes=DEFAULT_CHUNK_BYTES
+):
+    """
+    Exchange several tensors with every process in one batched alltoallv.
+
+    Unlike ``alltoallv_cpu``, which pads every message to the size of the
+    largest one and exchanges one tensor at a time, this function packs all
+    the tensors meant for a peer into one byte stream and sends exactly the
+    bytes needed, with point-to-point messages. The streams are sent in
+    rounds of at most ``chunk_bytes`` bytes per peer, which bounds the size
+    of the staging buffers irrespective of the amount of data exchanged.
+
+    The shapes and dtypes of the tensors are exchanged first, so a process
+    can send ``None`` for a tensor it does not have, and the tensors meant
+    for different peers may have different lengths.
+
+    Parameters:
+    -----------
+    rank : int
+        The rank of current worker
+    world_size : int
+        The size of the entire
+    input_tensor_lists : list of list of tensor
+        ``input_tensor_lists[i]`` is the list of tensors, or numpy arrays,
+        to send to rank ``i``. All the lists, on all the ranks, must have
+        the same length.
+    chunk_bytes : int, optional
+        The maximum number of bytes sent to each peer in one round.
+
+    Returns:
+    --------
+    list :
+        list of length ``world_size``, whose ``i``-th element is the list of
+        tensors received from rank ``i``. A tensor sent as ``None`` is
+        received as ``None``.
+    """
+    assert len(input_tensor_lists) == world_size
+    num_tensors = len(input_tensor_lists[0])
+    assert all(len(tl) == num_tensors for tl in input_tensor_lists)
+    assert chunk_bytes > 0
+    input_tensor_lists = [
+        [None if t is None else torch.as_tensor(t) for t in tl]
+        for tl in input_tensor_lists
+    ]
+
+    # Exchange shapes and dtypes, so every rank knows the size of every
+    # message and they all agree on the number of rounds.
+    send_meta = [
+        [None if t is None else (tuple(t.shape), t.dtype) for t in tl]
+        for tl in input_tensor_lists
+    ]
+    all_meta = [None for _ in range(world_size)]
+    dist.all_gather_object(all_meta, send_meta)
+    for k in range(num_tensors):
+        dims = set(
+            meta[rank][k][0][1:]
+            for meta in all_meta
+            if meta[rank][k] is not None
+        )
+        assert len(dims) <= 1, f"Tensor {k} has different shapes: {dims}"
+
+    send_segments = [
+        [_as_bytes(t) for t in tl if t is not None] for tl in input_tensor_lists
+    ]
+    send_bytes = [sum(seg.shape[0] for seg in segs) for segs in send_segments]
+
+    # Allocate the received tensors; bool tensors are received as uint8.
+    recv_tensors = []
+    for src in range(world_size):
+        recv_tensors.append(
+            [
+                None
+                if meta is None
+                else torch.empty(
+                    meta[0],
+                    dtype=torch.uint8 if meta[1] == torch.bool else meta[1],
+                )
+                for meta in all_meta[src][rank]
+            ]
+        )
+    recv_segments = [
+        [_as_bytes(t) for t in tl if t is not None] for tl in recv_tensors
+    ]
+    recv_bytes = [sum(seg.shape[0] for seg in segs) for segs in recv_segments]
+
+    # Messages to itself are copied locally.
+    buf = torch.empty((send_bytes[rank],), dtype=torch.uint8)
+    _copy_byte_range(send_segments[rank], 0, send_bytes[rank], buf)
+    _copy_byte_range(recv_segments[rank], 0, recv_bytes[rank], buf, False)
+
+    max_bytes = max(
+        [
+            _message_bytes(all_meta[src][dst])
+            for src in range(world_size)
+            for dst in range(world_size)
+            if src != dst
+        ],
+        default=0,
+    )
+    num_rounds = (max_bytes + chunk_bytes - 1) // chunk_bytes
+    for rnd in range(num_rounds):
+        start = rnd * chunk_bytes
+        requests = []
+        recv_bufs = {}
+        for peer in range(world_size):
+            end = min(start + chunk_bytes, recv_bytes[peer])
+            if peer != rank and end > start:
+                recv_bufs[peer] = torch.empty((end - start,), dtype=torch.uint8)
+                requests.append(dist.irecv(recv_bufs[peer], src=peer, tag=rnd))
+        for peer in range(world_size):
+            end = min(start + chunk_bytes, send_bytes[peer])
+            if peer != rank and end > start:
+                buf = torch.empty((end - start,), dtype=torch.uint8)
+                _copy_byte_range(send_segments[peer], start, end, buf)
+                requests.append(dist.isend(buf, dst=peer, tag=rnd))
+        for req in requests:
+            req.wait()
+        for peer, buf in recv_bufs.items():
+            end = start + buf.shape[0]
+            _copy_byte_range(recv_segments[peer], start, end, buf, False)
+
+    for src, tl in enumerate(recv_tensors):
+        for k, meta in enumerate(all_meta[src][rank]):
+            if meta is not None and meta[1] == torch.bool:
+                tl[k] = tl[k].to(torch.bool)
+    return recv_tensors
+
+
 def gather_metadata_json(metadata, rank, world_size):
     """
     Gather an object (json schema on `rank`)
@@ -534,6 +534,7 @@ def write_dgl_objects(
     orig_eids,
     formats,
     sort_etypes,
+    csc_graph=None,
 ):
     """
     Wrapper function to write graph, node/edge feature, original node/edge IDs.
@@ -558,12 +559,19 @@ def write_dgl_objects(
         Save graph in formats.
     sort_etypes : bool
         Whether to sort etypes in csc/csr.
+    csc_graph : CSCSamplingGraph, optional
+        The graph partition for GraphBolt, which is written to
+        csc_sampling_graph.tar if specified.
     """
     part_dir = output_dir + "/part" + str(part_id)
     os.makedirs(part_dir, exist_ok=True)
     write_graph_dgl(
         os.path.join(part_dir, "graph.dgl"), graph_obj, formats, sort_etypes
     )
+    if csc_graph is not None:
+        dgl.graphbolt.save_csc_sampling_graph(
+            csc_graph, os.path.join(part_dir, "csc_sampling_graph.tar")
+        )
 
     if node_features != None:
         write_node_features(
@@ -0,0 +1,458 @@
+# Requires setting PYTHONPATH=${GITROOT}/tools
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+from base import dump_partition_meta, PartitionMeta
+from distpartitioning import array_readwriter, constants
+from files import setdir
+
+STREAMING_ALGOS = ["ldg", "fennel", "hdrf"]
+
+
+def _ntype_offsets(metadata):
+    """Offsets of the node types in the homogeneous node ID space."""
+    num_nodes_per_type = metadata[constants.STR_NUM_NODES_PER_TYPE]
+    offsets = np.zeros(len(num_nodes_per_type) + 1, dtype=np.int64)
+    np.cumsum(num_nodes_per_type, out=offsets[1:])
+    return {
+        ntype: offsets[i]
+        for i, ntype in enumerate(metadata[constants.STR_NODE_TYPE])
+    }, int(offsets[-1])
+
+
+def _read_edge_chunk(in_dir, fmt_meta, path, src_offset, dst_offset):
+    data = array_readwriter.get_array_parser(**fmt_meta).read(
+        os.path.join(in_dir, path)
+    )
+    src = data[:, 0].astype(np.int64) + src_offset
+    dst = data[:, 1].astype(np.int64) + dst_offset
+    return src, dst
+
+
+def iter_edge_chunks(in_dir, metadata, num_workers=4):
+    """Iterate over the edge chunks of a graph in the chunked graph format.
+
+    The chunk files are read and parsed by a pool of threads, with at most
+    :attr:`num_workers` chunks read ahead, so the memory held at any time is
+    bounded by the size of a few chunks.
+
+    Parameters
+    ----------
+    in_dir : str
+        The directory containing the chunked graph.
+    metadata : dict
+        The content of ``metadata.json``.
+    num_workers : int, optional
+        The number of reader threads.
+
+    Yields
+    ------
+    numpy.ndarray, numpy.ndarray
+        The source and destination node IDs of the chunk in the homogeneous
+        node ID space.
+    """
+    offsets, _ = _ntype_offsets(metadata)
+    tasks = []
+    for etype, etype_info in metadata[constants.STR_EDGES].items():
+        src_ntype, _, dst_ntype = etype.split(":")
+        fmt = etype_info[constants.STR_FORMAT]
+        fmt_meta = {constants.STR_NAME: fmt[constants.STR_NAME]}
+        if fmt_meta[constants.STR_NAME] == constants.STR_CSV:
+            fmt_meta[constants.STR_FORMAT_DELIMITER] = fmt[
+                constants.STR_FORMAT_DELIMITER
+            ]
+        for path in etype_info[constants.STR_DATA]:
+            tasks.append(
+                (fmt_meta, path, offsets[src_ntype], offsets[dst_ntype])
+            )
+
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        futures = []
+        for task in tasks:
+            futures.append(pool.submit(_read_edge_chunk, in_dir, *task))
+            if len(futures) > num_workers:
+                yield futures.pop(0).result()
+        for future in futures:
+            yield future.result()
+
+
+def _iter_batches(chunks, batch_size):
+    for src, dst in chunks:
+        for i in range(0, len(src), batch_size):
+            yield src[i : i + batch_size], dst[i : i + batch_size]
+
+
+def _fill_unassigned(parts, sizes, num_parts):
+    """Assign the nodes that have not been seen to the emptiest partitions."""
+    unassigned = np.nonzero(parts < 0)[0]
+    if len(unassigned) == 0:
+        return
+    target = -(-(int(sizes.sum()) + len(unassigned)) // num_parts)
+    deficit = np.maximum(target - sizes, 0)
+    fill = np.repeat(np.arange(num_parts), deficit)[: len(unassigned)]
+    parts[unassigned] = fill
+    sizes += np.bincount(fill, minlength=num_parts)
+
+
+def _count_parts(nodes, inverse, nbr_parts, num_parts):
+    """Count the partitions of the neighbors of each node of a batch."""
+    known = nbr_parts >= 0
+    return np.bincount(
+        inverse[known] * num_parts + nbr_parts[known],
+        minlength=len(nodes) * num_parts,
+    ).reshape(len(nodes), num_parts)
+
+
+def _vertex_stream_partition(
+    chunks,
+    num_nodes,
+    num_edges,
+    num_parts,
+    algo,
+    batch_size,
+    slack,
+    num_passes=1,
+    max_rounds=8,
+):
+    """Streaming vertex partitioning with LDG or Fennel.
+
+    For each node, the partitions of its neighbors are counted over all the
+    edges streamed so far, and the node is assigned again in every batch it
+    appears in, to the partition holding most of its neighbors, penalized by
+    the partition size.  The last assignment of a node thus accounts for its
+    whole neighborhood.  The nodes of a batch are scored together, in up to
+    :attr:`max_rounds` rounds so that the nodes whose neighbors are only
+    assigned in an earlier round of the batch can follow them.  The empty
+    partitions are seeded with the nodes having most edges in the batch, and
+    the nodes without any assigned neighbor wait for a later batch.  Further
+    passes restream the edges and count the neighbors again, starting from
+    the assignment of the previous pass.
+    """
+    parts = np.full(num_nodes, -1, dtype=np.int32)
+    sizes = np.zeros(num_parts, dtype=np.int64)
+    # The partitions of the neighbors of each node counted in this pass.
+    nbr_counts = np.zeros((num_nodes, num_parts), dtype=np.int32)
+    capacity = slack * num_nodes / num_parts
+    gamma = 1.5
+    alpha = np.sqrt(num_parts) * num_edges / max(num_nodes, 1) ** gamma
+    # The number of nodes assigned between two updates of the sizes.
+    step = max(int(0.01 * capacity), 1)
+
+    def _score(counts):
+        if algo == "ldg":
+            scores = counts * (1 - sizes / capacity)
+            # Break ties towards the smaller partitions.
+            scores = scores - sizes / (capacity * num_parts)
+        else:
+            scores = counts - alpha * gamma * sizes ** (gamma - 1)
+        full = sizes >= capacity
+        if full.all():
+            return np.argmax(scores, 1)
+        scores[:, full] = -np.inf
+        assigned = np.argmax(scores, 1)
+        # The scores are stale within a batch, so move the nodes that would
+        # overflow a partition to the partitions with room left.
+        room = np.ceil(capacity - sizes).clip(0).astype(np.int64)
+        order = np.argsort(assigned, kind="stable")
+        starts = np.cumsum(np.bincount(assigned, minlength=num_parts))
+        starts -= np.bincount(assigned, minlength=num_parts)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order)) - starts[assigned[order]]
+        overflow = rank >= room[assigned]
+        if overflow.any():
+            room -= np.bincount(assigned[~overflow], minlength=num_parts)
+            spill = np.repeat(np.arange(num_parts), room.clip(0))
+            if len(spill) == 0:
+                spill = np.argsort(sizes)
+            assigned[overflow] = np.resize(spill, overflow.sum())
+        return assigned
+
+    def _assign(counts):
+        # Update the sizes after every slice of the nodes, so that the nodes
+        # with few assigned neighbors do not all follow the size penalty to
+        # the same partition.
+        assigned = np.empty(len(counts), dtype=np.int64)
+        for i in range(0, len(counts), step):
+            assigned[i : i + step] = _score(counts[i : i + step])
+            sizes[:] += np.bincount(assigned[i : i + step], minlength=num_parts)
+        return assigned
+
+    for _ in range(num_passes):
+        nbr_counts[:] = 0
+        for src, dst in _iter_batches(chunks(), batch_size):
+            u = np.concatenate([src, dst])
+            v = np.concatenate([dst, src])
+            nodes, inverse = np.unique(u, return_inverse=True)
+            nbr_parts = parts[v]
+            nbr_counts[nodes] += _count_parts(
+                nodes, inverse, nbr_parts, num_parts
+            )
+            # The edges to the nodes assigned in a round of this batch are
+            # counted after the round.
+            pending = nbr_parts < 0
+            degrees = np.bincount(inverse, minlength=len(nodes))
+            todo = np.ones(len(nodes), dtype=bool)
+            for _ in range(max_rounds):
+                counts = nbr_counts[nodes]
+                ready = np.nonzero(todo & (counts.sum(1) > 0))[0]
+                old = parts[nodes[ready]]
+                sizes -= np.bincount(old[old >= 0], minlength=num_parts)
+                assigned = _assign(counts[ready])
+                # Seed the empty partitions with the unassigned nodes having
+                # most edges in the batch, which their neighbors follow in
+                # the next rounds.
+                empty = np.nonzero(sizes == 0)[0]
+                seeds = np.nonzero(todo & (counts.sum(1) == 0))[0]
+                seeds = seeds[parts[nodes[seeds]] < 0]
+                seeds = seeds[np.argsort(-degrees[seeds], kind="stable")]
+                seeds, empty = seeds[: len(empty)], empty[: len(seeds)]
+                sizes[empty] += 1
+                ready = np.concatenate([ready, seeds])
+                if len(ready) == 0:
+                    break
+                parts[nodes[ready]] = np.concatenate([assigned, empty])
+                todo[ready] = False
+                if not todo.any():
+                    break
+                nbr_parts = parts[v[pending]]
+                nbr_counts[nodes] += _count_parts(
+                    nodes, inverse[pending], nbr_parts, num_parts
+                )
+                pending[pending] = nbr_parts < 0
+
+    _fill_unassigned(parts, sizes, num_parts)
+    return parts
+
+
+def _hdrf_partition(
+    chunks,
+    num_nodes,
+    num_edges,
+    num_parts,
+    batch_size,
+    lamb,
+    eps=1.0,
+    max_rounds=8,
+):
+    """Streaming vertex-cut partitioning with HDRF.
+
+    Every edge is assigned to the partition maximizing the HDRF score, which
+    favors the partitions that already hold a replica of its endpoint with
+    the higher partial degree.  The edges of a batch are scored together, in
+    up to :attr:`max_rounds` rounds so that the edges whose endpoints only get
+    a replica in an earlier round of the batch can follow it.  The edges
+    without any replica are spread over the partitions from the smallest one.
+    Each node is then owned by the partition holding most of its edges.
+    """
+    degrees = np.zeros(num_nodes, dtype=np.int64)
+    # The number of edges of each node in each partition, which is non-zero
+    # for the partitions holding a replica of the node.
+    edge_counts = np.zeros((num_nodes, num_parts), dtype=np.int32)
+    edge_sizes = np.zeros(num_parts, dtype=np.int64)
+
+    def _place(src, dst, assigned):
+        for ends in (src, dst):
+            keys, counts = np.unique(
+                ends * num_parts + assigned, return_counts=True
+            )
+            edge_counts.reshape(-1)[keys] += counts.astype(np.int32)
+        edge_sizes[:] += np.bincount(assigned, minlength=num_parts)
+
+    def _score(src, dst, theta_src):
+        has_src = edge_counts[src] > 0
+        has_dst = edge_counts[dst] > 0
+        rep = has_src * (2 - theta_src)[:, None]
+        rep += has_dst * (1 + theta_src)[:, None]
+        max_size = edge_sizes.max()
+        bal = (max_size - edge_sizes) / (eps + max_size - edge_sizes.min())
+        return np.argmax(rep + lamb * bal, 1)
+
+    # The state is updated at least every 1% of the average number of edges
+    # of a partition, so that the edges of a batch do not all follow the
+    # balance term to the same partition.
+    batch_size = min(batch_size, max(int(0.01 * num_edges / num_parts), 1))
+    for src, dst in _iter_batches(chunks, batch_size):
+        nodes, counts = np.unique(
+            np.concatenate([src, dst]), return_counts=True
+        )
+        degrees[nodes] += counts
+        deg_src = degrees[src].astype(np.float64)
+        theta_src = deg_src / (deg_src + degrees[dst])
+        todo = np.arange(len(src))
+        for _ in range(max_rounds):
+            ready = (edge_counts[src[todo]] > 0).any(1)
+            ready |= (edge_counts[dst[todo]] > 0).any(1)
+            if not ready.any():
+                break
+            edges, todo = todo[ready], todo[~ready]
+            _place(
+                src[edges],
+                dst[edges],
+                _score(src[edges], dst[edges], theta_src[edges]),
+            )
+            if len(todo) == 0:
+                break
+        # The edges still without replicas are spread over the partitions
+        # from the smallest one, as the sequential algorithm would.
+        assigned = np.argsort(edge_sizes, kind="stable")[
+            np.arange(len(todo)) % num_parts
+        ]
+        _place(src[todo], dst[todo], assigned)
+
+    # Each node is owned by the partition holding most of its edges.
+    parts = np.argmax(edge_counts, 1).astype(np.int32)
+    parts[edge_counts.max(1) == 0] = -1
+    sizes = np.bincount(parts[parts >= 0], minlength=num_parts)
+    _fill_unassigned(parts, sizes, num_parts)
+    return parts
+
+
+def streaming_partition(
+    in_dir,
+    metadata,
+    num_parts,
+    output_path,
+    algo="fennel",
+    batch_size=65536,
+    num_workers=4,
+    slack=1.1,
+    lamb=1.1,
+    num_passes=1,
+):
+    """
+    Partition the graph described in metadata by streaming over its edges and
+    generate partition ID mapping in :attr:`output_path`.
+
+    The edge chunks are streamed from :attr:`in_dir` through
+    ``array_readwriter``, so the memory usage is linear in the number of nodes
+    times the number of partitions rather than in the number of edges.  The
+    supported algorithms are
+
+    * ``ldg`` and ``fennel``, which assign each node to the partition holding
+      most of its neighbors, counted over its edges streamed so far, so that
+      its last assignment accounts for its whole neighborhood.  Passes after
+      the first one restream the edges to refine the assignment.
+
+    * ``hdrf``, which assigns each edge to a partition (vertex-cut) in a
+      single pass and makes each node owned by the partition holding most of
+      its edges.
+
+    The edges are scored in batches of :attr:`batch_size`, and the partition
+    sizes are updated within a batch, so larger batches are faster without
+    making the partitions much worse.  The chunks are read by
+    :attr:`num_workers` threads.
+
+    The output directory has the same layout as the one of
+    ``random_partition.py``: the partition ID mapping files named
+    "<node-type>.txt" and the metadata file "partition_meta.json".
+    """
+    if algo not in STREAMING_ALGOS:
+        raise ValueError(
+            f"Unknown algorithm {algo}. Supported: {STREAMING_ALGOS}"
+        )
+    _, num_nodes = _ntype_offsets(metadata)
+    num_edges = int(np.sum(metadata[constants.STR_NUM_EDGES_PER_TYPE]))
+    chunks = partial(iter_edge_chunks, in_dir, metadata, num_workers)
+    if algo == "hdrf":
+        parts = _hdrf_partition(
+            chunks(), num_nodes, num_edges, num_parts, batch_size, lamb
+        )
+    else:
+        parts = _vertex_stream_partition(
+            chunks,
+            num_nodes,
+            num_edges,
+            num_parts,
+            algo,
+            batch_size,
+            slack,
+            num_passes=num_passes,
+        )
+
+    with setdir(output_path):
+        offset = 0
+        num_nodes_per_type = metadata[constants.STR_NUM_NODES_PER_TYPE]
+        ntypes = metadata[constants.STR_NODE_TYPE]
+        for ntype, n in zip(ntypes, num_nodes_per_type):
+            logging.info("Writing partition for node type %s" % ntype)
+            array_readwriter.get_array_parser(name="csv").write(
+                ntype + ".txt", parts[offset : offset + n]
+            )
+            offset += n
+        part_meta = PartitionMeta(
+            version="1.0.0", num_parts=num_parts, algo_name=algo
+        )
+        dump_partition_meta(part_meta, "partition_meta.json")
+
+
+# Run with PYTHONPATH=${GIT_ROOT_DIR}/tools
+# where ${GIT_ROOT_DIR} is the directory to the DGL git repository.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--in_dir",
+        type=str,
+        help="input directory that contains the metadata file",
+    )
+    parser.add_argument("--out_dir", type=str, help="output directory")
+    parser.add_argument(
+        "--num_partitions", type=int, help="number of partitions"
+    )
+    parser.add_argument(
+        "--algo",
+        type=str,
+        default="fennel",
+        choices=STREAMING_ALGOS,
+        help="streaming partitioning algorithm",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=65536,
+        help="number of edges scored together; larger batches are faster",
+    )
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=4,
+        help="number of threads reading the edge chunks",
+    )
+    parser.add_argument(
+        "--slack",
+        type=float,
+        default=1.1,
+        help="maximum partition size relative to the average (ldg/fennel)",
+    )
+    parser.add_argument(
+        "--lamb",
+        type=float,
+        default=1.1,
+        help="weight of the balance term (hdrf)",
+    )
+    parser.add_argument(
+        "--num_passes",
+        type=int,
+        default=1,
+        help="number of passes over the edges (ldg/fennel)",
+    )
+    logging.basicConfig(level="INFO")
+    args = parser.parse_args()
+    with open(os.path.join(args.in_dir, "metadata.json")) as f:
+        metadata = json.load(f)
+    streaming_partition(
+        args.in_dir,
+        metadata,
+        args.num_partitions,
+        args.out_dir,
+        algo=args.algo,
+        batch_size=args.batch_size,
+        num_workers=args.num_workers,
+        slack=args.slack,
+        lamb=args.lamb,
+        num_passes=args.num_passes,
+    )